@@ -25,8 +25,6 @@ from retry import with_retry
 
 # Google Calendar API v3 base URL
 _CALENDAR_API = "https://www.googleapis.com/calendar/v3/calendars"
-# freeBusy is a sibling of /calendars, not under it
-_FREEBUSY_API = "https://www.googleapis.com/calendar/v3/freeBusy"
 
 # Internal pagination: events fetched per page while scanning the window
 _PAGE_SIZE = 250
@@ -341,35 +339,6 @@ def patch_event(
     )
 
 
-@with_retry(max_attempts=3, delay_ms=1000)
-def freebusy_query(
-    emails: list[str], time_min: datetime, time_max: datetime,
-) -> dict[str, Any]:
-    """Free/busy blocks for a set of calendars.
-
-    Returns the raw per-calendar map: email -> {"busy": [...]} or
-    {"errors": [...]}. A notFound error means that calendar isn't VISIBLE to
-    this account (ACL), not that the person is free — callers must surface
-    the difference, or a slot search silently treats an invisible diary as
-    an empty one.
-
-    Needs the calendar.freebusy scope (2026-08-19) — calendar.events does not
-    cover this endpoint, so pre-existing tokens 403 here while every other
-    calendar call works. Callers teach setup_oauth(force=True) on that 403.
-    """
-    client = get_sync_client()
-    response = client.post_json(
-        _FREEBUSY_API,
-        json_body={
-            "timeMin": time_min.isoformat(),
-            "timeMax": time_max.isoformat(),
-            "items": [{"id": email} for email in emails],
-        },
-    )
-    calendars: dict[str, Any] = response.get("calendars", {})
-    return calendars
-
-
 @with_retry(max_attempts=3, delay_ms=1000)
 def list_status_events(
     calendar_id: str,
@@ -0,0 +1,118 @@
+"""
+Free/busy queries at review scale — chunked, concurrent, merged.
+
+One freeBusy request carries at most MAX_CALENDARS calendars, and Google
+refuses windows much past two months (timeRangeTooLong). A 30–80 person
+review over a quarter breaks both, so freebusy_query splits the attendee list
+into MAX_CALENDARS groups and the window into MAX_WINDOW spans, fetches every
+(group, span) pair concurrently, and merges the answers back into the single
+per-calendar map one request would have returned.
+
+Merging keeps the honesty contract of the raw map: a calendar that errored in
+ANY chunk is reported with its errors (never as a partial busy list that reads
+as free time), and a busy block Google clipped at a span boundary is joined
+back into the one block it was.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any
+
+from adapters.http_client import get_sync_client
+from retry import with_retry
+from telemetry import count, run_in_context
+
+# freeBusy is a sibling of /calendars, not under it
+_FREEBUSY_API = "https://www.googleapis.com/calendar/v3/freeBusy"
+
+# Google's per-request calendar cap (calendarExpansionMax)
+MAX_CALENDARS = 50
+# Comfortably inside the longest window freeBusy accepts
+MAX_WINDOW = timedelta(days=60)
+MAX_WORKERS = 4
+
+
+def freebusy_query(
+    emails: list[str], time_min: datetime, time_max: datetime,
+) -> dict[str, Any]:
+    """Free/busy blocks for a set of calendars.
+
+    Returns the raw per-calendar map: email -> {"busy": [...]} or
+    {"errors": [...]}. A notFound error means that calendar isn't VISIBLE to
+    this account (ACL), not that the person is free — callers must surface
+    the difference, or a slot search silently treats an invisible diary as
+    an empty one.
+
+    Needs the calendar.freebusy scope (2026-08-19) — calendar.events does not
+    cover this endpoint, so pre-existing tokens 403 here while every other
+    calendar call works. Callers teach setup_oauth(force=True) on that 403.
+    """
+    groups = [emails[i:i + MAX_CALENDARS] for i in range(0, len(emails), MAX_CALENDARS)]
+    spans = []
+    cursor = time_min
+    while cursor < time_max:
+        spans.append((cursor, min(cursor + MAX_WINDOW, time_max)))
+        cursor = spans[-1][1]
+    chunks = [(group, start, end) for start, end in spans for group in groups]
+    if len(chunks) <= 1:
+        return _query_chunk(emails, time_min, time_max)
+
+    count("freebusy_chunks", len(chunks))
+    pool = ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(chunks)))
+    try:
+        futures = [pool.submit(run_in_context(_query_chunk), *chunk) for chunk in chunks]
+        # Span-major order: each calendar's blocks arrive in time order
+        answers = [future.result() for future in futures]
+    finally:
+        # One failed chunk fails the query — don't start the ones still queued
+        pool.shutdown(cancel_futures=True)
+    return _merge_answers(answers, {end for _, end in spans[:-1]})
+
+
+@with_retry(max_attempts=3, delay_ms=1000)
+def _query_chunk(
+    emails: list[str], time_min: datetime, time_max: datetime,
+) -> dict[str, Any]:
+    """One freeBusy request — within MAX_CALENDARS and MAX_WINDOW."""
+    client = get_sync_client()
+    response = client.post_json(
+        _FREEBUSY_API,
+        json_body={
+            "timeMin": time_min.isoformat(),
+            "timeMax": time_max.isoformat(),
+            "items": [{"id": email} for email in emails],
+        },
+    )
+    calendars: dict[str, Any] = response.get("calendars", {})
+    return calendars
+
+
+def _merge_answers(
+    answers: list[dict[str, Any]], boundaries: set[datetime],
+) -> dict[str, Any]:
+    """Per-chunk calendar maps → one map, errors sticky, split blocks rejoined."""
+    merged: dict[str, dict[str, list[dict[str, Any]]]] = {}
+    for answer in answers:
+        for email, entry in answer.items():
+            target = merged.setdefault(email, {"busy": [], "errors": []})
+            target["errors"].extend(entry.get("errors", []))
+            for block in entry.get("busy", []):
+                busy = target["busy"]
+                if busy and _joins(busy[-1], block, boundaries):
+                    busy[-1] = {"start": busy[-1]["start"], "end": block["end"]}
+                else:
+                    busy.append(block)
+
+    calendars: dict[str, Any] = {}
+    for email, entry in merged.items():
+        calendars[email] = {"errors": entry["errors"]} if entry["errors"] else {"busy": entry["busy"]}
+    return calendars
+
+
+def _joins(previous: dict[str, Any], block: dict[str, Any], boundaries: set[datetime]) -> bool:
+    """True when block continues previous across a span boundary."""
+    try:
+        end = datetime.fromisoformat(previous["end"])
+        return end == datetime.fromisoformat(block["start"]) and end in boundaries
+    except (KeyError, ValueError):
+        return False
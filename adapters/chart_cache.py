@@ -0,0 +1,103 @@
+"""
+Chart PNG cache — skips the Slides round trip for charts that haven't changed.
+
+render_charts_as_pngs pays ~3s to create a temp presentation plus ~2s per
+chart on every sheet fetch. A rendered chart is a pure function of the chart
+spec and the data behind it, so PNGs are kept on disk keyed by:
+
+    (spreadsheet id, chartId, hash of the chart spec, spreadsheet modifiedTime)
+
+modifiedTime moves on any edit to the spreadsheet, data or chart, so a key
+can go stale but never lie. Without a modifiedTime (callers that don't have
+Drive metadata) nothing is read or written.
+
+One file per chart under CACHE_DIR, written atomically (temp + rename). Hits
+refresh the file's mtime and the oldest files beyond MAX_ENTRIES are pruned
+after each store. Every failure is a miss — the cache can only save time.
+"""
+
+import hashlib
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+from models import ChartData
+from telemetry import count
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = Path.home() / ".cache" / "mise" / "charts"
+MAX_ENTRIES = 500
+
+
+def spec_hash(spec: dict[str, Any]) -> str:
+    """Stable digest of a chart spec (key order doesn't matter)."""
+    return hashlib.sha256(orjson.dumps(spec, option=orjson.OPT_SORT_KEYS)).hexdigest()[:16]
+
+
+def _entry_path(spreadsheet_id: str, chart: ChartData, modified_time: str) -> Path:
+    key = "\0".join((spreadsheet_id, str(chart.chart_id), chart.spec_hash or "", modified_time))
+    return CACHE_DIR / f"{hashlib.sha256(key.encode()).hexdigest()}.png"
+
+
+def load_cached_charts(
+    spreadsheet_id: str,
+    charts: list[ChartData],
+    modified_time: str | None,
+) -> tuple[list[ChartData], int]:
+    """
+    Fill png_bytes from the cache where possible.
+
+    Returns:
+        (charts still needing a render, time spent on lookups in ms)
+    """
+    if not modified_time:
+        return charts, 0
+    start = time.perf_counter()
+    misses: list[ChartData] = []
+    for chart in charts:
+        path = _entry_path(spreadsheet_id, chart, modified_time)
+        try:
+            chart.png_bytes = path.read_bytes()
+            os.utime(path)
+        except OSError:
+            misses.append(chart)
+    if len(charts) > len(misses):
+        count("chart_cache_hits", len(charts) - len(misses))
+    return misses, int((time.perf_counter() - start) * 1000)
+
+
+def store_rendered_charts(
+    spreadsheet_id: str,
+    charts: list[ChartData],
+    modified_time: str | None,
+) -> None:
+    """Cache every chart that rendered. Best-effort."""
+    if not modified_time:
+        return
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        for chart in charts:
+            if not chart.png_bytes:
+                continue
+            path = _entry_path(spreadsheet_id, chart, modified_time)
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_bytes(chart.png_bytes)
+            os.replace(tmp, path)
+        _prune()
+    except OSError as e:
+        logger.debug("Chart cache write failed: %s", e)
+
+
+def _prune() -> None:
+    """Drop the least recently used entries beyond MAX_ENTRIES."""
+    entries = list(CACHE_DIR.glob("*.png"))
+    if len(entries) <= MAX_ENTRIES:
+        return
+    entries.sort(key=lambda p: p.stat().st_mtime)
+    for path in entries[:len(entries) - MAX_ENTRIES]:
+        path.unlink(missing_ok=True)
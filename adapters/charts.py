@@ -30,6 +30,7 @@ from typing import Any
 import httpx
 
 from models import ChartData
+from adapters.chart_cache import spec_hash
 from adapters.http_client import get_sync_client
 
 
@@ -77,6 +78,7 @@ def get_charts_from_spreadsheet(spreadsheet_response: dict[str, Any]) -> list[Ch
                 title=title,
                 sheet_name=sheet_name,
                 chart_type=chart_type,
+                spec_hash=spec_hash(spec),
             ))
 
     return charts
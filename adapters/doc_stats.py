@@ -0,0 +1,83 @@
+"""
+Per-document fetch history — decides when fetch_document should speculate.
+
+fetch_document's extra calls are conditional: the preview-mode re-fetch only
+when the inline response carries suggestions, the markdown-export checkbox
+oracle only when a checkbox list exists. Made serially, a suggestion-heavy
+doc with checkboxes costs three round trips where a clean one costs one.
+
+A document fetched before usually looks the same next time. Each fetch
+records whether suggestions and checkboxes were present; once a document has
+MIN_FETCHES on record and a condition held in at least SPECULATE_RATE of
+them, the next fetch issues that call alongside the primary one and throws
+the result away if it turns out unneeded. A wasted speculative call costs
+quota, not latency.
+
+History lives in one small JSON file (STATS_PATH), written atomically and
+capped at MAX_DOCS by last fetch. Best-effort throughout: an unreadable file
+is no history, and no history is no speculation.
+"""
+
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+STATS_PATH = Path.home() / ".cache" / "mise" / "doc_stats.json"
+MAX_DOCS = 1000
+MIN_FETCHES = 2
+SPECULATE_RATE = 0.5
+
+_lock = threading.Lock()
+
+
+def _load() -> dict[str, dict[str, Any]]:
+    try:
+        stats = orjson.loads(STATS_PATH.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return {}
+    return stats if isinstance(stats, dict) else {}
+
+
+def predict(document_id: str) -> tuple[bool, bool]:
+    """
+    Whether this document's history says to speculate.
+
+    Returns:
+        (expect suggestions, expect a checkbox list)
+    """
+    entry = _load().get(document_id)
+    if not entry or entry.get("fetches", 0) < MIN_FETCHES:
+        return False, False
+    fetches = entry["fetches"]
+    return (
+        entry.get("suggestions", 0) / fetches >= SPECULATE_RATE,
+        entry.get("checkboxes", 0) / fetches >= SPECULATE_RATE,
+    )
+
+
+def record_fetch(document_id: str, *, suggestions: bool, checkboxes: bool) -> None:
+    """Add one fetch's outcome to the document's history."""
+    with _lock:
+        stats = _load()
+        entry = stats.setdefault(document_id, {"fetches": 0, "suggestions": 0, "checkboxes": 0})
+        entry["fetches"] += 1
+        entry["suggestions"] += suggestions
+        entry["checkboxes"] += checkboxes
+        entry["last"] = time.time()
+        if len(stats) > MAX_DOCS:
+            for stale in sorted(stats, key=lambda k: stats[k].get("last", 0))[:len(stats) - MAX_DOCS]:
+                del stats[stale]
+        try:
+            STATS_PATH.parent.mkdir(parents=True, exist_ok=True)
+            tmp = STATS_PATH.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_bytes(orjson.dumps(stats))
+            os.replace(tmp, STATS_PATH)
+        except OSError as e:
+            logger.debug("Doc stats write failed: %s", e)
@@ -7,11 +7,14 @@ Uses httpx via MiseSyncClient (Phase 1 migration). Will switch to
 MiseHttpClient (async) when the tools/server layer goes async.
 """
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any
 
 from models import DocData, DocTab
 from retry import with_retry
-from adapters.http_client import get_sync_client
+from telemetry import count, run_in_context
+from adapters import doc_stats
+from adapters.http_client import MiseSyncClient, get_sync_client
 from extractors.docs import (
     annotate_checkbox_states,
     annotate_suggestion_markup,
@@ -78,7 +81,32 @@ def _build_legacy_tab(doc: dict[str, Any]) -> DocTab:
     )
 
 
-def _apply_checkbox_states(client: Any, document_id: str, data: DocData) -> None:
+def _get_document(client: MiseSyncClient, document_id: str, view_mode: str) -> dict[str, Any]:
+    """One documents.get in the given suggestionsViewMode."""
+    return client.get_json(
+        f"{_DOCS_API}/{document_id}",
+        params={
+            "includeTabsContent": "true",
+            "fields": DOCUMENT_FIELDS,
+            "suggestionsViewMode": view_mode,
+        },
+    )
+
+
+def _get_markdown_export(client: MiseSyncClient, document_id: str) -> bytes:
+    """The Drive markdown export — the checkbox oracle's source."""
+    return client.get_bytes(
+        f"{_DRIVE_FILES_API}/{document_id}/export",
+        params={"mimeType": "text/markdown"},
+    )
+
+
+def _apply_checkbox_states(
+    client: Any,
+    document_id: str,
+    data: DocData,
+    export: "Future[bytes] | None" = None,
+) -> bool:
     """Annotate checkbox paragraphs with checked-state via the markdown-export oracle.
 
     The Docs API does NOT expose checkbox checked-state (a checked and an
@@ -87,7 +115,11 @@ def _apply_checkbox_states(client: Any, document_id: str, data: DocData) -> None
     markers, and annotate each checkbox paragraph in document order. Any failure
     (no export, permission, count mismatch) degrades to plain bullets with a
     warning; a wrong tick is never emitted. One extra API call, and only when a
-    checkbox list actually exists.
+    checkbox list actually exists — unless `export` is a speculative call
+    already in flight, whose result is then used instead.
+
+    Returns:
+        Whether the document has a checkbox list (for doc_stats)
     """
     has_checkbox = any(
         is_checkbox_list(list_def)
@@ -95,24 +127,22 @@ def _apply_checkbox_states(client: Any, document_id: str, data: DocData) -> None
         for list_def in tab.lists.values()
     )
     if not has_checkbox:
-        return
+        return False
 
     try:
-        md_bytes = client.get_bytes(
-            f"{_DRIVE_FILES_API}/{document_id}/export",
-            params={"mimeType": "text/markdown"},
-        )
+        md_bytes = export.result() if export else _get_markdown_export(client, document_id)
         states = parse_checkbox_markers(md_bytes.decode("utf-8"))
     except Exception as exc:  # export is best-effort — never fail the whole fetch
         data.adapter_warnings.append(
             f"Checkbox tick-state unavailable: markdown export failed ({exc}). "
             "Rendering plain bullets."
         )
-        return
+        return True
 
     warning = annotate_checkbox_states(data.tabs, states)
     if warning:
         data.adapter_warnings.append(warning)
+    return True
 
 
 def _build_tabs(doc: dict[str, Any]) -> list[DocTab]:
@@ -144,7 +174,10 @@ def fetch_document(document_id: str, suggestions: str = "accepted") -> DocData:
       ({++ins++}/{--del--} with [sN] pairing tags).
 
     Mirrors the checkbox-oracle pattern: the extra call is paid only when the
-    condition it resolves actually exists.
+    condition it resolves actually exists. For a document whose history
+    (doc_stats) says the preview call or the checkbox export will be needed,
+    it is issued concurrently with the first call instead, and discarded if
+    this fetch turns out not to need it.
 
     Args:
         document_id: The document ID (from URL or API)
@@ -164,16 +197,42 @@ def fetch_document(document_id: str, suggestions: str = "accepted") -> DocData:
         )
 
     client = get_sync_client()
+    preview_mode = _SUGGESTION_VIEW_MODES[suggestions] if suggestions != "markup" else None
+    expect_suggestions, expect_checkboxes = doc_stats.predict(document_id)
 
+    pool = ThreadPoolExecutor(max_workers=2) if expect_checkboxes or (expect_suggestions and preview_mode) else None
+    try:
+        preview = (
+            pool.submit(run_in_context(_get_document), client, document_id, preview_mode)
+            if pool and expect_suggestions and preview_mode else None
+        )
+        export = pool.submit(run_in_context(_get_markdown_export), client, document_id) if pool and expect_checkboxes else None
+        doc_data, has_checkboxes = _fetch_views(client, document_id, suggestions, preview_mode, preview, export)
+    finally:
+        if pool:
+            # A discarded speculative call may still be in flight — don't wait on it
+            pool.shutdown(wait=False)
+
+    for future, needed in ((preview, doc_data.suggestion_count > 0), (export, has_checkboxes)):
+        if future is not None:
+            count("speculative_calls")
+            if not needed:
+                count("speculative_discards")
+    doc_stats.record_fetch(document_id, suggestions=doc_data.suggestion_count > 0, checkboxes=has_checkboxes)
+    return doc_data
+
+
+def _fetch_views(
+    client: MiseSyncClient,
+    document_id: str,
+    suggestions: str,
+    preview_mode: str | None,
+    preview: "Future[dict[str, Any]] | None",
+    export: "Future[bytes] | None",
+) -> tuple[DocData, bool]:
+    """fetch_document's calls; preview/export are speculative calls already in flight."""
     # First call: inline view, so unresolved suggestions are visible/countable
-    doc = client.get_json(
-        f"{_DOCS_API}/{document_id}",
-        params={
-            "includeTabsContent": "true",
-            "fields": DOCUMENT_FIELDS,
-            "suggestionsViewMode": "SUGGESTIONS_INLINE",
-        },
-    )
+    doc = _get_document(client, document_id, "SUGGESTIONS_INLINE")
 
     title = doc.get("title", "Untitled")
     tabs = _build_tabs(doc)
@@ -181,7 +240,7 @@ def fetch_document(document_id: str, suggestions: str = "accepted") -> DocData:
     adapter_warnings: list[str] = []
 
     if suggestion_count > 0:
-        if suggestions == "markup":
+        if preview_mode is None:
             annotate_suggestion_markup(tabs)
             adapter_warnings.append(
                 f"Document carries {suggestion_count} unresolved suggested edit(s), "
@@ -192,14 +251,7 @@ def fetch_document(document_id: str, suggestions: str = "accepted") -> DocData:
             )
         else:
             # Preview modes: let Google resolve the suggestions server-side
-            doc = client.get_json(
-                f"{_DOCS_API}/{document_id}",
-                params={
-                    "includeTabsContent": "true",
-                    "fields": DOCUMENT_FIELDS,
-                    "suggestionsViewMode": _SUGGESTION_VIEW_MODES[suggestions],
-                },
-            )
+            doc = preview.result() if preview else _get_document(client, document_id, preview_mode)
             tabs = _build_tabs(doc)
             if suggestions == "accepted":
                 adapter_warnings.append(
@@ -227,6 +279,6 @@ def fetch_document(document_id: str, suggestions: str = "accepted") -> DocData:
     doc_data.adapter_warnings.extend(adapter_warnings)
 
     # Checkbox checked-state isn't in the Docs API — resolve it via export oracle
-    _apply_checkbox_states(client, document_id, doc_data)
+    has_checkboxes = _apply_checkbox_states(client, document_id, doc_data, export)
 
-    return doc_data
+    return doc_data, has_checkboxes
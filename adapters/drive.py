@@ -33,6 +33,7 @@ from models import (
 )
 from retry import with_retry
 from adapters.http_client import get_sync_client
+from adapters.drive_meta_cache import remember as remember_metadata
 
 
 # Google Drive API v3 base URLs
@@ -113,6 +114,7 @@ SEARCH_RESULT_FIELDS = (
     "mimeType,"
     "createdTime,"
     "modifiedTime,"
+    "size,"  # with the rest, fetch_drive can route from a search hit (drive_meta_cache)
     "owners(displayName),"
     "webViewLink,"
     "description"  # Contains Message ID for exfil'd email attachments
@@ -153,10 +155,12 @@ def get_file_metadata(file_id: str) -> dict[str, Any]:
         MiseError: On API failure
     """
     client = get_sync_client()
-    return client.get_json(
+    metadata: dict[str, Any] = client.get_json(
         f"{_DRIVE_API}/{file_id}",
         params={"fields": FILE_METADATA_FIELDS, "supportsAllDrives": "true"},
     )
+    remember_metadata([metadata])
+    return metadata
 
 
 @with_retry(max_attempts=3, delay_ms=1000)
@@ -185,7 +189,12 @@ def export_file(file_id: str, mime_type: str) -> bytes:
 
 
 @with_retry(max_attempts=3, delay_ms=1000)
-def download_file(file_id: str, max_memory_size: int = STREAMING_THRESHOLD_BYTES) -> bytes:
+def download_file(
+    file_id: str,
+    max_memory_size: int = STREAMING_THRESHOLD_BYTES,
+    *,
+    file_size: int | None = None,
+) -> bytes:
     """
     Download file content (for binary/non-native files).
 
@@ -195,6 +204,8 @@ def download_file(file_id: str, max_memory_size: int = STREAMING_THRESHOLD_BYTES
     Args:
         file_id: The file ID
         max_memory_size: Maximum size to load into memory (default: 50MB)
+        file_size: Size from metadata the caller already holds — skips the
+            size query
 
     Returns:
         File content as bytes
@@ -202,14 +213,9 @@ def download_file(file_id: str, max_memory_size: int = STREAMING_THRESHOLD_BYTES
     Raises:
         MiseError: If file too large for memory, or on API failure
     """
-    # Check size first
     client = get_sync_client()
-    metadata = client.get_json(
-        f"{_DRIVE_API}/{file_id}",
-        params={"fields": "size", "supportsAllDrives": "true"},
-    )
-
-    file_size = int(metadata.get("size", 0))
+    if file_size is None:
+        file_size = get_file_size(file_id)
     if file_size > max_memory_size:
         raise MiseError(
             ErrorKind.INVALID_INPUT,
@@ -226,7 +232,27 @@ def download_file(file_id: str, max_memory_size: int = STREAMING_THRESHOLD_BYTES
 
 
 @with_retry(max_attempts=3, delay_ms=1000)
-def download_file_to_temp(file_id: str, suffix: str = "") -> Path:
+def stream_file(file_id: str, file_obj: Any) -> None:
+    """
+    Stream file content into a binary file object (memory-safe, no size query).
+
+    Every attempt starts the file over (seek(0) + truncate()), so a retry
+    never appends to a partial download. Pass a workspace DepositStream to
+    land the bytes straight in the deposit folder.
+
+    Raises:
+        MiseError: On API failure
+    """
+    file_obj.seek(0)
+    file_obj.truncate()
+    get_sync_client().stream_to_file(
+        f"{_DRIVE_API}/{file_id}",
+        file_obj,
+        params={"alt": "media", "supportsAllDrives": "true"},
+    )
+
+
+def download_file_to_temp(file_id: str, suffix: str = "", *, file_size: int | None = None) -> Path:
     """
     Download file content to a temporary file (streaming, memory-safe).
 
@@ -236,6 +262,8 @@ def download_file_to_temp(file_id: str, suffix: str = "") -> Path:
     Args:
         file_id: The file ID
         suffix: File suffix (e.g., ".pdf", ".pptx")
+        file_size: Size from metadata; very large files are fetched as
+            concurrent byte ranges (see drive_download)
 
     Returns:
         Path to temp file containing downloaded content
@@ -243,18 +271,13 @@ def download_file_to_temp(file_id: str, suffix: str = "") -> Path:
     Raises:
         MiseError: On API failure
     """
-    client = get_sync_client()
-
-    # Create temp file
     tmp = tempfile.NamedTemporaryFile(suffix=suffix, delete=False)
     tmp_path = Path(tmp.name)
 
     try:
-        client.stream_to_file(
-            f"{_DRIVE_API}/{file_id}",
-            tmp,
-            params={"alt": "media"},
-        )
+        from adapters.drive_download import download_segmented  # imports this module
+        if not download_segmented(file_id, tmp_path, file_size):
+            stream_file(file_id, tmp)
         tmp.close()
         return tmp_path
     except Exception:
@@ -332,6 +355,7 @@ def search_files(
 
         response = client.get_json(f"{_DRIVE_API}", params=params)
         pages += 1
+        remember_metadata(response.get("files", []))
 
         for file in response.get("files", []):
             owners = [
@@ -447,8 +471,9 @@ def upload_file_content(file_id: str, content: bytes, mime_type: str) -> dict[st
     )
 
 
-# Fields for folder listing — name, ID, and MIME type is all we need
-FOLDER_LIST_FIELDS = "nextPageToken,files(id,name,mimeType)"
+# Fields for folder listing — the listing needs name, ID and MIME type; the rest
+# lets fetch_drive route a listed file without its own files.get (drive_meta_cache)
+FOLDER_LIST_FIELDS = "nextPageToken,files(id,name,mimeType,createdTime,modifiedTime,size,webViewLink,description)"
 
 # Max pages to fetch eagerly (3 pages × 100 items = 300 items)
 FOLDER_LIST_MAX_PAGES = 3
@@ -474,6 +499,9 @@ def list_folder(folder_id: str) -> FolderListing:
     Raises:
         MiseError: On API failure
     """
+    from adapters.drive_mirror import mirror_list_folder  # opt-in mirror; imports us
+    if (mirrored := mirror_list_folder(folder_id)) is not None:
+        return mirrored
     client = get_sync_client()
 
     query = f"'{folder_id}' in parents and trashed = false"
@@ -498,6 +526,7 @@ def list_folder(folder_id: str) -> FolderListing:
 
         response = client.get_json(f"{_DRIVE_API}", params=params)
         pages_fetched += 1
+        remember_metadata(response.get("files", []))
 
         for item in response.get("files", []):
             if item.get("mimeType") == GOOGLE_FOLDER_MIME:
@@ -591,148 +620,6 @@ def list_folder_recursive(
     return _traverse(folder_id, folder_name, 0)
 
 
-# =============================================================================
-# PRE-EXFIL LOOKUP
-# =============================================================================
-
-_email_attachments_folder_id: str | None = None
-_email_attachments_folder_checked: bool = False
-
-
-def _get_email_attachments_folder_id() -> str | None:
-    """
-    Get the Email Attachments folder ID.
-
-    Checks in order:
-    1. MISE_EMAIL_ATTACHMENTS_FOLDER_ID env var
-    2. Auto-discover folder named "Email Attachments" in Drive
-
-    Returns None if not configured and can't auto-discover.
-    Cached manually (not lru_cache) so None results aren't cached permanently —
-    allows re-discovery if the folder is created after server start.
-    """
-    global _email_attachments_folder_id, _email_attachments_folder_checked
-
-    if _email_attachments_folder_checked:
-        return _email_attachments_folder_id
-
-    # Check env var first
-    folder_id = os.environ.get("MISE_EMAIL_ATTACHMENTS_FOLDER_ID")
-    if folder_id:
-        _email_attachments_folder_id = folder_id
-        _email_attachments_folder_checked = True
-        return folder_id
-
-    # Auto-discover by name
-    try:
-        client = get_sync_client()
-        response = client.get_json(
-            f"{_DRIVE_API}",
-            params={
-                "q": "name = 'Email Attachments' and mimeType = 'application/vnd.google-apps.folder' and trashed = false",
-                "pageSize": "1",
-                "fields": "files(id)",
-            },
-        )
-        files = response.get("files", [])
-        if files:
-            discovered_id: str = files[0]["id"]
-            _email_attachments_folder_id = discovered_id
-            _email_attachments_folder_checked = True
-            return discovered_id
-    except Exception:
-        pass  # Don't cache failures — retry next call
-
-    return None
-
-
-@with_retry(max_attempts=3, delay_ms=1000)
-def lookup_exfiltrated(message_ids: list[str]) -> dict[str, list[dict[str, Any]]]:
-    """
-    Look up which messages have attachments pre-exfiltrated to Drive.
-
-    The Apps Script exfiltrator stores metadata in file descriptions:
-        Message ID: 19abc123...
-        From: alice@example.com
-        Subject: Budget analysis
-
-    This queries the Email Attachments folder for files matching these
-    message IDs. Found files are already indexed by Drive and can be
-    fetched directly (faster than Gmail API download + extraction).
-
-    Args:
-        message_ids: List of Gmail message IDs to look up
-
-    Returns:
-        Dict mapping message_id to list of Drive file metadata:
-        {
-            'msg123': [
-                {'file_id': '1ABC...', 'name': 'report.pdf', 'mimeType': 'application/pdf'},
-                ...
-            ],
-            ...
-        }
-        Messages with no exfiltrated attachments won't have a key.
-    """
-    if not message_ids:
-        return {}
-
-    folder_id = _get_email_attachments_folder_id()
-    if not folder_id:
-        return {}
-
-    client = get_sync_client()
-    result: dict[str, list[dict[str, Any]]] = {}
-
-    # Query for all message IDs at once using fullText search
-    # Message IDs are unique (Gmail's hex format)
-    # Files are in dated subfolders, so search globally (not just direct children)
-    # Escape message IDs to prevent query injection via crafted descriptions
-    from validation import escape_drive_query
-    if len(message_ids) == 1:
-        query = f"fullText contains 'Message ID: {escape_drive_query(message_ids[0])}'"
-    else:
-        # Batch query with OR
-        id_clauses = " or ".join(
-            f"fullText contains 'Message ID: {escape_drive_query(mid)}'" for mid in message_ids
-        )
-        query = f"({id_clauses})"
-
-    try:
-        response = client.get_json(
-            f"{_DRIVE_API}",
-            params={
-                "q": query,
-                "fields": "files(id,name,mimeType,description)",
-                "pageSize": "1000",  # Should be plenty for a batch
-            },
-        )
-
-        files = response.get("files", [])
-
-        # Group files by message ID (extracted from description)
-        for f in files:
-            description = f.get("description", "")
-            # Extract message ID from description
-            for line in description.split("\n"):
-                if line.startswith("Message ID:"):
-                    msg_id = line.split(":", 1)[1].strip()
-                    if msg_id in message_ids:
-                        if msg_id not in result:
-                            result[msg_id] = []
-                        result[msg_id].append({
-                            "file_id": f["id"],
-                            "name": f["name"],
-                            "mimeType": f.get("mimeType", ""),
-                        })
-                    break
-
-    except Exception:
-        pass  # Silently fail - pre-exfil is optional optimization
-
-    return result
-
-
 # =============================================================================
 # COMMENTS
 # =============================================================================
@@ -0,0 +1,243 @@
+"""
+Pre-exfil lookup — which Gmail messages' attachments already sit in Drive.
+
+The Apps Script exfiltrator (apps-script/) copies attachments into the
+Email Attachments folder and tags each file with exact-match properties:
+the Gmail message id and the attachment's content hash. Thread fetches ask
+which of their messages have such copies, so they can fetch the Drive file
+instead of downloading and converting the attachment again.
+
+The tags are public `properties`, not `appProperties`: those are private to
+the Cloud project that wrote them, the script's project is not mise's OAuth
+client, and a query for them would never match.
+
+The lookup used to be one `fullText contains 'Message ID: …' or …` query
+for the whole thread, read from a single unpaginated page and parsed back
+out of descriptions — slow to evaluate and unbounded in length on long
+threads. Now:
+
+- ids go LOOKUP_CHUNK at a time into `properties has {…}` queries, run
+  in parallel and paginated to the end;
+- ids the tags don't answer — files the exfiltrator wrote before it tagged
+  them, until `backfillLookupProperties()` has run — fall back to the old
+  fullText form, chunked the same way (MISE_EXFIL_FULLTEXT_FALLBACK=0 turns
+  this off once the backfill is done);
+- every answered id, found or not, is memoised for MEMO_TTL_SECONDS, so a
+  re-fetched thread or a follow-up attachment fetch asks nothing.
+
+Split from adapters/drive.py 2026-10-18 (module-size ratchet): the lookup is
+its own concern, with its own folder discovery and memo.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from adapters.drive import _DRIVE_API
+from adapters.http_client import get_sync_client
+from retry import with_retry
+from telemetry import count, run_in_context
+from validation import escape_drive_query
+
+# properties keys the exfiltrator writes — keep in step with apps-script/src/Code.gs
+MESSAGE_ID_PROPERTY = "miseMessageId"
+CONTENT_HASH_PROPERTY = "miseContentHash"
+
+# Ids per query. Each clause is ~70 characters; 25 keeps a query far from
+# Drive's URL limits while an 80-message thread still needs only four.
+LOOKUP_CHUNK = 25
+LOOKUP_WORKERS = 4
+FULLTEXT_FALLBACK = os.environ.get("MISE_EXFIL_FULLTEXT_FALLBACK", "1") != "0"
+
+# The exfiltrator runs on a timer, so a miss can turn into a hit; the memo
+# forgets after a while rather than hiding a new copy all session.
+MEMO_TTL_SECONDS = 600.0
+MEMO_MAX_ENTRIES = 5000
+
+_SHORTCUT_MIME = "application/vnd.google-apps.shortcut"
+_LOOKUP_FIELDS = "nextPageToken,files(id,name,mimeType,description,properties)"
+
+_memo: "OrderedDict[str, tuple[float, list[dict[str, Any]]]]" = OrderedDict()
+_memo_lock = threading.Lock()
+
+_email_attachments_folder_id: str | None = None
+_email_attachments_folder_checked: bool = False
+
+
+def _get_email_attachments_folder_id() -> str | None:
+    """
+    Get the Email Attachments folder ID.
+
+    Checks in order:
+    1. MISE_EMAIL_ATTACHMENTS_FOLDER_ID env var
+    2. Auto-discover folder named "Email Attachments" in Drive
+
+    Returns None if not configured and can't auto-discover.
+    Cached manually (not lru_cache) so None results aren't cached permanently —
+    allows re-discovery if the folder is created after server start.
+    """
+    global _email_attachments_folder_id, _email_attachments_folder_checked
+
+    if _email_attachments_folder_checked:
+        return _email_attachments_folder_id
+
+    # Check env var first
+    folder_id = os.environ.get("MISE_EMAIL_ATTACHMENTS_FOLDER_ID")
+    if folder_id:
+        _email_attachments_folder_id = folder_id
+        _email_attachments_folder_checked = True
+        return folder_id
+
+    # Auto-discover by name
+    try:
+        client = get_sync_client()
+        response = client.get_json(
+            f"{_DRIVE_API}",
+            params={
+                "q": "name = 'Email Attachments' and mimeType = 'application/vnd.google-apps.folder' and trashed = false",
+                "pageSize": "1",
+                "fields": "files(id)",
+            },
+        )
+        files = response.get("files", [])
+        if files:
+            discovered_id: str = files[0]["id"]
+            _email_attachments_folder_id = discovered_id
+            _email_attachments_folder_checked = True
+            return discovered_id
+    except Exception:
+        pass  # Don't cache failures — retry next call
+
+    return None
+
+
+def lookup_exfiltrated(message_ids: list[str]) -> dict[str, list[dict[str, Any]]]:
+    """
+    Look up which messages have attachments pre-exfiltrated to Drive.
+
+    Args:
+        message_ids: List of Gmail message IDs to look up
+
+    Returns:
+        Dict mapping message_id to list of Drive file metadata:
+        {
+            'msg123': [
+                {'file_id': '1ABC...', 'name': 'report.pdf', 'mimeType': 'application/pdf'},
+                ...
+            ],
+            ...
+        }
+        Messages with no exfiltrated attachments won't have a key. Never
+        raises — pre-exfil is an optimisation, and a failed chunk just
+        leaves its messages to the Gmail download.
+    """
+    if not message_ids:
+        return {}
+
+    if not _get_email_attachments_folder_id():
+        return {}
+
+    result: dict[str, list[dict[str, Any]]] = {}
+    pending: list[str] = []
+    for message_id in dict.fromkeys(message_ids):
+        memoised = _recall(message_id)
+        if memoised is None:
+            pending.append(message_id)
+        elif memoised:
+            result[message_id] = memoised
+    count("exfil_lookup_memo_hits", len(message_ids) - len(pending))
+
+    chunks = [pending[i:i + LOOKUP_CHUNK] for i in range(0, len(pending), LOOKUP_CHUNK)]
+    if not chunks:
+        return result
+    lookup = run_in_context(_lookup_chunk)
+    with ThreadPoolExecutor(max_workers=min(LOOKUP_WORKERS, len(chunks))) as pool:
+        for found in pool.map(lookup, chunks):
+            result.update(found)
+    return result
+
+
+def clear_memo() -> None:
+    """Forget every memoised answer."""
+    with _memo_lock:
+        _memo.clear()
+
+
+def _lookup_chunk(message_ids: list[str]) -> dict[str, list[dict[str, Any]]]:
+    """One chunk: tagged files first, then fullText for the ids still unanswered."""
+    try:
+        found = _query_exfil(" or ".join(
+            f"properties has {{ key='{MESSAGE_ID_PROPERTY}' and value='{escape_drive_query(mid)}' }}"
+            for mid in message_ids
+        ), message_ids)
+        untagged = [mid for mid in message_ids if mid not in found]
+        if untagged and FULLTEXT_FALLBACK:
+            found.update(_query_exfil(" or ".join(
+                f"fullText contains 'Message ID: {escape_drive_query(mid)}'" for mid in untagged
+            ), untagged))
+    except Exception:
+        return {}  # Silently fail — pre-exfil is optional optimization; nothing memoised
+    _memoise(message_ids, found)
+    return found
+
+
+@with_retry(max_attempts=3, delay_ms=1000)
+def _query_exfil(id_clauses: str, message_ids: list[str]) -> dict[str, list[dict[str, Any]]]:
+    """Every page of one lookup query, grouped by the message id each file names."""
+    client = get_sync_client()
+    wanted = set(message_ids)
+    found: dict[str, list[dict[str, Any]]] = {}
+    page_token: str | None = None
+    while True:
+        params: dict[str, Any] = {
+            # Shortcuts the exfiltrator makes for linked files name the message too
+            "q": f"({id_clauses}) and mimeType != '{_SHORTCUT_MIME}' and trashed = false",
+            "fields": _LOOKUP_FIELDS,
+            "pageSize": "1000",
+        }
+        if page_token:
+            params["pageToken"] = page_token
+        response = client.get_json(f"{_DRIVE_API}", params=params)
+        for f in response.get("files", []):
+            message_id = _message_id_of(f)
+            if message_id in wanted:
+                found.setdefault(message_id, []).append({
+                    "file_id": f["id"],
+                    "name": f["name"],
+                    "mimeType": f.get("mimeType", ""),
+                })
+        page_token = response.get("nextPageToken")
+        if not page_token:
+            return found
+
+
+def _message_id_of(file: dict[str, Any]) -> str | None:
+    """The message id a file was exfiltrated from: its tag, else its description."""
+    tagged = (file.get("properties") or {}).get(MESSAGE_ID_PROPERTY)
+    if tagged:
+        return str(tagged)
+    for line in (file.get("description") or "").split("\n"):
+        if line.startswith("Message ID:"):
+            return line.split(":", 1)[1].strip()
+    return None
+
+
+def _recall(message_id: str) -> list[dict[str, Any]] | None:
+    with _memo_lock:
+        entry = _memo.get(message_id)
+        if entry is None or time.monotonic() - entry[0] > MEMO_TTL_SECONDS:
+            return None
+        return [dict(f) for f in entry[1]]
+
+
+def _memoise(message_ids: list[str], found: dict[str, list[dict[str, Any]]]) -> None:
+    now = time.monotonic()
+    with _memo_lock:
+        for message_id in message_ids:
+            _memo[message_id] = (now, found.get(message_id, []))
+            _memo.move_to_end(message_id)
+        while len(_memo) > MEMO_MAX_ENTRIES:
+            _memo.popitem(last=False)
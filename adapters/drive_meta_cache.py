@@ -0,0 +1,64 @@
+"""
+Drive metadata cache — routing metadata from calls already made this session.
+
+fetch_drive routes by mimeType, so every Drive fetch used to start with a
+files.get — even for an id the agent took from a search a few seconds
+earlier, whose response already carried everything routing needs.
+search_files, list_folder and get_file_metadata feed their file records
+in here; fetch_drive recalls one to start the download at once and runs its
+files.get alongside as a freshness check instead of in front of it.
+
+Small and short-lived by design: bounded to MAX_ENTRIES (least recently
+used goes first) and TTL_SECONDS old. Every field mask that feeds it must
+request ROUTING_FIELDS — a record missing one would route like a full
+files.get but deposit less (no email context, no dates).
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from typing import Any
+
+TTL_SECONDS = 600.0
+MAX_ENTRIES = 2000
+
+# What the fetch handlers read from metadata. Drive omits empty fields
+# (no description, no size for Workspace files), so this is a contract on
+# the field masks, not on each record.
+ROUTING_FIELDS = ("id", "name", "mimeType", "createdTime", "modifiedTime", "size", "webViewLink", "description")
+
+_entries: "OrderedDict[str, tuple[float, dict[str, Any]]]" = OrderedDict()
+_lock = threading.Lock()
+
+
+def remember(files: Iterable[dict[str, Any]]) -> None:
+    """Cache Drive file records from a response whose mask covers ROUTING_FIELDS."""
+    now = time.monotonic()
+    with _lock:
+        for record in files:
+            if file_id := record.get("id"):
+                _entries[file_id] = (now, record)
+                _entries.move_to_end(file_id)
+        while len(_entries) > MAX_ENTRIES:
+            _entries.popitem(last=False)
+
+
+def recall(file_id: str) -> dict[str, Any] | None:
+    """The cached record for file_id, or None when absent or older than TTL_SECONDS."""
+    with _lock:
+        entry = _entries.get(file_id)
+        if entry is None:
+            return None
+        stored, record = entry
+        if time.monotonic() - stored > TTL_SECONDS:
+            del _entries[file_id]
+            return None
+        _entries.move_to_end(file_id)
+        return dict(record)
+
+
+def clear() -> None:
+    """Drop every entry."""
+    with _lock:
+        _entries.clear()
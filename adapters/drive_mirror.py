@@ -0,0 +1,493 @@
+"""
+Local Drive metadata mirror — folder listings and metadata search from SQLite.
+
+Agents list the same project folders and search by name over and over, and a
+folder tree of a few thousand items costs dozens of paginated files.list
+calls. With MISE_DRIVE_MIRROR set, the metadata of every file the user can
+see (id, name, parents, mimeType, created/modifiedTime, owners, link,
+description) lives in an SQLite mirror under MIRROR_DIR, one per account
+(keyed by the about.user permissionId) so a guest token, an ambient service
+account or a re-auth as someone else never sees another identity's files:
+
+- list_folder: answered locally for any folder the mirror knows, so
+  list_folder_recursive renders whole trees without a round trip per level.
+- search_files queries: mirror_search compiles name/mimeType/owners/parents/
+  trashed/created/modifiedTime predicates (and, or, not, parentheses) to SQL.
+  fullText contains — and any clause the mirror has no column for — returns
+  None and the caller queries Drive live.
+
+Lifecycle:
+- Seed: the first mirrored call starts a background crawl of files.list
+  over all drives, after reading changes.getStartPageToken so edits landing
+  mid-crawl are replayed. Calls stay live until the crawl finishes.
+- Keep current: calls replay changes.list from the stored page token, at
+  most once per MIN_SYNC_SECONDS so a tree walk pays for one sync, not one
+  per folder. Removed files are dropped; trashed ones are kept, flagged.
+- Rebuild: a page token Drive no longer recognises wipes and reseeds.
+
+Search results come back most recently modified first; Drive's own ranking
+for a query without orderBy is unspecified, so the order can differ from a
+live search while the set of files is the same.
+"""
+
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from datetime import timezone
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+from models import (
+    DriveSearchResult, DriveSearchResults, ErrorKind, FolderFile, FolderItem,
+    FolderListing, MiseError,
+)
+from retry import with_retry
+from telemetry import count
+from adapters.http_client import get_sync_client
+from adapters.drive import (
+    _DRIVE_API, FOLDER_LIST_MAX_PAGES, FOLDER_LIST_PAGE_SIZE, GOOGLE_FOLDER_MIME,
+    _parse_datetime, parse_email_context,
+)
+
+logger = logging.getLogger(__name__)
+
+MIRROR_DIR = Path.home() / ".cache" / "mise"
+ENABLED = os.environ.get("MISE_DRIVE_MIRROR", "") not in ("", "0")
+MIN_SYNC_SECONDS = 5.0
+
+_ABOUT_API = "https://www.googleapis.com/drive/v3/about"
+_CHANGES_API = "https://www.googleapis.com/drive/v3/changes"
+_FILE_FIELDS = (
+    "id,name,mimeType,parents,createdTime,modifiedTime,"
+    "owners(displayName,emailAddress),webViewLink,description,trashed"
+)
+_ALL_DRIVES = {"supportsAllDrives": "true", "includeItemsFromAllDrives": "true"}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS state (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS files (
+    id TEXT PRIMARY KEY, name TEXT NOT NULL, mime_type TEXT NOT NULL,
+    created REAL, modified REAL, owner_emails TEXT NOT NULL,
+    trashed INTEGER NOT NULL, meta BLOB NOT NULL);
+CREATE TABLE IF NOT EXISTS parents (file_id TEXT NOT NULL, parent_id TEXT NOT NULL);
+CREATE INDEX IF NOT EXISTS parents_parent ON parents (parent_id);
+CREATE INDEX IF NOT EXISTS parents_file ON parents (file_id);
+"""
+
+_seed_lock = threading.Lock()
+# Per mirror file: a switch of identity mustn't inherit the last one's sync
+_last_sync: dict[Path, float] = {}
+# (client, permissionId) — a new client (re-auth, new identity) looks again
+_account: tuple[Any, str] | None = None
+
+
+class _Unsupported(Exception):
+    """The query needs something only the live API can evaluate."""
+
+
+def mirror_list_folder(folder_id: str) -> FolderListing | None:
+    """
+    list_folder from the mirror — same ordering, cap and truncation flag.
+
+    Returns None when the mirror is off, unseeded, or doesn't know the
+    folder (an unknown id must still 404 live, not list as empty).
+    """
+    conn = _ready()
+    if conn is None:
+        return None
+    with closing(conn):
+        if folder_id == "root":
+            folder_id = _get_state(conn, "root_id") or folder_id
+        known = conn.execute(
+            "SELECT 1 FROM files WHERE id = ? UNION ALL "
+            "SELECT 1 FROM parents WHERE parent_id = ? LIMIT 1", (folder_id, folder_id),
+        ).fetchone()
+        if not known:
+            return None
+        cap = FOLDER_LIST_MAX_PAGES * FOLDER_LIST_PAGE_SIZE
+        rows = conn.execute(
+            "SELECT id, name, mime_type FROM files WHERE trashed = 0 AND id IN "
+            "(SELECT file_id FROM parents WHERE parent_id = ?) "
+            "ORDER BY name COLLATE NOCASE LIMIT ?", (folder_id, cap + 1),
+        ).fetchall()
+    count("drive_mirror_hits")
+
+    subfolders = [FolderItem(id=i, name=n) for i, n, m in rows[:cap] if m == GOOGLE_FOLDER_MIME]
+    files = [FolderFile(id=i, name=n, mime_type=m) for i, n, m in rows[:cap] if m != GOOGLE_FOLDER_MIME]
+    return FolderListing(
+        subfolders=subfolders,
+        files=files,
+        file_count=len(files),
+        folder_count=len(subfolders),
+        item_count=len(subfolders) + len(files),
+        types=sorted({f.mime_type for f in files if f.mime_type}),
+        truncated=len(rows) > cap,
+    )
+
+
+def mirror_search(query: str, max_results: int = 20, folder_id: str | None = None) -> DriveSearchResults | None:
+    """
+    search_files from the mirror, for queries it can evaluate exactly.
+
+    Args:
+        query: Drive search query
+        max_results: Maximum number of results
+        folder_id: Optional folder ID scoping results to immediate children
+
+    Returns:
+        DriveSearchResults, most recently modified first, or None — the
+        caller then searches live.
+    """
+    if folder_id is not None:
+        query = f"{query} and '{folder_id}' in parents"
+    try:
+        where, params = _Parser(query).parse()
+    except _Unsupported:
+        return None
+    conn = _ready()
+    if conn is None:
+        return None
+    with closing(conn):
+        rows = conn.execute(
+            f"SELECT meta FROM files WHERE {where} ORDER BY modified DESC LIMIT ?",
+            [*params, max_results + 1],
+        ).fetchall()
+    count("drive_mirror_hits")
+    return DriveSearchResults(
+        results=[_search_result(orjson.loads(row[0])) for row in rows[:max_results]],
+        truncated=len(rows) > max_results,
+    )
+
+
+def _search_result(meta: dict[str, Any]) -> DriveSearchResult:
+    """The DriveSearchResult search_files would build from the same metadata."""
+    description = meta.get("description")
+    return DriveSearchResult(
+        file_id=meta["id"],
+        name=meta.get("name", ""),
+        mime_type=meta.get("mimeType", ""),
+        created_time=_parse_datetime(meta.get("createdTime")),
+        modified_time=_parse_datetime(meta.get("modifiedTime")),
+        owners=[o.get("displayName", o.get("emailAddress", "")) for o in meta.get("owners", [])],
+        web_view_link=meta.get("webViewLink"),
+        description=description,
+        email_context=parse_email_context(description),
+    )
+
+
+# =============================================================================
+# QUERY COMPILER
+# =============================================================================
+
+_TOKEN = re.compile(r"\s*(?:'((?:[^'\\]|\\.)*)'|(!=|<=|>=|[=<>()])|([A-Za-z]+))")
+_COMPARISONS = {"=", "!=", "<", "<=", ">", ">="}
+_TIME_COLUMNS = {"createdtime": "created", "modifiedtime": "modified"}
+
+
+class _Parser:
+    """Drive query language → SQL over the files table.
+
+    expr := term ('or' term)* ; term := factor ('and' factor)* ;
+    factor := 'not' factor | '(' expr ')' | predicate
+    """
+
+    def __init__(self, query: str) -> None:
+        self.tokens: list[tuple[str, str]] = []
+        pos = 0
+        query = query.strip()
+        while pos < len(query):
+            match = _TOKEN.match(query, pos)
+            if not match or match.end() == pos:
+                raise _Unsupported(query[pos:])
+            string, symbol, word = match.groups()
+            if string is not None:
+                self.tokens.append(("str", re.sub(r"\\(.)", r"\1", string)))
+            elif symbol is not None:
+                self.tokens.append(("sym", symbol))
+            else:
+                self.tokens.append(("word", word.lower()))
+            pos = match.end()
+        self.i = 0
+        self.params: list[Any] = []
+
+    def parse(self) -> tuple[str, list[Any]]:
+        if not self.tokens:
+            raise _Unsupported("empty query")
+        sql = self._expr()
+        if self.i != len(self.tokens):
+            raise _Unsupported("trailing tokens")
+        return sql, self.params
+
+    def _peek(self) -> tuple[str, str] | None:
+        return self.tokens[self.i] if self.i < len(self.tokens) else None
+
+    def _take(self) -> tuple[str, str]:
+        token = self._peek()
+        if token is None:
+            raise _Unsupported("unexpected end")
+        self.i += 1
+        return token
+
+    def _expr(self) -> str:
+        parts = [self._term()]
+        while self._peek() == ("word", "or"):
+            self.i += 1
+            parts.append(self._term())
+        return parts[0] if len(parts) == 1 else "(" + " OR ".join(parts) + ")"
+
+    def _term(self) -> str:
+        parts = [self._factor()]
+        while self._peek() == ("word", "and"):
+            self.i += 1
+            parts.append(self._factor())
+        return " AND ".join(parts)
+
+    def _factor(self) -> str:
+        token = self._take()
+        if token == ("word", "not"):
+            return f"NOT ({self._factor()})"
+        if token == ("sym", "("):
+            inner = self._expr()
+            if self._take() != ("sym", ")"):
+                raise _Unsupported("unbalanced parentheses")
+            return f"({inner})"
+        if token[0] == "str":
+            if self._take() != ("word", "in"):
+                raise _Unsupported("expected 'in'")
+            return self._membership(token[1], self._take())
+        return self._predicate(token)
+
+    def _membership(self, value: str, collection: tuple[str, str]) -> str:
+        if collection == ("word", "parents"):
+            if value == "root":
+                return ("id IN (SELECT file_id FROM parents WHERE parent_id = "
+                        "(SELECT value FROM state WHERE key = 'root_id'))")
+            self.params.append(value)
+            return "id IN (SELECT file_id FROM parents WHERE parent_id = ?)"
+        # 'me' needs the signed-in address, which the mirror doesn't hold
+        if collection == ("word", "owners") and value != "me":
+            self.params.append(f"% {value.lower()} %")
+            return "owner_emails LIKE ?"
+        raise _Unsupported(f"'{value}' in {collection[1]}")
+
+    def _predicate(self, field: tuple[str, str]) -> str:
+        op_token = self._take()
+        op = op_token[1]
+        kind, value = self._take()
+        if field[0] != "word" or (op not in _COMPARISONS and op_token != ("word", "contains")):
+            raise _Unsupported(f"{field[1]} {op}")
+        name = field[1]
+
+        if name == "trashed" and op in ("=", "!=") and kind == "word" and value in ("true", "false"):
+            return f"trashed {op} {int(value == 'true')}"
+        if kind != "str":
+            raise _Unsupported(f"{name} {op} {value}")
+        if name in ("name", "mimetype") and op in ("=", "!=", "contains"):
+            column = "name" if name == "name" else "mime_type"
+            self.params.append(value)
+            if op == "contains":
+                # Drive matches a name term by prefix of its words, not anywhere
+                return "name_has_prefix(name, ?)" if column == "name" else "instr(mime_type, ?) > 0"
+            return f"{column} {op} ?"
+        if name in _TIME_COLUMNS and op in _COMPARISONS:
+            moment = _parse_datetime(value)
+            if moment is None:
+                raise _Unsupported(f"{name} {op} {value}")
+            # Drive reads a zone-less time as UTC
+            self.params.append(moment.replace(tzinfo=moment.tzinfo or timezone.utc).timestamp())
+            return f"{_TIME_COLUMNS[name]} {op} ?"
+        raise _Unsupported(name)
+
+
+_WORD_START = re.compile(r"(?<![0-9a-z])(?=[0-9a-z])")
+
+
+def _name_has_prefix(name: str, term: str) -> bool:
+    """Drive's name contains: the term starts at the beginning of some word."""
+    name, term = name.lower(), term.lower()
+    return any(name.startswith(term, m.start()) for m in _WORD_START.finditer(name))
+
+
+# =============================================================================
+# STORAGE, SEED AND SYNC
+# =============================================================================
+
+
+def _mirror_path() -> Path:
+    """The signed-in account's mirror file."""
+    global _account
+    client = get_sync_client()
+    if _account is None or _account[0] is not client:
+        _account = (client, re.sub(r"[^\w-]", "_", _permission_id()))
+    return MIRROR_DIR / f"drive_mirror-{_account[1]}.sqlite3"
+
+
+@with_retry(max_attempts=3, delay_ms=1000)
+def _permission_id() -> str:
+    about = get_sync_client().get_json(_ABOUT_API, params={"fields": "user(permissionId)"})
+    return str(about["user"]["permissionId"])
+
+
+def _connect() -> sqlite3.Connection:
+    path = _mirror_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path, timeout=30)
+    # WAL: listings read while a seed or sync writes
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(_SCHEMA)
+    conn.create_function("name_has_prefix", 2, _name_has_prefix, deterministic=True)
+    return conn
+
+
+def _get_state(conn: sqlite3.Connection, key: str) -> str | None:
+    row = conn.execute("SELECT value FROM state WHERE key = ?", (key,)).fetchone()
+    return row[0] if row else None
+
+
+def _set_state(conn: sqlite3.Connection, key: str, value: str) -> None:
+    conn.execute("INSERT OR REPLACE INTO state VALUES (?, ?)", (key, value))
+
+
+def _reset(conn: sqlite3.Connection) -> None:
+    for table in ("state", "files", "parents"):
+        conn.execute(f"DELETE FROM {table}")
+    conn.commit()
+
+
+def _ready() -> sqlite3.Connection | None:
+    """An open, current mirror connection — or None, starting a seed if needed."""
+    if not ENABLED:
+        return None
+    try:
+        conn = _connect()
+        if _sync(conn):
+            return conn
+        conn.close()
+    except (sqlite3.Error, MiseError) as e:
+        logger.info("Drive mirror unavailable, querying live: %s", e)
+        return None
+    _start_seed()
+    return None
+
+
+def _store(conn: sqlite3.Connection, file_id: str, meta: dict[str, Any] | None) -> None:
+    """Replace one file's rows; None drops it."""
+    conn.execute("DELETE FROM files WHERE id = ?", (file_id,))
+    conn.execute("DELETE FROM parents WHERE file_id = ?", (file_id,))
+    if meta is None:
+        return
+    created, modified = (_parse_datetime(meta.get(k)) for k in ("createdTime", "modifiedTime"))
+    emails = " ".join(o.get("emailAddress", "").lower() for o in meta.get("owners", []))
+    conn.execute(
+        "INSERT INTO files VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        (file_id, meta.get("name", ""), meta.get("mimeType", ""),
+         created.timestamp() if created else None, modified.timestamp() if modified else None,
+         f" {emails} ", int(bool(meta.get("trashed"))), orjson.dumps(meta)),
+    )
+    conn.executemany(
+        "INSERT INTO parents VALUES (?, ?)", [(file_id, p) for p in meta.get("parents", [])],
+    )
+
+
+def _sync(conn: sqlite3.Connection) -> bool:
+    """Replay changes since the stored page token. False if there's no usable mirror."""
+    page_token = _get_state(conn, "page_token")
+    if page_token is None:
+        return False
+    path = _mirror_path()
+    if time.monotonic() - _last_sync.get(path, 0.0) < MIN_SYNC_SECONDS:
+        return True
+    try:
+        changes, page_token = _changes_since(page_token)
+    except MiseError as e:
+        if e.kind is not ErrorKind.NOT_FOUND:
+            raise
+        logger.info("Drive change token expired — rebuilding the mirror")
+        _reset(conn)
+        return False
+    for change in changes:
+        file = change.get("file")
+        _store(conn, change["fileId"], None if change.get("removed") or not file else file)
+    _set_state(conn, "page_token", page_token)
+    conn.commit()
+    _last_sync[path] = time.monotonic()
+    if changes:
+        count("drive_mirror_synced_files", len(changes))
+    return True
+
+
+@with_retry(max_attempts=3, delay_ms=1000)
+def _changes_since(page_token: str) -> tuple[list[dict[str, Any]], str]:
+    """Every change since page_token, and the token to resume from next time."""
+    client = get_sync_client()
+    changes: list[dict[str, Any]] = []
+    while True:
+        response = client.get_json(_CHANGES_API, params={
+            "pageToken": page_token, "pageSize": "1000", **_ALL_DRIVES,
+            "fields": f"nextPageToken,newStartPageToken,changes(fileId,removed,file({_FILE_FIELDS}))",
+        })
+        changes.extend(c for c in response.get("changes", []) if c.get("fileId"))
+        if "newStartPageToken" in response:
+            return changes, str(response["newStartPageToken"])
+        page_token = response["nextPageToken"]
+
+
+def _start_seed() -> None:
+    """Crawl every drive in the background, once."""
+    if not _seed_lock.locked():
+        threading.Thread(target=_seed, name="drive-mirror-seed", daemon=True).start()
+
+
+def _seed() -> None:
+    if not _seed_lock.acquire(blocking=False):
+        return
+    try:
+        client = get_sync_client()
+        # Before listing: whatever changes mid-crawl is replayed by the first sync
+        start = client.get_json(f"{_CHANGES_API}/startPageToken", params={"supportsAllDrives": "true"})
+        root = client.get_json(f"{_DRIVE_API}/root", params={"fields": "id"})
+        seeded = 0
+        with closing(_connect()) as conn:
+            _reset(conn)
+            for files in _crawl():
+                for meta in files:
+                    _store(conn, meta["id"], meta)
+                conn.commit()
+                seeded += len(files)
+            _set_state(conn, "root_id", root["id"])
+            _set_state(conn, "page_token", str(start["startPageToken"]))
+            conn.commit()
+        logger.info("Drive mirror seeded: %d files", seeded)
+    except Exception as e:
+        # Background and best-effort: calls simply stay live
+        logger.warning("Drive mirror seed failed: %s", e)
+    finally:
+        _seed_lock.release()
+
+
+def _crawl() -> Any:
+    """files.list over all drives, one page of metadata at a time."""
+    page_token: str | None = None
+    while True:
+        response = _list_page(page_token)
+        yield response.get("files", [])
+        page_token = response.get("nextPageToken")
+        if not page_token:
+            return
+
+
+@with_retry(max_attempts=3, delay_ms=1000)
+def _list_page(page_token: str | None) -> dict[str, Any]:
+    params: dict[str, Any] = {
+        "q": "trashed = false", "corpora": "allDrives", "pageSize": "1000",
+        "fields": f"nextPageToken,files({_FILE_FIELDS})", **_ALL_DRIVES,
+    }
+    if page_token:
+        params["pageToken"] = page_token
+    return get_sync_client().get_json(_DRIVE_API, params=params)
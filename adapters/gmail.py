@@ -15,6 +15,7 @@ import logging
 import re
 import tempfile
 
+import httpx
 import orjson
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
@@ -44,6 +45,7 @@ _GMAIL_API = "https://gmail.googleapis.com/gmail/v1/users/me"
 # Fields to request for threads — only what we need
 THREAD_FIELDS = (
     "id,"
+    "historyId,"
     "messages("
     "id,"
     "threadId,"
@@ -269,7 +271,9 @@ def fetch_thread(thread_id: str) -> GmailThreadData:
     Fetch complete thread data.
 
     Uses threads.get with format=full to get all messages in one call.
-    Full payload includes headers, body, and attachment metadata.
+    Full payload includes headers, body, and attachment metadata. Threads
+    known to be long, or whose one-shot fetch times out, are fetched message
+    by message instead (gmail_delta.fetch_thread_chunked) — same result.
 
     Args:
         thread_id: The thread ID (from URL or API)
@@ -280,12 +284,21 @@ def fetch_thread(thread_id: str) -> GmailThreadData:
     Raises:
         MiseError: On API failure (converted by @with_retry)
     """
+    from adapters.gmail_delta import fetch_thread_chunked, is_large_thread
+
+    if is_large_thread(thread_id):
+        return fetch_thread_chunked(thread_id)
+
     client = get_sync_client()
 
-    thread = client.get_json(
-        f"{_GMAIL_API}/threads/{thread_id}",
-        params={"format": "full", "fields": THREAD_FIELDS},
-    )
+    try:
+        thread = client.get_json(
+            f"{_GMAIL_API}/threads/{thread_id}",
+            params={"format": "full", "fields": THREAD_FIELDS},
+        )
+    except httpx.TimeoutException:
+        logger.info("threads.get for %s timed out, fetching it message by message", thread_id)
+        return fetch_thread_chunked(thread_id)
 
     # Parse messages
     messages = [_build_message(msg) for msg in thread.get("messages", [])]
@@ -297,6 +310,8 @@ def fetch_thread(thread_id: str) -> GmailThreadData:
         thread_id=thread_id,
         subject=subject,
         messages=messages,
+        history_id=thread.get("historyId"),
+        raw_messages=thread.get("messages", []),
     )
 
 
@@ -392,18 +407,8 @@ def search_threads(
     # Preserve snippets from list response — individual fetch with fields mask doesn't include them
     snippets_by_id = {t["id"]: t.get("snippet", "") for t in threads}
 
-    # Step 2: Fetch thread metadata individually
-    # Fields mask gives us payload parts tree (for attachment filenames)
-    # without message body data. Per-message snippet included so the result
-    # can reflect the LATEST message, not the thread-list snippet (which Gmail
-    # draws from an arbitrary message — observed misattributing authorship).
-    # Two levels of parts: calendar invites nest text/calendar inside
-    # multipart/alternative, so a one-level mask misses it (mise-pinodi).
-    search_fields = (
-        "id,messages(id,internalDate,labelIds,snippet,"
-        "payload(headers,mimeType,parts(filename,mimeType,body(attachmentId,size),"
-        "parts(filename,mimeType,body(attachmentId,size)))))"
-    )
+    # Step 2: Fetch thread metadata individually — one triage row each
+    from adapters.gmail_triage import SEARCH_FIELDS, thread_search_result
 
     results: list[GmailSearchResult] = []
     for thread in threads:
@@ -411,73 +416,15 @@ def search_threads(
         try:
             response = client.get_json(
                 f"{_GMAIL_API}/threads/{thread_id}",
-                params={"format": "full", "fields": search_fields},
+                params={"format": "full", "fields": SEARCH_FIELDS},
             )
         except Exception:
             # Skip failed threads, don't fail entire search
             continue
 
-        messages = response.get("messages", [])
-        if not messages:
-            continue
-
-        # First message has subject and sender
-        first_msg = messages[0]
-        payload = first_msg.get("payload", {})
-        headers = _parse_headers(payload.get("headers", []))
-
-        # Collect attachment names from all messages (filtered)
-        attachment_names: list[str] = []
-        for msg in messages:
-            msg_payload = msg.get("payload", {})
-            msg_attachments = parse_attachments_from_payload(msg_payload)
-            # Filter out trivial attachments
-            filtered = filter_attachments(msg_attachments)
-            for att in filtered:
-                if att.get("filename"):
-                    attachment_names.append(att["filename"])
-
-        resp_thread_id = response.get("id", "")
-        if not resp_thread_id:
-            logger.warning("Thread response with empty thread_id — skipping")
-            continue
-
-        # Collect label IDs from first message (thread-level view)
-        first_label_ids = first_msg.get("labelIds", [])
-        # Unread count across the thread (is_unread kept as the boolean view)
-        unread_count = sum(
-            1 for msg in messages if "UNREAD" in msg.get("labelIds", [])
-        )
-
-        # Latest-message signals: whose move is it? (mise-samono)
-        last_msg = messages[-1]
-        last_headers = _parse_headers(last_msg.get("payload", {}).get("headers", []))
-        last_sender = last_headers.get("From")
-
-        # Calendar invite present anywhere in the thread? Free — the parts
-        # tree is already in the fields mask (mise-pinodi).
-        has_invite = any(
-            payload_has_calendar_part(msg.get("payload", {})) for msg in messages
-        )
-
-        results.append(GmailSearchResult(
-            thread_id=resp_thread_id,
-            subject=headers.get("Subject", ""),
-            # Prefer the latest message's snippet — the thread-list snippet can
-            # surface an arbitrary (often quoted/early) message's text.
-            snippet=last_msg.get("snippet") or snippets_by_id.get(resp_thread_id, ""),
-            date=_parse_date(headers.get("Date"), first_msg.get("internalDate")),
-            from_address=headers.get("From"),
-            message_count=len(messages),
-            has_attachments=len(attachment_names) > 0,
-            attachment_names=attachment_names,
-            is_unread=unread_count > 0,
-            label_ids=first_label_ids,
-            last_sender=last_sender,
-            from_me=_is_own_address(last_sender),
-            unread_count=unread_count,
-            has_invite=has_invite,
-        ))
+        result = thread_search_result(response, snippets_by_id.get(thread_id, ""))
+        if result is not None:
+            results.append(result)
 
     return GmailSearchResults(results=results, truncated=truncated)
 
@@ -493,15 +440,10 @@ class AttachmentDownload:
     filename: str
     mime_type: str
     size: int
-    content: bytes
-    temp_path: Path | None = None  # For large files streamed to disk
-
+    content: bytes  # Empty when the download is on disk at temp_path
+    temp_path: Path | None = None
 
-# Large attachment threshold (50MB) - stream to disk above this
-ATTACHMENT_STREAMING_THRESHOLD = 50 * 1024 * 1024
 
-
-@with_retry(max_attempts=3, delay_ms=1000)
 def download_attachment(
     message_id: str,
     attachment_id: str,
@@ -509,52 +451,41 @@ def download_attachment(
     mime_type: str = "",
 ) -> AttachmentDownload:
     """
-    Download a Gmail attachment.
+    Download a Gmail attachment to a temp file.
 
-    For small attachments, returns content in memory.
-    For large attachments (>50MB), streams to temp file.
+    The response is decoded while it streams (adapters/gmail_stream), so
+    neither the base64 text nor the decoded attachment is ever held whole.
+    The caller unlinks temp_path when done.
 
     Args:
         message_id: Gmail message ID containing the attachment
         attachment_id: Attachment ID from message payload
-        filename: Optional filename (for result metadata)
+        filename: Optional filename (for result metadata and temp suffix)
         mime_type: Optional MIME type (for result metadata)
 
     Returns:
-        AttachmentDownload with content bytes (or temp_path for large files)
+        AttachmentDownload with temp_path set and content empty
 
     Raises:
         MiseError: On API failure
     """
-    client = get_sync_client()
-
-    # Download attachment data
-    response = client.get_json(
-        f"{_GMAIL_API}/messages/{message_id}/attachments/{attachment_id}",
-    )
+    from adapters.gmail_stream import stream_attachment  # imports this module
 
-    # Decode base64url data
-    data = base64.urlsafe_b64decode(response["data"])
-    size = len(data)
-
-    # For large files, write to temp and release memory
-    temp_path = None
-    if size > ATTACHMENT_STREAMING_THRESHOLD:
-        suffix = ""
-        if filename and "." in filename:
-            suffix = "." + filename.rsplit(".", 1)[1]
-        tmp = tempfile.NamedTemporaryFile(suffix=suffix, delete=False)
-        tmp.write(data)
-        tmp.close()
-        temp_path = Path(tmp.name)
-        data = b""  # Release decoded bytes — content lives on disk now
+    suffix = "." + filename.rsplit(".", 1)[1] if "." in filename else ""
+    tmp = tempfile.NamedTemporaryFile(suffix=suffix, delete=False)
+    try:
+        with tmp:
+            size = stream_attachment(message_id, attachment_id, tmp)
+    except BaseException:
+        Path(tmp.name).unlink(missing_ok=True)
+        raise
 
     return AttachmentDownload(
         filename=filename or "attachment",
         mime_type=mime_type or "application/octet-stream",
         size=size,
-        content=data,
-        temp_path=temp_path,
+        content=b"",
+        temp_path=Path(tmp.name),
     )
 
 
@@ -0,0 +1,201 @@
+"""
+Gmail thread deltas — a thread rebuilt from what a deposit already holds.
+
+threads.get with format=full returns every message of a thread every time.
+An agent watching an active thread re-fetches it over and over, and each
+time the 95 messages it already had come down again with the one it
+didn't. Here a re-fetch asks only for the message list (minimal format: ids
+and labels), fetches the new messages' full payloads, and rebuilds the
+thread from the stored payloads plus the new ones. The rebuild goes through
+_build_message like any other fetch, so the GmailThreadData is the same one
+threads.get would have produced.
+
+The same message-level fetch serves very long threads. threads.get hands
+back a 150-message thread with its HTML bodies as one multi-megabyte JSON
+document, parsed in one go, and it can run past API_TIMEOUT. Those threads
+are listed instead and their messages fetched on the pool, each parsed as it
+arrives so the parsing overlaps the downloads still in flight. A thread is
+taken down this path when search has already shown it to be long, or when
+the one-shot threads.get times out.
+"""
+
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Any
+
+from adapters.gmail import _GMAIL_API, _build_message
+from adapters.http_client import get_sync_client
+from models import EmailMessage, GmailThreadData
+from retry import with_retry
+from telemetry import count, run_in_context
+
+# The per-message part of adapters.gmail.THREAD_FIELDS — a message fetched
+# alone must parse exactly like one fetched with its thread.
+MESSAGE_FIELDS = "id,threadId,labelIds,payload(headers,mimeType,body,parts),internalDate"
+
+MESSAGE_WORKERS = 6
+
+# Threads with at least this many messages skip the one-shot threads.get
+LARGE_THREAD_MESSAGES = 60
+_SIZES_MAX_ENTRIES = 2000
+
+_sizes: "OrderedDict[str, int]" = OrderedDict()
+_sizes_lock = threading.Lock()
+
+
+@dataclass
+class ThreadListing:
+    """A thread's current shape: historyId plus message ids and labels, in thread order."""
+    history_id: str | None
+    message_ids: list[str]
+    label_ids: dict[str, list[str]]
+
+
+@with_retry(max_attempts=3, delay_ms=1000)
+def list_thread_messages(thread_id: str) -> ThreadListing:
+    """
+    The thread's message ids and labels — no headers, no bodies.
+
+    Raises:
+        MiseError: On API failure
+    """
+    client = get_sync_client()
+    thread = client.get_json(
+        f"{_GMAIL_API}/threads/{thread_id}",
+        params={"format": "minimal", "fields": "historyId,messages(id,labelIds)"},
+    )
+    messages = thread.get("messages", [])
+    return ThreadListing(
+        history_id=thread.get("historyId"),
+        message_ids=[m["id"] for m in messages],
+        label_ids={m["id"]: m.get("labelIds", []) for m in messages},
+    )
+
+
+@with_retry(max_attempts=3, delay_ms=1000)
+def fetch_raw_message(message_id: str) -> dict[str, Any]:
+    """One message's full payload, as threads.get would have carried it."""
+    client = get_sync_client()
+    message: dict[str, Any] = client.get_json(
+        f"{_GMAIL_API}/messages/{message_id}",
+        params={"format": "full", "fields": MESSAGE_FIELDS},
+    )
+    return message
+
+
+def fetch_raw_messages(message_ids: list[str]) -> list[dict[str, Any]]:
+    """Full payloads for message_ids, in order, fetched on a bounded pool."""
+    if not message_ids:
+        return []
+    fetch = run_in_context(fetch_raw_message)
+    with ThreadPoolExecutor(max_workers=min(MESSAGE_WORKERS, len(message_ids))) as pool:
+        messages = list(pool.map(fetch, message_ids))
+    count("gmail_messages_fetched", len(message_ids))
+    return messages
+
+
+def build_thread(thread_id: str, raw_messages: list[dict[str, Any]], history_id: str | None) -> GmailThreadData:
+    """GmailThreadData from message payloads — the same assembly fetch_thread does."""
+    messages = [_build_message(msg) for msg in raw_messages]
+    return GmailThreadData(
+        thread_id=thread_id,
+        subject=messages[0].subject if messages else "",
+        messages=messages,
+        history_id=history_id,
+        raw_messages=raw_messages,
+    )
+
+
+def note_thread_sizes(sizes: dict[str, int]) -> None:
+    """Remember message counts seen elsewhere (search rows) for routing fetches."""
+    with _sizes_lock:
+        for thread_id, n in sizes.items():
+            _sizes[thread_id] = n
+            _sizes.move_to_end(thread_id)
+        while len(_sizes) > _SIZES_MAX_ENTRIES:
+            _sizes.popitem(last=False)
+
+
+def is_large_thread(thread_id: str) -> bool:
+    """Whether thread_id is known to be long enough for fetch_thread_chunked."""
+    with _sizes_lock:
+        return _sizes.get(thread_id, 0) >= LARGE_THREAD_MESSAGES
+
+
+def clear_thread_sizes() -> None:
+    """Forget every remembered message count."""
+    with _sizes_lock:
+        _sizes.clear()
+
+
+def fetch_thread_chunked(thread_id: str) -> GmailThreadData:
+    """
+    Fetch a thread message by message — fetch_thread's path for long threads.
+
+    Lists the message ids, fetches the payloads on a bounded pool and parses
+    each one as it lands. The result is the GmailThreadData fetch_thread's
+    single threads.get would have built.
+
+    Raises:
+        MiseError: On API failure
+    """
+    listing = list_thread_messages(thread_id)
+    raw: dict[str, dict[str, Any]] = {}
+    built: dict[str, EmailMessage] = {}
+    if listing.message_ids:
+        fetch = run_in_context(fetch_raw_message)
+        with ThreadPoolExecutor(max_workers=min(MESSAGE_WORKERS, len(listing.message_ids))) as pool:
+            pending: dict[Future[dict[str, Any]], str] = {
+                pool.submit(fetch, message_id): message_id for message_id in listing.message_ids
+            }
+            try:
+                for future in as_completed(pending):
+                    message_id = pending[future]
+                    raw[message_id] = future.result()
+                    built[message_id] = _build_message(raw[message_id])
+            except BaseException:
+                for future in pending:
+                    future.cancel()
+                raise
+        count("gmail_messages_fetched", len(listing.message_ids))
+    count("gmail_threads_chunked")
+    messages = [built[m] for m in listing.message_ids]
+    return GmailThreadData(
+        thread_id=thread_id,
+        subject=messages[0].subject if messages else "",
+        messages=messages,
+        history_id=listing.history_id,
+        raw_messages=[raw[m] for m in listing.message_ids],
+    )
+
+
+def refresh_thread(thread_id: str, stored: dict[str, dict[str, Any]]) -> tuple[GmailThreadData, set[str]] | None:
+    """
+    Rebuild a thread from stored payloads, fetching only the messages added since.
+
+    Args:
+        thread_id: The thread ID
+        stored: {message_id: raw payload} from the earlier fetch
+
+    Returns:
+        (thread, ids of the messages fetched now), or None when the stored
+        payloads can't be reused — a message was deleted — and the caller
+        should fetch the thread whole.
+
+    Raises:
+        MiseError: On API failure
+    """
+    listing = list_thread_messages(thread_id)
+    if not set(stored) <= set(listing.message_ids):
+        return None
+    new_ids = [m for m in listing.message_ids if m not in stored]
+    fetched = dict(zip(new_ids, fetch_raw_messages(new_ids)))
+    raw_messages = [
+        # Labels (read, starred, moved) change without a new message; take today's
+        {**stored[m], "labelIds": listing.label_ids.get(m, [])} if m in stored else fetched[m]
+        for m in listing.message_ids
+    ]
+    count("gmail_messages_reused", len(stored))
+    return build_thread(thread_id, raw_messages, listing.history_id), set(new_ids)
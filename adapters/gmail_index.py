@@ -0,0 +1,430 @@
+"""
+Local Gmail metadata index — triage searches answered from SQLite.
+
+Every live Gmail search pays threads.list plus one threads.get per result.
+With MISE_GMAIL_INDEX set, the headers, snippets, labels and attachment
+names of recent threads live in an SQLite FTS5 index under INDEX_DIR, and
+search_local answers triage queries — from:/to:/cc:/subject:/filename:,
+label:, the in:/is: system labels, has:attachment, and after:/before:/
+newer_than:/older_than: — in milliseconds. Anything else returns None and
+the caller searches live: bare words and quoted phrases search message
+bodies, which the index never holds; OR, negation and grouping aren't worth
+a second query engine.
+
+Lifecycle:
+- Seed: the first indexed search starts a background crawl of every thread
+  with mail in the last SEED_DAYS (0 = the whole mailbox). The mailbox
+  historyId is read BEFORE listing, so mail landing mid-crawl is replayed.
+  Searches stay live until the crawl finishes.
+- Keep current: each search first replays users.history.list from the
+  stored historyId and re-fetches every thread a record touched (dropping
+  the ones that are gone). One cheap call when nothing changed.
+- Rebuild: Gmail keeps history for about a week. A 404 on the stored
+  historyId wipes the index and reseeds.
+
+The index holds every thread with mail since its floor, not the whole
+mailbox. Results come newest-first, so a local answer is exact when it
+fills max_results with threads newer than the floor (an unindexed thread is
+older than every row returned) or when the query's own lower date bound is above the floor. Otherwise the
+search goes live rather than under-report.
+
+There is one index per mailbox, named by the address users.getProfile
+reports, so a guest token, an ambient service account or a re-auth as
+someone else never searches another identity's mail.
+
+Matching is per message, as in Gmail: from:alice subject:budget needs one
+message satisfying both, and the thread is what's returned.
+"""
+
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+from zoneinfo import ZoneInfo
+
+import orjson
+
+from models import ErrorKind, GmailSearchResult, GmailSearchResults, MiseError
+from retry import with_retry
+from telemetry import count, run_in_context
+from adapters.http_client import get_sync_client
+from adapters.gmail import _GMAIL_API, _parse_headers, resolve_label_name
+from adapters.gmail_triage import SEARCH_FIELDS, thread_search_result
+from extractors.gmail import parse_attachments_from_payload
+
+logger = logging.getLogger(__name__)
+
+INDEX_DIR = Path.home() / ".cache" / "mise"
+ENABLED = os.environ.get("MISE_GMAIL_INDEX", "") not in ("", "0")
+SEED_DAYS = int(os.environ.get("MISE_GMAIL_INDEX_DAYS", 90))
+FETCH_WORKERS = 8
+# Threads fetched and committed together while seeding
+_SEED_BATCH = 200
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS state (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS threads (
+    thread_id TEXT PRIMARY KEY, latest REAL NOT NULL, result BLOB NOT NULL);
+CREATE TABLE IF NOT EXISTS messages (
+    message_id TEXT PRIMARY KEY, thread_id TEXT NOT NULL, date REAL NOT NULL,
+    labels TEXT NOT NULL, has_attachment INTEGER NOT NULL);
+CREATE INDEX IF NOT EXISTS messages_thread ON messages (thread_id);
+CREATE VIRTUAL TABLE IF NOT EXISTS message_text USING fts5(
+    message_id UNINDEXED, sender, recipients, cc, subject, filenames);
+"""
+
+# op:value, value optionally "quoted" — anything else is a bare term
+_TERM = re.compile(r'(\w+):("[^"]*"|\S+)|(\S+)')
+_TEXT_OPS = {
+    "from": "sender", "to": "recipients", "cc": "cc",
+    "subject": "subject", "filename": "filenames",
+}
+_SYSTEM_LABEL_OPS = {
+    ("in", "inbox"): "INBOX", ("in", "sent"): "SENT",
+    ("in", "starred"): "STARRED", ("is", "starred"): "STARRED",
+    ("in", "important"): "IMPORTANT", ("is", "important"): "IMPORTANT",
+    ("is", "unread"): "UNREAD",
+}
+# Gmail reads after:/before: dates as midnight Pacific
+_GMAIL_TZ = ZoneInfo("America/Los_Angeles")
+_AGE_DAYS = {"d": 1, "m": 30, "y": 365}
+
+_seed_lock = threading.Lock()
+# (client, mailbox address) — a new client (re-auth, new identity) looks again
+_account: tuple[Any, str] | None = None
+
+
+@dataclass
+class _Query:
+    """A search compiled to SQL over the index."""
+    match: list[str] = field(default_factory=list)   # FTS5 column phrases, ANDed
+    where: list[str] = field(default_factory=list)   # conditions on messages
+    params: list[Any] = field(default_factory=list)
+    since: float | None = None                       # lower date bound, epoch s
+
+
+def search_local(query: str, max_results: int = 20) -> GmailSearchResults | None:
+    """
+    Answer a Gmail search from the local index, if it can be answered exactly.
+
+    Args:
+        query: Sanitized Gmail search query
+        max_results: Maximum number of threads
+
+    Returns:
+        GmailSearchResults newest-first (the shape search_threads returns), or
+        None when the index is off, unseeded, can't evaluate the query, or
+        might be missing older matches — the caller then searches live.
+    """
+    if not ENABLED:
+        return None
+    compiled = _compile(query)
+    if compiled is None:
+        return None
+    try:
+        with closing(_connect()) as conn:
+            if not _sync(conn):
+                _start_seed()
+                return None
+            results = _answer(conn, compiled, max_results)
+    except (sqlite3.Error, MiseError) as e:
+        logger.info("Gmail index unavailable, searching live: %s", e)
+        return None
+    count("gmail_index_hits" if results is not None else "gmail_index_misses")
+    return results
+
+
+def _compile(query: str) -> _Query | None:
+    """Gmail operators → SQL, or None if any term needs the live API."""
+    compiled = _Query()
+    for term in _TERM.finditer(query):
+        op, value = (term.group(1) or "").lower(), (term.group(2) or "").strip('"')
+        if term.group(3) is not None or not value:
+            return None
+        if op in _TEXT_OPS:
+            if op in ("from", "to", "cc") and value.lower() == "me":
+                return None  # Gmail's "me" covers send-as aliases the index can't know
+            phrase = value.replace('"', "")
+            compiled.match.append(f'{_TEXT_OPS[op]} : "{phrase}"')
+        elif (op, value.lower()) in _SYSTEM_LABEL_OPS:
+            compiled.where.append("labels LIKE ?")
+            compiled.params.append(f"% {_SYSTEM_LABEL_OPS[op, value.lower()]} %")
+        elif (op, value.lower()) == ("is", "read"):
+            compiled.where.append("labels NOT LIKE '% UNREAD %'")
+        elif op == "label":
+            try:
+                label_id = resolve_label_name(value)
+            except MiseError:
+                return None
+            compiled.where.append("labels LIKE ?")
+            compiled.params.append(f"% {label_id} %")
+        elif (op, value.lower()) == ("has", "attachment"):
+            compiled.where.append("has_attachment = 1")
+        elif op in ("after", "before", "newer_than", "older_than"):
+            bound = _date_bound(op, value)
+            if bound is None:
+                return None
+            if op in ("after", "newer_than"):
+                compiled.where.append("date >= ?")
+                compiled.since = max(compiled.since or 0.0, bound)
+            else:
+                compiled.where.append("date < ?")
+            compiled.params.append(bound)
+        else:
+            return None
+    return compiled
+
+
+def _date_bound(op: str, value: str) -> float | None:
+    """Epoch seconds for a date operand: YYYY/MM/DD, YYYY-MM-DD, epoch, or 7d/3m/1y."""
+    if op in ("newer_than", "older_than"):
+        match = re.fullmatch(r"(\d+)([dmy])", value.lower())
+        if not match:
+            return None
+        return time.time() - int(match.group(1)) * _AGE_DAYS[match.group(2)] * 86400
+    if value.isdigit():
+        return float(value)
+    try:
+        day = datetime.strptime(value.replace("-", "/"), "%Y/%m/%d")
+    except ValueError:
+        return None
+    return day.replace(tzinfo=_GMAIL_TZ).timestamp()
+
+
+def _answer(conn: sqlite3.Connection, compiled: _Query, max_results: int) -> GmailSearchResults | None:
+    """Run a compiled query; None when the index's floor could hide matches."""
+    conditions = ["labels NOT LIKE '% SPAM %'", "labels NOT LIKE '% TRASH %'", *compiled.where]
+    params = list(compiled.params)
+    if compiled.match:
+        conditions.append("message_id IN (SELECT message_id FROM message_text WHERE message_text MATCH ?)")
+        params.append(" AND ".join(compiled.match))
+    rows = conn.execute(
+        "SELECT result, latest FROM threads WHERE thread_id IN "
+        f"(SELECT thread_id FROM messages WHERE {' AND '.join(conditions)}) "
+        "ORDER BY latest DESC LIMIT ?",
+        [*params, max_results + 1],
+    ).fetchall()
+
+    floor = float(_get_state(conn, "floor") or 0)
+    # A full page is exact only down to the floor: a sync re-fetches any
+    # thread history touches, however old, so the last row could sit below
+    # it with unindexed threads between
+    full_page = len(rows) >= max_results and rows[max_results - 1][1] >= floor
+    exact = full_page or not floor or (compiled.since or 0) >= floor
+    if not exact:
+        return None
+    return GmailSearchResults(
+        results=[_load_result(row[0]) for row in rows[:max_results]],
+        truncated=len(rows) > max_results,
+    )
+
+
+def _load_result(blob: bytes) -> GmailSearchResult:
+    data = orjson.loads(blob)
+    if data["date"]:
+        data["date"] = datetime.fromisoformat(data["date"])
+    return GmailSearchResult(**data)
+
+
+# =============================================================================
+# STORAGE
+# =============================================================================
+
+
+def _index_path() -> Path:
+    """The signed-in mailbox's index file."""
+    global _account
+    client = get_sync_client()
+    if _account is None or _account[0] is not client:
+        _account = (client, re.sub(r"[^\w.@-]", "_", _mailbox_address().lower()))
+    return INDEX_DIR / f"gmail_index-{_account[1]}.sqlite3"
+
+
+@with_retry(max_attempts=3, delay_ms=1000)
+def _mailbox_address() -> str:
+    profile = get_sync_client().get_json(f"{_GMAIL_API}/profile", params={"fields": "emailAddress"})
+    return str(profile["emailAddress"])
+
+
+def _connect() -> sqlite3.Connection:
+    path = _index_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path, timeout=30)
+    # WAL: searches read while a seed or sync writes
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(_SCHEMA)
+    return conn
+
+
+def _get_state(conn: sqlite3.Connection, key: str) -> str | None:
+    row = conn.execute("SELECT value FROM state WHERE key = ?", (key,)).fetchone()
+    return row[0] if row else None
+
+
+def _set_state(conn: sqlite3.Connection, key: str, value: str) -> None:
+    conn.execute("INSERT OR REPLACE INTO state VALUES (?, ?)", (key, value))
+
+
+def _reset(conn: sqlite3.Connection) -> None:
+    for table in ("state", "threads", "messages", "message_text"):
+        conn.execute(f"DELETE FROM {table}")
+    conn.commit()
+
+
+def _store_threads(conn: sqlite3.Connection, fetched: dict[str, dict[str, Any] | None]) -> None:
+    """Replace each thread's rows with its fresh fetch; None drops it."""
+    for thread_id, response in fetched.items():
+        conn.execute(
+            "DELETE FROM message_text WHERE message_id IN "
+            "(SELECT message_id FROM messages WHERE thread_id = ?)", (thread_id,),
+        )
+        conn.execute("DELETE FROM messages WHERE thread_id = ?", (thread_id,))
+        conn.execute("DELETE FROM threads WHERE thread_id = ?", (thread_id,))
+        result = thread_search_result(response) if response else None
+        if result is None or response is None:
+            continue
+
+        latest = 0.0
+        for msg in response["messages"]:
+            payload = msg.get("payload", {})
+            headers = _parse_headers(payload.get("headers", []))
+            date = int(msg.get("internalDate", 0)) / 1000
+            latest = max(latest, date)
+            filenames = [a["filename"] for a in parse_attachments_from_payload(payload)]
+            conn.execute(
+                "INSERT OR REPLACE INTO messages VALUES (?, ?, ?, ?, ?)",
+                (msg["id"], thread_id, date, f" {' '.join(msg.get('labelIds', []))} ", int(bool(filenames))),
+            )
+            conn.execute(
+                "INSERT INTO message_text VALUES (?, ?, ?, ?, ?, ?)",
+                (msg["id"], headers.get("From", ""), headers.get("To", ""), headers.get("Cc", ""),
+                 headers.get("Subject", ""), " ".join(filenames)),
+            )
+        conn.execute(
+            "INSERT INTO threads VALUES (?, ?, ?)",
+            (thread_id, latest, orjson.dumps(asdict(result))),
+        )
+
+
+# =============================================================================
+# SEED AND SYNC
+# =============================================================================
+
+
+def _sync(conn: sqlite3.Connection) -> bool:
+    """Replay history since the stored historyId. False if there's no usable index."""
+    history_id = _get_state(conn, "history_id")
+    if history_id is None:
+        return False
+    try:
+        changed, latest = _history_since(history_id)
+    except MiseError as e:
+        if e.kind is not ErrorKind.NOT_FOUND:
+            raise
+        logger.info("Gmail history %s expired — rebuilding the index", history_id)
+        _reset(conn)
+        return False
+    if changed:
+        _store_threads(conn, _fetch_threads(sorted(changed)))
+        count("gmail_index_synced_threads", len(changed))
+    _set_state(conn, "history_id", latest)
+    conn.commit()
+    return True
+
+
+@with_retry(max_attempts=3, delay_ms=1000)
+def _history_since(history_id: str) -> tuple[set[str], str]:
+    """Thread ids touched since history_id, and the mailbox's current historyId."""
+    client = get_sync_client()
+    changed: set[str] = set()
+    page_token: str | None = None
+    while True:
+        params: dict[str, Any] = {"startHistoryId": history_id, "maxResults": 500}
+        if page_token:
+            params["pageToken"] = page_token
+        response = client.get_json(f"{_GMAIL_API}/history", params=params)
+        for record in response.get("history", []):
+            changed.update(m["threadId"] for m in record.get("messages", []) if m.get("threadId"))
+        page_token = response.get("nextPageToken")
+        if not page_token:
+            return changed, str(response.get("historyId", history_id))
+
+
+@with_retry(max_attempts=3, delay_ms=1000)
+def _fetch_thread(thread_id: str) -> dict[str, Any]:
+    return get_sync_client().get_json(
+        f"{_GMAIL_API}/threads/{thread_id}",
+        params={"format": "full", "fields": SEARCH_FIELDS},
+    )
+
+
+def _fetch_or_none(thread_id: str) -> dict[str, Any] | None:
+    """A thread's search metadata; None if it no longer exists."""
+    try:
+        return _fetch_thread(thread_id)
+    except MiseError as e:
+        if e.kind is ErrorKind.NOT_FOUND:
+            return None
+        raise
+
+
+def _fetch_threads(thread_ids: list[str]) -> dict[str, dict[str, Any] | None]:
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as pool:
+        return dict(zip(thread_ids, pool.map(run_in_context(_fetch_or_none), thread_ids)))
+
+
+def _start_seed() -> None:
+    """Crawl the mailbox in the background, once."""
+    if not _seed_lock.locked():
+        threading.Thread(target=_seed, name="gmail-index-seed", daemon=True).start()
+
+
+def _seed() -> None:
+    if not _seed_lock.acquire(blocking=False):
+        return
+    try:
+        client = get_sync_client()
+        # Before listing: whatever lands mid-crawl is replayed by the first sync
+        history_id = str(client.get_json(f"{_GMAIL_API}/profile")["historyId"])
+        floor = time.time() - SEED_DAYS * 86400 if SEED_DAYS else 0.0
+        thread_ids = _list_thread_ids(f"after:{int(floor)}" if floor else "")
+        with closing(_connect()) as conn:
+            _reset(conn)
+            for start in range(0, len(thread_ids), _SEED_BATCH):
+                _store_threads(conn, _fetch_threads(thread_ids[start:start + _SEED_BATCH]))
+                conn.commit()
+            _set_state(conn, "floor", str(floor))
+            _set_state(conn, "history_id", history_id)
+            conn.commit()
+        logger.info("Gmail index seeded: %d threads", len(thread_ids))
+    except Exception as e:
+        # Background and best-effort: searches simply stay live
+        logger.warning("Gmail index seed failed: %s", e)
+    finally:
+        _seed_lock.release()
+
+
+@with_retry(max_attempts=3, delay_ms=1000)
+def _list_thread_ids(query: str) -> list[str]:
+    client = get_sync_client()
+    thread_ids: list[str] = []
+    page_token: str | None = None
+    while True:
+        params: dict[str, Any] = {"maxResults": 500}
+        if query:
+            params["q"] = query
+        if page_token:
+            params["pageToken"] = page_token
+        response = client.get_json(f"{_GMAIL_API}/threads", params=params)
+        thread_ids.extend(t["id"] for t in response.get("threads", []))
+        page_token = response.get("nextPageToken")
+        if not page_token:
+            return thread_ids
@@ -0,0 +1,105 @@
+"""
+Gmail triage rows — one thread's metadata as a GmailSearchResult.
+
+Shared by search_threads (live threads.list + per-thread fetch) and the
+local index (gmail_index), so a row built from either path is identical:
+same subject/sender rules, same latest-message signals, same attachment
+filtering.
+"""
+
+import logging
+from typing import Any
+
+from models import GmailSearchResult
+from adapters.gmail import _is_own_address, _parse_date, _parse_headers, payload_has_calendar_part
+from extractors.gmail import parse_attachments_from_payload
+from filters import filter_attachments
+
+logger = logging.getLogger(__name__)
+
+# Fields mask gives us payload parts tree (for attachment filenames)
+# without message body data. Per-message snippet included so the result
+# can reflect the LATEST message, not the thread-list snippet (which Gmail
+# draws from an arbitrary message — observed misattributing authorship).
+# Two levels of parts: calendar invites nest text/calendar inside
+# multipart/alternative, so a one-level mask misses it (mise-pinodi).
+SEARCH_FIELDS = (
+    "id,messages(id,internalDate,labelIds,snippet,"
+    "payload(headers,mimeType,parts(filename,mimeType,body(attachmentId,size),"
+    "parts(filename,mimeType,body(attachmentId,size)))))"
+)
+
+
+def thread_search_result(response: dict[str, Any], list_snippet: str = "") -> GmailSearchResult | None:
+    """
+    Build the triage row for a thread fetched with SEARCH_FIELDS.
+
+    Args:
+        response: threads.get response
+        list_snippet: threads.list snippet, the fallback when the latest
+            message carries none
+
+    Returns:
+        GmailSearchResult, or None for an empty or id-less thread
+    """
+    messages = response.get("messages", [])
+    if not messages:
+        return None
+
+    # First message has subject and sender
+    first_msg = messages[0]
+    payload = first_msg.get("payload", {})
+    headers = _parse_headers(payload.get("headers", []))
+
+    # Collect attachment names from all messages (filtered)
+    attachment_names: list[str] = []
+    for msg in messages:
+        msg_payload = msg.get("payload", {})
+        msg_attachments = parse_attachments_from_payload(msg_payload)
+        # Filter out trivial attachments
+        filtered = filter_attachments(msg_attachments)
+        for att in filtered:
+            if att.get("filename"):
+                attachment_names.append(att["filename"])
+
+    resp_thread_id = response.get("id", "")
+    if not resp_thread_id:
+        logger.warning("Thread response with empty thread_id — skipping")
+        return None
+
+    # Collect label IDs from first message (thread-level view)
+    first_label_ids = first_msg.get("labelIds", [])
+    # Unread count across the thread (is_unread kept as the boolean view)
+    unread_count = sum(
+        1 for msg in messages if "UNREAD" in msg.get("labelIds", [])
+    )
+
+    # Latest-message signals: whose move is it? (mise-samono)
+    last_msg = messages[-1]
+    last_headers = _parse_headers(last_msg.get("payload", {}).get("headers", []))
+    last_sender = last_headers.get("From")
+
+    # Calendar invite present anywhere in the thread? Free — the parts
+    # tree is already in the fields mask (mise-pinodi).
+    has_invite = any(
+        payload_has_calendar_part(msg.get("payload", {})) for msg in messages
+    )
+
+    return GmailSearchResult(
+        thread_id=resp_thread_id,
+        subject=headers.get("Subject", ""),
+        # Prefer the latest message's snippet — the thread-list snippet can
+        # surface an arbitrary (often quoted/early) message's text.
+        snippet=last_msg.get("snippet") or list_snippet,
+        date=_parse_date(headers.get("Date"), first_msg.get("internalDate")),
+        from_address=headers.get("From"),
+        message_count=len(messages),
+        has_attachments=len(attachment_names) > 0,
+        attachment_names=attachment_names,
+        is_unread=unread_count > 0,
+        label_ids=first_label_ids,
+        last_sender=last_sender,
+        from_me=_is_own_address(last_sender),
+        unread_count=unread_count,
+        has_invite=has_invite,
+    )
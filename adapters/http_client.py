@@ -36,10 +36,10 @@ from pathlib import Path
 
 import httpx
 import orjson
-from google.auth.transport.requests import Request as GoogleAuthRequest
 
 from jeton import load_credentials
 from oauth_config import TOKEN_FILE, SCOPES
+from telemetry import api_span_name, count, span
 from token_store import resolve_token_path
 
 logger = logging.getLogger(__name__)
@@ -186,6 +186,7 @@ class MiseHttpClient:
         the friendly re-auth pointer.
         """
         from google.auth.exceptions import RefreshError
+        from google.auth.transport.requests import Request as GoogleAuthRequest  # pulls in requests
 
         try:
             self._credentials.refresh(GoogleAuthRequest())
@@ -420,6 +421,7 @@ class MiseSyncClient:
         the friendly re-auth pointer.
         """
         from google.auth.exceptions import RefreshError
+        from google.auth.transport.requests import Request as GoogleAuthRequest  # pulls in requests
 
         try:
             self._credentials.refresh(GoogleAuthRequest())
@@ -496,15 +498,20 @@ class MiseSyncClient:
         elif content is not None:
             kwargs["content"] = content
 
-        response = self._client.request(method, url, **kwargs)
-
-        # Retry once on 401 — token may report valid but be expired server-side
-        # (google-auth's creds.valid only checks local expiry field, which can
-        # be None for some token formats). AuthorizedHttp did this automatically.
-        if response.status_code == 401:
-            self._refresh_or_reload()
-            kwargs["headers"]["Authorization"] = f"Bearer {self._credentials.token}"
+        with span(api_span_name(url)):
             response = self._client.request(method, url, **kwargs)
+            count("http_requests")
+
+            # Retry once on 401 — token may report valid but be expired server-side
+            # (google-auth's creds.valid only checks local expiry field, which can
+            # be None for some token formats). AuthorizedHttp did this automatically.
+            if response.status_code == 401:
+                self._refresh_or_reload()
+                kwargs["headers"]["Authorization"] = f"Bearer {self._credentials.token}"
+                response = self._client.request(method, url, **kwargs)
+                count("http_requests")
+                count("retries")
+            count("http_bytes", len(response.content))
 
         response.raise_for_status()
         return response
@@ -636,6 +643,7 @@ class MiseSyncClient:
         file_obj: Any,
         *,
         params: QueryParamsType = None,
+        headers: dict[str, str] | None = None,
         chunk_size: int = 65536,
     ) -> None:
         """Stream a download directly to a file object.
@@ -644,15 +652,35 @@ class MiseSyncClient:
             url: URL to download
             file_obj: File-like object to write to (must be opened in binary mode)
             params: Optional query parameters
+            headers: Extra request headers (e.g. Range)
             chunk_size: Download chunk size in bytes (default: 64KB)
         """
-        req_headers = self._auth_headers()
-        with self._client.stream(
+        req_headers = {**self._auth_headers(), **(headers or {})}
+        with span(api_span_name(url)), self._client.stream(
             "GET", url, headers=req_headers, params=params,
         ) as response:
+            count("http_requests")
             response.raise_for_status()
             for chunk in response.iter_bytes(chunk_size=chunk_size):
                 file_obj.write(chunk)
+                count("http_bytes", len(chunk))
+
+    def probe_status(
+        self,
+        url: str,
+        *,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> int:
+        """Status code of a GET whose body is never read — the response is
+        closed once its headers arrive, however large the body would be."""
+        req_headers = {**self._auth_headers(), **(headers or {})}
+        with span(api_span_name(url)), self._client.stream(
+            "GET", url, headers=req_headers, params=params,
+        ) as response:
+            count("http_requests")
+            response.raise_for_status()
+            return response.status_code
 
     def close(self) -> None:
         """Close the underlying connection pool."""
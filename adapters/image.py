@@ -75,7 +75,7 @@ def get_extension(mime_type: str) -> str:
     return MIME_TO_EXTENSION.get(mime_type, "bin")
 
 
-def fetch_image(file_id: str, filename: str, mime_type: str) -> ImageResult:
+def fetch_image(file_id: str, filename: str, mime_type: str, file_size: int | None = None) -> ImageResult:
     """
     Fetch image from Drive.
 
@@ -87,26 +87,29 @@ def fetch_image(file_id: str, filename: str, mime_type: str) -> ImageResult:
         file_id: Drive file ID
         filename: Original filename (for constructing output name)
         mime_type: MIME type of the image
+        file_size: Size from Drive metadata, when the caller has it — saves
+            a size query
 
     Returns:
         ImageResult with image bytes and optional PNG render for SVG
     """
     # Check file size for streaming decision
-    file_size = get_file_size(file_id)
+    if file_size is None:
+        file_size = get_file_size(file_id)
     warnings: list[str] = []
 
     if file_size > STREAMING_THRESHOLD_BYTES:
         # Large file: stream to temp, read back
         warnings.append(f"Large image ({file_size / (1024*1024):.1f}MB): using streaming download")
         ext = get_extension(mime_type)
-        tmp_path = download_file_to_temp(file_id, suffix=f".{ext}")
+        tmp_path = download_file_to_temp(file_id, suffix=f".{ext}", file_size=file_size)
         try:
             image_bytes = tmp_path.read_bytes()
         finally:
             tmp_path.unlink(missing_ok=True)
     else:
         # Normal download
-        image_bytes = download_file(file_id)
+        image_bytes = download_file(file_id, file_size=file_size)
 
     # Build output filename with correct extension
     ext = get_extension(mime_type)
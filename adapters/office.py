@@ -185,8 +185,10 @@ def _convert_xlsx_via_sheets_api(
         file_id_hint=file_id,
         source_file_id=source_file_id,
     ) as temp_id:
-        # Read all tabs via Sheets API (no chart rendering for temp files)
-        spreadsheet_data = fetch_spreadsheet(temp_id, render_charts=False)
+        # Read all tabs via Sheets API (no chart rendering for temp files).
+        # One-shot, never row-paged: the content is assembled as one string
+        # here and the per-tab CSVs re-read the same values afterwards.
+        spreadsheet_data = fetch_spreadsheet(temp_id, render_charts=False, stream=False)
 
         # Extract content (gets all tabs with === Sheet: Name === headers)
         content = extract_sheets_content(spreadsheet_data)
@@ -205,6 +207,7 @@ def _convert_xlsx_via_sheets_api(
 def fetch_and_convert_office(
     file_id: str,
     office_type: OfficeType,
+    file_size: int | None = None,
 ) -> OfficeConversionResult:
     """
     Download Office file from Drive and extract content.
@@ -215,17 +218,20 @@ def fetch_and_convert_office(
     Args:
         file_id: Drive file ID
         office_type: 'docx', 'xlsx', or 'pptx'
+        file_size: Size from Drive metadata, when the caller has it — saves
+            a size query
 
     Returns:
         OfficeConversionResult with content and format info
     """
     # Check file size to determine download strategy
-    file_size = get_file_size(file_id)
+    if file_size is None:
+        file_size = get_file_size(file_id)
     suffix = f".{office_type}"
 
     if file_size > STREAMING_THRESHOLD_BYTES:
         # Large file: stream to temp, pass path (not bytes) to avoid OOM
-        tmp_path = download_file_to_temp(file_id, suffix=suffix)
+        tmp_path = download_file_to_temp(file_id, suffix=suffix, file_size=file_size)
         try:
             result = convert_office_content(
                 file_path=tmp_path,
@@ -244,7 +250,7 @@ def fetch_and_convert_office(
                 tmp_path.unlink(missing_ok=True)
     else:
         # Small file: load into memory
-        file_bytes = download_file(file_id)
+        file_bytes = download_file(file_id, file_size=file_size)
         result = convert_office_content(
             file_bytes=file_bytes,
             office_type=office_type,
@@ -168,6 +168,7 @@ def fetch_and_convert_pdf(
     file_id: str,
     min_chars_threshold: int = DEFAULT_MIN_CHARS_THRESHOLD,
     thumbnails: bool = True,
+    file_size: int | None = None,
 ) -> PdfConversionResult:
     """
     Download PDF from Drive and extract content.
@@ -179,19 +180,22 @@ def fetch_and_convert_pdf(
         file_id: Drive file ID
         min_chars_threshold: Minimum chars to consider markitdown successful
         thumbnails: False skips page-thumbnail rendering entirely (mise-giwawa)
+        file_size: Size from Drive metadata, when the caller has it — saves
+            a size query
 
     Returns:
         PdfConversionResult with content and extraction method used
     """
     # Check file size to determine download strategy
-    file_size = get_file_size(file_id)
+    if file_size is None:
+        file_size = get_file_size(file_id)
 
     if file_size > STREAMING_THRESHOLD_BYTES:
         # Large file: stream to temp, extract from path
-        return _fetch_and_convert_pdf_large(file_id, min_chars_threshold, thumbnails=thumbnails)
+        return _fetch_and_convert_pdf_large(file_id, min_chars_threshold, thumbnails=thumbnails, file_size=file_size)
     else:
         # Small file: load into memory
-        pdf_bytes = download_file(file_id)
+        pdf_bytes = download_file(file_id, file_size=file_size)
         result = convert_pdf_content(
             file_bytes=pdf_bytes,
             file_id=file_id,
@@ -217,6 +221,7 @@ def _fetch_and_convert_pdf_large(
     file_id: str,
     min_chars_threshold: int = DEFAULT_MIN_CHARS_THRESHOLD,
     *, thumbnails: bool = True,
+    file_size: int | None = None,
 ) -> PdfConversionResult:
     """
     Extract large PDF using streaming download.
@@ -224,7 +229,7 @@ def _fetch_and_convert_pdf_large(
     Downloads to temp file, delegates to convert_pdf_content(file_path=...),
     then cleans up.
     """
-    tmp_path = download_file_to_temp(file_id, suffix=".pdf")
+    tmp_path = download_file_to_temp(file_id, suffix=".pdf", file_size=file_size)
 
     try:
         result = convert_pdf_content(
@@ -29,6 +29,7 @@ from pathlib import Path
 from typing import Any, Iterable
 
 from logging_config import logger
+from telemetry import span
 
 # BBC annual report (256pp) extracts in ~1s on tube-class hardware; the
 # ceiling is for pathological PDFs on slow disks, not a working budget.
@@ -48,12 +49,13 @@ def count_pdf_pages(
     try:
         from pdf2image import pdfinfo_from_bytes, pdfinfo_from_path
 
-        if file_path is not None:
-            info = pdfinfo_from_path(str(file_path))
-        elif file_bytes is not None:
-            info = pdfinfo_from_bytes(file_bytes)
-        else:
-            return None
+        with span("pdfinfo"):
+            if file_path is not None:
+                info = pdfinfo_from_path(str(file_path))
+            elif file_bytes is not None:
+                info = pdfinfo_from_bytes(file_bytes)
+            else:
+                return None
         pages = info.get("Pages")
         return int(pages) if pages else None
     except Exception as e:
@@ -86,11 +88,12 @@ def run_pdftotext(
         tmp_created = True
 
     try:
-        proc = subprocess.run(
-            [_pdftotext_bin(), "-layout", "-enc", "UTF-8", str(file_path), "-"],
-            capture_output=True,
-            timeout=PDFTOTEXT_TIMEOUT_S,
-        )
+        with span("pdftotext"):
+            proc = subprocess.run(
+                [_pdftotext_bin(), "-layout", "-enc", "UTF-8", str(file_path), "-"],
+                capture_output=True,
+                timeout=PDFTOTEXT_TIMEOUT_S,
+            )
         if proc.returncode != 0:
             detail = proc.stderr.decode("utf-8", errors="replace").strip()[:200]
             raise ValueError(f"pdftotext exit {proc.returncode}: {detail}")
@@ -160,10 +163,11 @@ def _page_area_in2(file_path: Path) -> float | None:
     only needs to tell full-page backgrounds from sub-page graphics.
     """
     try:
-        proc = subprocess.run(
-            [_poppler_bin("pdfinfo"), str(file_path)],
-            capture_output=True, timeout=30,
-        )
+        with span("pdfinfo"):
+            proc = subprocess.run(
+                [_poppler_bin("pdfinfo"), str(file_path)],
+                capture_output=True, timeout=30,
+            )
         m = re.search(
             r"Page size:\s+([\d.]+) x ([\d.]+)",
             proc.stdout.decode("utf-8", errors="replace"),
@@ -222,10 +226,11 @@ def extract_pdf_crops(
         tmp_created = True
 
     try:
-        listing = subprocess.run(
-            [_poppler_bin("pdfimages"), "-list", str(file_path)],
-            capture_output=True, timeout=PDFIMAGES_TIMEOUT_S,
-        )
+        with span("pdfimages"):
+            listing = subprocess.run(
+                [_poppler_bin("pdfimages"), "-list", str(file_path)],
+                capture_output=True, timeout=PDFIMAGES_TIMEOUT_S,
+            )
         if listing.returncode != 0:
             detail = listing.stderr.decode("utf-8", errors="replace").strip()[:200]
             raise ValueError(f"pdfimages -list exit {listing.returncode}: {detail}")
@@ -252,10 +257,11 @@ def extract_pdf_crops(
             return []
 
         with tempfile.TemporaryDirectory() as out_dir:
-            extract = subprocess.run(
-                [_poppler_bin("pdfimages"), "-png", str(file_path), f"{out_dir}/img"],
-                capture_output=True, timeout=PDFIMAGES_TIMEOUT_S,
-            )
+            with span("pdfimages"):
+                extract = subprocess.run(
+                    [_poppler_bin("pdfimages"), "-png", str(file_path), f"{out_dir}/img"],
+                    capture_output=True, timeout=PDFIMAGES_TIMEOUT_S,
+                )
             if extract.returncode != 0:
                 detail = extract.stderr.decode("utf-8", errors="replace").strip()[:200]
                 raise ValueError(f"pdfimages -png exit {extract.returncode}: {detail}")
@@ -291,3 +291,53 @@ def _render_via_pdf2image(
         method="pdf2image",
         warnings=warnings,
     )
+
+
+def render_pdf_page_selection(
+    file_path: Path,
+    page_indices: list[int],
+    width_px: int,
+) -> dict[int, bytes]:
+    """
+    Render only the given pages (0-based) to PNGs scaled to width_px wide.
+
+    For callers that know which pages they want (a Slides deck exported
+    whole, thumbnails for a handful of slides). poppler is invoked once per
+    contiguous run of pages, not once per page. Pages poppler can't render
+    are simply absent from the result.
+
+    Raises:
+        ImportError: If poppler-utils / pdf2image is unavailable
+    """
+    import io
+    from pdf2image import convert_from_path
+    from pdf2image.exceptions import PDFInfoNotInstalledError
+
+    runs: list[list[int]] = []
+    for index in sorted(set(page_indices)):
+        if runs and index == runs[-1][-1] + 1:
+            runs[-1].append(index)
+        else:
+            runs.append([index])
+
+    rendered: dict[int, bytes] = {}
+    for run in runs:
+        try:
+            images = convert_from_path(
+                str(file_path),
+                fmt="png",
+                size=(width_px, None),
+                first_page=run[0] + 1,  # poppler is 1-indexed
+                last_page=run[-1] + 1,
+            )
+        except PDFInfoNotInstalledError:
+            raise ImportError(
+                "poppler-utils not installed. Install with: "
+                "apt-get install poppler-utils (Debian/Ubuntu) or "
+                "brew install poppler (macOS)"
+            )
+        for index, pil_img in zip(run, images):
+            buf = io.BytesIO()
+            pil_img.save(buf, format="PNG")
+            rendered[index] = buf.getvalue()
+    return rendered
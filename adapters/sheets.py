@@ -14,25 +14,33 @@ from typing import Any, Literal
 
 import orjson
 
-from models import SpreadsheetData, SheetTab, ChartData, CellValue
+from models import SpreadsheetData, SheetTab, ChartData, CellValue, ColumnarGrid
 from retry import with_retry
+from telemetry import span
 from adapters.http_client import get_sync_client
 from adapters.charts import get_charts_from_spreadsheet, render_charts_as_pngs
+from adapters.chart_cache import load_cached_charts, store_rendered_charts
 
 
 # Google Sheets API v4 base URL
 _SHEETS_API = "https://sheets.googleapis.com/v4/spreadsheets"
 
 # Fields to request from spreadsheets().get()
-# Include sheetType to filter OBJECT sheets, charts for metadata, and merges
+# Include sheetType to filter OBJECT sheets, charts for metadata, and merges;
+# gridProperties sizes the grid for the row-paged decision
 SPREADSHEET_METADATA_FIELDS = (
     "spreadsheetId,"
     "properties(title,locale,timeZone),"
-    "sheets(properties(sheetId,title,sheetType),"
+    "sheets(properties(sheetId,title,sheetType,gridProperties(rowCount,columnCount)),"
     "merges,"
-    "charts(chartId,spec(title,basicChart(chartType),pieChart,histogramChart)))"
+    "charts(chartId,spec))"  # whole spec: its hash keys the chart render cache
 )
 
+# Above this many grid cells (rowCount × columnCount over the selected tabs)
+# fetch_spreadsheet pages rows instead of one all-tabs batchGet. A default new
+# sheet is 1000×26, so only genuinely large grids cross it.
+STREAM_GRID_CELLS = 2_000_000
+
 
 def _parse_cell_value(value: Any) -> CellValue:
     """Convert API cell value to our CellValue type."""
@@ -52,6 +60,8 @@ def _parse_row(row: list[Any]) -> list[CellValue]:
 def _resolve_merges(
     values: list[list[CellValue]],
     merges: list[dict[str, Any]],
+    row_offset: int = 0,
+    carry: dict[int, CellValue] | None = None,
 ) -> int:
     """
     Propagate top-left cell values into empty merged cells.
@@ -60,27 +70,37 @@ def _resolve_merges(
     range — all other cells come back as empty. This fills them in so CSV
     output has correct data in every row.
 
+    Row-paged fetches pass the page's first sheet row as row_offset and one
+    carry dict per tab: a merge whose top-left sits on an earlier page takes
+    its source value from carry, keyed by the merge's index in merges.
+
     Mutates `values` in place. Returns the number of cells filled.
     """
     filled = 0
 
-    for merge in merges:
+    for merge_idx, merge in enumerate(merges):
         start_row = merge.get("startRowIndex", 0)
-        end_row = merge.get("endRowIndex", start_row + 1)
+        end_row = merge.get("endRowIndex", start_row + 1) - row_offset
+        start_row -= row_offset
         start_col = merge.get("startColumnIndex", 0)
         end_col = merge.get("endColumnIndex", start_col + 1)
 
         # Get the top-left cell value (the source of truth)
-        if start_row >= len(values):
+        if start_row >= len(values) or end_row <= 0:
             continue
-        top_row = values[start_row]
-        source_value = top_row[start_col] if start_col < len(top_row) else None
+        if start_row >= 0:
+            top_row = values[start_row]
+            source_value = top_row[start_col] if start_col < len(top_row) else None
+            if carry is not None:
+                carry[merge_idx] = source_value
+        else:
+            source_value = carry.get(merge_idx) if carry is not None else None
 
         if source_value is None:
             continue
 
         # Fill all cells in the merge range (skip the top-left itself)
-        for row_idx in range(start_row, min(end_row, len(values))):
+        for row_idx in range(max(start_row, 0), min(end_row, len(values))):
             row = values[row_idx]
             # Extend row if needed (sparse rows shorter than merge range)
             while len(row) < end_col:
@@ -101,6 +121,9 @@ def fetch_spreadsheet(
     spreadsheet_id: str,
     render_charts: bool = True,
     tabs: list[str] | None = None,
+    stream: bool | None = None,
+    columnar: bool = False,
+    modified_time: str | None = None,
 ) -> SpreadsheetData:
     """
     Fetch complete spreadsheet data including charts.
@@ -110,9 +133,17 @@ def fetch_spreadsheet(
     2. spreadsheets().values().batchGet() for GRID sheets only
     3. Chart rendering via Slides API (if charts present and render_charts=True)
 
+    Very large sheets skip step 2: each GRID tab gets a lazy row-paged
+    SheetTab.pages instead of values (see adapters/sheets_paging.py).
+    columnar=True keeps one-shot tabs as a ColumnarGrid instead of boxed rows:
+    about half the memory, same CSV.
+
     Args:
         spreadsheet_id: The spreadsheet ID (from URL or API)
         render_charts: Whether to render charts as PNGs (default True)
+        stream: Row-paged mode — None decides by grid size, True/False force it
+        columnar: Store one-shot tabs in SheetTab.grid (values left empty)
+        modified_time: Drive modifiedTime — enables the chart render cache
 
     Returns:
         SpreadsheetData ready for the extractor
@@ -139,6 +170,7 @@ def fetch_spreadsheet(
     all_sheet_info: list[tuple[str, str]] = []
     merges_by_sheet: dict[str, list[dict[str, Any]]] = {}  # sheet name → merge ranges
     sheet_ids: dict[str, int] = {}  # sheet name → numeric sheetId (URL ?gid=)
+    grid_dims: dict[str, tuple[int, int]] = {}  # sheet name → (rowCount, columnCount)
 
     for sheet in metadata.get("sheets", []):
         props = sheet.get("properties", {})
@@ -147,6 +179,8 @@ def fetch_spreadsheet(
         all_sheet_info.append((name, sheet_type))
         if "sheetId" in props:
             sheet_ids[name] = props["sheetId"]
+        grid = props.get("gridProperties", {})
+        grid_dims[name] = (grid.get("rowCount", 0), grid.get("columnCount", 0))
 
         # Collect merge ranges for GRID sheets
         sheet_merges = sheet.get("merges", [])
@@ -177,7 +211,15 @@ def fetch_spreadsheet(
     formula_count = 0
     merged_cell_count = 0
 
-    if grid_sheets:
+    if stream is None:
+        stream = sum(r * c for r, c in (grid_dims[n] for n, _ in grid_sheets)) > STREAM_GRID_CELLS
+    if grid_sheets and stream:
+        # Placeholders — pages are attached once `result` exists to count into
+        sheets.extend(
+            SheetTab(name=name, values=[], sheet_type=st, sheet_id=sheet_ids.get(name))
+            for name, st in grid_sheets
+        )
+    elif grid_sheets:
         ranges = [f"'{name}'" for name, _ in grid_sheets]
 
         # batchGet uses repeated "ranges" query params — httpx needs list of tuples
@@ -203,7 +245,9 @@ def fetch_spreadsheet(
 
         for (sheet_name, sheet_type), value_range in zip(grid_sheets, value_ranges):
             raw_values = value_range.get("values", [])
-            parsed_values = [_parse_row(row) for row in raw_values]
+            # Columnar: from_rows normalizes cell types itself, so the raw
+            # rows go straight in and no boxed row list is ever built
+            parsed_values = raw_values if columnar else [_parse_row(row) for row in raw_values]
 
             # Resolve merged cells: propagate top-left value to all covered cells
             if sheet_name in merges_by_sheet:
@@ -213,9 +257,10 @@ def fetch_spreadsheet(
 
             sheets.append(SheetTab(
                 name=sheet_name,
-                values=parsed_values,
+                values=[] if columnar else parsed_values,
                 sheet_type=sheet_type,
                 sheet_id=sheet_ids.get(sheet_name),
+                grid=ColumnarGrid.from_rows(parsed_values) if columnar else None,
             ))
 
         # Count formula cells (cells starting with = in FORMULA render)
@@ -237,11 +282,16 @@ def fetch_spreadsheet(
 
     # Extract chart metadata
     charts = get_charts_from_spreadsheet(metadata)
-    chart_render_time_ms = 0
+    chart_render_time_ms = chart_cache_time_ms = chart_cache_hits = 0
 
-    # Render charts as PNGs if requested
+    # Render charts as PNGs if requested — only the ones the cache lacks
     if render_charts and charts:
-        charts, chart_render_time_ms = render_charts_as_pngs(spreadsheet_id, charts)
+        with span("charts"):
+            stale, chart_cache_time_ms = load_cached_charts(spreadsheet_id, charts, modified_time)
+            chart_cache_hits = len(charts) - len(stale)
+            if stale:
+                _, chart_render_time_ms = render_charts_as_pngs(spreadsheet_id, stale)
+                store_rendered_charts(spreadsheet_id, stale, modified_time)
 
     result = SpreadsheetData(
         title=title,
@@ -251,10 +301,20 @@ def fetch_spreadsheet(
         locale=locale,
         time_zone=time_zone,
         chart_render_time_ms=chart_render_time_ms,
+        chart_cache_time_ms=chart_cache_time_ms,
+        chart_cache_hits=chart_cache_hits,
         formula_count=formula_count,
         merged_cell_count=merged_cell_count,
     )
     result.warnings.extend(warnings)
+    if grid_sheets and stream:
+        from adapters.sheets_paging import iter_tab_pages  # imports this module
+
+        for tab in sheets[:len(grid_sheets)]:
+            tab.pages = iter_tab_pages(
+                spreadsheet_id, tab.name, *grid_dims[tab.name],
+                merges_by_sheet.get(tab.name, []), result,
+            )
     return result
 
 
@@ -0,0 +1,123 @@
+"""
+Row-paged Sheets values — the streaming half of fetch_spreadsheet.
+
+The one-shot path pulls every GRID tab in one FORMATTED_VALUE batchGet plus
+a second FORMULA batchGet and holds both as boxed cells; a 500k-row sheet
+doesn't fit a worker. Here each tab is fetched by row range ('Tab'!1:4000,
+'Tab'!4001:8000, ...) and yielded page by page, so the caller can write CSV
+as rows arrive and peak memory is one page of each render option.
+
+What the paging must not change, relative to the one-shot path:
+- Rows: the API trims trailing blank rows per range, so a page that ends in
+  blanks comes back short. Those rows are held back and re-emitted (as empty
+  rows) only if data follows — exactly what the one-shot response contains.
+- Merges: resolved per page by _resolve_merges with a per-tab carry, so a
+  merge straddling a page boundary still fills from its top-left cell.
+- Counts: formula and merged-cell counts accumulate onto the SpreadsheetData
+  as pages are consumed, totalling what the one-shot path reports.
+
+The FORMULA page is only counted, never kept; with concurrent=True it is
+fetched on a worker thread while the FORMATTED_VALUE page is in flight.
+"""
+
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from models import CellValue, SpreadsheetData
+from retry import with_retry
+from telemetry import run_in_context
+from adapters.http_client import get_sync_client
+from adapters.sheets import _SHEETS_API, _parse_row, _resolve_merges
+
+# Cells per page (both render options are in memory at once) and a floor for
+# very wide sheets, where a handful of rows per request would cost more in
+# round trips than it saves in memory.
+PAGE_CELLS = 200_000
+MIN_PAGE_ROWS = 500
+
+# Fetch the FORMULA page alongside the FORMATTED_VALUE page.
+CONCURRENT_RENDERS = True
+
+
+@with_retry(max_attempts=3, delay_ms=1000)
+def _get_page(spreadsheet_id: str, range_: str, render: str) -> list[list[Any]]:
+    """One range in one render option — batchGet, so the range rides as a query param."""
+    client = get_sync_client()
+    response = client.get_json(
+        f"{_SHEETS_API}/{spreadsheet_id}/values:batchGet",
+        params=[("valueRenderOption", render), ("ranges", range_)],
+    )
+    value_ranges = response.get("valueRanges", [])
+    return list(value_ranges[0].get("values", [])) if value_ranges else []
+
+
+def _count_formulas(rows: list[list[Any]]) -> int:
+    """Cells starting with = in a FORMULA render."""
+    return sum(
+        1 for row in rows for cell in row if isinstance(cell, str) and cell.startswith("=")
+    )
+
+
+def iter_tab_pages(
+    spreadsheet_id: str,
+    tab_name: str,
+    row_count: int,
+    column_count: int,
+    merges: list[dict[str, Any]],
+    counts: SpreadsheetData,
+    concurrent: bool = CONCURRENT_RENDERS,
+) -> Iterator[list[list[CellValue]]]:
+    """
+    Yield one tab's rows page by page, merges resolved.
+
+    Args:
+        spreadsheet_id: The spreadsheet ID
+        tab_name: GRID tab title
+        row_count: gridProperties.rowCount (0 = unknown: one page, whole tab)
+        column_count: gridProperties.columnCount, sizes the page
+        merges: The tab's merge ranges from spreadsheet metadata
+        counts: Receives formula_count / merged_cell_count increments
+
+    Raises:
+        MiseError: On API failure (converted by @with_retry per page)
+    """
+    page_rows = max(MIN_PAGE_ROWS, PAGE_CELLS // max(column_count, 1))
+    quoted = "'" + tab_name.replace("'", "''") + "'"
+    bounds: list[tuple[int, int | None]] = [
+        (start, min(start + page_rows, row_count))
+        for start in range(0, row_count, page_rows)
+    ] or [(0, None)]
+
+    carry: dict[int, CellValue] = {}
+    held_blank = 0  # trailing blank rows of earlier pages, pending data after them
+    pool = ThreadPoolExecutor(max_workers=1) if concurrent else None
+    try:
+        for start, end in bounds:
+            range_ = quoted if end is None else f"{quoted}!{start + 1}:{end}"
+            formula_job = (
+                pool.submit(run_in_context(_get_page), spreadsheet_id, range_, "FORMULA")
+                if pool else None
+            )
+            raw = _get_page(spreadsheet_id, range_, "FORMATTED_VALUE")
+            formulas = (
+                formula_job.result() if formula_job
+                else _get_page(spreadsheet_id, range_, "FORMULA")
+            )
+            counts.formula_count += _count_formulas(formulas)
+            del formulas
+
+            span_rows = (end - start) if end is not None else len(raw)
+            if not raw:
+                held_blank += span_rows
+                continue
+            page: list[list[CellValue]] = [[] for _ in range(held_blank)]
+            page.extend(_parse_row(row) for row in raw)
+            counts.merged_cell_count += _resolve_merges(
+                page, merges, row_offset=start - held_blank, carry=carry,
+            )
+            held_blank = span_rows - len(raw)
+            yield page
+    finally:
+        if pool:
+            pool.shutdown(wait=True)
@@ -10,19 +10,33 @@ MiseHttpClient (async) when the tools/server layer goes async.
 NOTE: httpx's connection pool is thread-safe, so concurrent thumbnail
 fetches share the singleton client — no need for per-thread isolation
 (unlike the old httplib2 pattern).
+
+Two thumbnail engines, same SlideData.thumbnail_bytes out of either:
+- api: pages.getThumbnail per slide, then a download of each contentUrl.
+  Capped at 2 in flight (rate limit), so cost grows with every slide.
+- pdf: one Drive export of the whole deck as PDF, then poppler renders
+  just the flagged pages locally. A fixed export cost, then cheap pages.
+_fetch_thumbnails_selective picks by how many slides need thumbnails, and
+falls back to api whenever the pdf engine can't be trusted.
 """
 
+import logging
+import tempfile
 import urllib.error
 import urllib.request
 from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 import httpx
 
-from models import PresentationData
+from models import PresentationData, SlideData
 from retry import with_retry
+from telemetry import span
 from adapters.http_client import get_sync_client
 from extractors.slides import parse_presentation
 
+logger = logging.getLogger(__name__)
+
 
 # Google Slides API v1 base URL
 _SLIDES_API = "https://slides.googleapis.com/v1/presentations"
@@ -37,6 +51,15 @@ PRESENTATION_FIELDS = (
     "slides(objectId,pageElements,slideProperties(notesPage))"
 )
 
+# From this many flagged slides up, export the deck once as PDF instead of
+# calling getThumbnail per slide. At 2 in flight a getThumbnail + download
+# pair averages ~0.5s of wall time per slide; the export is a few seconds
+# flat plus a fraction of a second per rendered page.
+PDF_ENGINE_MIN_SLIDES = 12
+
+# getThumbnail's MEDIUM size is 800px wide; the pdf engine renders to match.
+_THUMBNAIL_WIDTH_PX = 800
+
 
 @with_retry(max_attempts=3, delay_ms=1000)
 def fetch_presentation(
@@ -48,7 +71,8 @@ def fetch_presentation(
 
     Calls:
     1. presentations().get() for structure and text
-    2. Concurrent pages().getThumbnail() for slides needing thumbnails
+    2. Thumbnails for slides needing them — concurrent pages().getThumbnail(),
+       or for many slides one PDF export rendered locally (see module doc)
 
     Thumbnail API calls use isolated service objects per thread (shared httplib2
     connections cause SSL corruption). Capped at 2 concurrent workers — Google
@@ -94,10 +118,8 @@ def _fetch_thumbnails_selective(
     - needs_thumbnail=False (stock photos, text-only)
     - slide_id is missing
 
-    getThumbnail API calls run concurrently — httpx's connection pool is
-    thread-safe, so all threads share the singleton client (no per-thread
-    isolation needed unlike the old httplib2 pattern).
-    Image downloads are also parallelized.
+    Decks with PDF_ENGINE_MIN_SLIDES or more flagged slides go through the
+    pdf engine; if that fails, or for smaller decks, the api engine.
 
     Updates data.slides[i].thumbnail_bytes in place.
     """
@@ -108,6 +130,73 @@ def _fetch_thumbnails_selective(
     if not target_slides:
         return
 
+    if len(target_slides) < PDF_ENGINE_MIN_SLIDES or not _fetch_thumbnails_via_pdf(
+        presentation_id, data, target_slides
+    ):
+        _fetch_thumbnails_via_api(presentation_id, data, target_slides)
+
+    data.thumbnails_included = any(s.thumbnail_bytes for s in data.slides)
+
+
+def _fetch_thumbnails_via_pdf(
+    presentation_id: str,
+    data: PresentationData,
+    target_slides: list[SlideData],
+) -> bool:
+    """
+    The pdf engine: export the deck once, render the target slides' pages.
+
+    Returns False — having set nothing — when the result can't be trusted:
+    the export failed (Drive caps exports at 10MB), poppler is missing, or
+    the PDF's page count doesn't match the slide count, so page i might not
+    be slide i.
+    """
+    from adapters.drive import export_file
+    from adapters.pdf_info import count_pdf_pages
+    from adapters.pdf_render import render_pdf_page_selection
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf_path = Path(tmp) / "deck.pdf"
+        try:
+            with span("thumbnails.export"):
+                pdf_path.write_bytes(export_file(presentation_id, "application/pdf"))
+            page_count = count_pdf_pages(file_path=pdf_path)
+            if page_count != len(data.slides):
+                logger.info(
+                    "PDF export has %s pages for %d slides; using getThumbnail",
+                    page_count, len(data.slides),
+                )
+                return False
+            with span("thumbnails.render"):
+                rendered = render_pdf_page_selection(
+                    pdf_path, [s.index for s in target_slides], _THUMBNAIL_WIDTH_PX,
+                )
+        except Exception as e:
+            logger.info("PDF thumbnail engine unavailable (%s); using getThumbnail", e)
+            return False
+
+    for slide in target_slides:
+        image = rendered.get(slide.index)
+        if image is not None:
+            slide.thumbnail_bytes = image
+        else:
+            slide.warnings.append("Thumbnail unavailable: PDF page could not be rendered")
+    return True
+
+
+def _fetch_thumbnails_via_api(
+    presentation_id: str,
+    data: PresentationData,
+    target_slides: list[SlideData],
+) -> None:
+    """
+    The api engine: getThumbnail per slide, then download each contentUrl.
+
+    getThumbnail API calls run concurrently — httpx's connection pool is
+    thread-safe, so all threads share the singleton client (no per-thread
+    isolation needed unlike the old httplib2 pattern).
+    Image downloads are also parallelized.
+    """
     client = get_sync_client()
     slide_by_id = {s.slide_id: s for s in data.slides if s.slide_id}
 
@@ -174,5 +263,3 @@ def _fetch_thumbnails_selective(
             slide.thumbnail_bytes = image_data
         elif error:
             slide.warnings.append(error)
-
-    data.thumbnails_included = any(s.thumbnail_bytes for s in data.slides)
@@ -538,6 +538,26 @@ function buildDescription(message, contentHash) {
   ].join('\n');
 }
 
+/**
+ * Build exact-match lookup tags for an uploaded file.
+ * mise finds a message's copies with `properties has {...}` queries — far
+ * cheaper than fullText over descriptions. Public properties, not
+ * appProperties: those are private to this script's Cloud project, and mise
+ * queries through its own OAuth client, which could never see them. Keys must match MESSAGE_ID_PROPERTY
+ * and CONTENT_HASH_PROPERTY in mise's adapters/drive_exfil.py.
+ * Apps Script exposes no stable Gmail attachment id, so the content hash
+ * identifies the attachment within its message.
+ * @param {string} messageId
+ * @param {string} contentHash
+ * @returns {Object<string, string>}
+ */
+function buildLookupProperties(messageId, contentHash) {
+  return {
+    miseMessageId: messageId,
+    miseContentHash: contentHash,
+  };
+}
+
 /**
  * Process a single message: extract attachments and Drive links, upload to Drive.
  * @param {GoogleAppsScript.Gmail.GmailMessage} message
@@ -606,6 +626,7 @@ function processMessage(message, contentHashes, dryRun = false, attemptedFileIds
         name: filename,
         parents: [folder.getId()],
         description: description,
+        properties: buildLookupProperties(messageId, hash),
         modifiedTime: messageDate.toISOString()
       };
       Drive.Files.create(fileMetadata, blob);
@@ -1785,6 +1806,118 @@ function repairFileTimestamps(batchSize = 100, dryRun = false) {
   return stats;
 }
 
+/**
+ * Backfill lookup tags (properties) onto files uploaded before they existed,
+ * or tagged only with the appProperties mise cannot read.
+ * Reads Message ID and Content Hash from each description — shortcuts
+ * ("Linked from email. Message ID: …") are not attachment copies and are
+ * left untagged. Idempotent, so re-running over tagged files is harmless.
+ * Processes files in batches to avoid timeouts.
+ *
+ * @param {number} [batchSize=200] - Files to process per run
+ * @param {boolean} [dryRun=false] - If true, report what would be tagged without changing
+ * @returns {{processed: number, tagged: number, skipped: number, errors: number}}
+ */
+function backfillLookupProperties(batchSize = 200, dryRun = false) {
+  const root = getOrCreateRootFolder();
+  const folders = root.getFolders();
+
+  let processed = 0;
+  let tagged = 0;
+  let skipped = 0;
+  let errors = 0;
+
+  // Get checkpoint to resume from previous run
+  const props = PropertiesService.getScriptProperties();
+  const lastFolder = props.getProperty('lookup_tags_last_folder') || '';
+  const lastOffset = parseInt(props.getProperty('lookup_tags_last_offset') || '0', 10);
+  let currentOffset = 0;
+  let reachedCheckpoint = lastFolder === '';
+
+  console.log(`[Tags] Starting${dryRun ? ' [DRY RUN]' : ''}, batch size: ${batchSize}`);
+  if (lastFolder) {
+    console.log(`[Tags] Resuming from folder ${lastFolder}, offset ${lastOffset}`);
+  }
+
+  while (folders.hasNext() && processed < batchSize) {
+    const folder = folders.next();
+    const folderName = folder.getName();
+
+    // Skip folders until we reach checkpoint
+    if (!reachedCheckpoint) {
+      if (folderName === lastFolder) {
+        reachedCheckpoint = true;
+      } else {
+        continue;
+      }
+    }
+
+    const files = folder.getFiles();
+    currentOffset = 0;
+
+    while (files.hasNext() && processed < batchSize) {
+      const file = files.next();
+      currentOffset++;
+
+      // Skip files until we reach offset in checkpoint folder
+      if (folderName === lastFolder && currentOffset <= lastOffset) {
+        continue;
+      }
+
+      try {
+        const description = file.getDescription() || '';
+        const idMatch = description.match(/^Message ID: (\w+)/m);
+        const hashMatch = description.match(/^Content Hash: ([a-f0-9]+)/m);
+
+        if (!idMatch || !hashMatch) {
+          skipped++;
+          processed++;
+          continue;
+        }
+
+        if (dryRun) {
+          console.log(`[Tags] Would tag: ${file.getName()} (${idMatch[1]})`);
+        } else {
+          // Carry modifiedTime along: it holds the email date, and a metadata
+          // update must not replace it with today
+          Drive.Files.update(
+            {
+              properties: buildLookupProperties(idMatch[1], hashMatch[1]),
+              modifiedTime: file.getLastUpdated().toISOString()
+            },
+            file.getId()
+          );
+        }
+
+        tagged++;
+        processed++;
+
+      } catch (e) {
+        console.error(`[Tags] Error on ${file.getName()}: ${e.message}`);
+        errors++;
+        processed++;
+      }
+    }
+
+    // Save checkpoint after each folder
+    if (!dryRun && processed > 0) {
+      props.setProperty('lookup_tags_last_folder', folderName);
+      props.setProperty('lookup_tags_last_offset', String(currentOffset));
+    }
+  }
+
+  // Clear checkpoint if we finished all folders
+  if (!folders.hasNext() && !dryRun) {
+    props.deleteProperty('lookup_tags_last_folder');
+    props.deleteProperty('lookup_tags_last_offset');
+    console.log('[Tags] Completed all folders, checkpoint cleared');
+  }
+
+  const stats = { processed, tagged, skipped, errors, dryRun, done: !folders.hasNext() };
+  console.log(`[Tags] Complete: ${JSON.stringify(stats)}`);
+  return stats;
+}
+
 /**
  * Clear repair checkpoint to start fresh.
  */
@@ -1936,6 +2069,44 @@ function triggeredRepair() {
   return result;
 }
 
+/**
+ * Set up a trigger to backfill lookup tags in batches.
+ * Runs every 5 minutes until all folders are done, then auto-removes itself.
+ */
+function setupTagBackfillTrigger() {
+  // Remove any existing tag trigger
+  const triggers = ScriptApp.getProjectTriggers();
+  for (const trigger of triggers) {
+    if (trigger.getHandlerFunction() === 'triggeredTagBackfill') {
+      ScriptApp.deleteTrigger(trigger);
+    }
+  }
+
+  ScriptApp.newTrigger('triggeredTagBackfill').timeBased().everyMinutes(5).create();
+  console.log('Created tag backfill trigger (every 5 minutes)');
+  return { created: true, interval: '5 minutes' };
+}
+
+/**
+ * Triggered tag backfill - processes batch and auto-removes trigger when done.
+ */
+function triggeredTagBackfill() {
+  const result = backfillLookupProperties(500, false);
+  console.log(`[Tags Trigger] ${JSON.stringify(result)}`);
+
+  if (result.done) {
+    const triggers = ScriptApp.getProjectTriggers();
+    for (const trigger of triggers) {
+      if (trigger.getHandlerFunction() === 'triggeredTagBackfill') {
+        ScriptApp.deleteTrigger(trigger);
+        console.log('[Tags Trigger] Complete - trigger removed');
+      }
+    }
+  }
+
+  return result;
+}
+
 /**
  * Clear all triggers for this project.
  */
@@ -4,46 +4,61 @@ CLI interface for mise-en-space.
 
 Usage:
     mise search "query"
-    mise fetch <file_id_or_url>
+    mise fetch <file_id_or_url> [<file_id_or_url> ...]
     mise create "Title" --content "markdown"
+    mise gc [--dry-run]
+    mise daemon stop
 
 This provides the same functionality as the MCP tools but via command line,
 making it accessible to agents that don't support MCP (like pi).
+
+With MISE_CLI_DAEMON=1, commands run in a warm background process (see
+cli_daemon.py) — imports, credentials, connection pools and caches are paid
+for once per session instead of once per call.
 """
 
 import argparse
 import json
+import os
 import sys
-
-from tools import do_search, do_fetch, do_create
+from pathlib import Path
+from typing import Any
 
 
-def cmd_search(args: argparse.Namespace) -> None:
+def cmd_search(args: argparse.Namespace, cwd: Path) -> dict[str, Any]:
     """Search Drive and Gmail."""
+    from tools import do_search  # per command: each pays only for its own imports
     sources = args.sources if args.sources else None
-    result = do_search(args.query, sources, args.max_results)
-    print(json.dumps(result.to_dict(), indent=2))
+    return do_search(args.query, sources, args.max_results, base_path=cwd).to_dict()
 
 
-def cmd_fetch(args: argparse.Namespace) -> None:
-    """Fetch content to filesystem."""
-    result = do_fetch(args.file_id)
-    print(json.dumps(result.to_dict(), indent=2))
+def cmd_fetch(args: argparse.Namespace, cwd: Path) -> dict[str, Any]:
+    """Fetch content to filesystem — several ids fetch concurrently."""
+    from tools import do_fetch
+    return do_fetch(args.file_id[0] if len(args.file_id) == 1 else args.file_id, base_path=cwd).to_dict()
 
 
-def cmd_create(args: argparse.Namespace) -> None:
+def cmd_create(args: argparse.Namespace, cwd: Path) -> dict[str, Any]:
     """Create Google Doc from markdown."""
+    from tools import do_create
     content = args.content
     if content is None:
         # Read from stdin if no --content provided
         content = sys.stdin.read()
 
-    result = do_create(content, args.title, args.type, args.folder)
-    print(json.dumps(result.to_dict(), indent=2))
+    result = do_create(content, args.title, args.type, args.folder, base_path=str(cwd))
+    return result if isinstance(result, dict) else result.to_dict()
 
 
-def main() -> None:
+def cmd_gc(args: argparse.Namespace, cwd: Path) -> dict[str, Any]:
+    """Trim .mise/ to the retention policy."""
+    from tools.gc import do_gc
+    return do_gc(cwd, dry_run=args.dry_run, max_bytes=args.max_bytes, max_age_days=args.max_age_days)
+
+
+def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
+        prog="mise",
         description="Google Workspace content fetching CLI",
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
@@ -52,8 +67,11 @@ Examples:
     mise search "from:alice budget" --sources gmail
     mise fetch 1abc123def456
     mise fetch "https://docs.google.com/document/d/1abc.../edit"
+    mise fetch 1abc123def456 1xyz789ghi012 19a8b7c6d5e4f3a2
     mise create "Meeting Notes" --content "# Meeting Notes\\n\\n- Item 1"
     echo "# Notes" | mise create "Notes"
+    mise gc --dry-run --max-bytes 2G         # what retention would remove here
+    MISE_CLI_DAEMON=1 mise search "budget"    # later calls reuse a warm process
 """,
     )
     subparsers = parser.add_subparsers(dest="command", required=True)
@@ -79,7 +97,8 @@ Examples:
     fetch_p = subparsers.add_parser("fetch", help="Fetch content to mise/")
     fetch_p.add_argument(
         "file_id",
-        help="Drive file ID, Gmail thread ID, or Google URL (Drive, Gmail)",
+        nargs="+",
+        help="Drive file ID, Gmail thread ID, or Google URL (Drive, Gmail); several fetch as one batch",
     )
     fetch_p.set_defaults(func=cmd_fetch)
 
@@ -102,8 +121,55 @@ Examples:
     )
     create_p.set_defaults(func=cmd_create)
 
-    args = parser.parse_args()
-    args.func(args)
+    # gc
+    gc_p = subparsers.add_parser("gc", help="Remove old deposits from .mise/ (MISE_GC_* settings)")
+    gc_p.add_argument("--dry-run", action="store_true", help="List what would be removed")
+    gc_p.add_argument("--max-bytes", help="Total size to trim .mise/ to, e.g. 2G (0 = no limit)")
+    gc_p.add_argument("--max-age-days", type=float, help="Remove deposits not accessed for this long (0 = no limit)")
+    gc_p.set_defaults(func=cmd_gc)
+
+    # daemon
+    daemon_p = subparsers.add_parser("daemon", help="Control the warm background process")
+    daemon_p.add_argument("action", choices=["stop", "status"])
+    daemon_p.set_defaults(func=None)
+
+    return parser
+
+
+def run(argv: list[str], cwd: Path, stdin: str | None = None) -> dict[str, Any]:
+    """Parse and execute one command; cwd is where deposits land, stdin is the caller's piped input."""
+    args = build_parser().parse_args(argv)
+    if stdin is not None and getattr(args, "content", "") is None:
+        args.content = stdin
+    result: dict[str, Any] = args.func(args, cwd)
+    return result
+
+
+def main() -> None:
+    argv = sys.argv[1:]
+    args = build_parser().parse_args(argv)  # usage errors exit here, in the caller's terminal
+    cwd = Path.cwd()
+
+    if args.command == "daemon":
+        from cli_daemon import daemon_status, stop_daemon
+        print(json.dumps(stop_daemon() if args.action == "stop" else daemon_status(), indent=2))
+        return
+
+    if os.environ.get("MISE_CLI_DAEMON", "") not in ("", "0"):
+        from cli_daemon import forward
+        stdin = None
+        if args.command == "create" and args.content is None:
+            # The daemon can't read our stdin — send the content along, and
+            # keep it for the local run too, since stdin is now spent. It
+            # travels beside argv, never through argparse, which would read
+            # content like "---" as a flag and drop a bare "--".
+            args.content = stdin = sys.stdin.read()
+        forwarded = forward(argv, cwd, stdin=stdin)
+        if forwarded is not None:
+            sys.stdout.write(forwarded)
+            return
+
+    print(json.dumps(args.func(args, cwd), indent=2))
 
 
 if __name__ == "__main__":
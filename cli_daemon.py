@@ -0,0 +1,263 @@
+"""
+Warm CLI daemon — `mise` calls forwarded to one long-lived process.
+
+A fresh `mise` process re-imports the package, reloads credentials,
+re-resolves the user's address and opens a cold TLS connection pool before
+it does any work. Agents that shell out hundreds of times a session pay that
+on every call. With MISE_CLI_DAEMON=1:
+
+- The first call finds no daemon, starts one in the background and runs
+  in-process itself — nobody waits for the daemon to come up.
+- Later calls connect to SOCKET_PATH, send their argv and cwd, and print
+  the JSON the daemon sends back. Deposits land in the caller's cwd.
+- The daemon exits after IDLE_SECONDS without a request, or on
+  `mise daemon stop`. A daemon that can't be reached — not running, stale
+  socket — means the call runs in-process. One that dies mid-call is
+  reported as an error instead: the call may already have run, and a
+  create must not run twice.
+
+The socket sits in a 0700 directory: the daemon acts with the user's
+Google credentials, so only the user may talk to it. Code changes need a
+`mise daemon stop` to take effect.
+
+A daemon keeps the environment it started with, and that environment picks
+the identity (MISE_TOKEN_PATH, MISE_CREDENTIALS) and the behaviour (MISE_*
+flags). So each distinct environment gets its own daemon: the socket name
+carries a hash of it. Every request also carries it, and a daemon refuses
+one that doesn't match its own — the caller then runs in-process rather
+than as someone else.
+"""
+
+import fcntl
+import hashlib
+import json
+import logging
+import os
+import socket
+import socketserver
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Outside MISE_*, what else chooses whose credentials a call runs with
+_IDENTITY_VARS = ("GOOGLE_APPLICATION_CREDENTIALS",)
+# Paths, resolved against the caller's cwd: the daemon runs elsewhere
+_PATH_VARS = ("MISE_TOKEN_PATH", "GOOGLE_APPLICATION_CREDENTIALS")
+
+
+def _environment() -> dict[str, str]:
+    """The variables that shape a call, with relative paths made absolute."""
+    env = {
+        name: value for name, value in os.environ.items()
+        if (name.startswith("MISE_") and not name.startswith("MISE_CLI_DAEMON"))
+        or name in _IDENTITY_VARS
+    }
+    for name in _PATH_VARS:
+        if env.get(name):
+            env[name] = os.path.abspath(env[name])
+    return dict(sorted(env.items()))
+
+
+_ENV_KEY = hashlib.sha256(json.dumps(_environment()).encode()).hexdigest()[:12]
+
+RUNTIME_DIR = Path.home() / ".cache" / "mise" / "cli-daemon"
+SOCKET_PATH = RUNTIME_DIR / f"mise-{_ENV_KEY}.sock"
+LOCK_PATH = RUNTIME_DIR / f"mise-{_ENV_KEY}.lock"
+IDLE_SECONDS = float(os.environ.get("MISE_CLI_DAEMON_IDLE", "900"))
+
+# A call that takes longer than this is still a call in progress, not a
+# dead daemon: fetches of large folders legitimately run for minutes.
+_CALL_TIMEOUT = 600.0
+_CONNECT_TIMEOUT = 0.5
+
+
+# =============================================================================
+# CLIENT
+# =============================================================================
+
+
+def forward(argv: list[str], cwd: Path, stdin: str | None = None) -> str | None:
+    """
+    Run one CLI call in the daemon. stdin is the caller's piped input, if read.
+
+    Returns:
+        The daemon's JSON output, or None — the caller then runs the command
+        itself. A missing daemon is started in the background for next time;
+        one started with a different environment refuses the call.
+    """
+    try:
+        sock = _connect()
+    except OSError as e:  # no socket, or one a dead daemon left behind
+        logger.info("CLI daemon unavailable, running in-process: %s", e)
+        _spawn()
+        return None
+    try:
+        reply = _exchange(sock, {"argv": argv, "cwd": str(cwd), "stdin": stdin, "env": _environment()})
+    except (OSError, ValueError) as e:
+        # Delivered, then lost: the call may have run (a create would have
+        # made its doc), so running it again here could do it twice.
+        return json.dumps({
+            "error": True, "kind": "unknown",
+            "message": f"The mise CLI daemon failed mid-call ({e}). Check before retrying "
+                       "anything that writes; `mise daemon stop` resets it.",
+        }, indent=2) + "\n"
+    output = reply.get("output")
+    return output if isinstance(output, str) else None
+
+
+def stop_daemon() -> dict[str, Any]:
+    """Ask a running daemon to exit after its in-flight calls."""
+    try:
+        return _request({"op": "stop"})
+    except OSError:
+        return {"running": False}
+
+
+def daemon_status() -> dict[str, Any]:
+    """Whether a daemon is answering, and since when."""
+    try:
+        return _request({"op": "status"})
+    except OSError:
+        return {"running": False}
+
+
+def _request(message: dict[str, Any]) -> dict[str, Any]:
+    return _exchange(_connect(), message)
+
+
+def _connect() -> socket.socket:
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(_CONNECT_TIMEOUT)
+        sock.connect(str(SOCKET_PATH))
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+def _exchange(sock: socket.socket, message: dict[str, Any]) -> dict[str, Any]:
+    """One request/response — a JSON line each way — then close."""
+    with sock:
+        sock.settimeout(_CALL_TIMEOUT)
+        sock.sendall(json.dumps(message).encode() + b"\n")
+        sock.shutdown(socket.SHUT_WR)
+        chunks = []
+        while chunk := sock.recv(65536):
+            chunks.append(chunk)
+    reply: dict[str, Any] = json.loads(b"".join(chunks))
+    return reply
+
+
+def _spawn() -> None:
+    """Start a detached daemon; it exits at once if another holds the lock."""
+    try:
+        subprocess.Popen(
+            [sys.executable, str(Path(__file__).resolve()), "--serve"],
+            cwd=Path(__file__).resolve().parent,
+            env={**os.environ, **_environment()},  # relative paths resolved here, not there
+            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except OSError as e:
+        logger.info("Could not start the CLI daemon: %s", e)
+
+
+# =============================================================================
+# SERVER
+# =============================================================================
+
+
+class _Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path: str) -> None:
+        super().__init__(path, _Handler)
+        self.started = time.time()
+        self.last_active = time.monotonic()
+        self.in_flight = 0
+        self.calls = 0
+        self.env = _environment()
+        self.state_lock = threading.Lock()
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    server: _Server
+
+    def handle(self) -> None:
+        server = self.server
+        with server.state_lock:
+            server.in_flight += 1
+        try:
+            message = json.loads(self.rfile.readline() or b"{}")
+            reply = self._answer(message)
+        except Exception as e:  # one bad request must not take the daemon down
+            reply = {"output": json.dumps({"error": True, "kind": "unknown", "message": str(e)}, indent=2) + "\n"}
+        finally:
+            with server.state_lock:
+                server.in_flight -= 1
+                server.last_active = time.monotonic()
+        self.wfile.write(json.dumps(reply).encode())
+
+    def _answer(self, message: dict[str, Any]) -> dict[str, Any]:
+        server = self.server
+        if message.get("op") == "stop":
+            threading.Thread(target=server.shutdown, daemon=True).start()
+            return {"running": False, "stopped": True}
+        if message.get("op") == "status":
+            return {"running": True, "pid": os.getpid(), "started": server.started, "calls": server.calls}
+        if message.get("env") != server.env:
+            # Another identity or other flags: answering would act as the
+            # wrong account. No output sends the caller back in-process.
+            logger.info("CLI daemon refused a call from a different environment")
+            return {"refused": "environment"}
+
+        with server.state_lock:
+            server.calls += 1
+        import cli  # the daemon runs exactly the code an in-process call would
+        try:
+            result = cli.run(list(message["argv"]), Path(message["cwd"]), message.get("stdin"))
+        except SystemExit as e:  # argparse — main() already validated, so rare
+            result = {"error": True, "kind": "invalid_input", "message": f"bad arguments (exit {e.code})"}
+        return {"output": json.dumps(result, indent=2) + "\n"}
+
+
+def serve() -> None:
+    """Run the daemon until idle or stopped. One per user and environment, by lock."""
+    RUNTIME_DIR.mkdir(parents=True, exist_ok=True)
+    os.chmod(RUNTIME_DIR, 0o700)
+    with open(LOCK_PATH, "w") as lock:
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return  # another daemon is up, or starting
+        SOCKET_PATH.unlink(missing_ok=True)  # left by a daemon that died
+        server = _Server(str(SOCKET_PATH))
+        os.chmod(SOCKET_PATH, 0o600)
+        watchdog = threading.Thread(target=_shutdown_when_idle, args=(server,), daemon=True)
+        watchdog.start()
+        try:
+            server.serve_forever(poll_interval=0.5)
+        finally:
+            server.server_close()
+            SOCKET_PATH.unlink(missing_ok=True)
+
+
+def _shutdown_when_idle(server: _Server) -> None:
+    while True:
+        time.sleep(min(IDLE_SECONDS, 30.0))
+        with server.state_lock:
+            idle = server.in_flight == 0 and time.monotonic() - server.last_active >= IDLE_SECONDS
+        if idle:
+            server.shutdown()
+            return
+
+
+if __name__ == "__main__":
+    if sys.argv[1:] == ["--serve"]:
+        serve()
@@ -0,0 +1,174 @@
+"""
+Per-tab Docs rendering — the half of extract_doc_content that can fan out.
+
+Each tab renders from its own footnotes, lists and inline objects, so tabs
+are independent until assembly. extract_doc_content renders them one after
+another; extract_doc_content_parallel renders them on a process pool (the
+walk is pure-Python CPU, so threads would share one core) and assembles the
+results in tab order through the same _assemble_tabs.
+
+What assembly keeps identical whichever way the tabs were rendered:
+- max_length truncation: tabs are consumed in order and assembly stops at
+  the tab that crosses the limit, cutting it at the same character.
+- Warnings: unknown element types and missing inline objects are aggregated
+  from exactly the tabs that were reached, in tab order.
+- Line alignment: the separators and injected "# {title}" headers are
+  byte-identical, so build_doc_structure's line numbers are unchanged.
+
+Rendering every tab up front costs the tabs past a truncation point some
+wasted work on the pool; queued tabs are cancelled once assembly stops.
+
+The pool is created on first use and kept, one per worker count, so only
+the first large document pays worker start-up. Workers are spawned, never
+forked: the server is multithreaded, and a forked child inherits whatever
+locks its other threads held at the moment of the fork.
+"""
+
+import gc
+import multiprocessing
+import os
+import threading
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+
+from models import DocData, DocTab
+from extractors.docs import _extract_text_from_elements, _render_footnote_definitions
+
+# A pool costs worker start-up plus pickling every tab across; below these
+# sizes the serial walk finishes first. Elements are top-level structural
+# elements summed over the tabs.
+PARALLEL_MIN_TABS = 4
+PARALLEL_MIN_ELEMENTS = 20_000
+MAX_WORKERS = 8
+# A long-lived worker is replaced after this many tabs, bounding whatever
+# it accumulates with the collector off (see _pool)
+TABS_PER_WORKER = 500
+
+_pools: dict[int, ProcessPoolExecutor] = {}
+_pools_lock = threading.Lock()
+
+TabRender = tuple[str, set[str], list[str]]
+
+
+def extract_doc_content_parallel(
+    data: DocData,
+    max_length: int | None = None,
+    workers: int | None = None,
+) -> str:
+    """
+    extract_doc_content, with tabs rendered concurrently on a process pool.
+
+    Output and data.warnings are identical to extract_doc_content's.
+
+    Args:
+        data: DocData with title and tabs
+        max_length: Optional character limit. Truncates if exceeded.
+        workers: Pool size. None decides from the document: small documents
+            (under PARALLEL_MIN_TABS tabs or PARALLEL_MIN_ELEMENTS elements)
+            render serially, large ones on up to MAX_WORKERS processes.
+    """
+    if workers is None:
+        elements = sum(len(tab.body.get("content", [])) for tab in data.tabs)
+        big = len(data.tabs) >= PARALLEL_MIN_TABS and elements >= PARALLEL_MIN_ELEMENTS
+        workers = min(len(data.tabs), os.cpu_count() or 1, MAX_WORKERS) if big else 1
+    if workers < 2:
+        return _assemble_tabs(data, map(_render_tab, data.tabs), max_length)
+
+    futures = [_pool(workers).submit(_render_tab, tab) for tab in data.tabs]
+    try:
+        return _assemble_tabs(data, (future.result() for future in futures), max_length)
+    finally:
+        # The pool outlives this document — drop only its tabs still queued
+        for future in futures:
+            future.cancel()
+
+
+def _pool(workers: int) -> ProcessPoolExecutor:
+    """The shared pool of this many workers, spawned on first use."""
+    with _pools_lock:
+        pool = _pools.get(workers)
+        if pool is None:
+            # Rendering makes no cycles; the collector only slows unpickling
+            # the tabs (every nested dict is a GC-tracked allocation)
+            pool = _pools[workers] = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=gc.disable,
+                max_tasks_per_child=TABS_PER_WORKER,
+            )
+        return pool
+
+
+def _render_tab(tab: DocTab) -> TabRender:
+    """
+    One tab's markdown, title header included, plus the warnings it raised.
+
+    Returns:
+        (tab content, unknown element types, missing inline object ids)
+    """
+    unknown_elements: set[str] = set()
+    missing_objects: list[str] = []
+    collected_footnotes: list[tuple[str, str]] = []
+    tab_text = _extract_text_from_elements(
+        tab.body.get("content", []),
+        tab.footnotes,
+        collected_footnotes,
+        tab.lists,
+        None,  # list_counters
+        tab.inline_objects,
+        unknown_elements,
+        missing_objects,
+    )
+
+    # Add footnote definitions if any
+    tab_text += _render_footnote_definitions(collected_footnotes, tab.footnotes)
+
+    # Add tab title header if content doesn't start with H1
+    if not tab_text.lstrip().startswith("# "):
+        tab_text = f"# {tab.title}\n\n{tab_text}"
+    return tab_text, unknown_elements, missing_objects
+
+
+def _assemble_tabs(data: DocData, rendered: Iterable[TabRender], max_length: int | None) -> str:
+    """Join rendered tabs in order — truncation and warnings for extract_doc_content."""
+    content_parts: list[str] = []
+    total_length = 0
+
+    # Seed warnings from the adapter (e.g. checkbox export desync), then set up
+    # tracking. The adapter runs before extraction, so clearing unconditionally
+    # would drop its warnings.
+    data.warnings = list(data.adapter_warnings)
+    unknown_elements: set[str] = set()
+    missing_objects: list[str] = []
+
+    for i, (tab_content, tab_unknown, tab_missing) in enumerate(rendered):
+        # Add separator between tabs
+        if i > 0:
+            content_parts.append("\n\n" + "=" * 60 + "\n")
+        unknown_elements |= tab_unknown
+        missing_objects.extend(tab_missing)
+
+        # Check length limit
+        if max_length and (total_length + len(tab_content)) > max_length:
+            remaining = max_length - total_length
+            if remaining > 100:
+                content_parts.append(tab_content[:remaining])
+                original = total_length + len(tab_content)
+                content_parts.append(
+                    f"\n\n[... TRUNCATED at {max_length:,} chars "
+                    f"(document is {original:,} chars) ...]"
+                )
+            data.warnings.append(f"Content truncated at {max_length:,} characters")
+            break
+
+        content_parts.append(tab_content)
+        total_length += len(tab_content)
+
+    # Aggregate warnings
+    if unknown_elements:
+        data.warnings.append(f"Unknown element types ignored: {', '.join(sorted(unknown_elements))}")
+    if missing_objects:
+        data.warnings.append(f"Missing inline objects: {', '.join(missing_objects[:5])}" +
+                            (f" (+{len(missing_objects)-5} more)" if len(missing_objects) > 5 else ""))
+
+    return "".join(content_parts).strip()
@@ -36,67 +36,10 @@ def extract_doc_content(
 
             More content...
     """
-    content_parts: list[str] = []
-    total_length = 0
-
-    # Seed warnings from the adapter (e.g. checkbox export desync), then set up
-    # tracking. The adapter runs before extraction, so clearing unconditionally
-    # would drop its warnings.
-    data.warnings = list(data.adapter_warnings)
-    unknown_elements: set[str] = set()
-    missing_objects: list[str] = []
-
-    for i, tab in enumerate(data.tabs):
-        # Add separator between tabs
-        if i > 0:
-            content_parts.append("\n\n" + "=" * 60 + "\n")
-
-        # Extract tab content
-        collected_footnotes: list[tuple[str, str]] = []
-        tab_text = _extract_text_from_elements(
-            tab.body.get("content", []),
-            tab.footnotes,
-            collected_footnotes,
-            tab.lists,
-            None,  # list_counters
-            tab.inline_objects,
-            unknown_elements,
-            missing_objects,
-        )
-
-        # Add footnote definitions if any
-        tab_text += _render_footnote_definitions(collected_footnotes, tab.footnotes)
-
-        # Add tab title header if content doesn't start with H1
-        if not tab_text.lstrip().startswith("# "):
-            tab_content = f"# {tab.title}\n\n{tab_text}"
-        else:
-            tab_content = tab_text
-
-        # Check length limit
-        if max_length and (total_length + len(tab_content)) > max_length:
-            remaining = max_length - total_length
-            if remaining > 100:
-                content_parts.append(tab_content[:remaining])
-                original = total_length + len(tab_content)
-                content_parts.append(
-                    f"\n\n[... TRUNCATED at {max_length:,} chars "
-                    f"(document is {original:,} chars) ...]"
-                )
-            data.warnings.append(f"Content truncated at {max_length:,} characters")
-            break
-
-        content_parts.append(tab_content)
-        total_length += len(tab_content)
-
-    # Aggregate warnings
-    if unknown_elements:
-        data.warnings.append(f"Unknown element types ignored: {', '.join(sorted(unknown_elements))}")
-    if missing_objects:
-        data.warnings.append(f"Missing inline objects: {', '.join(missing_objects[:5])}" +
-                            (f" (+{len(missing_objects)-5} more)" if len(missing_objects) > 5 else ""))
+    # Per-tab rendering and assembly live in doc_tabs (which imports this module)
+    from extractors.doc_tabs import _assemble_tabs, _render_tab
 
-    return "".join(content_parts).strip()
+    return _assemble_tabs(data, map(_render_tab, data.tabs), max_length)
 
 
 # =============================================================================
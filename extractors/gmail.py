@@ -14,6 +14,7 @@ from models import GmailThreadData, EmailMessage, ForwardedMessage
 from html_convert import clean_html_for_conversion as _clean_html_for_conversion
 
 from .talon_signature import strip_signature_and_quotes
+from .thread_dedup import elide_seen_paragraphs, elision_marker, remember_paragraphs
 
 
 def _convert_html_to_markdown(html: str) -> tuple[str, bool]:
@@ -48,6 +49,7 @@ def _convert_html_to_markdown(html: str) -> tuple[str, bool]:
 def extract_message_content(
     message: EmailMessage,
     strip_signature: bool = True,
+    seen: set[int] | None = None,
 ) -> tuple[str, list[str]]:
     """
     Extract clean text content from a single email message.
@@ -55,6 +57,9 @@ def extract_message_content(
     Args:
         message: EmailMessage with body_text and/or body_html
         strip_signature: Whether to strip signatures and quoted replies
+        seen: Thread-wide paragraph set (see thread_dedup). When given,
+            paragraphs an earlier message carried are elided, and this
+            message's paragraphs are added for the messages after it.
 
     Returns:
         Tuple of (clean_text_content, warnings_list)
@@ -77,11 +82,22 @@ def extract_message_content(
         warnings.append("Message has no body content")
         return '', warnings
 
+    # Elide re-quoted history first — talon then only walks the new text
+    elided_tail = 0
+    if seen is not None:
+        source = body
+        body, elided_tail = elide_seen_paragraphs(body, seen)
+        remember_paragraphs(source, seen)
+
     # Strip signatures and quoted replies if requested
     if strip_signature and body:
         body, strip_warnings = strip_signature_and_quotes(body)
         warnings.extend(strip_warnings)
 
+    if elided_tail:
+        marker = elision_marker(elided_tail)
+        body = f"{body.rstrip()}\n\n{marker}" if body.strip() else marker
+
     # Append MIME-forwarded messages (message/rfc822 parts)
     # These are invisible to the plain text parser — they're binary MIME parts,
     # not inline text. We append them with clear attribution so the content
@@ -141,6 +157,7 @@ def extract_thread_content(
     data: GmailThreadData,
     max_length: int | None = None,
     strip_signatures: bool = True,
+    dedupe_quotes: bool = True,
 ) -> str:
     """
     Convert Gmail thread data to markdown text.
@@ -151,6 +168,8 @@ def extract_thread_content(
         data: GmailThreadData with subject and messages
         max_length: Optional character limit. Truncates if exceeded.
         strip_signatures: Whether to strip signatures from each message
+        dedupe_quotes: Whether to elide paragraphs an earlier message in the
+            thread already carried (Outlook-style unprefixed quoting)
 
     Returns:
         Formatted thread content with message headers and clean body text.
@@ -179,6 +198,9 @@ def extract_thread_content(
     content_parts.append(header)
     total_length += len(header)
 
+    # Paragraph hashes carried by the messages so far (thread_dedup)
+    seen: set[int] | None = set() if dedupe_quotes else None
+
     # Process each message
     truncated = False
     for i, message in enumerate(data.messages, start=1):
@@ -203,7 +225,9 @@ def extract_thread_content(
         total_length += len(msg_header_block)
 
         # Message body
-        body, msg_warnings = extract_message_content(message, strip_signature=strip_signatures)
+        body, msg_warnings = extract_message_content(
+            message, strip_signature=strip_signatures, seen=seen,
+        )
         for w in msg_warnings:
             data.warnings.append(f"Message {i}: {w}")
 
@@ -3,7 +3,9 @@
 import io
 from dataclasses import dataclass, field
 
-from PIL import Image
+# PIL is imported inside the two functions that use it: this module's
+# constants are read on every fetch import path, and Pillow costs more to
+# import than the rest of the fetch router together.
 
 
 # Claude API hard limits (per-axis px; raw bytes). Tool constants may add headroom.
@@ -58,6 +60,8 @@ def validate_image_bytes(content_bytes: bytes, max_dimension_px: int = MAX_IMAGE
 
     Does NOT validate SVG — callers should skip validation for image/svg+xml.
     """
+    from PIL import Image
+
     try:
         img = Image.open(io.BytesIO(content_bytes))
         w, h = img.size
@@ -101,6 +105,8 @@ def resize_image_bytes(
 
     Does NOT handle SVG — callers should skip validation for image/svg+xml.
     """
+    from PIL import Image
+
     try:
         img = Image.open(io.BytesIO(content_bytes))
         img.load()
@@ -8,8 +8,9 @@ No API calls, no MCP awareness.
 import csv
 import io
 import re
+from array import array
 
-from models import SpreadsheetData, CellValue
+from models import SheetTab, SpreadsheetData, CellValue
 
 # The banner extract_sheets_content writes above each tab's rows. strip_sheet_header
 # is its inverse and MUST match what the writer emits — the round-trip test in
@@ -17,6 +18,9 @@ from models import SpreadsheetData, CellValue
 # there rather than silently re-breaking create-from-deposit (mise-kacani).
 _SHEET_HEADER_RE = re.compile(r"^=== Sheet: .* ===\r?\n?")
 
+# What an empty tab's rows render as, under its banner and in its per-tab file.
+EMPTY_SHEET = "(empty)\n"
+
 
 def extract_sheets_content(
     data: SpreadsheetData,
@@ -51,14 +55,9 @@ def extract_sheets_content(
 
     for sheet in data.sheets:
         sheet_name = sheet.name
-        values = sheet.values
-
-        if values:
-            sheet_content = f"\n=== Sheet: {sheet_name} ===\n"
 
-            for row in values:
-                csv_row = _row_to_csv(row)
-                sheet_content += csv_row + "\n"
+        if _has_rows(sheet):
+            sheet_content = sheet_banner(sheet_name) + sheet_to_csv(sheet)
 
             # Check length limit
             if max_length and (total_length + len(sheet_content)) > max_length:
@@ -72,15 +71,12 @@ def extract_sheets_content(
             content_parts.append(sheet_content)
             total_length += len(sheet_content)
         else:
-            content_parts.append(f"\n=== Sheet: {sheet_name} ===\n(empty)\n")
+            content_parts.append(sheet_banner(sheet_name) + EMPTY_SHEET)
             empty_sheets.append(sheet_name)
 
     # Warn about empty sheets
     if empty_sheets:
-        if len(empty_sheets) == 1:
-            data.warnings.append(f"Sheet '{empty_sheets[0]}' is empty")
-        else:
-            data.warnings.append(f"{len(empty_sheets)} sheets are empty: {', '.join(empty_sheets)}")
+        data.warnings.append(empty_sheets_warning(empty_sheets))
 
     return "".join(content_parts).strip()
 
@@ -101,24 +97,50 @@ def extract_sheets_per_tab(
     empty_sheets: list[str] = []
 
     for sheet in data.sheets:
-        if sheet.values:
-            lines = [_row_to_csv(row) for row in sheet.values]
-            result.append((sheet.name, "\n".join(lines) + "\n"))
+        if _has_rows(sheet):
+            result.append((sheet.name, sheet_to_csv(sheet)))
         else:
-            result.append((sheet.name, "(empty)\n"))
+            result.append((sheet.name, EMPTY_SHEET))
             empty_sheets.append(sheet.name)
 
     if empty_sheets:
-        if len(empty_sheets) == 1:
-            data.warnings.append(f"Sheet '{empty_sheets[0]}' is empty")
-        else:
-            data.warnings.append(
-                f"{len(empty_sheets)} sheets are empty: {', '.join(empty_sheets)}"
-            )
+        data.warnings.append(empty_sheets_warning(empty_sheets))
 
     return result
 
 
+def sheet_banner(sheet_name: str) -> str:
+    """The '=== Sheet: X ===' line that opens each tab in content.csv."""
+    return f"\n=== Sheet: {sheet_name} ===\n"
+
+
+def rows_to_csv(rows: list[list[CellValue]]) -> str:
+    """CSV lines for a run of rows, each newline-terminated.
+
+    Concatenating the results for consecutive pages of a tab gives the same
+    text as one call over the whole tab — what the row-paged writer relies on.
+    """
+    return "".join(_row_to_csv(row) + "\n" for row in rows)
+
+
+def sheet_to_csv(sheet: SheetTab) -> str:
+    """A tab's CSV lines, from whichever store holds its rows (grid or values)."""
+    if sheet.grid is not None:
+        return _columns_to_csv(sheet.grid.columns, sheet.grid.widths)
+    return rows_to_csv(sheet.values)
+
+
+def _has_rows(sheet: SheetTab) -> bool:
+    return bool(sheet.grid) if sheet.grid is not None else bool(sheet.values)
+
+
+def empty_sheets_warning(empty_sheets: list[str]) -> str:
+    """The warning for tabs that came back with no rows."""
+    if len(empty_sheets) == 1:
+        return f"Sheet '{empty_sheets[0]}' is empty"
+    return f"{len(empty_sheets)} sheets are empty: {', '.join(empty_sheets)}"
+
+
 def strip_sheet_header(csv_text: str) -> str:
     """
     Remove the leading '=== Sheet: X ===' banner from deposit CSV text.
@@ -142,11 +164,59 @@ def csv_text_to_values(csv_text: str) -> list[list[str]]:
     return [row for row in reader]
 
 
+def _columns_to_csv(columns: list[list[CellValue]], widths: "array[int]") -> str:
+    """
+    The bulk CSV writer: _row_to_csv's exact output, a column at a time.
+
+    Per-cell Python work is what made wide sheets slow, so each column is
+    first joined whole: that one C call both proves the column all-str (so
+    nothing needs stringifying) and is the probe for commas, quotes and
+    newlines — most columns need no escaping at all. Rows are then
+    assembled by zip and ",".join, both in C; the few rows shorter than the
+    widest (the API trims trailing blanks) are rejoined at their own width.
+
+    Not csv.writer: it writes a row holding one empty field as "", where
+    _row_to_csv writes an empty line.
+    """
+    if not widths:
+        return ""
+    if not columns:
+        return "\n" * len(widths)
+    texts = [_column_text(col) for col in columns]
+    lines = list(map(",".join, zip(*texts)))
+    full = len(texts)
+    for i, width in enumerate(widths):
+        if width != full:  # short row: rejoin without the padding cells
+            lines[i] = ",".join([text[i] for text in texts[:width]])
+    return "\n".join(lines) + "\n"
+
+
+def _column_text(col: list[CellValue]) -> list[str]:
+    """One column as CSV field text — _row_to_csv's per-cell rules, in bulk."""
+    text: list[str]
+    try:
+        probe = "\x00".join(col)  # type: ignore[arg-type]  # TypeError unless all-str
+        text = col  # type: ignore[assignment]
+    except TypeError:
+        if set(map(type, col)) == {str, type(None)}:
+            text = [v or "" for v in col]  # type: ignore[misc]
+        else:
+            text = ["" if v is None else str(v) for v in col]
+        probe = "\x00".join(text)
+    if "," in probe or '"' in probe or "\n" in probe:
+        return [
+            '"' + s.replace('"', '""') + '"' if "," in s or '"' in s or "\n" in s else s
+            for s in text
+        ]
+    return text
+
+
 def _row_to_csv(row: list[CellValue]) -> str:
     """
     Convert a row of cells to CSV format with proper escaping.
 
-    Escapes cells containing commas, quotes, or newlines.
+    Escapes cells containing commas, quotes, or newlines. The reference for
+    _columns_to_csv, which must stay byte-identical to it.
     """
     csv_cells: list[str] = []
 
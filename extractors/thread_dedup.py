@@ -0,0 +1,168 @@
+"""
+Thread-level quoted-content deduplication for Gmail extraction.
+
+strip_quoted_lines() only knows the '>' convention. Outlook and most mobile
+clients embed the whole prior conversation as UNPREFIXED text under a
+"From: … Sent: …" block, so each reply re-carries every message before it:
+a 30-message thread deposits the first message 30 times, and talon walks
+every copy. This pass drops paragraphs an earlier message in the thread
+already carried, leaving one marker per elided run.
+
+How a paragraph is judged (blank-line separated, compared after stripping
+'>' prefixes, collapsing whitespace and casefolding — so Outlook's re-wrap
+of a quoted paragraph still matches):
+
+- **seen**: substantive (>= _MIN_PARAGRAPH_CHARS) and an earlier message
+  carried it. Elided.
+- **header**: "From:/Sent:/To:" blocks, "On … wrote:", "-----Original
+  Message-----", Outlook's underscore rule. Elided only when the run it
+  introduces is seen — a header over new content is kept.
+- **short**: greetings, sign-offs, "Thanks,". Elided only inside a run
+  that is already open (after a seen paragraph or a dropped header) and
+  continues into seen content or the end; "Hi Bob," above a quoted tail stays.
+- **quoted**: every line '>'-prefixed. Passed through untouched —
+  strip_quoted_lines() already drops these silently, and Gmail-style
+  threads must read exactly as they did before this pass existed.
+- **new**: everything else. Kept.
+
+"Earlier message carried it" means the earlier message's FULL body, quotes
+and signature included: message 2's signature resurfaces in message 3's
+quoted tail even though message 2's own emission stripped it.
+
+Runs before signature stripping: once the quoted tail is gone, talon sees
+a short body whose last lines really are the sender's signature.
+
+Pure functions, no I/O (extractors layer).
+"""
+
+import re
+
+# Below this many normalized chars a paragraph is "short": too generic
+# ("Thanks, Bob", "See below.") to count as evidence of quoting on its own.
+_MIN_PARAGRAPH_CHARS = 32
+
+_RE_PARAGRAPH_BREAK = re.compile(r'\n[ \t]*\n')
+_RE_QUOTE_PREFIX = re.compile(r'^[ \t]*(?:>[ \t]?)+', re.MULTILINE)
+_RE_WHITESPACE = re.compile(r'\s+')
+
+_RE_HEADER_LINE = re.compile(
+    r'^\s*(?:[*_]{0,2})(?:from|sent|to|cc|bcc|date|subject)(?:[*_]{0,2})\s*:',
+    re.IGNORECASE,
+)
+_RE_RULE_LINE = re.compile(
+    r'^\s*(?:-{2,}\s*original message\s*-{2,}|_{10,})\s*$',  # Outlook text / HTML rule
+    re.IGNORECASE,
+)
+_RE_WROTE_PARAGRAPH = re.compile(r'^\s*on\s.{4,300}\swrote:\s*$', re.IGNORECASE | re.DOTALL)
+
+_NEW, _SEEN, _HEADER, _SHORT, _QUOTED = range(5)
+
+
+def _normalize(paragraph: str) -> str:
+    """Comparison key: quote prefixes off, whitespace collapsed, casefolded."""
+    unquoted = _RE_QUOTE_PREFIX.sub('', paragraph)
+    return _RE_WHITESPACE.sub(' ', unquoted).strip().casefold()
+
+
+def remember_paragraphs(body: str, seen: set[int]) -> None:
+    """Add every substantive paragraph of body to the thread's seen set.
+
+    Splits AFTER removing quote prefixes so a '>'-quoted paragraph (whose
+    blank separator lines are '>' alone) is recorded paragraph by paragraph.
+    """
+    for paragraph in _RE_PARAGRAPH_BREAK.split(_RE_QUOTE_PREFIX.sub('', body)):
+        key = _normalize(paragraph)
+        if len(key) >= _MIN_PARAGRAPH_CHARS:
+            # hash() is process-salted, which is fine: the set lives for one
+            # extract_thread_content call. An int per paragraph, not a copy.
+            seen.add(hash(key))
+
+
+def _classify(paragraph: str, seen: set[int]) -> int:
+    lines = [ln for ln in paragraph.split('\n') if ln.strip()]
+    if lines and all(ln.lstrip().startswith('>') for ln in lines):
+        return _QUOTED
+    if _RE_WROTE_PARAGRAPH.match(paragraph):
+        return _HEADER
+    # Outlook opens the block with a rule, then From:/Sent:/To:. A long Cc:
+    # list wraps onto continuation lines, so the block qualifies when it
+    # opens with a header line and most of its lines are headers.
+    while lines and _RE_RULE_LINE.match(lines[0]):
+        lines.pop(0)
+    if not lines and paragraph.strip():
+        return _HEADER
+    if lines and _RE_HEADER_LINE.match(lines[0]) and (
+        2 * sum(1 for ln in lines if _RE_HEADER_LINE.match(ln)) > len(lines)
+    ):
+        return _HEADER
+    key = _normalize(paragraph)
+    if len(key) < _MIN_PARAGRAPH_CHARS:
+        return _SHORT
+    return _SEEN if hash(key) in seen else _NEW
+
+
+def elision_marker(count: int) -> str:
+    """The line left where a run of already-seen paragraphs was dropped."""
+    noun = "paragraph" if count == 1 else "paragraphs"
+    return f"[... {count} {noun} quoted from earlier in this thread elided ...]"
+
+
+def elide_seen_paragraphs(body: str, seen: set[int]) -> tuple[str, int]:
+    """Drop runs of paragraphs an earlier message in the thread carried.
+
+    Does not update seen — call remember_paragraphs() on the original body
+    afterwards, so a message never elides its own repeated paragraphs.
+
+    Returns:
+        (head, trailing) — head is the body with mid-body runs replaced by
+        elision_marker() lines; trailing is the paragraph count of a run that
+        reached the end of the body (the usual reply-above-quote shape), 0 if
+        none. The caller appends that marker AFTER signature stripping, where
+        it can't be mistaken for the sender's sign-off. If nothing was elided,
+        head is body unchanged.
+    """
+    if not seen:
+        return body, 0
+    paragraphs = _RE_PARAGRAPH_BREAK.split(body)
+    kinds = [_classify(p, seen) for p in paragraphs]
+    if _SEEN not in kinds:
+        return body, 0
+
+    # Decide each neutral (header/short) paragraph from its substantive
+    # neighbours: the next one after it, and the last one before it.
+    n = len(kinds)
+    next_solid: list[int | None] = [None] * n
+    upcoming: int | None = None
+    for i in range(n - 1, -1, -1):
+        next_solid[i] = upcoming
+        if kinds[i] in (_NEW, _SEEN, _QUOTED):
+            upcoming = kinds[i]
+
+    drop = [False] * n
+    previous: int | None = None
+    run_open = False  # the last non-short paragraph was dropped
+    for i, kind in enumerate(kinds):
+        if kind == _SEEN:
+            drop[i] = True
+        elif kind == _HEADER:
+            drop[i] = next_solid[i] == _SEEN or (
+                next_solid[i] is None and previous == _SEEN
+            )
+        elif kind == _SHORT:
+            drop[i] = run_open and next_solid[i] in (_SEEN, None)
+        if kind in (_NEW, _SEEN, _QUOTED):
+            previous = kind
+        if kind != _SHORT:
+            run_open = drop[i]
+
+    kept: list[str] = []
+    run = 0
+    for paragraph, dropped in zip(paragraphs, drop):
+        if dropped:
+            run += 1
+            continue
+        if run:
+            kept.append(elision_marker(run))
+            run = 0
+        kept.append(paragraph)
+    return '\n\n'.join(kept), run
@@ -17,8 +17,6 @@ import re
 import tempfile
 from html.parser import HTMLParser
 
-import markdown
-
 
 def markdown_to_html(content: str) -> str:
     """
@@ -40,6 +38,10 @@ def markdown_to_html(content: str) -> str:
     "harden" it: that re-breaks table and bold rendering (the bug this fixes).
     Bare ampersands are still entity-escaped (& → &amp;).
     """
+    # Deferred: only drafts render markdown, but every Gmail read imports
+    # this module for the HTML→markdown side.
+    import markdown
+
     return markdown.markdown(
         content,
         extensions=["tables", "nl2br", "sane_lists"],
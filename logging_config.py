@@ -6,7 +6,8 @@ Extractors should NOT log (they're pure functions).
 
 Call logging: configure_call_logging() wires a JSONL RotatingFileHandler
 to ~/.local/share/mise/calls.jsonl. log_mcp_call() writes structured
-records for every search/fetch/do invocation.
+records for every search/fetch/do invocation, with the call's span tree
+(telemetry.py) under "perf" when a trace was started.
 """
 
 import json
@@ -17,6 +18,8 @@ import time
 from pathlib import Path
 from typing import Any
 
+from telemetry import finish_trace
+
 # Create logger for the package
 logger = logging.getLogger("mise")
 
@@ -104,6 +107,9 @@ def log_mcp_call(
         ok: Whether the call succeeded
         error: Error message if not ok
         result_summary: Key fields from the result (file_id, counts, etc.)
+
+    Closes the call's trace if one is open (see telemetry.start_trace) and
+    records its span tree — where the time went — under "perf".
     """
     record: dict[str, Any] = {
         "ts": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
@@ -117,6 +123,9 @@ def log_mcp_call(
             record["error"] = error
     if result_summary:
         record["result"] = result_summary
+    perf = finish_trace(ok)
+    if perf:
+        record["perf"] = perf
     _calls_logger.info(json.dumps(record, default=str))
 
 
@@ -67,23 +67,24 @@ Error contract
 `do()` returns the operation's result dict on success and
 `{"error": True, "kind": ..., "message": ...}` on failure — the same
 teaching errors the MCP surface emits, with the remedy in the message.
-`fetch()` returns a FetchResult or FetchError dataclass; `search()`
-returns a SearchResult whose `errors` list carries per-source failures.
+`fetch()` returns a FetchResult or FetchError dataclass (a
+FetchBatchResult of those for a list of ids); `search()` returns a SearchResult whose `errors` list carries per-source failures.
 Check, don't try/except: the machinery never raises for Workspace-side
 failures, only for programming errors (unknown params, bad modes).
 """
 
 from pathlib import Path
-from typing import Any
+from typing import Any, overload
 
 import token_store
 from adapters.http_client import clear_http_client, clear_sync_client
-from models import FetchError, FetchResult, MiseError, SearchResult
+from models import FetchBatchResult, FetchError, FetchResult, MiseError, SearchResult
 from tools import OPERATIONS, do_fetch, do_search
 from tools.dispatch import run_operation
 
 __all__ = [
     "OPERATIONS",
+    "FetchBatchResult",
     "FetchError",
     "FetchResult",
     "Mise",
@@ -131,6 +132,7 @@ _DO_DEFAULTS: dict[str, Any] = {
     "recurrence": None,
     "send_updates": None,
     "duration": None,
+    "min_free": None,
     "properties": None,
     "color": None,
     "visibility": None,
@@ -198,9 +200,23 @@ class Mise:
             time_max=time_max,
         )
 
+    @overload
+    def fetch(
+        self, file_id: str, base_path: Path | None = None, attachment: str | None = None,
+        recursive: bool = False, tabs: list[str] | None = None, suggestions: str = "accepted",
+        raw: bool = False, thumbnails: bool = True,
+    ) -> FetchResult | FetchError: ...
+
+    @overload
+    def fetch(
+        self, file_id: list[str], base_path: Path | None = None, attachment: str | None = None,
+        recursive: bool = False, tabs: list[str] | None = None, suggestions: str = "accepted",
+        raw: bool = False, thumbnails: bool = True,
+    ) -> FetchBatchResult | FetchError: ...
+
     def fetch(
         self,
-        file_id: str,
+        file_id: str | list[str],
         base_path: Path | None = None,
         attachment: str | None = None,
         recursive: bool = False,
@@ -208,14 +224,16 @@ class Mise:
         suggestions: str = "accepted",
         raw: bool = False,
         thumbnails: bool = True,
-    ) -> FetchResult | FetchError:
+    ) -> FetchResult | FetchError | FetchBatchResult:
         """Deposit one artefact's converted content; return path + cues.
 
         Accepts Drive file ids, Gmail thread/message ids, and folder ids
         (`recursive=True` for the full tree, depth 5). The deposit folder
         layout is in the module docstring; `result.path` names it.
         `thumbnails=False` skips page/slide thumbnail rendering — the
-        wall-clock lever for text-only corpus hydration.
+        wall-clock lever for text-only corpus hydration. A list of ids
+        fetches them concurrently into one FetchBatchResult — per-item
+        outcomes in input order, one failure never sinks the rest.
         """
         return do_fetch(
             file_id,
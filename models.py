@@ -9,9 +9,12 @@ Dataclasses defining the contracts between layers:
 These types make the adapter→extractor contract explicit and IDE-checkable.
 """
 
+from array import array
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from itertools import zip_longest
 from pathlib import Path
 from typing import Any
 
@@ -76,6 +79,74 @@ class MiseError(Exception):
 # Cell values from Sheets API are strings, numbers, booleans, or None
 CellValue = str | int | float | bool | None
 
+_CELL_TYPES = frozenset({str, int, float, bool, type(None)})
+_TEXT_TYPES = frozenset({str, type(None)})
+_SHARE_SAMPLE = 1024
+
+
+class ColumnarGrid:
+    """
+    Column-major cell store — the compact alternative to SheetTab.values.
+
+    Row-major values cost one list object per row and one boxed reference
+    per cell; a 100k-row sheet is 100k lists. Here there is one list per
+    column, repeated strings share one object (labels, statuses and dates
+    repeat down a column), and row widths live in a flat array('I') — the API
+    trims each row's trailing empty cells, and the CSV keeps that
+    raggedness. Cells past a row's width are padding and read as absent.
+    """
+
+    __slots__ = ("columns", "widths")
+
+    def __init__(self, columns: list[list[CellValue]], widths: "array[int]") -> None:
+        self.columns = columns
+        self.widths = widths
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[Sequence[Any]], intern: bool = True) -> "ColumnarGrid":
+        """Transpose API rows, normalizing cell types as _parse_cell_value does.
+
+        intern shares one object per repeated string within a column
+        (see _share_repeats) — the memory win on label-heavy sheets.
+        """
+        widths = array("I", map(len, rows))
+        # "" rather than None pads short rows: it keeps an all-text column
+        # all-str, which is what lets the CSV writer skip stringifying it.
+        columns: list[list[CellValue]] = [list(col) for col in zip_longest(*rows, fillvalue="")]
+        for i, col in enumerate(columns):
+            kinds = set(map(type, col))
+            if not kinds <= _CELL_TYPES:
+                columns[i] = col = [v if type(v) in _CELL_TYPES else str(v) for v in col]
+            if intern and kinds <= _TEXT_TYPES:  # 1, 1.0 and True are equal keys
+                columns[i] = _share_repeats(col)
+        return cls(columns, widths)
+
+    def __len__(self) -> int:
+        return len(self.widths)
+
+    def rows(self) -> Iterator[list[CellValue]]:
+        """Row-major view, each row cut back to its original width."""
+        if not self.columns:
+            for _ in self.widths:
+                yield []
+            return
+        for cells, width in zip(zip(*self.columns), self.widths):
+            yield list(cells[:width])
+
+
+def _share_repeats(col: list[CellValue]) -> list[CellValue]:
+    """One object per distinct value, if the column repeats enough to pay.
+
+    A per-column memo rather than sys.intern: ids and amounts are mostly
+    unique, and interning them only grows the global table. The first
+    _SHARE_SAMPLE cells decide, so a unique column costs one small set.
+    """
+    sample = col[:_SHARE_SAMPLE]
+    if len(set(sample)) * 2 > len(sample):
+        return col
+    memo = {value: value for value in col}
+    return list(map(memo.__getitem__, col))
+
 
 @dataclass
 class SheetTab:
@@ -86,6 +157,15 @@ class SheetTab:
     # Google's numeric sheetId (what a URL's ?gid= names). None for xlsx-sourced
     # data, which has no Google ids (mise-dogape).
     sheet_id: int | None = None
+    # Row-paged mode (very large sheets, see adapters/sheets_paging.py): values
+    # stays empty and this yields row pages, merges resolved, fetched lazily.
+    # Single pass — the spreadsheet's formula/merged counts are complete only
+    # once every tab's pages have been consumed.
+    pages: Iterator[list[list[CellValue]]] | None = None
+    # Columnar mode (fetch_spreadsheet(columnar=True)): values stays empty and
+    # the rows live here instead. Readers go through extractors.sheets, which
+    # renders either form to the same CSV.
+    grid: ColumnarGrid | None = None
 
 
 @dataclass
@@ -110,6 +190,9 @@ class ChartData:
     # Source data range (for metadata)
     source_ranges: list[str] = field(default_factory=list)
 
+    # Digest of the chart spec — part of the render cache key (adapters/chart_cache.py)
+    spec_hash: str | None = None
+
 
 @dataclass
 class SpreadsheetData:
@@ -133,8 +216,11 @@ class SpreadsheetData:
     locale: str | None = None
     time_zone: str | None = None
 
-    # Chart rendering timing (ms)
+    # Chart rendering timing (ms): the Slides round trip for charts the
+    # render cache missed, and the cache lookups for the ones it had
     chart_render_time_ms: int = 0
+    chart_cache_time_ms: int = 0
+    chart_cache_hits: int = 0
 
     # Formula cell count (cells where FORMULA differs from FORMATTED_VALUE)
     formula_count: int = 0
@@ -281,6 +367,11 @@ class GmailThreadData:
     # Warnings during extraction (signature stripping issues, encoding, etc.)
     warnings: list[str] = field(default_factory=list)
 
+    # The thread's historyId and its messages as the API sent them — what a
+    # re-fetch needs to pull only the messages added since (adapters/gmail_delta.py)
+    history_id: str | None = None
+    raw_messages: list[dict[str, Any]] = field(default_factory=list, repr=False)
+
     def __post_init__(self) -> None:
         self.message_count = len(self.messages)
         self.has_attachments = any(
@@ -566,6 +657,32 @@ class FetchError:
         return result
 
 
+@dataclass
+class FetchBatchResult:
+    """Result of a multi-id fetch — one FetchResult or FetchError per input.
+
+    A failed item never fails the batch: each input keeps its own outcome, in
+    input order, so a caller can see which of its 20 ids deposited and retry
+    only the rest.
+    """
+    inputs: list[str]
+    results: list[FetchResult | FetchError]
+
+    def to_dict(self) -> dict[str, Any]:
+        items = [
+            {"input": file_id, **result.to_dict()}
+            for file_id, result in zip(self.inputs, self.results)
+        ]
+        fetched = [r for r in self.results if isinstance(r, FetchResult)]
+        return {
+            "batch": True,
+            "fetched": len(fetched),
+            "failed": len(self.results) - len(fetched),
+            "paths": list(dict.fromkeys(r.path for r in fetched)),  # inputs naming one file share it
+            "results": items,
+        }
+
+
 
 def _describe_sender(row: dict[str, Any]) -> str | None:
     """One-line placement for a Gmail search row's live voice (mise-fajabe).
@@ -341,7 +341,7 @@ Fetch content to filesystem. Writes to `.mise/` in current directory.
 
 | Param | Type | Description |
 |-------|------|-------------|
-| `file_id` | str | Drive file ID or WHOLE URL (a `?gid`/`?tab`/`#heading`/`#slide`/`?disco` tail resolves to `cues.pointer` naming the deposited artefact; dangling pointers reported stale), Gmail thread ID or URL (search/label context rides as `cues.gmail_url_context`; a `#drafts/r…` link resolves to the draft's thread), an RFC 822 Message-ID, or Drive folder ID |
+| `file_id` | str | Drive file ID or WHOLE URL (a `?gid`/`?tab`/`#heading`/`#slide`/`?disco` tail resolves to `cues.pointer` naming the deposited artefact; dangling pointers reported stale), Gmail thread ID or URL (search/label context rides as `cues.gmail_url_context`; a `#drafts/r…` link resolves to the draft's thread), an RFC 822 Message-ID, or Drive folder ID — or a LIST of any of these, fetched concurrently into one result (per-item outcomes plus every deposit path; not with `attachment`/`raw`) |
 | `tabs` | list[str] | Tab names to fetch from a spreadsheet (default: all tabs) |
 | `suggestions` | str | Google Docs suggested-edit view: `accepted` (default), `original`, `markup` |
 | `recursive` | bool | Folder IDs only: full indented tree, depth 5 (default: immediate listing) |
@@ -503,7 +503,7 @@ Act on Google Workspace — create, move, edit documents, and draft emails.
 
 **Update_event** edits an event — `file_id` is the Calendar event id or the invite's Gmail thread id (resolved like `respond`). Gate grain is blast radius: **structural** changes (both `time_min`+`time_max` to move it, `recurrence` — including converting a single event into a series, `attendees` which are always ADDED never removed, `meet=True`) preview first and email attendees on confirm (`send_updates` default `all`); **cosmetic** changes (`content` = replace description, `title`, `location`, `include` = add attachments, `properties` = add/overwrite queryable key-values — existing keys merge, never wiped, so it backfills stamps on pre-existing events, `color` = recolour by name or 1–11, `visibility`, `transparency` = busy/free) execute directly and quietly (`send_updates` default `none`). `cues.previous` carries the old values — events have no version history, so that cue is the undo reference. Guests can only add attendees (when the organiser allows it); everything else needs the organiser.
 
-**Freebusy** answers "when can these people meet" as data: per-person busy blocks over `time_min`..`time_max`, plus — when `duration` (minutes) is given — computed common free slots (weekdays 09:00–17:30 in the user's timezone), plus each person's office days from their workingLocation events where their sharing allows. Two honesty cues to respect: people in `not_visible` are EXCLUDED from the slot arithmetic (their sharing hides even free/busy — a slot may clash with them), and "location not visible" means their sharing is free/busy-only, never "not in the office". Needs the calendar.freebusy scope (2026-08-19): older tokens 403 here with re-auth advice while every other calendar call still works.
+**Freebusy** answers "when can these people meet" as data: per-person busy blocks over `time_min`..`time_max`, plus — when `duration` (minutes) is given — computed common free slots (weekdays 09:00–17:30 in the user's timezone), or with `min_free=k` `quorum_free` slots where at least k of the visible people are free, ranked most-available first with `available` (fewest free at any moment) and `missing` (everyone busy at some point in the slot) — the 30–80 person review case where nobody is ever all free; plus each person's office days from their workingLocation events where their sharing allows. Two honesty cues to respect: people in `not_visible` are EXCLUDED from the slot arithmetic (their sharing hides even free/busy — a slot may clash with them), and "location not visible" means their sharing is free/busy-only, never "not in the office". Needs the calendar.freebusy scope (2026-08-19): older tokens 403 here with re-auth advice while every other calendar call still works.
 
 **Setup_oauth** is the bootstrap path for users who haven't authenticated yet. It opens Google's consent screen in their default browser and runs a localhost callback listener; once they approve, the token is saved to macOS Keychain. Returns immediately with the auth URL inline (so the user can paste it manually if browser auto-open fails). If a token already exists, returns `status: already_authenticated`. Use `force=true` to re-auth (e.g. after revoking access). Only available in stdio mode — not exposed in remote mode.
 
@@ -554,6 +554,7 @@ Act on Google Workspace — create, move, edit documents, and draft emails.
 | `include` | list[str] | None | create_event, update_event (Drive file IDs → event attachments) |
 | `send_updates` | str | all (structural) / none (cosmetic) | create_event, update_event ('all', 'externalOnly', 'none' — who gets emailed) |
 | `duration` | int | None | freebusy (minutes — triggers common-slot mining) |
+| `min_free` | int | None | freebusy (with duration — slots where at least this many are free, ranked most-available first) |
 | `properties` | dict[str,str] | None | create_event, update_event (queryable extendedProperties.private keys — no '=' in keys; update merges per-key) |
 | `color` | str | None | create_event, update_event (event colour — name like 'tomato' or id '1'–'11') |
 | `visibility` | str | None | create_event, update_event ('default', 'public', 'private') |
@@ -13,6 +13,7 @@ from typing import TypeVar, Callable, Any, ParamSpec, Awaitable, cast
 from logging_config import logger, log_retry
 from models import MiseError, ErrorKind
 from adapters.http_client import clear_sync_client
+from telemetry import count
 
 T = TypeVar("T")
 P = ParamSpec("P")
@@ -209,6 +210,7 @@ def with_retry(
                         delay_ms, attempt, backoff_multiplier, jitter_factor
                     )
                     log_retry(attempt + 1, max_attempts, wait_ms, str(e))
+                    count("retries")
                     await asyncio.sleep(wait_ms / 1000)
 
             # Should never reach here, but satisfy type checker
@@ -239,6 +241,7 @@ def with_retry(
                         delay_ms, attempt, backoff_multiplier, jitter_factor
                     )
                     log_retry(attempt + 1, max_attempts, wait_ms, str(e))
+                    count("retries")
                     time.sleep(wait_ms / 1000)
 
             # Should never reach here, but satisfy type checker
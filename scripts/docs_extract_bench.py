@@ -0,0 +1,118 @@
+"""
+Benchmark Docs extraction: serial tab walk vs the process-pool mode.
+
+Builds a synthetic handbook — many tabs, each with headings, formatted runs,
+links, nested lists, tables, footnotes and a missing inline object — and
+times extract_doc_content against extract_doc_content_parallel at several
+pool sizes. Asserts the markdown and warnings are identical, with and
+without a max_length that truncates mid-document.
+
+Usage:
+    uv run python scripts/docs_extract_bench.py [tabs] [paragraphs_per_tab]
+"""
+import copy
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from extractors.doc_tabs import extract_doc_content_parallel  # noqa: E402
+from extractors.docs import extract_doc_content  # noqa: E402
+from models import DocData, DocTab  # noqa: E402
+
+
+def _run(text: str, **style: Any) -> dict[str, Any]:
+    return {"textRun": {"content": text, "textStyle": style}}
+
+
+def make_tab(index: int, paragraphs: int) -> DocTab:
+    lists = {
+        "bullets": {"listProperties": {"nestingLevels": [{"glyphSymbol": "●"}, {"glyphSymbol": "○"}]}},
+        "numbers": {"listProperties": {"nestingLevels": [{"glyphType": "DECIMAL"}]}},
+    }
+    footnotes = {}
+    content: list[dict[str, Any]] = []
+    for n in range(paragraphs):
+        kind = n % 10
+        if kind == 0:
+            content.append({"paragraph": {
+                "paragraphStyle": {"namedStyleType": "HEADING_2"},
+                "elements": [_run(f"Section {index}.{n}\n")],
+            }})
+        elif kind in (1, 2):
+            content.append({"paragraph": {
+                "bullet": {"listId": "bullets" if kind == 1 else "numbers", "nestingLevel": n % 2 if kind == 1 else 0},
+                "elements": [_run("Item with "), _run("bold", bold=True), _run(" text\n")],
+            }})
+        elif kind == 3:
+            fn_id = f"fn.{index}.{n}"
+            footnotes[fn_id] = {"content": [{"paragraph": {"elements": [_run(f"Source {n}\n")]}}]}
+            content.append({"paragraph": {"elements": [
+                _run("Claim needing a citation"), {"footnoteReference": {"footnoteId": fn_id}}, _run("\n"),
+            ]}})
+        elif kind == 4:
+            cell = lambda t: {"content": [{"paragraph": {"elements": [_run(t + "\n")]}}]}  # noqa: E731
+            content.append({"table": {"tableRows": [
+                {"tableCells": [cell(f"r{r}c{c}") for c in range(4)]} for r in range(3)
+            ]}})
+        elif kind == 5:
+            content.append({"paragraph": {"elements": [
+                _run("See the "), _run("policy page", link={"url": f"https://example.com/{n}"}), _run(".\n"),
+            ]}})
+        else:
+            content.append({"paragraph": {"elements": [
+                _run(f"Body text for paragraph {n} of tab {index}, "),
+                _run("emphasised", italic=True),
+                _run(" and plain again, long enough to look like prose.\n"),
+            ]}})
+    content.append({"paragraph": {"elements": [{"inlineObjectElement": {"inlineObjectId": f"img.{index}"}}]}})
+    return DocTab(
+        title=f"Chapter {index + 1}", tab_id=f"t.{index}", index=index,
+        body={"content": content}, footnotes=footnotes, lists=lists,
+    )
+
+
+def make_doc(tabs: int, paragraphs: int) -> DocData:
+    return DocData(title="Handbook", document_id="bench", tabs=[make_tab(i, paragraphs) for i in range(tabs)])
+
+
+def timed(label: str, fn: Any, repeat: int = 3) -> tuple[str, list[str]]:
+    best = float("inf")
+    result: tuple[str, list[str]] = ("", [])
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    print(f"  {label:<12} {best * 1000:8.0f} ms")
+    return result
+
+
+def main() -> None:
+    tabs = int(sys.argv[1]) if len(sys.argv) > 1 else 48
+    paragraphs = int(sys.argv[2]) if len(sys.argv) > 2 else 1500
+    doc = make_doc(tabs, paragraphs)
+    elements = sum(len(t.body["content"]) for t in doc.tabs)
+    print(f"Docs extraction, {tabs} tabs, {elements:,} top-level elements, {os.cpu_count()} CPUs")
+
+    def serial(max_length: int | None = None) -> tuple[str, list[str]]:
+        data = copy.copy(doc)
+        return extract_doc_content(data, max_length=max_length), data.warnings
+
+    def pooled(workers: int, max_length: int | None = None) -> tuple[str, list[str]]:
+        data = copy.copy(doc)
+        return extract_doc_content_parallel(data, max_length=max_length, workers=workers), data.warnings
+
+    reference = timed("serial", serial)
+    for workers in (2, 4, 8):
+        assert timed(f"pool x{workers}", lambda: pooled(workers)) == reference, "pool output diverged"
+
+    cut = len(reference[0]) // 3
+    assert pooled(4, cut) == serial(cut), "truncated pool output diverged"
+    print(f"output    {len(reference[0]):,} chars, identical (also truncated at {cut:,})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Benchmark sheet → CSV: boxed rows (_parse_row + _row_to_csv) vs columnar.
+
+Builds a synthetic 100k x 30 FORMATTED_VALUE response — every cell a
+string, as the API sends them: repeated category labels, numbers, booleans,
+blanks, a free-text column with commas and quotes, and rows short of the
+full width (the API trims trailing blanks) — and times:
+
+  rows      _parse_row per row, then _row_to_csv per row (the default path)
+  columnar  ColumnarGrid.from_rows, then _columns_to_csv (fetch_spreadsheet
+            with columnar=True, then the extractor)
+  unshared  the same without sharing repeated strings (intern=False)
+  writer    the two CSV writers alone, on prebuilt rows / grid
+
+Asserts the outputs are byte-identical, and reports the memory each store
+retains once the response it was built from is gone (tracemalloc).
+
+Usage:
+    uv run python scripts/sheets_csv_bench.py [rows] [cols]
+"""
+import random
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import TypeVar
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from adapters.sheets import _parse_row  # noqa: E402
+from extractors.sheets import _columns_to_csv, rows_to_csv  # noqa: E402
+from models import ColumnarGrid  # noqa: E402
+
+T = TypeVar("T")
+
+
+def make_rows(n_rows: int, n_cols: int) -> list[list[str]]:
+    """Synthetic API rows — a fresh str object per cell, as orjson hands them over."""
+    rng = random.Random(42)
+    categories = ["North", "South", "East", "West", "Central", "Online"]
+    notes = ["ok", 'see "Q3" review', "late, chased twice", ""]
+    rows: list[list[str]] = []
+    for r in range(n_rows):
+        row: list[str] = []
+        for c in range(n_cols):
+            kind = c % 6
+            if kind == 0:
+                row.append("".join(rng.choice(categories)))  # copy, not the literal
+            elif kind == 1:
+                row.append(str(rng.randint(0, 10_000)))
+            elif kind == 2:
+                row.append(f"{rng.random() * 1000:.2f}")
+            elif kind == 3:
+                row.append("".join(rng.choice(["TRUE", "FALSE"])))
+            elif kind == 4:
+                row.append("" if rng.random() < 0.3 else f"r{r}c{c}")
+            else:
+                row.append("".join(rng.choice(notes)))
+        if r % 97 == 0:
+            del row[rng.randint(1, n_cols):]
+        rows.append(row)
+    return rows
+
+
+def timed(label: str, fn: Callable[[], str], repeat: int = 3) -> str:
+    best = float("inf")
+    out = ""
+    for _ in range(repeat):
+        start = time.perf_counter()
+        out = fn()
+        best = min(best, time.perf_counter() - start)
+    print(f"  {label:<9} {best * 1000:8.0f} ms")
+    return out
+
+
+def retained(build: Callable[[], T]) -> tuple[T, int]:
+    """Build, returning the result and the bytes it keeps allocated."""
+    tracemalloc.start()
+    obj = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return obj, size
+
+
+def main() -> None:
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    n_cols = int(sys.argv[2]) if len(sys.argv) > 2 else 30
+    print(f"Sheet → CSV, {n_rows:,} x {n_cols}")
+    raw = make_rows(n_rows, n_cols)
+
+    reference = timed("rows", lambda: rows_to_csv([_parse_row(r) for r in raw]))
+    columnar = timed("columnar", lambda: _to_csv(ColumnarGrid.from_rows(raw)))
+    unshared = timed("unshared", lambda: _to_csv(ColumnarGrid.from_rows(raw, intern=False)))
+    assert columnar == unshared == reference, "columnar writer diverged from _row_to_csv"
+
+    parsed = [_parse_row(r) for r in raw]
+    grid = ColumnarGrid.from_rows(raw)
+    print("writer only:")
+    timed("rows", lambda: rows_to_csv(parsed))
+    timed("columnar", lambda: _to_csv(grid))
+    del raw, parsed, grid
+
+    # Built from a response that is then dropped, as in fetch_spreadsheet:
+    # what stays allocated is the store and the strings it references.
+    _, rows_bytes = retained(lambda: [_parse_row(r) for r in make_rows(n_rows, n_cols)])
+    _, grid_bytes = retained(lambda: ColumnarGrid.from_rows(make_rows(n_rows, n_cols)))
+    print(f"output    {len(reference.encode()):,} bytes, identical")
+    print(f"memory    parsed rows {rows_bytes / 1e6:.0f} MB, grid {grid_bytes / 1e6:.0f} MB")
+
+
+def _to_csv(grid: ColumnarGrid) -> str:
+    return _columns_to_csv(grid.columns, grid.widths)
+
+
+if __name__ == "__main__":
+    main()
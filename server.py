@@ -35,12 +35,14 @@ from typing import Any
 
 from mcp.server.fastmcp import FastMCP
 from starlette.requests import Request
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, PlainTextResponse
 
 from adapters.conversion import cleanup_orphaned_temp_files
 from logging_config import configure_call_logging, log_mcp_call
+from telemetry import render_prometheus, start_trace
 from tools import do_search, do_fetch
 from tools.dispatch import DO_DESCRIPTION_FULL, DO_DESCRIPTION_REMOTE, run_operation
+from tools.gc import sweep_periodically
 from tools.remote import REMOTE_ALLOWED_OPS, fetch_remote, search_remote
 from tools.search import VALID_TYPE_FILTERS, CANONICAL_TYPE_NAMES
 from validation import looks_like_drive_query
@@ -58,14 +60,18 @@ _REMOTE_MODE = "--remote" in sys.argv or os.environ.get("MISE_REMOTE") == "1"
 
 @asynccontextmanager
 async def lifespan(app: FastMCP) -> AsyncIterator[None]:
-    """Run startup tasks — best-effort orphan cleanup."""
+    """Run startup tasks — best-effort orphan cleanup — and the deposit sweep."""
     try:
         count = await asyncio.to_thread(cleanup_orphaned_temp_files)
         if count:
             logger.info(f"Startup: cleaned up {count} orphaned temp files")
     except Exception as e:
         logger.debug(f"Startup orphan cleanup skipped: {e}")
-    yield
+    sweeper = asyncio.create_task(sweep_periodically())
+    try:
+        yield
+    finally:
+        sweeper.cancel()
 
 # Initialize MCP server
 mcp = FastMCP("Google Workspace v2", lifespan=lifespan)
@@ -80,6 +86,14 @@ async def health_check(request: Request) -> JSONResponse:
     return JSONResponse({"status": "ok"})
 
 
+# Opt-in (MISE_METRICS=1): call/span aggregates from telemetry.py, unauthenticated
+# like /health — so off by default on any host reachable beyond the pod.
+if os.environ.get("MISE_METRICS") == "1":
+    @mcp.custom_route("/metrics", methods=["GET"])
+    async def metrics(request: Request) -> PlainTextResponse:
+        return PlainTextResponse(render_prometheus(), media_type="text/plain; version=0.0.4")
+
+
 # ============================================================================
 # TOOLS — Verb Model (thin wrappers)
 # ============================================================================
@@ -127,6 +141,7 @@ def search(
         drive_count/gmail_count/activity_count/calendar_count: per-source counts
         cues: Scope notes and warnings
     """
+    start_trace("search")
     if query.strip() and raw_query and raw_query.strip():
         return {"error": True, "kind": "invalid_input",
                 "message": "Pass either 'query' (search terms) or 'raw_query' (Drive query "
@@ -202,7 +217,7 @@ def _log_search_result(call_params: dict[str, Any], result: dict[str, Any]) -> N
 
 
 @mcp.tool()
-def fetch(file_id: str, base_path: str = "", attachment: str | None = None, tabs: list[str] | None = None, recursive: bool = False, suggestions: str = "accepted", raw: bool = False, thumbnails: bool = True) -> dict[str, Any]:
+def fetch(file_id: str | list[str], base_path: str = "", attachment: str | None = None, tabs: list[str] | None = None, recursive: bool = False, suggestions: str = "accepted", raw: bool = False, thumbnails: bool = True) -> dict[str, Any]:
     """
     Fetch content to .mise/ — auto-detects type (Drive file, Gmail thread, folder).
 
@@ -216,8 +231,10 @@ def fetch(file_id: str, base_path: str = "", attachment: str | None = None, tabs
     files are otherwise converted and the original discarded, so the document itself was
     unreachable. Pairs with do(create, doc_type='file', file_path=...) to put a Gmail-only
     attachment into Drive. thumbnails=False skips page/slide thumbnail rendering
-    (PDFs, Slides) — much faster for text-only use.
+    (PDFs, Slides) — much faster for text-only use. A LIST of ids fetches them all
+    concurrently in one call: per-item results/errors plus every deposit path.
     """
+    start_trace("fetch")
     call_params: dict[str, Any] = {"file_id": file_id}
     if attachment:
         call_params["attachment"] = attachment
@@ -240,10 +257,10 @@ def fetch(file_id: str, base_path: str = "", attachment: str | None = None, tabs
     if _REMOTE_MODE:
         # Remote returns content inline in JSON; raw bytes can't be text-encoded,
         # the same reason image fetches carry metadata only in remote mode.
-        if raw:
+        if raw or isinstance(file_id, list):
             return {"error": True, "kind": "invalid_input",
-                    "message": "raw=True is not available in remote mode — binary content "
-                               "cannot be returned inline."}
+                    "message": "raw=True and multi-id fetch are not available in remote mode — "
+                               "fetch one file_id per call."}
         result = fetch_remote(file_id, base_path, attachment, recursive=recursive, tabs=tabs, suggestions=suggestions, thumbnails=thumbnails)
         _log_fetch_result(call_params, result)
         return result
@@ -261,7 +278,7 @@ def _log_fetch_result(call_params: dict[str, Any], result: dict[str, Any]) -> No
         log_mcp_call("fetch", params=call_params, ok=False, error=result.get("message"))
     else:
         summary: dict[str, Any] = {}
-        for k in ("type", "format", "metadata"):
+        for k in ("type", "format", "metadata", "fetched", "failed"):
             if k in result:
                 val = result[k]
                 if k == "metadata" and isinstance(val, dict):
@@ -308,12 +325,14 @@ def do(
     recurrence: str | list[str] | None = None,
     send_updates: str | None = None,
     duration: int | None = None,
+    min_free: int | None = None,
     properties: dict[str, str] | None = None,
     color: str | None = None,
     visibility: str | None = None,
     transparency: str | None = None,
 ) -> dict[str, Any]:
     """Act on Google Workspace."""
+    start_trace("do")
     # Build log params — include operation and non-None values that matter,
     # but skip content (can be huge) and base_path (noise).
     call_params: dict[str, Any] = {"operation": operation}
@@ -327,7 +346,7 @@ def do(
         ("supersede", supersede), ("range", range),
         ("attendees", attendees), ("time_min", time_min), ("time_max", time_max),
         ("location", location), ("meet", meet), ("recurrence", recurrence),
-        ("send_updates", send_updates), ("duration", duration),
+        ("send_updates", send_updates), ("duration", duration), ("min_free", min_free),
         ("properties", properties), ("color", color),
         ("visibility", visibility), ("transparency", transparency),
     ]:
@@ -383,7 +402,7 @@ def do(
         "range": range,
         "attendees": attendees, "time_min": time_min, "time_max": time_max,
         "location": location, "meet": meet, "recurrence": recurrence,
-        "send_updates": send_updates, "duration": duration,
+        "send_updates": send_updates, "duration": duration, "min_free": min_free,
         "properties": properties, "color": color,
         "visibility": visibility, "transparency": transparency,
     }
@@ -0,0 +1,259 @@
+"""
+Per-call performance telemetry — span trees for the calls.jsonl record.
+
+A call record used to say THAT a fetch took eleven seconds, never WHERE: the
+Docs API, the Drive comments pass, pdftotext, the chart round trip, or the
+disk writes were indistinguishable after the fact. This module carries a
+lightweight span tree through the call in a ContextVar, and log_mcp_call()
+folds the finished tree into the record's "perf" key.
+
+Usage:
+    start_trace("fetch")                  # server.py, top of the tool
+    with span("pdftotext"):               # any layer below
+        ...
+    count("http_bytes", len(body))        # counters land on the open span
+
+Design choices, deliberately small:
+- Spans with the SAME name under the same parent MERGE (calls += 1, times
+  summed). A 120-slide deck makes 120 thumbnail requests; the record wants
+  one "http:slides" node with calls=120, not 120 nodes.
+- Counters (http_requests, http_bytes, retries, deposit_bytes, and a
+  <cache>_hits per cache: chart_cache_hits, drive_meta_cache_hits, ...)
+  attach to the innermost open span and are rolled up to the root on finish.
+- CPU time is per-thread (time.thread_time), so a span opened in a worker
+  thread measures that worker. ContextVars don't cross into executor threads
+  by themselves — submit through run_in_context() to keep the parent link.
+- No trace open → every call here is a no-op. Library consumers (the
+  mise_en_space facade, glaneur) pay nothing and see nothing.
+
+Root-level utility like logging_config and retry: adapters, workspace and
+server.py all import it, so it may import none of them.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import threading
+import time
+import urllib.parse
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+# One lock for every tree: spans from pool workers merge into a shared parent,
+# and contention is a handful of dict updates per HTTP request.
+_lock = threading.Lock()
+
+
+@dataclass
+class Span:
+    """One node of a call's span tree (merged by name within a parent)."""
+    name: str
+    calls: int = 0
+    wall_ns: int = 0
+    cpu_ns: int = 0
+    counters: dict[str, int] = field(default_factory=dict)
+    children: dict[str, "Span"] = field(default_factory=dict)
+
+    def child(self, name: str) -> "Span":
+        node = self.children.get(name)
+        if node is None:
+            node = self.children[name] = Span(name)
+        return node
+
+    def totals(self) -> dict[str, int]:
+        """Counters summed over this span and every descendant."""
+        out = dict(self.counters)
+        for c in self.children.values():
+            for k, v in c.totals().items():
+                out[k] = out.get(k, 0) + v
+        return out
+
+    def to_dict(self) -> dict[str, Any]:
+        node: dict[str, Any] = {
+            "name": self.name,
+            "wall_ms": round(self.wall_ns / 1e6, 1),
+            "cpu_ms": round(self.cpu_ns / 1e6, 1),
+        }
+        if self.calls > 1:
+            node["calls"] = self.calls
+        if self.counters:
+            node["counters"] = dict(self.counters)
+        if self.children:
+            node["children"] = [c.to_dict() for c in self.children.values()]
+        return node
+
+
+@dataclass
+class CallTrace:
+    """The span tree for one search/fetch/do invocation."""
+    tool: str
+    root: Span
+    start_wall: int
+    start_cpu: int
+
+
+_trace: contextvars.ContextVar[CallTrace | None] = contextvars.ContextVar(
+    "mise_trace", default=None,
+)
+_current: contextvars.ContextVar[Span | None] = contextvars.ContextVar(
+    "mise_span", default=None,
+)
+
+
+def start_trace(tool: str) -> CallTrace:
+    """Open a fresh trace for this call, replacing any stale one in context."""
+    root = Span(tool, calls=1)
+    trace = CallTrace(tool, root, time.perf_counter_ns(), time.thread_time_ns())
+    _trace.set(trace)
+    _current.set(root)
+    return trace
+
+
+def finish_trace(ok: bool = True) -> dict[str, Any] | None:
+    """Close the open trace and return its record, or None if none was open.
+
+    The record is the tree plus the rolled-up counters. Also folds the call
+    into the process-wide aggregates behind render_prometheus().
+    """
+    trace = _trace.get()
+    if trace is None:
+        return None
+    _trace.set(None)
+    _current.set(None)
+    root = trace.root
+    with _lock:
+        root.wall_ns = time.perf_counter_ns() - trace.start_wall
+        root.cpu_ns = time.thread_time_ns() - trace.start_cpu
+        totals = root.totals()
+        _aggregate(trace.tool, ok, root, totals)
+        record = root.to_dict()
+    record.pop("name", None)
+    if totals:
+        record["totals"] = totals
+    return record
+
+
+@contextmanager
+def span(name: str) -> Iterator[Span | None]:
+    """Time a block as a child of the open span. No-op without a trace."""
+    parent = _current.get()
+    if parent is None:
+        yield None
+        return
+    with _lock:
+        node = parent.child(name)
+    token = _current.set(node)
+    wall0, cpu0 = time.perf_counter_ns(), time.thread_time_ns()
+    try:
+        yield node
+    finally:
+        wall, cpu = time.perf_counter_ns() - wall0, time.thread_time_ns() - cpu0
+        _current.reset(token)
+        with _lock:
+            node.calls += 1
+            node.wall_ns += wall
+            node.cpu_ns += cpu
+
+
+def count(counter: str, n: int = 1) -> None:
+    """Add n to a counter on the open span. No-op without a trace."""
+    node = _current.get()
+    if node is None:
+        return
+    with _lock:
+        node.counters[counter] = node.counters.get(counter, 0) + n
+
+
+def api_span_name(url: str) -> str:
+    """Span name for a Google API request: 'http:docs', 'http:drive', ...
+
+    API hosts name the service in the subdomain; www.googleapis.com names it
+    in the first path segment (drive, upload, calendar).
+    """
+    parsed = urllib.parse.urlsplit(url)
+    label = (parsed.hostname or "unknown").split(".")[0]
+    if label == "www":
+        label = parsed.path.strip("/").split("/")[0] or label
+    return f"http:{label}"
+
+
+def run_in_context(fn: Callable[..., T]) -> Callable[..., T]:
+    """Bind fn to the caller's context, for ThreadPoolExecutor.submit/map.
+
+    Each invocation runs in its own copy of the captured context, so spans
+    opened by concurrent workers attach to the caller's span.
+    """
+    ctx = contextvars.copy_context()
+
+    def bound(*args: Any, **kwargs: Any) -> T:
+        return ctx.copy().run(fn, *args, **kwargs)
+
+    return bound
+
+
+# =============================================================================
+# PROCESS AGGREGATES — Prometheus text exposition
+# =============================================================================
+
+_calls: dict[tuple[str, bool], int] = {}
+_call_seconds: dict[str, float] = {}
+_span_calls: dict[str, int] = {}
+_span_seconds: dict[str, float] = {}
+_counter_totals: dict[str, int] = {}
+
+
+def _aggregate(tool: str, ok: bool, root: Span, totals: dict[str, int]) -> None:
+    """Fold one finished call into the aggregates. Caller holds _lock."""
+    _calls[(tool, ok)] = _calls.get((tool, ok), 0) + 1
+    _call_seconds[tool] = _call_seconds.get(tool, 0.0) + root.wall_ns / 1e9
+    stack = list(root.children.values())
+    while stack:
+        node = stack.pop()
+        _span_calls[node.name] = _span_calls.get(node.name, 0) + node.calls
+        _span_seconds[node.name] = _span_seconds.get(node.name, 0.0) + node.wall_ns / 1e9
+        stack.extend(node.children.values())
+    for k, v in totals.items():
+        _counter_totals[k] = _counter_totals.get(k, 0) + v
+
+
+def render_prometheus() -> str:
+    """Process-lifetime aggregates in Prometheus text exposition format."""
+    lines = [
+        "# HELP mise_calls_total MCP tool calls by tool and outcome.",
+        "# TYPE mise_calls_total counter",
+    ]
+    with _lock:
+        for (tool, ok), n in sorted(_calls.items()):
+            lines.append(f'mise_calls_total{{tool="{tool}",ok="{str(ok).lower()}"}} {n}')
+        lines += [
+            "# HELP mise_call_seconds_total Wall time spent in MCP tool calls.",
+            "# TYPE mise_call_seconds_total counter",
+        ]
+        for tool, s in sorted(_call_seconds.items()):
+            lines.append(f'mise_call_seconds_total{{tool="{tool}"}} {s:.6f}')
+        lines += [
+            "# HELP mise_span_calls_total Span entries by span name.",
+            "# TYPE mise_span_calls_total counter",
+        ]
+        for name, n in sorted(_span_calls.items()):
+            lines.append(f'mise_span_calls_total{{span="{name}"}} {n}')
+        lines += [
+            "# HELP mise_span_seconds_total Wall time by span name (nested spans overlap).",
+            "# TYPE mise_span_seconds_total counter",
+        ]
+        for name, s in sorted(_span_seconds.items()):
+            lines.append(f'mise_span_seconds_total{{span="{name}"}} {s:.6f}')
+        for k, v in sorted(_counter_totals.items()):
+            lines += [f"# TYPE mise_{k}_total counter", f"mise_{k}_total {v}"]
+    return "\n".join(lines) + "\n"
+
+
+def reset_aggregates() -> None:
+    """Clear the process aggregates (for testing)."""
+    with _lock:
+        for agg in (_calls, _call_seconds, _span_calls, _span_seconds, _counter_totals):
+            agg.clear()
@@ -56,6 +56,57 @@ def _no_signature_in_tests() -> "object":
         yield
 
 
+# ============================================================================
+# Doc fetch history isolation
+# ============================================================================
+# fetch_document records every fetch in ~/.cache/mise/doc_stats.json and
+# speculates from it. Point it at a per-test file so tests neither write to
+# the developer's cache nor inherit speculation from earlier tests.
+@pytest.fixture(autouse=True)
+def _isolated_doc_stats(tmp_path: Path) -> "object":
+    with patch("adapters.doc_stats.STATS_PATH", tmp_path / "doc_stats.json"):
+        yield
+
+
+# ============================================================================
+# Gmail index isolation
+# ============================================================================
+# The local Gmail index is opt-in (MISE_GMAIL_INDEX). Keep a developer's
+# setting from routing unit-test searches through their own mailbox index.
+@pytest.fixture(autouse=True)
+def _gmail_index_off(tmp_path: Path) -> "object":
+    with patch("adapters.gmail_index.ENABLED", False), \
+         patch("adapters.gmail_index.INDEX_DIR", tmp_path):
+        yield
+
+
+# The Drive metadata mirror is opt-in too (MISE_DRIVE_MIRROR) — same isolation.
+@pytest.fixture(autouse=True)
+def _drive_mirror_off(tmp_path: Path) -> "object":
+    with patch("adapters.drive_mirror.ENABLED", False), \
+         patch("adapters.drive_mirror.MIRROR_DIR", tmp_path):
+        yield
+
+
+# The Drive metadata cache lives for the process — clear it so one test's
+# search results don't route another test's fetch.
+@pytest.fixture(autouse=True)
+def _drive_meta_cache_clear() -> "object":
+    from adapters.drive_meta_cache import clear
+    clear()
+    yield
+    clear()
+
+
+# Likewise the thread sizes search notes for routing long-thread fetches.
+@pytest.fixture(autouse=True)
+def _gmail_thread_sizes_clear() -> "object":
+    from adapters.gmail_delta import clear_thread_sizes
+    clear_thread_sizes()
+    yield
+    clear_thread_sizes()
+
+
 def load_fixture(category: str, name: str) -> dict:
     """
     Load a JSON fixture by category and name.
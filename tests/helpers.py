@@ -61,12 +61,13 @@ def sheet_fetch_context(
     """
     # Build the SpreadsheetData mock with sensible defaults
     sheet_data = MagicMock()
-    sheet_data.sheets = [MagicMock()]
+    sheet_data.sheets = [MagicMock(pages=None)]  # one-shot, not row-paged
     sheet_data.charts = []
     sheet_data.warnings = []
     sheet_data.formula_count = 0
     sheet_data.merged_cell_count = 0
     sheet_data.chart_render_time_ms = 0
+    sheet_data.chart_cache_hits = 0
 
     comment_content = "comments" if comment_count > 0 else None
     _tabs_info = tabs_info if tabs_info is not None else []
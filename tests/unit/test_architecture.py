@@ -81,14 +81,14 @@ POLICED_DIRS = ("extractors", "adapters", "tools", "workspace", "resources", "mi
 # module added in future — is governed by MODULE_MAX_LINES via the glob, so
 # discovery still decides who is policed. This dict only records who already owed.
 _LEGACY_SIZE_BASELINE = {
-    "adapters/drive.py": 1151,
-    "adapters/gmail.py": 1066,  # tightened 2026-08-07: id resolvers split to gmail_ids.py
-    "tools/create.py": 922,  # tightened 2026-08-09 thrice: find_placeholder_indices moved to doc_chips.py, de-aliased imports (mise-rafote), csv_text_to_values moved to extractors/sheets.py (mise-kacani)
-    "extractors/docs.py": 892,
-    "tools/fetch/drive.py": 808,  # tightened 2026-08-08: _write_per_tab_csvs moved to common.py (mise-dogape); +1 (2026-08-13): pdf_page_fidelity spread in fetch_pdf's manifest extras — logic lives in common.py (mise-wujoga); +2 (2026-08-18): deposit_pdf_crops call + spread — logic lives in common.py (mise-jopohi)
-    "resources/docs.py": 898,  # +30 for the 'people' search source (mise-mahiho); the last 6 are the multi-word query trap, added after a live probe showed `orgTitle:Head of Strategy` returns zero SILENTLY — a caller who doesn't know that reads the zero as "nobody has that job" — this module's mass IS resource text, so its ceiling tracks CAPABILITY additions; splitting a resource string across siblings would be worse. Raise only with a new op or search source, and only by what the new capability's grammar actually needs. The people entry earns its lines on query grammar (Admin SDK syntax, not Drive's) plus two honesty notes the caller cannot infer. +3 (2026-08-14): the fetch param table backfilled recursive/raw and gained thumbnails — closing a self-disclosure gap found at /close (the table had silently lagged the signature). +18 (2026-08-16): the calendar window (mise-riduka) — two param rows plus a section whose lines are the capability's grammar: whole-day widening of bare dates, overlap semantics, and the two overflow modes a caller cannot infer from the truncation cue alone. +23 (2026-08-19): three calendar-write ops (mise-rijeco) — table rows, a params table, and three prose blocks whose lines are the ops' contract: gate grain (structural vs cosmetic), the not_visible/location honesty cues, and the no-delete boundary. +1 (2026-08-19, gujiro+kawegu): two params (properties, color) cost ONE net line — prose extended in place, two table rows; the line carries the probed label ceiling a caller cannot infer (unknown eventLabelId accepted-and-enriched, palette scope-gated). +2 (2026-08-20, writable-fields sweep): visibility + transparency rows — the transparency line carries the busy/free semantics a caller cannot infer (an opaque hold eats colleagues' slot-mining; the dry run's fiction-slots fault in reverse).
-    "tools/fetch/gmail.py": 705,  # +1 (2026-08-07): the gmail_ids split turned one import into two; +6 (2026-08-09): web_link emission, logic lives in gmail_ids.thread_web_link_or_warn (mise-hetaba); +2 (2026-08-13): thumbnails opt-out — one signature line, one if-guard at the render site (mise-giwawa); +2 (2026-08-13): pdf_page_fidelity call + spread on the attachment path — logic lives in common.py (mise-wujoga)
-    "adapters/http_client.py": 703,  # +11 (2026-08-12): ambient-mode dispatch — a 4-line branch in _load_and_diagnose_credentials plus a 5-line refresh guard in EACH near-duplicate client (mise-wasagu). +9 (2026-08-12 evening, mise-dareti): constructor-injected credentials pay the SAME three seams — a 3-line return in the loader, a 3-line refusal in each refresh path; the registry and teaching text live in token_store. These are the only seams identity selection can intercept. Halves when MiseSyncClient dies in Phase 2.
+    "adapters/drive.py": 1038,  # +15 (2026-10-18): stream_file, the retried streaming download that starts its target over on each attempt — download_file_to_temp and fetch_text's deposit stream both go through it; download_file takes the size the router already fetched; +4 (2026-10-18): download_file_to_temp's file_size param and the branch into drive_download's segmented downloader — the downloader itself lives in drive_download.py; +3 (2026-10-18): list_folder answers from the opt-in metadata mirror first — the mirror itself lives in drive_mirror.py; +7 (2026-10-18): get_file_metadata, search_files and list_folder feed the session metadata cache, and the search mask asks for size — the cache itself lives in drive_meta_cache.py; tightened 2026-10-18: the pre-exfil lookup and its folder discovery moved to drive_exfil.py
+    "adapters/gmail.py": 1012,  # tightened 2026-08-07: id resolvers split to gmail_ids.py; tightened 2026-10-18: triage-row builder split to gmail_triage.py (shared with the local index); +3 (2026-10-18): threads.get asks for historyId, and fetch_thread keeps it and the raw payloads on GmailThreadData for incremental re-fetch (gmail_delta.py); +12 (2026-10-18): fetch_thread sends long threads (known from search, or whose threads.get times out) to gmail_delta.fetch_thread_chunked — the chunked fetch itself lives there
+    "tools/create.py": 694,  # tightened 2026-08-09 thrice: find_placeholder_indices moved to doc_chips.py, de-aliased imports (mise-rafote), csv_text_to_values moved to extractors/sheets.py (mise-kacani); tightened 2026-10-18: image embedding moved to doc_images.py
+    "extractors/docs.py": 835,  # tightened 2026-10-18: per-tab rendering and assembly moved to doc_tabs.py (which adds the process-pool mode)
+    "tools/fetch/drive.py": 825,  # tightened 2026-08-08: _write_per_tab_csvs moved to common.py (mise-dogape); +1 (2026-08-13): pdf_page_fidelity spread in fetch_pdf's manifest extras — logic lives in common.py (mise-wujoga); +2 (2026-08-18): deposit_pdf_crops call + spread — logic lives in common.py (mise-jopohi); +4 (2026-10-18): telemetry spans around the three extractor calls plus their import — the extractors are pure and may not import telemetry, so the call site is the only place their time can be attributed; +2 (2026-10-18): fetch_sheet's branch to the row-paged CSV writer — the writer lives in common.py, the branch is the only line that can pick it; +2 (2026-10-18): chart render-cache stats spread into the manifest extras and result metadata — the fields are built by common._chart_cache_stats; +3 (2026-10-18): fetch_drive routes from the session metadata cache when it has the id — the overlap with the freshness check lives in common.route_then_confirm; +3 (2026-10-18): the row-paged sheet streams into a staging folder and is moved in only once every page has arrived — the staging helpers live in workspace/streams.py; +3 (2026-10-18): fetch_text stages its download the same way
+    "resources/docs.py": 899,  # +30 for the 'people' search source (mise-mahiho); the last 6 are the multi-word query trap, added after a live probe showed `orgTitle:Head of Strategy` returns zero SILENTLY — a caller who doesn't know that reads the zero as "nobody has that job" — this module's mass IS resource text, so its ceiling tracks CAPABILITY additions; splitting a resource string across siblings would be worse. Raise only with a new op or search source, and only by what the new capability's grammar actually needs. The people entry earns its lines on query grammar (Admin SDK syntax, not Drive's) plus two honesty notes the caller cannot infer. +3 (2026-08-14): the fetch param table backfilled recursive/raw and gained thumbnails — closing a self-disclosure gap found at /close (the table had silently lagged the signature). +18 (2026-08-16): the calendar window (mise-riduka) — two param rows plus a section whose lines are the capability's grammar: whole-day widening of bare dates, overlap semantics, and the two overflow modes a caller cannot infer from the truncation cue alone. +23 (2026-08-19): three calendar-write ops (mise-rijeco) — table rows, a params table, and three prose blocks whose lines are the ops' contract: gate grain (structural vs cosmetic), the not_visible/location honesty cues, and the no-delete boundary. +1 (2026-08-19, gujiro+kawegu): two params (properties, color) cost ONE net line — prose extended in place, two table rows; the line carries the probed label ceiling a caller cannot infer (unknown eventLabelId accepted-and-enriched, palette scope-gated). +2 (2026-08-20, writable-fields sweep): visibility + transparency rows — the transparency line carries the busy/free semantics a caller cannot infer (an opaque hold eats colleagues' slot-mining; the dry run's fiction-slots fault in reverse). +1 (2026-10-18): the min_free row — quorum slot mining for big reviews; the freebusy prose absorbed its semantics in place.
+    "tools/fetch/gmail.py": 728,  # +1 (2026-08-07): the gmail_ids split turned one import into two; +6 (2026-08-09): web_link emission, logic lives in gmail_ids.thread_web_link_or_warn (mise-hetaba); +2 (2026-08-13): thumbnails opt-out — one signature line, one if-guard at the render site (mise-giwawa); +2 (2026-08-13): pdf_page_fidelity call + spread on the attachment path — logic lives in common.py (mise-wujoga); +2 (2026-10-18): telemetry span around extract_thread_content + import (same reason as fetch/drive.py); +1 (2026-10-18): lookup_exfiltrated imports from drive_exfil.py, split from drive.py; +18 (2026-10-18): incremental re-fetch — reuse the earlier deposit and its stored payloads, skip carried messages' attachments, record message_ids/history_id; the state handling lives in gmail_refetch.py and the thread rebuild in adapters/gmail_delta.py, and these are the seams inside the one attachment loop; +2 (2026-10-18): fetch_attachment keeps Office/PDF downloads on disk — the body moved under an attachment_downloads() wrapper so the temp files go however it returns; the helpers, and _deposit_raw with them, live in gmail_attachments.py
+    "adapters/http_client.py": 731,  # +11 (2026-08-12): ambient-mode dispatch — a 4-line branch in _load_and_diagnose_credentials plus a 5-line refresh guard in EACH near-duplicate client (mise-wasagu). +9 (2026-08-12 evening, mise-dareti): constructor-injected credentials pay the SAME three seams — a 3-line return in the loader, a 3-line refusal in each refresh path; the registry and teaching text live in token_store. These are the only seams identity selection can intercept. Halves when MiseSyncClient dies in Phase 2. +8 (2026-10-18): per-call telemetry — request() and stream_to_file() are the only seams every Google API byte passes through, so HTTP count/bytes/401-retries are counted here; span naming lives in telemetry.api_span_name. +2 (2026-10-18): stream_to_file takes extra headers — Range requests for drive_download's segments go through the same accounted seam. +1 (2026-10-18): google-auth's requests transport is imported in the two refresh paths, not at module load — it drags in requests and the crypto stack, ~100ms of every CLI start, and only a refresh needs it. +17 (2026-10-18): probe_status, a streamed GET closed at its headers — drive_download's Range probe must not read a whole file when a server ignores Range.
     "extractors/slides.py": 607,  # +7 (2026-08-18): the exhibit anchor on thumbnailed slides — an eye-level line in the per-slide render, which only this module can emit (mise-jopohi)
     "extractors/talon_signature.py": 518,
 }
@@ -169,7 +169,7 @@ class TestLayerBoundaries:
             "html", "xml", "csv", "io", "textwrap", "string",
             "base64", "tempfile", "os", "logging",
             # The package itself (internal imports)
-            "extractors", "talon_signature",
+            "extractors", "talon_signature", "thread_dedup",
             # Shared type definitions (allowed - no side effects)
             "models",
             # Extraction utilities (no API calls, just data transformation)
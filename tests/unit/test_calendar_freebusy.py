@@ -0,0 +1,93 @@
+"""Unit tests for chunked, concurrent freeBusy queries."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+from adapters.calendar_freebusy import MAX_CALENDARS, MAX_WINDOW, freebusy_query
+
+_T0 = datetime(2026, 9, 1, tzinfo=timezone.utc)
+
+
+def _iso(dt: datetime) -> str:
+    return dt.isoformat().replace("+00:00", "Z")
+
+
+def _fake_post(busy_for):
+    """post_json stand-in: answers each requested calendar over the asked span."""
+    calls = []
+
+    def post_json(url, json_body):
+        calls.append(json_body)
+        start = datetime.fromisoformat(json_body["timeMin"])
+        end = datetime.fromisoformat(json_body["timeMax"])
+        return {"calendars": {
+            item["id"]: busy_for(item["id"], start, end) for item in json_body["items"]
+        }}
+
+    return post_json, calls
+
+
+class TestFreebusyQuery:
+
+    @patch("adapters.calendar_freebusy.get_sync_client")
+    def test_small_query_is_one_request(self, mock_get_client) -> None:
+        post_json, calls = _fake_post(lambda email, s, e: {"busy": []})
+        mock_get_client.return_value = MagicMock(post_json=post_json)
+
+        result = freebusy_query(["a@x.com", "b@x.com"], _T0, _T0 + timedelta(days=7))
+
+        assert len(calls) == 1
+        assert result == {"a@x.com": {"busy": []}, "b@x.com": {"busy": []}}
+
+    @patch("adapters.calendar_freebusy.get_sync_client")
+    def test_attendees_and_window_split_into_compliant_chunks(self, mock_get_client) -> None:
+        post_json, calls = _fake_post(lambda email, s, e: {"busy": []})
+        mock_get_client.return_value = MagicMock(post_json=post_json)
+        emails = [f"p{i}@x.com" for i in range(MAX_CALENDARS + 30)]
+
+        result = freebusy_query(emails, _T0, _T0 + MAX_WINDOW + timedelta(days=10))
+
+        assert len(calls) == 4  # two attendee groups × two spans
+        assert all(len(body["items"]) <= MAX_CALENDARS for body in calls)
+        assert all(
+            datetime.fromisoformat(body["timeMax"]) - datetime.fromisoformat(body["timeMin"]) <= MAX_WINDOW
+            for body in calls
+        )
+        assert set(result) == set(emails)
+
+    @patch("adapters.calendar_freebusy.get_sync_client")
+    def test_block_clipped_at_span_boundary_is_rejoined(self, mock_get_client) -> None:
+        boundary = _T0 + MAX_WINDOW
+        meeting = (boundary - timedelta(hours=1), boundary + timedelta(hours=1))
+
+        def busy_for(email, start, end):
+            s, e = max(meeting[0], start), min(meeting[1], end)
+            blocks = [{"start": _iso(s), "end": _iso(e)}] if s < e else []
+            daily = {"start": _iso(start + timedelta(days=1)), "end": _iso(start + timedelta(days=1, hours=1))}
+            return {"busy": sorted([daily, *blocks], key=lambda block: block["start"])}
+
+        post_json, _ = _fake_post(busy_for)
+        mock_get_client.return_value = MagicMock(post_json=post_json)
+
+        result = freebusy_query(["a@x.com"], _T0, boundary + timedelta(days=5))
+
+        busy = result["a@x.com"]["busy"]
+        assert {"start": _iso(meeting[0]), "end": _iso(meeting[1])} in busy
+        assert len(busy) == 3
+
+    @patch("adapters.calendar_freebusy.get_sync_client")
+    def test_error_in_any_chunk_wins_over_partial_busy(self, mock_get_client) -> None:
+        boundary = _T0 + MAX_WINDOW
+
+        def busy_for(email, start, end):
+            if email == "hidden@x.com" and start >= boundary:
+                return {"errors": [{"reason": "notFound"}]}
+            return {"busy": []}
+
+        post_json, _ = _fake_post(busy_for)
+        mock_get_client.return_value = MagicMock(post_json=post_json)
+
+        result = freebusy_query(["a@x.com", "hidden@x.com"], _T0, boundary + timedelta(days=1))
+
+        assert result["hidden@x.com"] == {"errors": [{"reason": "notFound"}]}
+        assert result["a@x.com"] == {"busy": []}
@@ -141,6 +141,20 @@ class TestLogMcpCall:
         assert len(records) == 3
         assert [r["tool"] for r in records] == ["search", "fetch", "do"]
 
+    def test_open_trace_lands_under_perf(self, log_file: Path) -> None:
+        from telemetry import count, span, start_trace
+        start_trace("fetch")
+        with span("http:docs"):
+            count("http_requests")
+        log_mcp_call("fetch", params={"file_id": "x"})
+        rec = self._read_records(log_file)[0]
+        assert rec["perf"]["children"][0]["name"] == "http:docs"
+        assert rec["perf"]["totals"] == {"http_requests": 1}
+
+    def test_no_trace_no_perf_key(self, log_file: Path) -> None:
+        log_mcp_call("search", params={"query": "a"})
+        assert "perf" not in self._read_records(log_file)[0]
+
     def test_no_handler_is_silent(self) -> None:
         """log_mcp_call doesn't crash when no handler is configured."""
         # _calls_logger has no handlers after autouse fixture restores original
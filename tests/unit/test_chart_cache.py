@@ -0,0 +1,130 @@
+"""Unit tests for the chart PNG render cache."""
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from models import ChartData
+from adapters import chart_cache
+from adapters.chart_cache import load_cached_charts, spec_hash, store_rendered_charts
+from telemetry import finish_trace, start_trace
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path: Path):
+    with patch.object(chart_cache, "CACHE_DIR", tmp_path / "charts"):
+        yield tmp_path / "charts"
+
+
+def _charts() -> list[ChartData]:
+    return [
+        ChartData(chart_id=1, title="Revenue", spec_hash=spec_hash({"title": "Revenue"})),
+        ChartData(chart_id=2, title="Costs", spec_hash=spec_hash({"title": "Costs"})),
+    ]
+
+
+class TestChartCache:
+
+    def test_spec_hash_ignores_key_order(self) -> None:
+        assert spec_hash({"a": 1, "b": {"c": 2, "d": 3}}) == spec_hash({"b": {"d": 3, "c": 2}, "a": 1})
+        assert spec_hash({"a": 1}) != spec_hash({"a": 2})
+
+    def test_round_trip(self) -> None:
+        rendered = _charts()
+        rendered[0].png_bytes = b"png-1"
+        rendered[1].png_bytes = None  # failed render — not cached
+        store_rendered_charts("s1", rendered, "2026-10-01T00:00:00Z")
+
+        fresh = _charts()
+        misses, _ = load_cached_charts("s1", fresh, "2026-10-01T00:00:00Z")
+
+        assert fresh[0].png_bytes == b"png-1"
+        assert misses == [fresh[1]]
+
+    def test_hits_are_counted_on_the_call_trace(self) -> None:
+        rendered = _charts()
+        rendered[0].png_bytes = b"png-1"
+        store_rendered_charts("s1", rendered, "2026-10-01T00:00:00Z")
+
+        start_trace("fetch")
+        load_cached_charts("s1", _charts(), "2026-10-01T00:00:00Z")
+        record = finish_trace()
+
+        assert record is not None and record["totals"]["chart_cache_hits"] == 1
+
+    @pytest.mark.parametrize("change", ["modified_time", "spec", "spreadsheet"])
+    def test_any_key_change_misses(self, change: str) -> None:
+        rendered = _charts()
+        rendered[0].png_bytes = b"png-1"
+        store_rendered_charts("s1", rendered[:1], "t1")
+
+        chart = _charts()[0]
+        if change == "spec":
+            chart.spec_hash = spec_hash({"title": "Revenue", "legend": "BOTTOM"})
+        misses, _ = load_cached_charts(
+            "s2" if change == "spreadsheet" else "s1",
+            [chart],
+            "t2" if change == "modified_time" else "t1",
+        )
+        assert misses == [chart] and chart.png_bytes is None
+
+    def test_no_modified_time_bypasses_cache(self, cache_dir: Path) -> None:
+        rendered = _charts()
+        rendered[0].png_bytes = b"png-1"
+        store_rendered_charts("s1", rendered, None)
+        assert not cache_dir.exists()
+
+        charts = _charts()
+        assert load_cached_charts("s1", charts, None) == (charts, 0)
+
+    def test_prunes_least_recently_used(self, cache_dir: Path) -> None:
+        with patch.object(chart_cache, "MAX_ENTRIES", 2):
+            for t in ("t1", "t2", "t3"):
+                rendered = _charts()[:1]
+                rendered[0].png_bytes = t.encode()
+                store_rendered_charts("s1", rendered, t)
+        assert len(list(cache_dir.glob("*.png"))) == 2
+
+
+class TestFetchSpreadsheetUsesCache:
+
+    @patch("adapters.sheets.render_charts_as_pngs")
+    @patch("adapters.sheets.get_charts_from_spreadsheet")
+    @patch("adapters.sheets.get_sync_client")
+    def test_only_stale_charts_rendered(self, mock_get_client, mock_charts, mock_render) -> None:
+        from adapters.sheets import fetch_spreadsheet
+
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+        mock_client.get_json.return_value = {"properties": {"title": "Dash"}, "sheets": []}
+
+        cached = _charts()
+        cached[0].png_bytes = b"cached-png"
+        store_rendered_charts("s1", cached[:1], "t1")
+
+        charts = _charts()
+        mock_charts.return_value = charts
+
+        def render(spreadsheet_id, stale):
+            for chart in stale:
+                chart.png_bytes = b"fresh-png"
+            return stale, 2400
+
+        mock_render.side_effect = render
+
+        with patch("retry.time.sleep"):
+            result = fetch_spreadsheet("s1", modified_time="t1")
+
+        assert mock_render.call_args[0][1] == [charts[1]]
+        assert [c.png_bytes for c in result.charts] == [b"cached-png", b"fresh-png"]
+        assert result.chart_render_time_ms == 2400
+        assert result.chart_cache_hits == 1
+
+        # The fresh render was stored: a second fetch renders nothing
+        mock_charts.return_value = _charts()
+        mock_render.reset_mock()
+        with patch("retry.time.sleep"):
+            again = fetch_spreadsheet("s1", modified_time="t1")
+        mock_render.assert_not_called()
+        assert again.chart_cache_hits == 2 and again.chart_render_time_ms == 0
@@ -0,0 +1,162 @@
+"""Unit tests for the warm CLI daemon."""
+
+import io
+import json
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+import cli
+import cli_daemon
+from cli_daemon import daemon_status, forward, serve, stop_daemon
+
+
+@pytest.fixture
+def runtime():
+    # AF_UNIX paths are capped near 100 bytes — pytest's tmp_path can exceed it
+    directory = Path(tempfile.mkdtemp(prefix="mise-d", dir="/tmp"))
+    with patch.object(cli_daemon, "RUNTIME_DIR", directory), \
+         patch.object(cli_daemon, "SOCKET_PATH", directory / "s.sock"), \
+         patch.object(cli_daemon, "LOCK_PATH", directory / "s.lock"), \
+         patch.object(cli_daemon, "_spawn") as spawn:
+        yield spawn
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+@pytest.fixture
+def daemon(runtime):
+    thread = threading.Thread(target=serve, daemon=True)
+    thread.start()
+    for _ in range(100):
+        if cli_daemon.SOCKET_PATH.exists():
+            break
+        time.sleep(0.02)
+    yield thread
+    stop_daemon()
+    thread.join(timeout=5)
+
+
+class TestForward:
+
+    def test_no_daemon_starts_one_and_runs_in_process(self, runtime) -> None:
+        assert forward(["search", "budget"], Path("/work")) is None
+        runtime.assert_called_once()
+
+    def test_stale_socket_counts_as_no_daemon(self, runtime) -> None:
+        cli_daemon.RUNTIME_DIR.mkdir(exist_ok=True)
+        cli_daemon.SOCKET_PATH.touch()
+        assert forward(["search", "budget"], Path("/work")) is None
+        runtime.assert_called_once()
+
+    def test_call_runs_in_the_daemon_with_the_callers_cwd(self, daemon) -> None:
+        calls = []
+
+        def fake_run(argv, cwd, stdin=None):
+            calls.append((argv, cwd))
+            return {"path": str(cwd / ".mise"), "argv": argv}
+
+        with patch.object(cli, "run", side_effect=fake_run):
+            output = forward(["search", "budget"], Path("/work"))
+            again = forward(["fetch", "abc"], Path("/elsewhere"))
+
+        assert json.loads(output) == {"path": "/work/.mise", "argv": ["search", "budget"]}
+        assert json.loads(again)["path"] == "/elsewhere/.mise"
+        assert daemon_status()["calls"] == 2
+
+    def test_failing_call_is_an_error_result_not_a_dead_daemon(self, daemon) -> None:
+        with patch.object(cli, "run", side_effect=RuntimeError("boom")):
+            output = forward(["search", "x"], Path("/work"))
+        assert json.loads(output) == {"error": True, "kind": "unknown", "message": "boom"}
+        assert daemon_status()["running"] is True
+
+    def test_call_from_another_identity_runs_in_process(self, daemon, monkeypatch) -> None:
+        monkeypatch.setenv("MISE_TOKEN_PATH", "/home/guest/token.json")
+        with patch.object(cli, "run") as run:
+            assert forward(["search", "budget"], Path("/work")) is None
+        run.assert_not_called()
+        assert daemon_status()["calls"] == 0
+
+    def test_stop_ends_the_daemon_and_cleans_up(self, daemon) -> None:
+        assert stop_daemon()["stopped"] is True
+        daemon.join(timeout=5)
+        assert not daemon.is_alive()
+        assert not cli_daemon.SOCKET_PATH.exists()
+        assert daemon_status() == {"running": False}
+
+    def test_idle_daemon_exits(self, runtime) -> None:
+        with patch.object(cli_daemon, "IDLE_SECONDS", 0.1):
+            thread = threading.Thread(target=serve, daemon=True)
+            thread.start()
+            thread.join(timeout=5)
+        assert not thread.is_alive()
+
+
+class TestEnvironment:
+
+    def test_identity_and_flags_are_included(self, monkeypatch) -> None:
+        monkeypatch.setenv("MISE_CREDENTIALS", "ambient")
+        monkeypatch.setenv("MISE_DRIVE_MIRROR", "1")
+        monkeypatch.setenv("GOOGLE_APPLICATION_CREDENTIALS", "/keys/sa.json")
+        env = cli_daemon._environment()
+        assert env["MISE_CREDENTIALS"] == "ambient"
+        assert env["MISE_DRIVE_MIRROR"] == "1"
+        assert env["GOOGLE_APPLICATION_CREDENTIALS"] == "/keys/sa.json"
+
+    def test_daemon_knobs_are_not(self, monkeypatch) -> None:
+        monkeypatch.setenv("MISE_CLI_DAEMON", "1")
+        monkeypatch.setenv("MISE_CLI_DAEMON_IDLE", "60")
+        assert not any(name.startswith("MISE_CLI_DAEMON") for name in cli_daemon._environment())
+
+    def test_relative_token_path_is_resolved_against_the_callers_cwd(self, monkeypatch, tmp_path) -> None:
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("MISE_TOKEN_PATH", "token.json")
+        assert cli_daemon._environment()["MISE_TOKEN_PATH"] == str(tmp_path / "token.json")
+
+
+class TestCliMain:
+
+    def test_daemon_mode_prints_the_forwarded_output(self, capsys, monkeypatch) -> None:
+        monkeypatch.setenv("MISE_CLI_DAEMON", "1")
+        monkeypatch.setattr("sys.argv", ["mise", "search", "budget"])
+        with patch("cli_daemon.forward", return_value='{"warm": true}\n') as fwd, \
+             patch.object(cli, "cmd_search") as local:
+            cli.main()
+        fwd.assert_called_once_with(["search", "budget"], Path.cwd(), stdin=None)
+        local.assert_not_called()
+        assert capsys.readouterr().out == '{"warm": true}\n'
+
+    def test_unavailable_daemon_falls_back_in_process(self, capsys, monkeypatch) -> None:
+        monkeypatch.setenv("MISE_CLI_DAEMON", "1")
+        monkeypatch.setattr("sys.argv", ["mise", "fetch", "abc"])
+        with patch("cli_daemon.forward", return_value=None), \
+             patch("tools.do_fetch") as do_fetch:
+            do_fetch.return_value.to_dict.return_value = {"path": ".mise/x"}
+            cli.main()
+        do_fetch.assert_called_once_with("abc", base_path=Path.cwd())
+        assert json.loads(capsys.readouterr().out) == {"path": ".mise/x"}
+
+    def test_create_from_stdin_falls_back_with_the_same_content(self, capsys, monkeypatch) -> None:
+        monkeypatch.setenv("MISE_CLI_DAEMON", "1")
+        monkeypatch.setattr("sys.argv", ["mise", "create", "Notes"])
+        monkeypatch.setattr("sys.stdin", io.StringIO("# Notes body\n"))
+        with patch("cli_daemon.forward", return_value=None) as fwd, \
+             patch("tools.do_create", return_value={"id": "d1"}) as do_create:
+            cli.main()
+        fwd.assert_called_once_with(["create", "Notes"], Path.cwd(), stdin="# Notes body\n")
+        assert do_create.call_args.args[0] == "# Notes body\n"
+
+    @pytest.mark.parametrize("content", ["---", "--", "-x"])
+    def test_create_forwards_content_that_starts_with_a_dash(self, daemon, capsys, monkeypatch, content) -> None:
+        monkeypatch.setenv("MISE_CLI_DAEMON", "1")
+        monkeypatch.setattr("sys.argv", ["mise", "create", "Notes"])
+        monkeypatch.setattr("sys.stdin", io.StringIO(content))
+        with patch.object(cli, "cmd_create", return_value={"id": "d1"}) as create:
+            cli.main()
+        assert daemon_status()["calls"] == 1  # answered by the daemon, not in-process
+        assert create.call_args.args[0].content == content
+        assert json.loads(capsys.readouterr().out) == {"id": "d1"}
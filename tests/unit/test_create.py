@@ -13,6 +13,8 @@ from extractors.sheets import csv_text_to_values
 from tools.create import (
     do_create, _do_create_internal, _read_source, _read_multi_tab_source,
     DOC_TYPE_TO_MIME,
+)
+from tools.doc_images import (
     _parse_image_refs, _embed_images_in_doc,
     _PLACEHOLDER_PREFIX, _PLACEHOLDER_SUFFIX,
 )
@@ -1274,11 +1276,12 @@ class TestParseImageRefs:
 class TestEmbedImagesInDoc:
     """Test the full image embedding pipeline (mocked)."""
 
-    # find_placeholder_indices moved to tools.doc_chips (mise-rafote split), so
-    # its client needs patching at that module too — patch targets follow the
-    # module a function LIVES in, not the one that imports it.
+    # find_placeholder_indices moved to tools.doc_chips (mise-rafote split) and
+    # the embed pass to tools.doc_images, so clients are patched at both —
+    # patch targets follow the module a function LIVES in, not the one that
+    # imports it.
     @patch("tools.doc_chips.get_sync_client")
-    @patch("tools.create.get_sync_client")
+    @patch("tools.doc_images.get_sync_client")
     @patch("extractors.image.resize_image_bytes")
     def test_embeds_images_successfully(self, mock_resize, mock_get_client, mock_chips_client, tmp_path: Path) -> None:
         """Full pipeline: upload → share → find indices → batchUpdate → cleanup."""
@@ -1340,6 +1343,73 @@ class TestEmbedImagesInDoc:
         result = _embed_images_in_doc("doc123", [], None)
         assert result == {}
 
+    @patch("tools.doc_images.find_placeholder_indices")
+    @patch("tools.doc_images.get_sync_client")
+    @patch("extractors.image.resize_image_bytes")
+    def test_identical_images_uploaded_once(self, mock_resize, mock_get_client, mock_indices, tmp_path: Path) -> None:
+        """The same logo referenced three times is one upload, one share, one cleanup."""
+        (tmp_path / "logo.png").write_bytes(b"\x89PNG logo")
+        (tmp_path / "copy.png").write_bytes(b"\x89PNG logo")  # same bytes, other name
+        (tmp_path / "chart.png").write_bytes(b"\x89PNG chart")
+        mock_resize.side_effect = lambda data, mime: MagicMock(content_bytes=data, mime_type=mime)
+
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+        mock_client.upload_multipart.side_effect = lambda url, meta, data, mime, params: {
+            "id": "tmp_" + meta["name"]
+        }
+        mock_client.post_json.return_value = {"id": "perm"}
+
+        content = "![a](logo.png) ![b](chart.png) ![c](logo.png) ![d](copy.png)"
+        refs = _parse_image_refs(content)[1]
+        mock_indices.return_value = {r.placeholder: (10 * (i + 1), 10 * (i + 1) + 5) for i, r in enumerate(refs)}
+
+        result = _embed_images_in_doc("doc123", refs, tmp_path)
+
+        assert result == {"images_embedded": 4}
+        assert mock_client.upload_multipart.call_count == 2
+        batch = mock_client.post_json.call_args_list[-1].kwargs["json_body"]["requests"]
+        uris = [r["insertInlineImage"]["uri"] for r in batch if "insertInlineImage" in r]
+        # Reverse document order; the logo's first ref named its upload
+        assert [u.rsplit("=", 1)[1] for u in uris] == [
+            "tmp__mise_temp_logo.png", "tmp__mise_temp_logo.png",
+            "tmp__mise_temp_chart.png", "tmp__mise_temp_logo.png",
+        ]
+        deletes = [c for c in mock_client.request.call_args_list if "/permissions/" not in c.args[1]]
+        assert sorted(c.args[1].rsplit("/", 1)[1] for c in deletes) == [
+            "tmp__mise_temp_chart.png", "tmp__mise_temp_logo.png",
+        ]
+
+    @patch("tools.doc_images.find_placeholder_indices")
+    @patch("tools.doc_images.get_sync_client")
+    @patch("extractors.image.resize_image_bytes")
+    def test_errors_reported_in_ref_order(self, mock_resize, mock_get_client, mock_indices, tmp_path: Path) -> None:
+        """Concurrent prep and upload still report errors in document order."""
+        for name in ("a.png", "b.png", "c.png"):
+            (tmp_path / name).write_bytes(name.encode())
+        mock_resize.side_effect = lambda data, mime: MagicMock(content_bytes=data, mime_type=mime)
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+
+        def upload(url, meta, data, mime, params):
+            if data == b"c.png":
+                raise RuntimeError("quota")
+            return {"id": "tmp"}
+
+        mock_client.upload_multipart.side_effect = upload
+        mock_client.post_json.return_value = {"id": "perm"}
+        refs = _parse_image_refs("![](gone1.png) ![](a.png) ![](c.png) ![](gone2.png) ![](b.png)")[1]
+        mock_indices.return_value = {r.placeholder: (i, i + 1) for i, r in enumerate(refs)}
+
+        result = _embed_images_in_doc("doc123", refs, tmp_path)
+
+        assert result["images_embedded"] == 2
+        assert result["image_errors"] == [
+            "Image not found: gone1.png",
+            "Image not found: gone2.png",
+            "Upload failed for c.png: quota",
+        ]
+
 
 class TestDocCreateWithImages:
     """Integration: do_create with markdown containing image refs."""
@@ -1576,8 +1646,8 @@ class TestImageBatchFailureRestoresPlaceholders:
     the placeholders are rewritten back to their literal ![alt](path) text."""
 
     @patch("tools.doc_chips.get_sync_client")
-    @patch("tools.create.restore_placeholders")
-    @patch("tools.create.get_sync_client")
+    @patch("tools.doc_images.restore_placeholders")
+    @patch("tools.doc_images.get_sync_client")
     @patch("extractors.image.resize_image_bytes")
     def test_batch_failure_calls_restore_with_literal_markdown(
         self, mock_resize, mock_get_client, mock_restore, mock_chips_client, tmp_path: Path
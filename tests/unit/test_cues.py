@@ -48,6 +48,17 @@ class TestBuildCues:
 
         assert cues["files"] == ["comments.md", "content.md", "manifest.json"]
 
+    def test_buffered_manifest_is_listed(self, tmp_path: Path) -> None:
+        """A manifest still held by the fetch's deposit batch is listed as written."""
+        from workspace import deposit_batch, write_manifest
+
+        (tmp_path / "content.md").write_text("hello")
+        with deposit_batch():
+            write_manifest(tmp_path, "doc", "Test", "abc123")
+            cues = _build_cues(tmp_path)
+
+        assert cues["files"] == ["content.md", "manifest.json"]
+
     def test_content_length_from_md(self, tmp_path: Path) -> None:
         """Content length measured from content.md."""
         content = "# Title\n\nSome markdown content here."
@@ -534,7 +545,7 @@ class TestFetchDocCues:
     """Verify cues are populated correctly during doc fetch."""
 
     @patch("tools.fetch.drive.fetch_document")
-    @patch("tools.fetch.drive.extract_doc_content", return_value="# Doc Content")
+    @patch("tools.fetch.drive.extract_doc_content_parallel", return_value="# Doc Content")
     @patch("tools.fetch.drive.write_content")
     @patch("tools.fetch.drive._enrich_with_comments", return_value=(3, "comments"))
     @patch("tools.fetch.drive.write_manifest")
@@ -569,7 +580,7 @@ class TestFetchDocCues:
         assert "has_attachments" not in cues
 
     @patch("tools.fetch.drive.fetch_document")
-    @patch("tools.fetch.drive.extract_doc_content", return_value="# Doc")
+    @patch("tools.fetch.drive.extract_doc_content_parallel", return_value="# Doc")
     @patch("tools.fetch.drive.write_content")
     @patch("tools.fetch.drive._enrich_with_comments", return_value=(0, None))
     @patch("tools.fetch.drive.write_manifest")
@@ -625,9 +636,9 @@ class TestFetchSheetCues:
         """Multi-tab sheet cues include tab_count and tab_names."""
         from tests.helpers import sheet_fetch_context
 
-        tab1 = MagicMock()
+        tab1 = MagicMock(pages=None)  # one-shot, not row-paged
         tab1.name = "Revenue"
-        tab2 = MagicMock()
+        tab2 = MagicMock(pages=None)
         tab2.name = "Costs"
 
         with sheet_fetch_context(tmp_path) as ctx:
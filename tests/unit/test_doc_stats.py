@@ -0,0 +1,35 @@
+"""Unit tests for per-document fetch history (fetch_document speculation)."""
+
+from unittest.mock import patch
+
+from adapters import doc_stats
+from adapters.doc_stats import predict, record_fetch
+
+
+class TestDocStats:
+
+    def test_no_history_no_speculation(self) -> None:
+        assert predict("d1") == (False, False)
+
+    def test_needs_min_fetches(self) -> None:
+        record_fetch("d1", suggestions=True, checkboxes=True)
+        assert predict("d1") == (False, False)
+        record_fetch("d1", suggestions=True, checkboxes=True)
+        assert predict("d1") == (True, True)
+
+    def test_rate_per_condition(self) -> None:
+        for suggestions in (True, False, False):
+            record_fetch("d1", suggestions=suggestions, checkboxes=True)
+        assert predict("d1") == (False, True)
+
+    def test_unreadable_file_is_no_history(self) -> None:
+        doc_stats.STATS_PATH.write_text("not json")
+        assert predict("d1") == (False, False)
+        record_fetch("d1", suggestions=True, checkboxes=False)  # rewrites, doesn't raise
+        assert doc_stats._load()["d1"]["fetches"] == 1
+
+    def test_prunes_least_recent(self) -> None:
+        with patch.object(doc_stats, "MAX_DOCS", 2):
+            for doc_id in ("a", "b", "c"):
+                record_fetch(doc_id, suggestions=False, checkboxes=False)
+        assert set(doc_stats._load()) == {"b", "c"}
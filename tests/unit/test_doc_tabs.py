@@ -0,0 +1,80 @@
+"""Unit tests for per-tab Docs rendering (serial and process-pool)."""
+
+from concurrent.futures import Future
+from unittest.mock import patch
+
+import pytest
+
+from extractors import doc_tabs
+from extractors.doc_tabs import extract_doc_content_parallel
+from extractors.docs import extract_doc_content
+from models import DocData, DocTab
+
+
+def _tab(i: int, paragraphs: int = 30) -> DocTab:
+    content = [
+        {"paragraph": {"elements": [{"textRun": {"content": f"Tab {i} line {n} [^{n}]\n"}}]}}
+        for n in range(paragraphs)
+    ]
+    content.append({"paragraph": {"elements": [{"inlineObjectElement": {"inlineObjectId": f"gone.{i}"}}]}})
+    if i % 3 == 0:
+        content.append({"equation": {}})
+    if i % 2 == 0:
+        content.insert(0, {"paragraph": {
+            "paragraphStyle": {"namedStyleType": "HEADING_1"},
+            "elements": [{"textRun": {"content": f"Own heading {i}\n"}}],
+        }})
+    return DocTab(title=f"Tab {i}", tab_id=f"t.{i}", index=i, body={"content": content})
+
+
+def _doc(tabs: int = 7) -> DocData:
+    return DocData(title="Handbook", document_id="d1", tabs=[_tab(i) for i in range(tabs)],
+                   adapter_warnings=["from the adapter"])
+
+
+@pytest.fixture(autouse=True)
+def _fresh_pools():
+    """Each test starts without cached pools; a mocked pool must not leak into the next."""
+    yield
+    for pool in doc_tabs._pools.values():
+        pool.shutdown()
+    doc_tabs._pools.clear()
+
+
+class TestExtractDocContentParallel:
+
+    @pytest.mark.parametrize("max_length", [None, 2500, 150, 7000])
+    def test_pool_matches_serial(self, max_length: int | None) -> None:
+        """Same text, same truncation point, same warnings — in the same order."""
+        serial, pooled = _doc(), _doc()
+
+        expected = extract_doc_content(serial, max_length=max_length)
+        actual = extract_doc_content_parallel(pooled, max_length=max_length, workers=2)
+
+        assert actual == expected
+        assert pooled.warnings == serial.warnings
+        assert serial.warnings[0] == "from the adapter"
+
+    def test_small_doc_stays_serial(self) -> None:
+        with patch("extractors.doc_tabs.ProcessPoolExecutor") as mock_pool:
+            content = extract_doc_content_parallel(_doc())
+        mock_pool.assert_not_called()
+        assert content == extract_doc_content(_doc())
+
+    def test_large_doc_uses_pool(self) -> None:
+        def run_now(fn, *args):
+            future: Future = Future()
+            future.set_result(fn(*args))
+            return future
+
+        with patch("extractors.doc_tabs.PARALLEL_MIN_ELEMENTS", 10), \
+             patch("extractors.doc_tabs.os.cpu_count", return_value=4), \
+             patch("extractors.doc_tabs.ProcessPoolExecutor") as mock_pool:
+            mock_pool.return_value.submit.side_effect = run_now
+            first = extract_doc_content_parallel(_doc())
+            second = extract_doc_content_parallel(_doc())
+        assert first == second == extract_doc_content(_doc())
+        mock_pool.assert_called_once()  # one pool, kept for the next document
+        assert mock_pool.call_args.kwargs["max_workers"] == 4
+        assert mock_pool.call_args.kwargs["mp_context"].get_start_method() == "spawn"
+        mock_pool.return_value.shutdown.assert_not_called()
@@ -267,3 +267,93 @@ class TestFetchDocumentSuggestions:
             with patch('retry.time.sleep'):
                 fetch_document("any", suggestions="bogus")
         mock_get_client.return_value.get_json.assert_not_called()
+
+
+# ============================================================================
+# SPECULATION (doc_stats history → concurrent preview/export calls)
+# ============================================================================
+
+def _serve_views(inline: dict, preview: dict):
+    """get_json side effect answering by view mode — speculative calls race the first."""
+    def get_json(url, params):
+        return inline if params["suggestionsViewMode"] == "SUGGESTIONS_INLINE" else preview
+    return get_json
+
+
+class TestFetchDocumentSpeculation:
+    """Documents with a history of suggestions get the preview call up front."""
+
+    @patch('adapters.docs.get_sync_client')
+    def test_first_fetches_are_serial_then_speculate(self, mock_get_client) -> None:
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+        mock_client.get_json.side_effect = _serve_views(_inline_view_doc(), _accepted_view_doc())
+
+        with patch('retry.time.sleep'), patch('adapters.docs.count') as mock_count:
+            fetch_document("sugg123")
+            fetch_document("sugg123")
+            assert mock_count.call_count == 0  # no history yet: nothing speculative
+            result = fetch_document("sugg123")
+
+        mock_count.assert_called_once_with("speculative_calls")
+        assert mock_client.get_json.call_count == 6
+        run = result.tabs[0].body["content"][0]["paragraph"]["elements"][0]["textRun"]
+        assert run["content"] == "Six feet under screams, but no one cares about this song\n"
+
+    @patch('adapters.docs.get_sync_client')
+    def test_unneeded_preview_is_discarded(self, mock_get_client) -> None:
+        """History says suggestions, but they were resolved: the inline doc stands."""
+        from adapters import doc_stats
+        for _ in range(2):
+            doc_stats.record_fetch("sugg123", suggestions=True, checkboxes=False)
+        clean = {"documentId": "sugg123", "title": "Firework",
+                 "body": {"content": [{"paragraph": {"elements": [{"textRun": {"content": "Clean\n"}}]}}]}}
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+        mock_client.get_json.side_effect = _serve_views(clean, _accepted_view_doc())
+
+        with patch('retry.time.sleep'), patch('adapters.docs.count') as mock_count:
+            result = fetch_document("sugg123")
+
+        assert result.suggestion_count == 0 and result.adapter_warnings == []
+        assert result.tabs[0].body["content"][0]["paragraph"]["elements"][0]["textRun"]["content"] == "Clean\n"
+        assert [c.args for c in mock_count.call_args_list] == [("speculative_calls",), ("speculative_discards",)]
+
+    @patch('adapters.docs.get_sync_client')
+    def test_markup_mode_never_speculates_preview(self, mock_get_client) -> None:
+        from adapters import doc_stats
+        for _ in range(2):
+            doc_stats.record_fetch("sugg123", suggestions=True, checkboxes=False)
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+        mock_client.get_json.return_value = _inline_view_doc()
+
+        with patch('retry.time.sleep'):
+            fetch_document("sugg123", suggestions="markup")
+
+        assert mock_client.get_json.call_count == 1
+
+    @patch('adapters.docs.get_sync_client')
+    def test_checkbox_export_prefetched(self, mock_get_client) -> None:
+        """A doc that has carried checkboxes gets its markdown export alongside the first call."""
+        from adapters import doc_stats
+        for _ in range(2):
+            doc_stats.record_fetch("todo1", suggestions=False, checkboxes=True)
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+        mock_client.get_json.return_value = {
+            "documentId": "todo1", "title": "Todo",
+            "lists": {"l1": {"listProperties": {"nestingLevels": [{"glyphType": "GLYPH_TYPE_UNSPECIFIED"}]}}},
+            "body": {"content": [{"paragraph": {
+                "bullet": {"listId": "l1", "nestingLevel": 0},
+                "elements": [{"textRun": {"content": "Ship it\n"}}],
+            }}]},
+        }
+        mock_client.get_bytes.return_value = b"- [x] Ship it\n"
+
+        with patch('retry.time.sleep'), patch('adapters.docs.count') as mock_count:
+            result = fetch_document("todo1")
+
+        mock_client.get_bytes.assert_called_once()
+        mock_count.assert_called_once_with("speculative_calls")  # used, not discarded
+        assert result.tabs[0].body["content"][0]["paragraph"]["_mise_checkbox_checked"] is True
@@ -26,10 +26,9 @@ from adapters.drive import (
     get_file_size,
     search_files,
     fetch_file_comments,
-    lookup_exfiltrated,
     download_file_to_temp,
+    stream_file,
     is_google_workspace_file,
-    _get_email_attachments_folder_id,
     create_comment,
     reply_to_comment,
     COMMENT_UNSUPPORTED_MIMES,
@@ -166,6 +165,19 @@ class TestDownloadFile:
 
         assert result == b"file content"
 
+    @patch('adapters.drive.get_sync_client')
+    def test_known_size_skips_size_query(self, mock_get_client) -> None:
+        """A size from the caller's metadata saves the extra request."""
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+        mock_client.get_bytes.return_value = b"file content"
+
+        with patch('retry.time.sleep'):
+            result = download_file("file123", file_size=1024)
+
+        assert result == b"file content"
+        mock_client.get_json.assert_not_called()
+
     @patch('adapters.drive.get_sync_client')
     def test_large_file_raises(self, mock_get_client) -> None:
         """File over threshold raises MiseError."""
@@ -998,224 +1010,30 @@ class TestDownloadFileToTemp:
             download_file_to_temp("file123")
 
 
-# ============================================================================
-# EMAIL ATTACHMENTS FOLDER LOOKUP
-# ============================================================================
-
-
-class TestGetEmailAttachmentsFolderId:
-    """Test _get_email_attachments_folder_id with env var and auto-discover."""
-
-    def setup_method(self) -> None:
-        """Reset manual cache before each test."""
-        import adapters.drive as _drive_mod
-        _drive_mod._email_attachments_folder_id = None
-        _drive_mod._email_attachments_folder_checked = False
-
-    @patch.dict("os.environ", {"MISE_EMAIL_ATTACHMENTS_FOLDER_ID": "env_folder_id"})
-    def test_env_var_takes_priority(self) -> None:
-        """Environment variable returned without API call."""
-        result = _get_email_attachments_folder_id()
-        assert result == "env_folder_id"
-
-    @patch.dict("os.environ", {}, clear=True)
-    @patch("adapters.drive.get_sync_client")
-    def test_auto_discovers_folder(self, mock_get_client) -> None:
-        """Finds folder by name when env var not set."""
-        mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
-        mock_client.get_json.return_value = {
-            "files": [{"id": "discovered_id"}]
-        }
-
-        result = _get_email_attachments_folder_id()
-
-        assert result == "discovered_id"
-
-    @patch.dict("os.environ", {}, clear=True)
-    @patch("adapters.drive.get_sync_client")
-    def test_returns_none_when_not_found(self, mock_get_client) -> None:
-        """Returns None when no folder found and no env var."""
-        mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
-        mock_client.get_json.return_value = {"files": []}
-
-        result = _get_email_attachments_folder_id()
-
-        assert result is None
-
-    @patch.dict("os.environ", {}, clear=True)
-    @patch("adapters.drive.get_sync_client")
-    def test_returns_none_on_api_error(self, mock_get_client) -> None:
-        """Silently returns None on API failure."""
-        mock_get_client.side_effect = RuntimeError("no auth")
-
-        result = _get_email_attachments_folder_id()
-
-        assert result is None
-
-
-# ============================================================================
-# LOOKUP EXFILTRATED (mocked client + folder lookup)
-# ============================================================================
-
-
-class TestLookupExfiltrated:
-    """Test lookup_exfiltrated with mocked HTTP client."""
-
-    def setup_method(self) -> None:
-        import adapters.drive as _drive_mod
-        _drive_mod._email_attachments_folder_id = None
-        _drive_mod._email_attachments_folder_checked = False
-
-    @patch("retry.time.sleep")
-    @patch("adapters.drive._get_email_attachments_folder_id", return_value="folder123")
-    @patch("adapters.drive.get_sync_client")
-    def test_groups_files_by_message_id(self, mock_get_client, mock_folder, _sleep) -> None:
-        """Files matched to their message IDs from description."""
-        mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
-
-        mock_client.get_json.return_value = {
-            "files": [
-                {
-                    "id": "drive_file_1",
-                    "name": "report.pdf",
-                    "mimeType": "application/pdf",
-                    "description": "From: alice@x.com\nMessage ID: msg_aaa\nSubject: Q4",
-                },
-                {
-                    "id": "drive_file_2",
-                    "name": "data.xlsx",
-                    "mimeType": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                    "description": "Message ID: msg_bbb",
-                },
-            ],
-        }
-
-        result = lookup_exfiltrated(["msg_aaa", "msg_bbb"])
-
-        assert "msg_aaa" in result
-        assert result["msg_aaa"][0]["file_id"] == "drive_file_1"
-        assert result["msg_aaa"][0]["name"] == "report.pdf"
-        assert "msg_bbb" in result
-        assert result["msg_bbb"][0]["file_id"] == "drive_file_2"
-
-    @patch("retry.time.sleep")
-    @patch("adapters.drive._get_email_attachments_folder_id", return_value="folder123")
-    @patch("adapters.drive.get_sync_client")
-    def test_ignores_unmatched_message_ids(
-        self, mock_get_client, mock_folder, _sleep
-    ) -> None:
-        """Files with message IDs not in the request list are ignored."""
-        mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
-
-        mock_client.get_json.return_value = {
-            "files": [
-                {
-                    "id": "f1",
-                    "name": "other.pdf",
-                    "mimeType": "application/pdf",
-                    "description": "Message ID: msg_zzz",
-                },
-            ],
-        }
-
-        result = lookup_exfiltrated(["msg_aaa"])
-
-        assert result == {}
-
-    def test_empty_message_ids_returns_empty(self) -> None:
-        """Empty input returns empty dict without API calls."""
-        result = lookup_exfiltrated([])
-        assert result == {}
-
-    @patch("adapters.drive._get_email_attachments_folder_id", return_value=None)
-    def test_no_folder_returns_empty(self, mock_folder) -> None:
-        """No email attachments folder → empty dict."""
-        result = lookup_exfiltrated(["msg_aaa"])
-        assert result == {}
+class TestStreamFile:
+    """Test streaming a download into a caller's file object."""
 
     @patch("retry.time.sleep")
-    @patch("adapters.drive._get_email_attachments_folder_id", return_value="folder123")
     @patch("adapters.drive.get_sync_client")
-    def test_api_error_returns_empty(self, mock_get_client, mock_folder, _sleep) -> None:
-        """API failure silently returns empty dict (pre-exfil is optional)."""
+    def test_retry_starts_file_over(self, mock_get_client, _sleep, tmp_path) -> None:
+        """A failed attempt's partial bytes are discarded before the retry."""
         mock_client = MagicMock()
         mock_get_client.return_value = mock_client
-        mock_client.get_json.side_effect = RuntimeError("API down")
-
-        result = lookup_exfiltrated(["msg_aaa"])
+        attempts = iter([b"part", b"whole body"])
 
-        assert result == {}
-
-    @patch("retry.time.sleep")
-    @patch("adapters.drive._get_email_attachments_folder_id", return_value="folder123")
-    @patch("adapters.drive.get_sync_client")
-    def test_single_message_id_uses_simple_query(
-        self, mock_get_client, mock_folder, _sleep
-    ) -> None:
-        """Single message ID doesn't use OR query (optimization)."""
-        mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
-        mock_client.get_json.return_value = {"files": []}
+        def stream_to_file(url, file_obj, *, params):
+            chunk = next(attempts)
+            file_obj.write(chunk)
+            if chunk == b"part":
+                raise ConnectionError("connection reset")
 
-        lookup_exfiltrated(["msg_aaa"])
-
-        call_kwargs = mock_client.get_json.call_args.kwargs["params"]
-        assert "or" not in call_kwargs["q"].lower()
-        assert "msg_aaa" in call_kwargs["q"]
-
-    @patch("retry.time.sleep")
-    @patch("adapters.drive._get_email_attachments_folder_id", return_value="folder123")
-    @patch("adapters.drive.get_sync_client")
-    def test_multiple_message_ids_use_or_query(
-        self, mock_get_client, mock_folder, _sleep
-    ) -> None:
-        """Multiple message IDs batch with OR query."""
-        mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
-        mock_client.get_json.return_value = {"files": []}
-
-        lookup_exfiltrated(["msg_aaa", "msg_bbb"])
-
-        call_kwargs = mock_client.get_json.call_args.kwargs["params"]
-        assert " or " in call_kwargs["q"].lower()
-
-    @patch("retry.time.sleep")
-    @patch("adapters.drive._get_email_attachments_folder_id", return_value="folder123")
-    @patch("adapters.drive.get_sync_client")
-    def test_multiple_files_per_message(
-        self, mock_get_client, mock_folder, _sleep
-    ) -> None:
-        """Multiple attachments from same email grouped under one message ID."""
-        mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
-
-        mock_client.get_json.return_value = {
-            "files": [
-                {
-                    "id": "f1",
-                    "name": "report.pdf",
-                    "mimeType": "application/pdf",
-                    "description": "Message ID: msg_aaa",
-                },
-                {
-                    "id": "f2",
-                    "name": "data.csv",
-                    "mimeType": "text/csv",
-                    "description": "Message ID: msg_aaa",
-                },
-            ],
-        }
+        mock_client.stream_to_file.side_effect = stream_to_file
 
-        result = lookup_exfiltrated(["msg_aaa"])
+        with (tmp_path / "out").open("wb+") as f:
+            stream_file("file123", f)
 
-        assert len(result["msg_aaa"]) == 2
-        names = [f["name"] for f in result["msg_aaa"]]
-        assert "report.pdf" in names
-        assert "data.csv" in names
+        assert (tmp_path / "out").read_bytes() == b"whole body"
+        assert mock_client.stream_to_file.call_count == 2
 
 
 # ============================================================================
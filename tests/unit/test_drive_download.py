@@ -0,0 +1,119 @@
+"""Unit tests for segmented (concurrent Range) Drive downloads."""
+
+import hashlib
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from adapters import drive_download
+from adapters.drive import download_file_to_temp
+from adapters.drive_download import download_segmented
+
+BODY = bytes(range(256)) * 40  # 10,240 bytes
+
+
+def _drive(body: bytes = BODY, *, honour_ranges: bool = True, md5: str | None = None) -> MagicMock:
+    """A sync client serving body, with or without Range support."""
+    client = MagicMock()
+    client.get_json.return_value = {
+        "size": str(len(body)),
+        "md5Checksum": md5 if md5 is not None else hashlib.md5(body).hexdigest(),
+    }
+    client.probe_status.return_value = 206 if honour_ranges else 200
+
+    def stream_to_file(url, file_obj, *, params, headers=None):
+        data = body
+        if honour_ranges and headers and "Range" in headers:
+            start, end = map(int, headers["Range"].removeprefix("bytes=").split("-"))
+            data = body[start:end + 1]
+        for i in range(0, len(data), 1000):
+            file_obj.write(data[i:i + 1000])
+
+    client.stream_to_file.side_effect = stream_to_file
+    return client
+
+
+@pytest.fixture(autouse=True)
+def small_segments():
+    with patch.object(drive_download, "SEGMENTED_MIN_BYTES", 4096), \
+         patch.object(drive_download, "SEGMENT_BYTES", 3000):
+        yield
+
+
+class TestDownloadSegmented:
+
+    @patch("adapters.drive_download.get_sync_client")
+    def test_assembles_ranges_in_place(self, mock_get_client, tmp_path: Path) -> None:
+        mock_get_client.return_value = client = _drive()
+        dest = tmp_path / "big.bin"
+        dest.touch()
+
+        assert download_segmented("f1", dest, len(BODY)) is True
+
+        assert dest.read_bytes() == BODY
+        ranges = sorted(c.kwargs["headers"]["Range"] for c in client.stream_to_file.call_args_list)
+        assert ranges == ["bytes=0-2999", "bytes=3000-5999", "bytes=6000-8999", "bytes=9000-10239"]
+
+    @patch("adapters.drive_download.get_sync_client")
+    def test_below_threshold_not_attempted(self, mock_get_client, tmp_path: Path) -> None:
+        assert download_segmented("f1", tmp_path / "x", 4095) is False
+        assert download_segmented("f1", tmp_path / "x", None) is False
+        mock_get_client.assert_not_called()
+
+    @patch("adapters.drive_download.get_sync_client")
+    def test_ranges_not_honoured_falls_back(self, mock_get_client, tmp_path: Path) -> None:
+        mock_get_client.return_value = client = _drive(honour_ranges=False)
+        dest = tmp_path / "big.bin"
+        dest.touch()
+
+        assert download_segmented("f1", dest, len(BODY)) is False
+        client.stream_to_file.assert_not_called()
+
+    @patch("adapters.drive_download.get_sync_client")
+    def test_full_body_for_a_range_falls_back(self, mock_get_client, tmp_path: Path) -> None:
+        """A 206 probe but 200 segments: the writer refuses the overrun."""
+        client = _drive()
+        client.stream_to_file.side_effect = lambda url, f, *, params, headers=None: f.write(BODY)
+        mock_get_client.return_value = client
+        dest = tmp_path / "big.bin"
+        dest.touch()
+
+        assert download_segmented("f1", dest, len(BODY)) is False
+
+    @patch("adapters.drive_download.get_sync_client")
+    def test_checksum_mismatch_falls_back(self, mock_get_client, tmp_path: Path) -> None:
+        mock_get_client.return_value = _drive(md5="0" * 32)
+        dest = tmp_path / "big.bin"
+        dest.touch()
+
+        assert download_segmented("f1", dest, len(BODY)) is False
+
+
+class TestDownloadFileToTempSegmented:
+
+    @patch("adapters.drive.get_sync_client")
+    @patch("adapters.drive_download.get_sync_client")
+    def test_falls_back_to_single_stream(self, mock_seg_client, mock_get_client) -> None:
+        """Ranges refused: the temp file is streamed whole on one connection."""
+        mock_seg_client.return_value = _drive(honour_ranges=False)
+        mock_get_client.return_value = single = _drive(honour_ranges=False)
+
+        path = download_file_to_temp("f1", suffix=".zip", file_size=len(BODY))
+        try:
+            assert path.read_bytes() == BODY
+            single.stream_to_file.assert_called_once()
+        finally:
+            path.unlink(missing_ok=True)
+
+    @patch("adapters.drive.get_sync_client")
+    @patch("adapters.drive_download.get_sync_client")
+    def test_large_file_goes_segmented(self, mock_seg_client, mock_get_client) -> None:
+        mock_seg_client.return_value = _drive()
+
+        path = download_file_to_temp("f1", suffix=".zip", file_size=len(BODY))
+        try:
+            assert path.read_bytes() == BODY
+            mock_get_client.return_value.stream_to_file.assert_not_called()
+        finally:
+            path.unlink(missing_ok=True)
@@ -0,0 +1,360 @@
+"""
+Tests for the pre-exfil lookup — folder discovery, tagged and fullText
+queries, chunking, pagination and the memo.
+"""
+
+import re
+from typing import Any
+from unittest.mock import patch, MagicMock
+
+from adapters import drive_exfil
+from adapters.drive_exfil import (
+    lookup_exfiltrated,
+    clear_memo,
+    _get_email_attachments_folder_id,
+)
+
+
+# ============================================================================
+# EMAIL ATTACHMENTS FOLDER LOOKUP
+# ============================================================================
+
+
+class TestGetEmailAttachmentsFolderId:
+    """Test _get_email_attachments_folder_id with env var and auto-discover."""
+
+    def setup_method(self) -> None:
+        """Reset manual cache before each test."""
+        import adapters.drive_exfil as _drive_mod
+        _drive_mod._email_attachments_folder_id = None
+        _drive_mod._email_attachments_folder_checked = False
+
+    @patch.dict("os.environ", {"MISE_EMAIL_ATTACHMENTS_FOLDER_ID": "env_folder_id"})
+    def test_env_var_takes_priority(self) -> None:
+        """Environment variable returned without API call."""
+        result = _get_email_attachments_folder_id()
+        assert result == "env_folder_id"
+
+    @patch.dict("os.environ", {}, clear=True)
+    @patch("adapters.drive_exfil.get_sync_client")
+    def test_auto_discovers_folder(self, mock_get_client) -> None:
+        """Finds folder by name when env var not set."""
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+        mock_client.get_json.return_value = {
+            "files": [{"id": "discovered_id"}]
+        }
+
+        result = _get_email_attachments_folder_id()
+
+        assert result == "discovered_id"
+
+    @patch.dict("os.environ", {}, clear=True)
+    @patch("adapters.drive_exfil.get_sync_client")
+    def test_returns_none_when_not_found(self, mock_get_client) -> None:
+        """Returns None when no folder found and no env var."""
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+        mock_client.get_json.return_value = {"files": []}
+
+        result = _get_email_attachments_folder_id()
+
+        assert result is None
+
+    @patch.dict("os.environ", {}, clear=True)
+    @patch("adapters.drive_exfil.get_sync_client")
+    def test_returns_none_on_api_error(self, mock_get_client) -> None:
+        """Silently returns None on API failure."""
+        mock_get_client.side_effect = RuntimeError("no auth")
+
+        result = _get_email_attachments_folder_id()
+
+        assert result is None
+
+
+# ============================================================================
+# LOOKUP EXFILTRATED (mocked client + folder lookup)
+# ============================================================================
+
+
+class TestLookupExfiltrated:
+    """Test lookup_exfiltrated with mocked HTTP client."""
+
+    def setup_method(self) -> None:
+        import adapters.drive_exfil as _drive_mod
+        _drive_mod._email_attachments_folder_id = None
+        _drive_mod._email_attachments_folder_checked = False
+        clear_memo()
+
+    @patch("retry.time.sleep")
+    @patch("adapters.drive_exfil._get_email_attachments_folder_id", return_value="folder123")
+    @patch("adapters.drive_exfil.get_sync_client")
+    def test_groups_files_by_message_id(self, mock_get_client, mock_folder, _sleep) -> None:
+        """Files matched to their message IDs from description."""
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+
+        mock_client.get_json.return_value = {
+            "files": [
+                {
+                    "id": "drive_file_1",
+                    "name": "report.pdf",
+                    "mimeType": "application/pdf",
+                    "description": "From: alice@x.com\nMessage ID: msg_aaa\nSubject: Q4",
+                },
+                {
+                    "id": "drive_file_2",
+                    "name": "data.xlsx",
+                    "mimeType": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                    "description": "Message ID: msg_bbb",
+                },
+            ],
+        }
+
+        result = lookup_exfiltrated(["msg_aaa", "msg_bbb"])
+
+        assert "msg_aaa" in result
+        assert result["msg_aaa"][0]["file_id"] == "drive_file_1"
+        assert result["msg_aaa"][0]["name"] == "report.pdf"
+        assert "msg_bbb" in result
+        assert result["msg_bbb"][0]["file_id"] == "drive_file_2"
+
+    @patch("retry.time.sleep")
+    @patch("adapters.drive_exfil._get_email_attachments_folder_id", return_value="folder123")
+    @patch("adapters.drive_exfil.get_sync_client")
+    def test_ignores_unmatched_message_ids(
+        self, mock_get_client, mock_folder, _sleep
+    ) -> None:
+        """Files with message IDs not in the request list are ignored."""
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+
+        mock_client.get_json.return_value = {
+            "files": [
+                {
+                    "id": "f1",
+                    "name": "other.pdf",
+                    "mimeType": "application/pdf",
+                    "description": "Message ID: msg_zzz",
+                },
+            ],
+        }
+
+        result = lookup_exfiltrated(["msg_aaa"])
+
+        assert result == {}
+
+    def test_empty_message_ids_returns_empty(self) -> None:
+        """Empty input returns empty dict without API calls."""
+        result = lookup_exfiltrated([])
+        assert result == {}
+
+    @patch("adapters.drive_exfil._get_email_attachments_folder_id", return_value=None)
+    def test_no_folder_returns_empty(self, mock_folder) -> None:
+        """No email attachments folder → empty dict."""
+        result = lookup_exfiltrated(["msg_aaa"])
+        assert result == {}
+
+    @patch("retry.time.sleep")
+    @patch("adapters.drive_exfil._get_email_attachments_folder_id", return_value="folder123")
+    @patch("adapters.drive_exfil.get_sync_client")
+    def test_api_error_returns_empty(self, mock_get_client, mock_folder, _sleep) -> None:
+        """API failure silently returns empty dict (pre-exfil is optional)."""
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+        mock_client.get_json.side_effect = RuntimeError("API down")
+
+        result = lookup_exfiltrated(["msg_aaa"])
+
+        assert result == {}
+
+    @patch("retry.time.sleep")
+    @patch("adapters.drive_exfil._get_email_attachments_folder_id", return_value="folder123")
+    @patch("adapters.drive_exfil.get_sync_client")
+    def test_single_message_id_uses_simple_query(
+        self, mock_get_client, mock_folder, _sleep
+    ) -> None:
+        """Single message ID is one exact-match clause, no OR."""
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+        mock_client.get_json.return_value = {"files": []}
+
+        lookup_exfiltrated(["msg_aaa"])
+
+        tagged_query = mock_client.get_json.call_args_list[0].kwargs["params"]["q"]
+        assert " or " not in tagged_query.lower()
+        assert "properties has { key='miseMessageId' and value='msg_aaa' }" in tagged_query
+        assert "appProperties" not in tagged_query
+
+    @patch("retry.time.sleep")
+    @patch("adapters.drive_exfil._get_email_attachments_folder_id", return_value="folder123")
+    @patch("adapters.drive_exfil.get_sync_client")
+    def test_multiple_message_ids_use_or_query(
+        self, mock_get_client, mock_folder, _sleep
+    ) -> None:
+        """Multiple message IDs batch with OR query."""
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+        mock_client.get_json.return_value = {"files": []}
+
+        lookup_exfiltrated(["msg_aaa", "msg_bbb"])
+
+        tagged_query = mock_client.get_json.call_args_list[0].kwargs["params"]["q"]
+        assert " or " in tagged_query.lower()
+
+    @patch("retry.time.sleep")
+    @patch("adapters.drive_exfil._get_email_attachments_folder_id", return_value="folder123")
+    @patch("adapters.drive_exfil.get_sync_client")
+    def test_multiple_files_per_message(
+        self, mock_get_client, mock_folder, _sleep
+    ) -> None:
+        """Multiple attachments from same email grouped under one message ID."""
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+
+        mock_client.get_json.return_value = {
+            "files": [
+                {
+                    "id": "f1",
+                    "name": "report.pdf",
+                    "mimeType": "application/pdf",
+                    "description": "Message ID: msg_aaa",
+                },
+                {
+                    "id": "f2",
+                    "name": "data.csv",
+                    "mimeType": "text/csv",
+                    "description": "Message ID: msg_aaa",
+                },
+            ],
+        }
+
+        result = lookup_exfiltrated(["msg_aaa"])
+
+        assert len(result["msg_aaa"]) == 2
+        names = [f["name"] for f in result["msg_aaa"]]
+        assert "report.pdf" in names
+        assert "data.csv" in names
+
+
+# ============================================================================
+# TAGS, CHUNKS, PAGES, MEMO
+# ============================================================================
+
+
+def _tagged(file_id: str, message_id: str) -> dict:
+    return {"id": file_id, "name": f"{file_id}.pdf", "mimeType": "application/pdf",
+            "properties": {"miseMessageId": message_id, "miseContentHash": "abc"}}
+
+
+def _drive_answering_public_properties(files: list[dict]) -> Any:
+    """get_json over files as Drive answers mise's client: appProperties written
+    by another Cloud project are invisible to it, public properties are not."""
+    def get_json(url: str, params: dict[str, Any]) -> dict[str, Any]:
+        wanted = set(re.findall(r"(?<!app)properties has \{ key='miseMessageId' and value='([^']+)' \}",
+                                params["q"]))
+        return {"files": [f for f in files if f.get("properties", {}).get("miseMessageId") in wanted]}
+    return get_json
+
+
+@patch("retry.time.sleep")
+@patch("adapters.drive_exfil._get_email_attachments_folder_id", return_value="folder123")
+@patch("adapters.drive_exfil.get_sync_client")
+class TestIndexedLookup:
+
+    def setup_method(self) -> None:
+        clear_memo()
+
+    def test_tagged_files_match_without_a_description(self, mock_get_client, _folder, _sleep) -> None:
+        mock_get_client.return_value.get_json.return_value = {"files": [_tagged("f1", "msg_aaa")]}
+
+        result = lookup_exfiltrated(["msg_aaa"])
+
+        assert result == {"msg_aaa": [{"file_id": "f1", "name": "f1.pdf", "mimeType": "application/pdf"}]}
+        # Everything answered by tags: no fullText query
+        assert mock_get_client.return_value.get_json.call_count == 1
+
+    def test_tag_only_files_are_found_with_the_fallback_off(self, mock_get_client, _folder, _sleep) -> None:
+        # No description to fall back on, and no fullText query to do it:
+        # the tag query alone has to match what the exfiltrator wrote
+        files = [_tagged("f1", "msg_aaa"), _tagged("f2", "msg_bbb"),
+                 {"id": "f3", "name": "f3.pdf", "appProperties": {"miseMessageId": "msg_ccc"}}]
+        mock_get_client.return_value.get_json.side_effect = _drive_answering_public_properties(files)
+
+        with patch.object(drive_exfil, "FULLTEXT_FALLBACK", False):
+            result = lookup_exfiltrated(["msg_aaa", "msg_bbb", "msg_ccc"])
+
+        assert {mid: [f["file_id"] for f in found] for mid, found in result.items()} == {
+            "msg_aaa": ["f1"], "msg_bbb": ["f2"],
+        }
+
+    def test_untagged_ids_fall_back_to_full_text(self, mock_get_client, _folder, _sleep) -> None:
+        client = mock_get_client.return_value
+        client.get_json.side_effect = [
+            {"files": [_tagged("f1", "msg_aaa")]},
+            {"files": [{"id": "f2", "name": "old.pdf", "description": "Message ID: msg_bbb"}]},
+        ]
+
+        result = lookup_exfiltrated(["msg_aaa", "msg_bbb"])
+
+        assert set(result) == {"msg_aaa", "msg_bbb"}
+        fallback_query = client.get_json.call_args_list[1].kwargs["params"]["q"]
+        assert "fullText contains 'Message ID: msg_bbb'" in fallback_query
+        assert "msg_aaa" not in fallback_query
+
+    def test_fallback_can_be_turned_off(self, mock_get_client, _folder, _sleep) -> None:
+        mock_get_client.return_value.get_json.return_value = {"files": []}
+        with patch.object(drive_exfil, "FULLTEXT_FALLBACK", False):
+            lookup_exfiltrated(["msg_aaa"])
+        assert mock_get_client.return_value.get_json.call_count == 1
+
+    def test_long_threads_are_chunked(self, mock_get_client, _folder, _sleep) -> None:
+        client = mock_get_client.return_value
+        client.get_json.return_value = {"files": []}
+        ids = [f"msg_{i:03d}" for i in range(60)]
+
+        with patch.object(drive_exfil, "FULLTEXT_FALLBACK", False):
+            lookup_exfiltrated(ids)
+
+        queries = [c.kwargs["params"]["q"] for c in client.get_json.call_args_list]
+        assert len(queries) == 3  # 25 + 25 + 10
+        assert all(sum(mid in q for q in queries) == 1 for mid in ids)
+
+    def test_every_page_is_read(self, mock_get_client, _folder, _sleep) -> None:
+        client = mock_get_client.return_value
+        client.get_json.side_effect = [
+            {"files": [_tagged("f1", "msg_aaa")], "nextPageToken": "p2"},
+            {"files": [_tagged("f2", "msg_aaa")]},
+        ]
+
+        result = lookup_exfiltrated(["msg_aaa"])
+
+        assert [f["file_id"] for f in result["msg_aaa"]] == ["f1", "f2"]
+        assert client.get_json.call_args_list[1].kwargs["params"]["pageToken"] == "p2"
+
+    def test_answers_are_memoised_hits_and_misses_alike(self, mock_get_client, _folder, _sleep) -> None:
+        client = mock_get_client.return_value
+        client.get_json.side_effect = [{"files": [_tagged("f1", "msg_aaa")]}, {"files": []}]
+
+        first = lookup_exfiltrated(["msg_aaa", "msg_bbb"])
+        again = lookup_exfiltrated(["msg_aaa", "msg_bbb"])
+
+        assert first == again == {"msg_aaa": first["msg_aaa"]}
+        assert client.get_json.call_count == 2
+
+    def test_failed_chunk_is_not_memoised(self, mock_get_client, _folder, _sleep) -> None:
+        client = mock_get_client.return_value
+        client.get_json.side_effect = RuntimeError("API down")
+        assert lookup_exfiltrated(["msg_aaa"]) == {}
+
+        client.get_json.side_effect = None
+        client.get_json.return_value = {"files": [_tagged("f1", "msg_aaa")]}
+        assert "msg_aaa" in lookup_exfiltrated(["msg_aaa"])
+
+    def test_memo_expires(self, mock_get_client, _folder, _sleep) -> None:
+        client = mock_get_client.return_value
+        client.get_json.return_value = {"files": [_tagged("f1", "msg_aaa")]}
+        with patch.object(drive_exfil, "MEMO_TTL_SECONDS", -1.0):
+            lookup_exfiltrated(["msg_aaa"])
+            lookup_exfiltrated(["msg_aaa"])
+        assert client.get_json.call_count == 2
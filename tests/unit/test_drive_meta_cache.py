@@ -0,0 +1,154 @@
+"""Unit tests for the session Drive metadata cache and cache-routed fetches."""
+
+import threading
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from adapters import drive_meta_cache
+from adapters.drive import FILE_METADATA_FIELDS, FOLDER_LIST_FIELDS, SEARCH_RESULT_FIELDS, list_folder, search_files
+from adapters.drive_meta_cache import ROUTING_FIELDS, recall, remember
+from models import FetchResult, MiseError, ErrorKind
+from tools.fetch.drive import fetch_drive
+from workspace import deposit_batch, get_deposit_folder, write_manifest
+
+DOC_MIME = "application/vnd.google-apps.document"
+
+
+def _record(file_id: str = "f1", **overrides: str) -> dict[str, str]:
+    return {"id": file_id, "name": "Plan", "mimeType": DOC_MIME, "modifiedTime": "2026-10-18T09:00:00Z", **overrides}
+
+
+def _result(title: str = "Plan") -> FetchResult:
+    return FetchResult(path="/p", content_file="/p/content.md", format="markdown", type="doc", metadata={"title": title})
+
+
+class TestCache:
+
+    def test_recall_returns_a_copy(self) -> None:
+        remember([_record()])
+        recall("f1")["name"] = "changed"  # type: ignore[index]
+        assert recall("f1") == _record()
+
+    def test_unknown_id_is_a_miss(self) -> None:
+        assert recall("nope") is None
+
+    def test_expired_entries_are_misses(self) -> None:
+        with patch.object(drive_meta_cache, "TTL_SECONDS", -1.0):
+            remember([_record()])
+            assert recall("f1") is None
+
+    def test_least_recently_used_goes_first(self) -> None:
+        with patch.object(drive_meta_cache, "MAX_ENTRIES", 2):
+            remember([_record("a"), _record("b")])
+            recall("a")
+            remember([_record("c")])
+        assert recall("a") is not None
+        assert recall("b") is None
+        assert recall("c") is not None
+
+    @pytest.mark.parametrize("mask", [FILE_METADATA_FIELDS, SEARCH_RESULT_FIELDS, FOLDER_LIST_FIELDS])
+    def test_every_feeding_mask_covers_the_routing_fields(self, mask: str) -> None:
+        # A mask short of a field would route like a files.get but deposit
+        # less — assert on the mask, not on what a test fixture happens to hold
+        requested = {f.split("(")[0] for f in mask.replace("files(", "").replace(")", "").split(",")}
+        assert set(ROUTING_FIELDS) <= requested
+
+
+class TestFeeding:
+
+    @patch("adapters.drive.get_sync_client")
+    def test_search_results_are_remembered(self, mock_get_client: MagicMock) -> None:
+        mock_get_client.return_value.get_json.return_value = {"files": [_record("s1")]}
+        search_files("name contains 'Plan'")
+        assert recall("s1") == _record("s1")
+
+    @patch("adapters.drive.get_sync_client")
+    def test_folder_listing_is_remembered(self, mock_get_client: MagicMock) -> None:
+        mock_get_client.return_value.get_json.return_value = {"files": [_record("l1")]}
+        list_folder("folder1")
+        assert recall("l1") == _record("l1")
+
+
+class TestCachedFetch:
+
+    @patch("tools.fetch.common.get_file_metadata")
+    @patch("tools.fetch.drive.get_file_metadata")
+    @patch("tools.fetch.drive.fetch_doc")
+    def test_hit_routes_without_waiting_for_files_get(self, mock_doc, mock_route_meta, mock_check) -> None:
+        remember([_record()])
+        checking = threading.Event()
+        release = threading.Event()
+
+        def slow_check(file_id: str) -> dict[str, str]:
+            checking.set()
+            release.wait(5)
+            return _record()
+
+        def doc(*args: object, **kwargs: object) -> FetchResult:
+            # The download runs while the freshness check is still out
+            assert checking.wait(5)
+            release.set()
+            return _result()
+
+        mock_check.side_effect = slow_check
+        mock_doc.side_effect = doc
+
+        assert fetch_drive("f1") == _result()
+        mock_doc.assert_called_once()
+        mock_route_meta.assert_not_called()
+
+    @patch("tools.fetch.common.get_file_metadata")
+    @patch("tools.fetch.drive.fetch_doc")
+    def test_changed_file_is_fetched_again_from_fresh_metadata(self, mock_doc, mock_check) -> None:
+        remember([_record()])
+        mock_check.return_value = _record(name="Plan v2", modifiedTime="2026-10-18T10:00:00Z")
+        mock_doc.side_effect = lambda doc_id, title, *a, **k: _result(title)
+
+        result = fetch_drive("f1")
+
+        assert mock_doc.call_count == 2
+        assert result.metadata["title"] == "Plan v2"
+
+    @patch("tools.fetch.common.get_file_metadata")
+    @patch("tools.fetch.drive.fetch_doc")
+    def test_renamed_file_leaves_no_stale_deposit(self, mock_doc, mock_check, tmp_path) -> None:
+        remember([_record()])
+        mock_check.return_value = _record(name="Plan v2", modifiedTime="2026-10-18T10:00:00Z")
+
+        def doc(doc_id: str, title: str, *args: object, **kwargs: object) -> FetchResult:
+            folder = get_deposit_folder("doc", title, doc_id, base_path=tmp_path)
+            (folder / "content.md").write_text(title)
+            write_manifest(folder, "doc", title, doc_id)  # buffered until the batch exits
+            return FetchResult(path=str(folder), content_file=str(folder / "content.md"),
+                               format="markdown", type="doc", metadata={"title": title})
+
+        mock_doc.side_effect = doc
+
+        with deposit_batch():
+            result = fetch_drive("f1", base_path=tmp_path)
+
+        assert [f.name for f in (tmp_path / ".mise").iterdir()] == ["doc--plan-v2--f1"]
+        assert result.path == str(tmp_path / ".mise" / "doc--plan-v2--f1")
+        assert (Path(result.path) / "manifest.json").exists()
+
+    @patch("tools.fetch.common.get_file_metadata")
+    @patch("tools.fetch.drive.fetch_doc")
+    def test_failed_check_keeps_the_fetched_result(self, mock_doc, mock_check) -> None:
+        remember([_record()])
+        mock_check.side_effect = MiseError(ErrorKind.NETWORK_ERROR, "flaky")
+        mock_doc.return_value = _result()
+
+        assert fetch_drive("f1") == _result()
+        mock_doc.assert_called_once()
+
+    @patch("tools.fetch.common.get_file_metadata")
+    @patch("tools.fetch.drive.get_file_metadata")
+    @patch("tools.fetch.drive.fetch_doc")
+    def test_passed_metadata_skips_the_cache(self, mock_doc, mock_route_meta, mock_check) -> None:
+        remember([_record()])
+        mock_doc.return_value = _result()
+        fetch_drive("f1", metadata=_record())
+        mock_check.assert_not_called()
+        mock_route_meta.assert_not_called()
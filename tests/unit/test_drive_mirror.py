@@ -0,0 +1,175 @@
+"""Unit tests for the local Drive metadata mirror."""
+
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from models import ErrorKind, MiseError
+from adapters import drive_mirror
+from adapters.drive import GOOGLE_FOLDER_MIME, list_folder
+from adapters.drive_mirror import _Parser, _Unsupported, mirror_list_folder, mirror_search
+
+_DOC = "application/vnd.google-apps.document"
+
+
+def _file(file_id: str, name: str, parent: str, *, mime: str = _DOC,
+          modified: str = "2026-09-01T10:00:00Z", owner: str = "alice@example.com") -> dict[str, Any]:
+    return {
+        "id": file_id, "name": name, "mimeType": mime, "parents": [parent],
+        "createdTime": "2026-01-01T00:00:00Z", "modifiedTime": modified,
+        "owners": [{"displayName": owner.split("@")[0].title(), "emailAddress": owner}],
+        "webViewLink": f"https://docs.google.com/d/{file_id}", "trashed": False,
+    }
+
+
+class FakeDrive:
+    """get_json stand-in over an in-memory Drive."""
+
+    def __init__(self) -> None:
+        self.files: dict[str, dict[str, Any]] = {}
+        self.changes: list[dict[str, Any]] | Exception = []
+        self.lists = 0
+        self.account = "0123456789"
+
+    def get_json(self, url: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+        if url.endswith("/about"):
+            return {"user": {"permissionId": self.account}}
+        if url.endswith("/changes/startPageToken"):
+            return {"startPageToken": "1"}
+        if url.endswith("/changes"):
+            if isinstance(self.changes, Exception):
+                raise self.changes
+            return {"changes": self.changes, "newStartPageToken": "2"}
+        if url.endswith("/files/root"):
+            return {"id": "root-id"}
+        self.lists += 1
+        return {"files": list(self.files.values())}
+
+
+@pytest.fixture
+def drive(tmp_path: Path):
+    fake = FakeDrive()
+    for f in [
+        _file("f1", "Projects", "root-id", mime=GOOGLE_FOLDER_MIME),
+        _file("d1", "budget 2027", "f1", modified="2026-09-03T10:00:00Z"),
+        _file("d2", "Q3 Budget review", "f1", modified="2026-09-02T10:00:00Z", owner="bob@example.com"),
+        _file("d3", "notes", "f1", mime="application/pdf"),
+        _file("f2", "Archive", "f1", mime=GOOGLE_FOLDER_MIME),
+    ]:
+        fake.files[f["id"]] = f
+    client = MagicMock()
+    client.get_json.side_effect = fake.get_json
+    with patch.object(drive_mirror, "ENABLED", True), \
+         patch.object(drive_mirror, "MIN_SYNC_SECONDS", 0), \
+         patch.object(drive_mirror, "get_sync_client", return_value=client):
+        yield fake
+
+
+def _ids(results) -> list[str]:
+    return [r.file_id for r in results.results]
+
+
+class TestParser:
+
+    @pytest.mark.parametrize("query", [
+        "fullText contains 'budget'", "sharedWithMe", "starred = true",
+        "'me' in owners", "name contains", "(name = 'a'",
+    ])
+    def test_unsupported_queries_go_live(self, query: str) -> None:
+        with pytest.raises(_Unsupported):
+            _Parser(query).parse()
+
+    def test_boolean_structure_compiles(self) -> None:
+        where, params = _Parser(
+            "trashed = false and (name contains 'bud' or not mimeType = 'application/pdf')"
+        ).parse()
+        assert where == "trashed = 0 AND ((name_has_prefix(name, ?) OR NOT (mime_type = ?)))"
+        assert params == ["bud", "application/pdf"]
+
+
+class TestMirror:
+
+    def test_off_by_default(self, drive: FakeDrive) -> None:
+        with patch.object(drive_mirror, "ENABLED", False):
+            assert mirror_search("name contains 'budget'") is None
+
+    def test_unseeded_mirror_seeds_and_goes_live(self, drive: FakeDrive) -> None:
+        with patch.object(drive_mirror, "_start_seed") as start:
+            assert mirror_list_folder("f1") is None
+        start.assert_called_once()
+
+    def test_folder_listing_matches_the_api_shape(self, drive: FakeDrive) -> None:
+        drive_mirror._seed()
+        listing = mirror_list_folder("f1")
+        assert [f.name for f in listing.subfolders] == ["Archive"]
+        assert [f.name for f in listing.files] == ["budget 2027", "notes", "Q3 Budget review"]
+        assert listing.item_count == 4 and listing.types == ["application/pdf", _DOC]
+        assert not listing.truncated
+        assert [f.id for f in mirror_list_folder("root").subfolders] == ["f1"]
+        assert mirror_list_folder("unknown") is None  # must still 404 live
+
+    def test_list_folder_uses_the_mirror(self, drive: FakeDrive) -> None:
+        drive_mirror._seed()
+        lists = drive.lists
+        with patch("adapters.drive.get_sync_client") as live:
+            assert list_folder("f1").folder_count == 1
+        live.assert_not_called()
+        assert drive.lists == lists
+
+    def test_metadata_search(self, drive: FakeDrive) -> None:
+        drive_mirror._seed()
+        # Word-prefix match, newest first
+        assert _ids(mirror_search("trashed = false and name contains 'budg'")) == ["d1", "d2"]
+        assert _ids(mirror_search("name contains 'udget'")) == []
+        assert _ids(mirror_search("'bob@example.com' in owners")) == ["d2"]
+        assert _ids(mirror_search("mimeType = 'application/pdf'", folder_id="f1")) == ["d3"]
+        assert _ids(mirror_search("modifiedTime > '2026-09-02T12:00:00'")) == ["d1"]
+
+        row = mirror_search("name = 'Q3 Budget review'").results[0]
+        assert row.owners == ["Bob"] and row.modified_time.day == 2
+
+    def test_truncated_when_more_match(self, drive: FakeDrive) -> None:
+        drive_mirror._seed()
+        results = mirror_search("name contains 'budget'", max_results=1)
+        assert _ids(results) == ["d1"] and results.truncated
+
+    def test_changes_feed_keeps_it_current(self, drive: FakeDrive) -> None:
+        drive_mirror._seed()
+        moved = dict(drive.files["d1"], parents=["f2"])
+        drive.changes = [
+            {"fileId": "d1", "file": moved},
+            {"fileId": "d3", "removed": True},
+            {"fileId": "d2", "file": dict(drive.files["d2"], trashed=True)},
+        ]
+        assert [f.name for f in mirror_list_folder("f1").files] == []
+        assert [f.id for f in mirror_list_folder("f2").files] == ["d1"]
+        drive.changes = []
+        assert _ids(mirror_search("trashed = true")) == ["d2"]
+
+    def test_each_account_has_its_own_mirror(self, drive: FakeDrive) -> None:
+        drive_mirror._seed()
+        assert mirror_list_folder("f1") is not None
+
+        # A new client — re-auth or another identity — asks whose Drive this is
+        drive.account = "9876543210"
+        other = MagicMock()
+        other.get_json.side_effect = drive.get_json
+        with patch.object(drive_mirror, "get_sync_client", return_value=other), \
+             patch.object(drive_mirror, "_start_seed") as start:
+            assert mirror_list_folder("f1") is None
+        start.assert_called_once()
+        assert sorted(p.name for p in drive_mirror.MIRROR_DIR.glob("*.sqlite3")) == [
+            "drive_mirror-0123456789.sqlite3", "drive_mirror-9876543210.sqlite3",
+        ]
+
+    def test_expired_token_rebuilds(self, drive: FakeDrive) -> None:
+        drive_mirror._seed()
+        drive.changes = MiseError(ErrorKind.NOT_FOUND, "page token invalid")
+        with patch.object(drive_mirror, "_start_seed") as start:
+            assert mirror_list_folder("f1") is None
+        start.assert_called_once()
+        drive.changes = []
+        with patch.object(drive_mirror, "_start_seed"):
+            assert mirror_list_folder("f1") is None  # wiped until the reseed lands
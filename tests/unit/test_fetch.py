@@ -165,6 +165,28 @@ class TestPreExfilRouting:
         mock_drive_extract.assert_called_once()
         mock_gmail_extract.assert_not_called()
 
+    @patch("tools.fetch.gmail.fetch_thread")
+    @patch("tools.fetch.gmail.lookup_exfiltrated", return_value={})
+    @patch("tools.fetch.gmail.get_deposit_folder", return_value="/tmp/test-deposit")
+    @patch("tools.fetch.gmail.write_content")
+    @patch("tools.fetch.gmail.write_manifest")
+    @patch("tools.fetch.gmail.extract_thread_content", return_value="Thread content")
+    def test_looks_up_only_messages_with_attachments(
+        self, mock_extract, mock_manifest, mock_write, mock_folder, mock_lookup, mock_fetch
+    ):
+        """Messages without attachments can have no Drive copies — they aren't asked about."""
+        thread = _make_thread_data()
+        thread.messages.append(EmailMessage(
+            message_id="msg_with_att", from_address="carol@example.com", to_addresses=[], body_text="See attached",
+            attachments=[EmailAttachment(filename="a.txt", mime_type="text/plain", size=10, attachment_id="att_1")],
+        ))
+        mock_fetch.return_value = thread
+
+        with patch("tools.fetch.gmail._extract_attachment_content", return_value=None):
+            fetch_gmail("thread_xyz")
+
+        mock_lookup.assert_called_once_with(["msg_with_att"])
+
     @patch("tools.fetch.gmail.fetch_thread")
     @patch("tools.fetch.gmail.lookup_exfiltrated")
     @patch("tools.fetch.gmail._extract_from_drive")
@@ -695,6 +717,58 @@ class TestFetchAttachment:
         assert result.format == "markdown"
         mock_pdf.assert_called_once()
 
+    @patch("tools.fetch.gmail.fetch_thread")
+    @patch("tools.fetch.gmail.lookup_exfiltrated", return_value={})
+    @patch("tools.fetch.gmail_attachments.download_attachment")
+    @patch("tools.fetch.gmail.convert_office_content")
+    def test_office_attachment_converted_and_raw_deposited_from_disk(
+        self, mock_office, mock_download, mock_lookup, mock_fetch, tmp_path
+    ):
+        """The streamed download is converted and deposited from its temp file, never read whole."""
+        docx_mime = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+        att = EmailAttachment(filename="plan.docx", mime_type=docx_mime, size=9, attachment_id="att_1")
+        mock_fetch.return_value = _make_thread_data([att])
+        temp = tmp_path / "download.docx"
+        temp.write_bytes(b"PK docx!!")
+        mock_download.return_value = AttachmentDownload(
+            filename="plan.docx", mime_type=docx_mime, size=9, content=b"", temp_path=temp,
+        )
+        mock_office.return_value = OfficeConversionResult(
+            content="# Plan", source_type="docx", export_format="markdown", extension="md",
+        )
+
+        with patch.object(Path, "read_bytes", side_effect=AssertionError("read whole")):
+            result = fetch_attachment("thread_xyz", "plan.docx", base_path=tmp_path, raw=True)
+
+        assert isinstance(result, FetchResult)
+        assert mock_office.call_args.kwargs["file_path"] == temp
+        assert "file_bytes" not in mock_office.call_args.kwargs
+        assert (Path(result.path) / "plan.docx").read_bytes() == b"PK docx!!"
+        assert not temp.exists()
+
+    @patch("tools.fetch.gmail.fetch_thread")
+    @patch("tools.fetch.gmail.lookup_exfiltrated", return_value={})
+    @patch("tools.fetch.gmail_attachments.download_attachment")
+    @patch("tools.fetch.gmail.convert_pdf_content")
+    @patch("tools.fetch.gmail.render_pdf_pages")
+    def test_pdf_attachment_read_from_disk_and_cleaned_up(
+        self, mock_render, mock_pdf, mock_download, mock_lookup, mock_fetch, tmp_path
+    ):
+        att = EmailAttachment(filename="report.pdf", mime_type="application/pdf", size=8, attachment_id="att_2")
+        mock_fetch.return_value = _make_thread_data([att])
+        temp = tmp_path / "download.pdf"
+        temp.write_bytes(b"%PDF-1.7")
+        mock_download.return_value = AttachmentDownload(
+            filename="report.pdf", mime_type="application/pdf", size=8, content=b"", temp_path=temp,
+        )
+        mock_pdf.side_effect = RuntimeError("unreadable PDF")
+
+        with pytest.raises(RuntimeError):
+            fetch_attachment("thread_xyz", "report.pdf", base_path=tmp_path)
+
+        assert mock_pdf.call_args.kwargs["file_path"] == temp
+        assert not temp.exists()  # unlinked even though extraction failed
+
     @patch("tools.fetch.gmail.fetch_thread")
     @patch("tools.fetch.gmail.lookup_exfiltrated")
     @patch("tools.fetch.gmail.convert_office_content")
@@ -1262,6 +1336,24 @@ class TestDepositAttachmentContent:
         mock_write.assert_called_once()
         mock_img.assert_called_once()
 
+    @patch("tools.fetch.gmail_attachments.convert_pdf_content")
+    def test_pdf_on_disk_converted_from_its_path(self, mock_pdf, tmp_path):
+        """A downloaded PDF is converted from disk and copied in, never read whole."""
+        mock_pdf.return_value = PdfConversionResult(
+            content="# PDF Content", method="pdftotext", char_count=14,
+        )
+        downloaded = tmp_path / "download.pdf"
+        downloaded.write_bytes(b"%PDF-1.4 body")
+        folder = tmp_path / "deposit"
+        folder.mkdir()
+
+        result = _deposit_attachment_content(downloaded, "report.pdf", "application/pdf", "f1", folder)
+
+        assert result is not None and result["content_file"] == "report.pdf.md"
+        assert mock_pdf.call_args.kwargs["file_path"] == downloaded
+        assert (folder / "report.pdf").read_bytes() == b"%PDF-1.4 body"
+        assert (folder / "report.pdf.md").read_text() == "# PDF Content"
+
     @patch("tools.fetch.gmail_attachments.write_image")
     def test_image_deposited(self, mock_img):
         """Valid image bytes are deposited as file."""
@@ -1389,6 +1481,26 @@ class TestExtractAttachmentContent:
             result = _extract_attachment_content("msg1", att, Path("/tmp"), warnings)
         assert result is None
 
+    @patch("tools.fetch.gmail_attachments.download_attachment")
+    @patch("tools.fetch.gmail_attachments._deposit_attachment_content", side_effect=RuntimeError("bad pdf"))
+    def test_failed_extraction_still_cleans_temp(self, mock_deposit, mock_dl, tmp_path):
+        """The temp download goes even when extraction raises."""
+        downloaded = tmp_path / "r.pdf"
+        downloaded.write_bytes(b"bytes")
+        mock_dl.return_value = AttachmentDownload(
+            filename="r.pdf", mime_type="application/pdf", size=5, content=b"", temp_path=downloaded,
+        )
+        att = MagicMock()
+        att.attachment_id = "att1"
+        att.filename = "r.pdf"
+        att.mime_type = "application/pdf"
+        warnings: list[str] = []
+
+        assert _extract_attachment_content("msg1", att, tmp_path, warnings) is None
+        assert mock_deposit.call_args.args[0] == downloaded
+        assert not downloaded.exists()
+        assert "bad pdf" in warnings[0]
+
     @patch("tools.fetch.gmail_attachments.download_attachment", side_effect=RuntimeError("api error"))
     def test_failure_appends_warning(self, mock_dl):
         """Download failure appends warning."""
@@ -1500,7 +1612,7 @@ class TestFetchDoc:
     """Tests for fetch_doc orchestration."""
 
     @patch("tools.fetch.drive.fetch_document")
-    @patch("tools.fetch.drive.extract_doc_content", return_value="# Doc Content")
+    @patch("tools.fetch.drive.extract_doc_content_parallel", return_value="# Doc Content")
     @patch("tools.fetch.drive.get_deposit_folder", return_value=Path("/tmp/doc"))
     @patch("tools.fetch.drive.write_content", return_value=Path("/tmp/doc/content.md"))
     @patch("tools.fetch.drive._enrich_with_comments", return_value=(3, "comments"))
@@ -1522,7 +1634,7 @@ class TestFetchDoc:
         mock_comments.assert_called_once_with("doc1", Path("/tmp/doc"), document_markdown="# Doc Content")
 
     @patch("tools.fetch.drive.fetch_document")
-    @patch("tools.fetch.drive.extract_doc_content", return_value="# Doc")
+    @patch("tools.fetch.drive.extract_doc_content_parallel", return_value="# Doc")
     @patch("tools.fetch.drive.get_deposit_folder", return_value=Path("/tmp/doc"))
     @patch("tools.fetch.drive.write_content", return_value=Path("/tmp/doc/content.md"))
     @patch("tools.fetch.drive._enrich_with_comments", return_value=(0, None))
@@ -1541,7 +1653,7 @@ class TestFetchDoc:
         assert result.metadata["email_context"]["message_id"] == "m1"
 
     @patch("tools.fetch.drive.fetch_document")
-    @patch("tools.fetch.drive.extract_doc_content", return_value="# Doc")
+    @patch("tools.fetch.drive.extract_doc_content_parallel", return_value="# Doc")
     @patch("tools.fetch.drive.get_deposit_folder", return_value=Path("/tmp/doc"))
     @patch("tools.fetch.drive.write_content", return_value=Path("/tmp/doc/content.md"))
     @patch("tools.fetch.drive._enrich_with_comments", return_value=(0, None))
@@ -1560,7 +1672,7 @@ class TestFetchDoc:
         assert "warnings" in manifest_extra
 
     @patch("tools.fetch.drive.fetch_document")
-    @patch("tools.fetch.drive.extract_doc_content", return_value="# Doc")
+    @patch("tools.fetch.drive.extract_doc_content_parallel", return_value="# Doc")
     @patch("tools.fetch.drive.get_deposit_folder", return_value=Path("/tmp/doc"))
     @patch("tools.fetch.drive.write_content", return_value=Path("/tmp/doc/content.md"))
     @patch("tools.fetch.drive._enrich_with_comments", return_value=(0, None))
@@ -1688,7 +1800,7 @@ class TestFetchSheet:
         from tests.helpers import sheet_fetch_context
 
         with sheet_fetch_context(tmp_path) as ctx:
-            ctx.sheet_data.sheets = [MagicMock(), MagicMock()]
+            ctx.sheet_data.sheets = [MagicMock(pages=None), MagicMock(pages=None)]
 
             result = fetch_sheet("s1", "My Sheet", _drive_metadata("application/vnd.google-apps.spreadsheet"))
 
@@ -2011,52 +2123,83 @@ class TestFetchOffice:
 class TestFetchText:
     """Tests for fetch_text orchestration."""
 
-    @patch("tools.fetch.drive.download_file", return_value=b"Hello world")
-    @patch("tools.fetch.drive.get_deposit_folder", return_value=Path("/tmp/text"))
-    @patch("tools.fetch.drive.write_content", return_value=Path("/tmp/text/content.txt"))
+    @staticmethod
+    def _serve(*chunks: bytes):
+        """stream_file side effect: write the chunks the way stream_to_file would."""
+        def stream(file_id, file_obj):
+            file_obj.seek(0)
+            file_obj.truncate()
+            for chunk in chunks:
+                file_obj.write(chunk)
+        return stream
+
     @patch("tools.fetch.drive.write_manifest")
-    def test_plain_text(self, mock_manifest, mock_write, mock_folder, mock_dl):
-        """Plain text is downloaded and deposited."""
-        result = fetch_text("f1", "Notes", _drive_metadata("text/plain"))
+    @patch("tools.fetch.drive.stream_file")
+    def test_plain_text(self, mock_stream, mock_manifest, tmp_path):
+        """Plain text streams into the deposit folder."""
+        mock_stream.side_effect = self._serve(b"Hello ", b"world")
+
+        result = fetch_text("f1", "Notes", _drive_metadata("text/plain"), base_path=tmp_path)
 
         assert result.type == "text"
         assert result.format == "text"
         assert result.metadata["char_count"] == 11
+        assert Path(result.content_file).read_text() == "Hello world"
+        assert mock_manifest.call_args[1]["extra"]["char_count"] == 11
 
-    @patch("tools.fetch.drive.download_file", return_value=b"a,b\n1,2")
-    @patch("tools.fetch.drive.get_deposit_folder", return_value=Path("/tmp/text"))
-    @patch("tools.fetch.drive.write_content", return_value=Path("/tmp/text/content.csv"))
     @patch("tools.fetch.drive.write_manifest")
-    def test_csv_format(self, mock_manifest, mock_write, mock_folder, mock_dl):
+    @patch("tools.fetch.drive.stream_file")
+    def test_csv_format(self, mock_stream, mock_manifest, tmp_path):
         """CSV file gets csv format and extension."""
-        result = fetch_text("f1", "Data", _drive_metadata("text/csv"))
+        mock_stream.side_effect = self._serve(b"a,b\n1,2")
+
+        result = fetch_text("f1", "Data", _drive_metadata("text/csv"), base_path=tmp_path)
 
         assert result.format == "csv"
-        # Check the filename passed to write_content
-        assert mock_write.call_args[1].get("filename", "") == "content.csv" or "csv" in str(mock_write.call_args)
+        assert result.content_file.endswith("content.csv")
 
-    @patch("tools.fetch.drive.download_file", return_value=b'{"key": "value"}')
-    @patch("tools.fetch.drive.get_deposit_folder", return_value=Path("/tmp/text"))
-    @patch("tools.fetch.drive.write_content", return_value=Path("/tmp/text/content.json"))
     @patch("tools.fetch.drive.write_manifest")
-    def test_json_format(self, mock_manifest, mock_write, mock_folder, mock_dl):
+    @patch("tools.fetch.drive.stream_file")
+    def test_json_format(self, mock_stream, mock_manifest, tmp_path):
         """JSON file gets json format."""
-        result = fetch_text("f1", "Config", _drive_metadata("application/json"))
+        mock_stream.side_effect = self._serve(b'{"key": "value"}')
+
+        result = fetch_text("f1", "Config", _drive_metadata("application/json"), base_path=tmp_path)
 
         assert result.format == "json"
 
-    @patch("tools.fetch.drive.download_file", return_value=b"Hello")
-    @patch("tools.fetch.drive.get_deposit_folder", return_value=Path("/tmp/text"))
-    @patch("tools.fetch.drive.write_content", return_value=Path("/tmp/text/content.txt"))
     @patch("tools.fetch.drive.write_manifest")
-    def test_text_with_email_context(self, mock_manifest, mock_write, mock_folder, mock_dl):
+    @patch("tools.fetch.drive.stream_file")
+    def test_text_with_email_context(self, mock_stream, mock_manifest, tmp_path):
         """Email context in text result metadata."""
+        mock_stream.side_effect = self._serve(b"Hello")
         ctx = EmailContext(message_id="m1", from_address="a@b.com", subject="txt")
 
-        result = fetch_text("f1", "Notes", _drive_metadata("text/plain"), email_context=ctx)
+        result = fetch_text("f1", "Notes", _drive_metadata("text/plain"), email_context=ctx, base_path=tmp_path)
 
         assert "email_context" in result.metadata
 
+    @patch("tools.fetch.drive.stream_file")
+    def test_failed_download_keeps_the_previous_deposit(self, mock_stream, tmp_path):
+        """A download that fails part-way leaves the last good deposit whole."""
+        from workspace import get_deposit_folder, write_content
+
+        old = get_deposit_folder("text", "Notes", "f1", base_path=tmp_path)
+        write_content(old, "old notes", filename="content.txt")
+        (old / "manifest.json").write_text("{}")
+
+        def fail(file_id, file_obj):
+            file_obj.write(b"half of the new")
+            raise MiseError(ErrorKind.NETWORK_ERROR, "connection reset")
+
+        mock_stream.side_effect = fail
+        with pytest.raises(MiseError):
+            fetch_text("f1", "Notes", _drive_metadata("text/plain"), base_path=tmp_path)
+
+        assert (old / "content.txt").read_text() == "old notes"
+        assert (old / "manifest.json").exists()
+        assert sorted(p.name for p in (tmp_path / ".mise").iterdir()) == [old.name]
+
 
 class TestFetchImageFile:
     """Tests for fetch_image_file orchestration."""
@@ -2139,7 +2282,7 @@ class TestDoFetchRouting:
         """Drive IDs route to fetch_drive."""
         mock_drive.return_value = FetchResult(path="/p", content_file="/p/c.md", format="markdown", type="doc", metadata={})
         result = do_fetch("f1")
-        mock_drive.assert_called_once_with("f1", base_path=None, recursive=False, tabs=None, suggestions="accepted", thumbnails=True)
+        mock_drive.assert_called_once_with("f1", base_path=None, recursive=False, tabs=None, suggestions="accepted", thumbnails=True, metadata=None)
 
     @patch("tools.fetch.router.detect_id_type", return_value=("drive", "f1", UrlDecorations()))
     @patch("tools.fetch.router.fetch_drive")
@@ -2147,7 +2290,7 @@ class TestDoFetchRouting:
         """thumbnails=False reaches fetch_drive intact (mise-giwawa)."""
         mock_drive.return_value = FetchResult(path="/p", content_file="/p/c.md", format="markdown", type="doc", metadata={})
         do_fetch("f1", thumbnails=False)
-        mock_drive.assert_called_once_with("f1", base_path=None, recursive=False, tabs=None, suggestions="accepted", thumbnails=False)
+        mock_drive.assert_called_once_with("f1", base_path=None, recursive=False, tabs=None, suggestions="accepted", thumbnails=False, metadata=None)
 
     def test_mise_error_caught(self):
         """MiseError becomes FetchError."""
@@ -2176,7 +2319,7 @@ class TestDoFetchRouting:
         """base_path is forwarded to fetcher."""
         mock_drive.return_value = FetchResult(path="/p", content_file="/p/c.md", format="markdown", type="doc", metadata={})
         do_fetch("f1", base_path=Path("/custom"))
-        mock_drive.assert_called_once_with("f1", base_path=Path("/custom"), recursive=False, tabs=None, suggestions="accepted", thumbnails=True)
+        mock_drive.assert_called_once_with("f1", base_path=Path("/custom"), recursive=False, tabs=None, suggestions="accepted", thumbnails=True, metadata=None)
 
 
 class TestExtractParticipants:
@@ -2800,6 +2943,76 @@ class TestPerTabCsvDeposit:
         assert tabs_info[0]["filename"] == "content_q4-revenue-draft.csv"
         assert tabs_info[1]["filename"] == "content_uber-cool-sheet.csv"
 
+    def test_failed_page_keeps_the_previous_deposit(self, tmp_path: Path) -> None:
+        """A row page that fails mid-stream leaves the last good deposit whole."""
+        from models import SheetTab, SpreadsheetData
+        from workspace import get_deposit_folder, write_content
+
+        old = get_deposit_folder("sheet", "Big", "s1", base_path=tmp_path)
+        write_content(old, "old,rows\n", filename="content.csv")
+        (old / "manifest.json").write_text("{}")
+
+        def pages():
+            yield [["a", "b"]]
+            raise MiseError(ErrorKind.NETWORK_ERROR, "page 2 failed")
+
+        data = SpreadsheetData(title="Big", spreadsheet_id="s1", sheets=[
+            SheetTab(name="One", values=[], pages=pages()),
+            SheetTab(name="Two", values=[], pages=iter([[["c"]]])),
+        ])
+        with patch("tools.fetch.drive.fetch_spreadsheet", return_value=data), pytest.raises(MiseError):
+            fetch_sheet("s1", "Big", _drive_metadata("application/vnd.google-apps.spreadsheet"), base_path=tmp_path)
+
+        assert sorted(p.name for p in old.iterdir()) == ["content.csv", "manifest.json"]
+        assert (old / "content.csv").read_text() == "old,rows\n"
+        assert sorted(p.name for p in (tmp_path / ".mise").iterdir()) == [old.name]
+
+    @pytest.mark.parametrize("page_rows", [1, 2, 100, None])
+    def test_streamed_csvs_byte_identical(self, tmp_path: Path, page_rows: int | None) -> None:
+        """Row-paged writing produces exactly the one-shot files.
+
+        page_rows=None streams columnar tabs (SheetTab.grid) instead of pages.
+        """
+        from tools.fetch.common import _stream_sheet_csvs, _write_per_tab_csvs
+        from extractors.sheets import extract_sheets_content
+        from models import ColumnarGrid, SpreadsheetData, SheetTab
+
+        tabs = [
+            ("Summary", [[" lead", "a,b"], ["q\"uote", None], [], [1.5, True], ["tail ", " "]]),
+            ("Empty", []),
+            ("Details", [["x"], ["multi\nline"]]),
+        ]
+
+        def build(paged: bool) -> SpreadsheetData:
+            return SpreadsheetData(title="T", spreadsheet_id="t1", sheets=[
+                SheetTab(
+                    name=name,
+                    values=[] if paged else [list(r) for r in rows],
+                    pages=iter([rows[i:i + page_rows] for i in range(0, len(rows), page_rows)])
+                    if paged and page_rows else None,
+                    grid=ColumnarGrid.from_rows(rows) if paged and not page_rows else None,
+                )
+                for name, rows in tabs
+            ])
+
+        one_shot = build(paged=False)
+        (tmp_path / "a").mkdir()
+        write_path = tmp_path / "a" / "content.csv"
+        write_path.write_text(extract_sheets_content(one_shot))
+        tabs_info_a = _write_per_tab_csvs(tmp_path / "a", one_shot)
+
+        (tmp_path / "b").mkdir()
+        streamed = build(paged=True)
+        content_path, tabs_info_b = _stream_sheet_csvs(tmp_path / "b", streamed)
+
+        assert content_path.read_bytes() == write_path.read_bytes()
+        assert tabs_info_b == tabs_info_a
+        for entry in tabs_info_a:
+            assert (tmp_path / "b" / entry["filename"]).read_bytes() == (
+                tmp_path / "a" / entry["filename"]
+            ).read_bytes()
+        assert streamed.warnings == ["Sheet 'Empty' is empty"]
+
     def test_manifest_includes_tabs(self, tmp_path: Path):
         """Manifest includes tabs array when per-tab files exist."""
         from tests.helpers import sheet_fetch_context
@@ -2809,7 +3022,7 @@ class TestPerTabCsvDeposit:
             {"name": "Tab2", "filename": "content_tab2.csv"},
         ]
         with sheet_fetch_context(tmp_path, tabs_info=tabs) as ctx:
-            ctx.sheet_data.sheets = [MagicMock(name="Tab1"), MagicMock(name="Tab2")]
+            ctx.sheet_data.sheets = [MagicMock(name="Tab1", pages=None), MagicMock(name="Tab2", pages=None)]
 
             fetch_sheet("s1", "Sheet", _drive_metadata("application/vnd.google-apps.spreadsheet"))
 
@@ -2821,9 +3034,9 @@ class TestPerTabCsvDeposit:
         """Cues include tab_count and tab_names for multi-tab sheets."""
         from tests.helpers import sheet_fetch_context
 
-        tab1 = MagicMock()
+        tab1 = MagicMock(pages=None)
         tab1.name = "Revenue"
-        tab2 = MagicMock()
+        tab2 = MagicMock(pages=None)
         tab2.name = "Costs"
 
         with sheet_fetch_context(tmp_path) as ctx:
@@ -3089,7 +3302,7 @@ class TestRawAttachmentBytes:
     @patch("tools.fetch.gmail.get_deposit_folder", return_value=Path("/tmp/docx-raw"))
     @patch("tools.fetch.gmail.write_content", return_value=Path("/tmp/docx-raw/content.md"))
     @patch("tools.fetch.gmail.write_manifest")
-    @patch("tools.fetch.gmail.write_raw")
+    @patch("tools.fetch.gmail_attachments.write_raw")
     def test_raw_survives_the_drive_exfil_office_path(
         self, mock_raw, mock_manifest, mock_write, mock_folder,
         mock_office, mock_download, mock_lookup, mock_fetch
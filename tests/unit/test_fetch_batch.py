@@ -0,0 +1,119 @@
+"""Unit tests for multi-id fetch and batched Drive metadata."""
+
+from unittest.mock import MagicMock, patch
+
+from adapters.drive_batch import _parse_parts, get_files_metadata
+from models import FetchBatchResult, FetchError, FetchResult
+from tools.fetch import do_fetch, fetch_many
+
+
+def _batch_response(parts: list[tuple[int, int, str]], boundary: str = "batch_xyz") -> bytes:
+    """A multipart/mixed batch body: (content-id, status, json body) per part."""
+    body = ""
+    for index, status, payload in parts:
+        body += (
+            f"--{boundary}\r\nContent-Type: application/http\r\n"
+            f"Content-ID: <response-{index}>\r\n\r\n"
+            f"HTTP/1.1 {status} {'OK' if status == 200 else 'Not Found'}\r\n"
+            f"Content-Type: application/json; charset=UTF-8\r\n\r\n{payload}\r\n"
+        )
+    return (body + f"--{boundary}--").encode()
+
+
+def _ok(path: str) -> FetchResult:
+    return FetchResult(path=path, content_file=f"{path}/content.md", format="markdown",
+                       type="doc", metadata={})
+
+
+class TestBatchMetadata:
+
+    def test_parses_ok_parts_and_skips_errors(self) -> None:
+        content = _batch_response([
+            (0, 200, '{"id": "a", "mimeType": "application/pdf"}'),
+            (1, 404, '{"error": {"code": 404}}'),
+            (2, 200, '{"id": "c", "mimeType": "text/plain"}'),
+        ])
+        parts = _parse_parts('multipart/mixed; boundary="batch_xyz"', content)
+        assert parts == [(0, {"id": "a", "mimeType": "application/pdf"}),
+                         (2, {"id": "c", "mimeType": "text/plain"})]
+
+    @patch("adapters.drive_batch.get_sync_client")
+    def test_one_request_per_hundred_ids(self, mock_get_client) -> None:
+        def request(method, url, content, content_type):
+            count = content.count(b"GET /drive/v3/files/")
+            return MagicMock(
+                headers={"content-type": "multipart/mixed; boundary=batch_xyz"},
+                content=_batch_response([(i, 200, f'{{"id": "{i}"}}') for i in range(count)]),
+            )
+
+        mock_get_client.return_value.request.side_effect = request
+        ids = [f"id{i}" for i in range(150)]
+
+        found = get_files_metadata(ids + ["id0"])
+
+        assert mock_get_client.return_value.request.call_count == 2
+        assert len(found) == 150 and found["id149"] == {"id": "49"}
+
+    @patch("adapters.drive_batch.get_sync_client")
+    def test_failed_batch_is_empty_not_an_error(self, mock_get_client) -> None:
+        mock_get_client.return_value.request.side_effect = ConnectionError("down")
+        with patch("retry.time.sleep"):
+            assert get_files_metadata(["a", "b"]) == {}
+
+
+class TestFetchMany:
+
+    @patch("tools.fetch.batch.get_files_metadata")
+    @patch("tools.fetch.router.fetch_gmail")
+    @patch("tools.fetch.router.fetch_drive")
+    def test_items_keep_their_own_outcome_in_input_order(self, mock_drive, mock_gmail, mock_meta) -> None:
+        mock_meta.return_value = {"1abcDEFghiJKLmnoPQRstuVWXyz": {"mimeType": "application/pdf"}}
+        mock_drive.side_effect = lambda file_id, **kw: (
+            _ok(f".mise/pdf--{file_id}") if kw["metadata"] else
+            FetchError(kind="not_found", message="gone", file_id=file_id)
+        )
+        mock_gmail.return_value = _ok(".mise/gmail--thread")
+
+        result = do_fetch([
+            "https://drive.google.com/file/d/1abcDEFghiJKLmnoPQRstuVWXyz/view",
+            "19a8b7c6d5e4f3a2",
+            "1missingFileIdXXXXXXXXXXXXX",
+        ])
+
+        assert isinstance(result, FetchBatchResult)
+        # Drive ids share one metadata batch; the Gmail thread isn't in it
+        mock_meta.assert_called_once_with(["1abcDEFghiJKLmnoPQRstuVWXyz", "1missingFileIdXXXXXXXXXXXXX"])
+        out = result.to_dict()
+        assert (out["fetched"], out["failed"]) == (2, 1)
+        assert out["paths"] == [".mise/pdf--1abcDEFghiJKLmnoPQRstuVWXyz", ".mise/gmail--thread"]
+        assert [item["input"] for item in out["results"]] == [
+            "https://drive.google.com/file/d/1abcDEFghiJKLmnoPQRstuVWXyz/view",
+            "19a8b7c6d5e4f3a2",
+            "1missingFileIdXXXXXXXXXXXXX",
+        ]
+        assert out["results"][2]["kind"] == "not_found"
+
+    @patch("tools.fetch.batch.get_files_metadata", return_value={})
+    @patch("tools.fetch.router.fetch_drive")
+    def test_a_url_and_its_bare_id_are_one_fetch(self, mock_drive, mock_meta) -> None:
+        mock_drive.side_effect = lambda file_id, **kw: _ok(f".mise/doc--{file_id}")
+        url = "https://docs.google.com/document/d/1abcDEFghiJKLmnoPQRstuVWXyz/edit"
+
+        result = fetch_many(["1abcDEFghiJKLmnoPQRstuVWXyz", url, "1otherFileIdXXXXXXXXXXXXXXX"])
+
+        assert isinstance(result, FetchBatchResult)
+        assert mock_drive.call_count == 2
+        mock_meta.assert_called_once_with(["1abcDEFghiJKLmnoPQRstuVWXyz", "1otherFileIdXXXXXXXXXXXXXXX"])
+        assert result.results[0] is result.results[1]
+        out = result.to_dict()
+        assert [item["input"] for item in out["results"]] == ["1abcDEFghiJKLmnoPQRstuVWXyz", url, "1otherFileIdXXXXXXXXXXXXXXX"]
+        assert out["fetched"] == 3
+        assert out["paths"] == [".mise/doc--1abcDEFghiJKLmnoPQRstuVWXyz", ".mise/doc--1otherFileIdXXXXXXXXXXXXXXX"]
+
+    def test_attachment_needs_a_single_id(self) -> None:
+        result = fetch_many(["19a8b7c6d5e4f3a2", "19a8b7c6d5e4f3a3"], attachment="report.pdf")
+        assert isinstance(result, FetchError) and result.kind == "invalid_input"
+
+    def test_empty_list_is_invalid(self) -> None:
+        result = fetch_many(["", "  "])
+        assert isinstance(result, FetchError) and result.kind == "invalid_input"
@@ -1,11 +1,11 @@
 """Unit tests for do(freebusy) — availability + slot mining (mise-rijeco)."""
 
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from unittest.mock import patch
 from zoneinfo import ZoneInfo
 
 from models import ErrorKind, MiseError
-from tools.freebusy import _common_free_slots, _merge_blocks, do_freebusy
+from tools.freebusy import _merge_blocks, _mine_slots, do_freebusy
 
 _LON = ZoneInfo("Europe/London")
 
@@ -14,6 +14,18 @@ def _dt(day: int, hour: int, minute: int = 0) -> datetime:
     return datetime(2026, 9, day, hour, minute, tzinfo=_LON)
 
 
+def _common_free_slots(
+    busy: list[tuple[datetime, datetime]],
+    window_min: datetime,
+    window_max: datetime,
+    duration_minutes: int,
+    tz: ZoneInfo,
+) -> list[tuple[datetime, datetime]]:
+    """Everyone-free slots for one diary holding every busy block."""
+    slots = _mine_slots({"": busy}, window_min, window_max, duration_minutes, tz, min_free=1)
+    return [(start, end) for start, end, _, _ in slots]
+
+
 class TestSlotMining:
     def test_merge_overlapping_blocks(self) -> None:
         merged = _merge_blocks([
@@ -53,6 +65,79 @@ class TestSlotMining:
         assert slots == [(_dt(8, 9), _dt(8, 17, 30))]
 
 
+class TestQuorumMining:
+    def test_everyone_mode_matches_common_slots(self) -> None:
+        busy = {
+            "a": [(_dt(8, 10), _dt(8, 11))],
+            "b": [(_dt(8, 10, 30), _dt(8, 12)), (_dt(9, 9), _dt(9, 17, 30))],
+        }
+        slots = _mine_slots(busy, _dt(8, 0), _dt(9, 23), 30, _LON, min_free=2)
+        assert [(s, e) for s, e, _, _ in slots] == _common_free_slots(
+            [b for blocks in busy.values() for b in blocks],
+            _dt(8, 0), _dt(9, 23), duration_minutes=30, tz=_LON,
+        )
+
+    def test_k_of_n_ranks_most_available_first(self) -> None:
+        # Tue 8 Sep, three people: a busy 09:00–12:00, b busy 11:00–13:00
+        busy = {
+            "a": [(_dt(8, 9), _dt(8, 12))],
+            "b": [(_dt(8, 11), _dt(8, 13))],
+            "c": [],
+        }
+        slots = _mine_slots(busy, _dt(8, 0), _dt(8, 23), 30, _LON, min_free=2)
+        assert slots == [
+            (_dt(8, 13), _dt(8, 17, 30), 3, set()),
+            (_dt(8, 9), _dt(8, 11), 2, {"a"}),
+            (_dt(8, 12), _dt(8, 17, 30), 2, {"b"}),
+        ]
+
+    def test_quorum_stretch_keeps_one_group_free(self) -> None:
+        # c, then a, then b drop out back to back — 2 of 3 free all day, but
+        # never the same 2 for long
+        busy = {
+            "a": [(_dt(8, 13), _dt(8, 14))],
+            "b": [(_dt(8, 14), _dt(8, 15))],
+            "c": [(_dt(8, 9), _dt(8, 13))],
+        }
+        slots = _mine_slots(busy, _dt(8, 0), _dt(8, 23), 30, _LON, min_free=2)
+        assert slots == [
+            (_dt(8, 15), _dt(8, 17, 30), 3, set()),
+            (_dt(8, 9), _dt(8, 13), 2, {"c"}),
+            (_dt(8, 13), _dt(8, 14), 2, {"a"}),
+            (_dt(8, 14), _dt(8, 17, 30), 2, {"b"}),
+        ]
+
+    def test_disjoint_busy_blocks_both_count_against_a_long_stretch(self) -> None:
+        # One free at every instant, but nobody is free 09:00–17:30 throughout
+        busy = {
+            "p0": [(_dt(8, 10), _dt(8, 11))],
+            "p1": [(_dt(8, 13), _dt(8, 14))],
+        }
+        slots = _mine_slots(busy, _dt(8, 0), _dt(8, 23), 30, _LON, min_free=1)
+        assert slots == [
+            (_dt(8, 9), _dt(8, 10), 2, set()),
+            (_dt(8, 11), _dt(8, 13), 2, set()),
+            (_dt(8, 14), _dt(8, 17, 30), 2, set()),
+            (_dt(8, 9), _dt(8, 13), 1, {"p0"}),
+            (_dt(8, 11), _dt(8, 17, 30), 1, {"p1"}),
+        ]
+        assert all(available == 2 - len(missing) for _, _, available, missing in slots)
+
+    def test_scales_to_a_big_review(self) -> None:
+        # 80 people, one busy hour each, staggered 5 min — a dozen out at once
+        busy = {
+            f"p{i}": [(_dt(8, 9) + timedelta(minutes=5 * i), _dt(8, 10) + timedelta(minutes=5 * i))]
+            for i in range(80)
+        }
+        assert _mine_slots(busy, _dt(8, 0), _dt(8, 23), 30, _LON, min_free=80) == [
+            (_dt(8, 16, 35), _dt(8, 17, 30), 80, set()),
+        ]
+        quorum = _mine_slots(busy, _dt(8, 0), _dt(8, 23), 60, _LON, min_free=60)
+        assert quorum and all(slot[2] >= 60 for slot in quorum)
+        assert [slot[2] for slot in quorum] == sorted((slot[2] for slot in quorum), reverse=True)
+        assert all(len(slot[3]) == 80 - slot[2] for slot in quorum)
+
+
 def _fb(email_blocks: dict) -> dict:
     """Build a freebusy_query return: email → busy list or errors."""
     out = {}
@@ -144,6 +229,34 @@ class TestDoFreebusy:
         starts = [s["start"] for s in result["common_free"]]
         assert starts == [_dt(8, 12).isoformat()]
 
+    @patch("tools.freebusy.resolve_calendar_timezone", return_value="Europe/London")
+    @patch("tools.freebusy.list_status_events", return_value=[])
+    @patch("tools.freebusy.current_user_email", return_value=None)
+    @patch("tools.freebusy.freebusy_query")
+    def test_min_free_returns_ranked_quorum_slots(self, mock_fb, _me, _wl, _tz) -> None:
+        mock_fb.return_value = _fb({
+            "a@itv.com": [(_dt(8, 9), _dt(8, 17, 30))],
+            "b@itv.com": [],
+            "c@itv.com": [(_dt(8, 12), _dt(8, 13))],
+        })
+        result = do_freebusy(
+            attendees=["a@itv.com", "b@itv.com", "c@itv.com"],
+            time_min="2026-09-08", time_max="2026-09-08", duration=60, min_free=2,
+        )
+        assert "common_free" not in result
+        assert [(s["available"], s["missing"]) for s in result["quorum_free"]] == [
+            (2, ["a@itv.com"]), (2, ["a@itv.com"]),
+        ]
+        assert "at least 2 of 3" in result["slot_note"]
+
+    @patch("tools.freebusy.current_user_email", return_value=None)
+    def test_min_free_needs_duration(self, _me) -> None:
+        result = do_freebusy(
+            attendees=["a@itv.com"],
+            time_min="2026-09-08", time_max="2026-09-09", min_free=1,
+        )
+        assert result["error"] is True
+
     @patch("tools.freebusy.current_user_email", return_value=None)
     @patch("tools.freebusy.freebusy_query",
            side_effect=MiseError(ErrorKind.PERMISSION_DENIED, "insufficient scope"))
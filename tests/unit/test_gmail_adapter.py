@@ -5,13 +5,15 @@ Tests the helper functions that parse API response data,
 and the adapter functions with mocked httpx client.
 """
 
+import tempfile
 from datetime import datetime, timezone
+from pathlib import Path
 from unittest.mock import patch, MagicMock
 from urllib.parse import parse_qsl, urlsplit
 
 import pytest
 
-from models import GmailThreadData, GmailSearchResult, EmailMessage
+from models import GmailThreadData, GmailSearchResult, EmailMessage, MiseError
 from tests.conftest import load_fixture
 from adapters.gmail import (
     _parse_headers,
@@ -1167,74 +1169,67 @@ class TestSearchThreads:
 class TestDownloadAttachment:
     """Test attachment download with mocked httpx client."""
 
-    @patch('adapters.gmail.get_sync_client')
-    def test_small_attachment_in_memory(self, mock_get_client) -> None:
-        """Small attachment returns content in memory."""
+    @staticmethod
+    def _client(content: bytes) -> MagicMock:
         import base64
+        body = b'{\n  "data": "' + base64.urlsafe_b64encode(content) + b'"\n}\n'
+        client = MagicMock()
+        client.stream_to_file.side_effect = lambda url, f, **kw: [f.write(body[i:i + 7]) for i in range(0, len(body), 7)]
+        return client
+
+    @patch('adapters.gmail_stream.get_sync_client')
+    def test_attachment_streams_to_temp_file(self, mock_get_client) -> None:
+        """The decoded attachment lands on disk; nothing is held in memory."""
         content = b"Hello, this is a test attachment"
-        encoded = base64.urlsafe_b64encode(content).decode()
+        mock_get_client.return_value = self._client(content)
 
-        mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
-        mock_client.get_json.return_value = {"data": encoded}
-
-        with patch('retry.time.sleep'):
-            result = download_attachment("msg1", "att1", filename="test.txt", mime_type="text/plain")
+        result = download_attachment("msg1", "att1", filename="test.txt", mime_type="text/plain")
 
         assert isinstance(result, AttachmentDownload)
-        assert result.content == content
+        assert result.content == b""
         assert result.filename == "test.txt"
         assert result.mime_type == "text/plain"
         assert result.size == len(content)
-        assert result.temp_path is None
+        assert result.temp_path is not None and result.temp_path.suffix == ".txt"
+        assert result.temp_path.read_bytes() == content
+        result.temp_path.unlink()
 
         # Verify correct URL
-        call_args = mock_client.get_json.call_args
+        call_args = mock_get_client.return_value.stream_to_file.call_args
         assert "/messages/msg1/attachments/att1" in call_args[0][0]
 
-    @patch('adapters.gmail.get_sync_client')
+    @patch('adapters.gmail_stream.get_sync_client')
     def test_default_filename_and_mime(self, mock_get_client) -> None:
         """Missing filename/mime get defaults."""
-        import base64
-        encoded = base64.urlsafe_b64encode(b"data").decode()
+        mock_get_client.return_value = self._client(b"data")
 
-        mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
-        mock_client.get_json.return_value = {"data": encoded}
-
-        with patch('retry.time.sleep'):
-            result = download_attachment("msg1", "att1")
+        result = download_attachment("msg1", "att1")
 
         assert result.filename == "attachment"
         assert result.mime_type == "application/octet-stream"
+        assert result.temp_path is not None
+        result.temp_path.unlink()
 
-    @patch('adapters.gmail.get_sync_client')
-    def test_large_attachment_clears_content(self, mock_get_client) -> None:
-        """Large attachment writes to temp and clears content bytes to save memory."""
-        import base64
-        from adapters.gmail import ATTACHMENT_STREAMING_THRESHOLD
+    @patch('adapters.gmail_stream.get_sync_client')
+    def test_failed_download_leaves_no_temp_file(self, mock_get_client) -> None:
+        """A truncated response raises, and the partial temp file is removed."""
+        created: list[str] = []
+        real = tempfile.NamedTemporaryFile
 
-        # Create data larger than threshold
-        content = b"x" * (ATTACHMENT_STREAMING_THRESHOLD + 1)
-        encoded = base64.urlsafe_b64encode(content).decode()
+        def tracking(*args, **kwargs):
+            tmp = real(*args, **kwargs)
+            created.append(tmp.name)
+            return tmp
 
-        mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
-        mock_client.get_json.return_value = {"data": encoded}
+        client = MagicMock()
+        client.stream_to_file.side_effect = lambda url, f, **kw: f.write(b'{"data": "aGVsbG8')
+        mock_get_client.return_value = client
 
-        with patch('retry.time.sleep'):
-            result = download_attachment("msg1", "att1", filename="big.pdf", mime_type="application/pdf")
-
-        assert result.temp_path is not None
-        assert result.temp_path.exists()
-        assert result.content == b""  # Memory released
-        assert result.size == len(content)  # Size still recorded
+        with patch('adapters.gmail.tempfile.NamedTemporaryFile', side_effect=tracking), \
+             patch('retry.time.sleep'), pytest.raises(MiseError):
+            download_attachment("msg1", "att1", filename="big.pdf")
 
-        # Temp file has the actual content
-        assert result.temp_path.read_bytes() == content
-
-        # Clean up
-        result.temp_path.unlink()
+        assert created and not any(Path(name).exists() for name in created)
 
 
 # ============================================================================
@@ -561,6 +561,82 @@ class TestThreadExtraction:
         assert "Q4 Planning Meeting Notes" in result
 
 
+def _outlook_thread(n: int) -> GmailThreadData:
+    """n messages, each re-quoting the whole conversation Outlook-style."""
+    messages: list[EmailMessage] = []
+    history = ""
+    for i in range(1, n + 1):
+        own = (
+            f"Update number {i}: the regional survey numbers are attached and "
+            f"the weighting for quarter {i} has been re-run against the new base."
+        )
+        body = f"Hi team,\n\n{own}\n\nThanks,\nSender {i}"
+        if history:
+            body += (
+                f"\n\n________________________________\n"
+                f"From: Sender {i - 1} <s{i - 1}@example.com>\n"
+                f"Sent: 05 May 2026 14:{i:02d}\nTo: Team <team@example.com>\n"
+                f"Subject: RE: Survey\n\n{history}"
+            )
+        messages.append(EmailMessage(
+            message_id=f"m{i}", from_address=f"s{i}@example.com",
+            to_addresses=["team@example.com"], subject="RE: Survey", body_text=body,
+        ))
+        history = body
+    return GmailThreadData(thread_id="t1", subject="Survey", messages=messages)
+
+
+class TestThreadQuoteDedup:
+    """Outlook-style unprefixed quoting is elided thread-wide (thread_dedup)."""
+
+    def test_each_update_emitted_once(self):
+        result = extract_thread_content(_outlook_thread(6))
+        for i in range(1, 7):
+            assert result.count(f"Update number {i}:") == 1
+        assert "quoted from earlier in this thread elided" in result
+        assert "Sent: 05 May 2026" not in result
+
+    def test_output_grows_linearly(self):
+        """The point of the pass: 30 replies no longer carry 30 copies."""
+        deduped = extract_thread_content(_outlook_thread(30))
+        full = extract_thread_content(_outlook_thread(30), dedupe_quotes=False)
+        assert len(deduped) * 5 < len(full)
+
+    def test_marker_follows_reply_not_signature(self):
+        """Header, greeting, quoted body and sign-off fold into ONE marker,
+        placed after talon has stripped the replier's own signature."""
+        result = extract_thread_content(_outlook_thread(2))
+        second = result.split("[2/2]")[1]
+        assert "Sender 2" not in second
+        assert "Update number 2:" in second
+        assert second.rstrip().endswith(
+            "Update number 2: the regional survey numbers are attached and the "
+            "weighting for quarter 2 has been re-run against the new base.\n\n"
+            "[... 4 paragraphs quoted from earlier in this thread elided ...]"
+        )
+
+    def test_new_content_under_header_is_kept(self):
+        """A From:/Sent: block over content no earlier message carried stays."""
+        fwd = (
+            "FYI see below.\n\nFrom: Outsider <o@example.com>\nSent: Monday\n\n"
+            "This paragraph never appeared earlier in the thread at all."
+        )
+        data = _outlook_thread(1)
+        data.messages.append(EmailMessage(
+            message_id="m2", from_address="s2@example.com",
+            to_addresses=["team@example.com"], body_text=fwd,
+        ))
+        result = extract_thread_content(data)
+        assert "This paragraph never appeared earlier" in result
+        assert "elided" not in result
+
+    def test_gmail_style_quotes_unchanged(self, gmail_thread_response):
+        """'>' quoting is talon's job — the dedup pass adds no markers to it."""
+        assert extract_thread_content(gmail_thread_response) == extract_thread_content(
+            gmail_thread_response, dedupe_quotes=False
+        )
+
+
 class TestRealFixtureRoundTrip:
     """Round-trip tests: real API fixture → adapter → extractor → content string."""
 
@@ -0,0 +1,212 @@
+"""Unit tests for the local Gmail metadata index."""
+
+import time
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from models import ErrorKind, MiseError
+from adapters import gmail_index
+from adapters.gmail_index import _compile, search_local
+
+_NOW_MS = int(time.time() * 1000)
+_DAY_MS = 86_400_000
+
+
+def _message(msg_id: str, sender: str, subject: str, *, days_ago: int = 0,
+             labels: tuple[str, ...] = ("INBOX",), filename: str | None = None) -> dict[str, Any]:
+    parts = []
+    if filename:
+        parts.append({"filename": filename, "mimeType": "application/pdf",
+                      "body": {"attachmentId": f"att-{msg_id}", "size": 50_000}})
+    return {
+        "id": msg_id,
+        "internalDate": str(_NOW_MS - days_ago * _DAY_MS),
+        "labelIds": list(labels),
+        "snippet": f"snippet {msg_id}",
+        "payload": {
+            "mimeType": "multipart/mixed",
+            "headers": [
+                {"name": "From", "value": sender},
+                {"name": "To", "value": "me@example.com"},
+                {"name": "Subject", "value": subject},
+            ],
+            "parts": parts,
+        },
+    }
+
+
+class FakeGmail:
+    """get_json stand-in over an in-memory mailbox."""
+
+    def __init__(self) -> None:
+        self.threads: dict[str, list[dict[str, Any]]] = {}
+        self.history: list[dict[str, Any]] | Exception = []
+        self.history_id = "100"
+        self.thread_gets = 0
+        self.address = "me@example.com"
+
+    def get_json(self, url: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+        tail = url.rsplit("/users/me/", 1)[1]
+        if tail == "profile":
+            return {"historyId": self.history_id, "emailAddress": self.address}
+        if tail == "history":
+            if isinstance(self.history, Exception):
+                raise self.history
+            return {"history": self.history, "historyId": self.history_id}
+        if tail == "threads":
+            after = (params or {}).get("q", "").removeprefix("after:")
+            since_ms = int(after) * 1000 if after else 0
+            return {"threads": [{"id": t} for t, msgs in self.threads.items()
+                                if any(int(m["internalDate"]) >= since_ms for m in msgs)]}
+        thread_id = tail.split("/")[1]
+        self.thread_gets += 1
+        if thread_id not in self.threads:
+            raise MiseError(ErrorKind.NOT_FOUND, "gone")
+        return {"id": thread_id, "messages": self.threads[thread_id]}
+
+
+@pytest.fixture
+def gmail(tmp_path: Path):
+    fake = FakeGmail()
+    fake.threads = {
+        "t1": [_message("m1", "Alice Smith <alice@example.com>", "Budget 2027", days_ago=3,
+                        filename="forecast.pdf"),
+               _message("m2", "Bob <bob@example.com>", "Re: Budget 2027", days_ago=1,
+                        labels=("INBOX", "UNREAD"))],
+        "t2": [_message("m3", "Bob <bob@example.com>", "Offsite", days_ago=2)],
+        "t3": [_message("m4", "Carol <carol@example.com>", "Old news", days_ago=5,
+                        labels=("SENT",))],
+    }
+    client = MagicMock()
+    client.get_json.side_effect = fake.get_json
+    with patch.object(gmail_index, "ENABLED", True), \
+         patch.object(gmail_index, "SEED_DAYS", 0), \
+         patch.object(gmail_index, "get_sync_client", return_value=client), \
+         patch("adapters.gmail.current_user_email", return_value="me@example.com"):
+        yield fake
+
+
+def _ids(results) -> list[str]:
+    return [r.thread_id for r in results.results]
+
+
+class TestCompile:
+
+    @pytest.mark.parametrize("query", [
+        "budget", '"quarterly plan"', "from:alice OR from:bob", "-from:alice",
+        "in:trash", "larger:5M", "after:yesterday",
+    ])
+    def test_body_text_and_unsupported_operators_go_live(self, query: str) -> None:
+        assert _compile(query) is None
+
+    @pytest.mark.parametrize("query", ["from:me newer_than:7d", "to:me", "cc:ME is:unread"])
+    def test_me_goes_live(self, query: str) -> None:
+        # Gmail's "me" is the account and its send-as aliases, not the text "me"
+        assert _compile(query) is None
+
+    def test_triage_operators_compile(self) -> None:
+        compiled = _compile('from:alice subject:"budget 2027" is:unread has:attachment after:2026/09/01')
+        assert compiled is not None
+        assert compiled.match == ['sender : "alice"', 'subject : "budget 2027"']
+        assert compiled.since is not None
+
+
+class TestSearchLocal:
+
+    def test_off_by_default(self, gmail: FakeGmail) -> None:
+        with patch.object(gmail_index, "ENABLED", False):
+            assert search_local("from:alice") is None
+
+    def test_unseeded_index_seeds_and_goes_live(self, gmail: FakeGmail) -> None:
+        with patch.object(gmail_index, "_start_seed") as start:
+            assert search_local("from:alice") is None
+        start.assert_called_once()
+
+    def test_seeded_index_answers_triage_queries(self, gmail: FakeGmail) -> None:
+        gmail_index._seed()
+        gets = gmail.thread_gets
+
+        assert _ids(search_local("from:bob")) == ["t1", "t2"]  # newest thread first
+        assert _ids(search_local("filename:forecast")) == ["t1"]
+        assert _ids(search_local("is:unread")) == ["t1"]
+        assert _ids(search_local("in:sent")) == ["t3"]
+        assert _ids(search_local("subject:offsite newer_than:7d")) == ["t2"]
+        # Per message, as Gmail: no single message is from Alice AND unread
+        assert _ids(search_local("from:alice is:unread")) == []
+        assert gmail.thread_gets == gets  # no per-thread fetches
+
+        row = search_local("from:alice").results[0]
+        assert row.subject == "Budget 2027" and row.message_count == 2
+        assert row.attachment_names == ["forecast.pdf"] and row.unread_count == 1
+
+    def test_truncated_when_more_match(self, gmail: FakeGmail) -> None:
+        gmail_index._seed()
+        results = search_local("from:bob", max_results=1)
+        assert _ids(results) == ["t1"] and results.truncated
+
+    def test_partial_index_goes_live_unless_exact(self, gmail: FakeGmail) -> None:
+        with patch.object(gmail_index, "SEED_DAYS", 30):
+            gmail_index._seed()
+        # Few matches: an older, unindexed thread might also match
+        assert search_local("from:carol", max_results=5) is None
+        # A full page is exact — anything unindexed is older than every row
+        assert _ids(search_local("from:bob", max_results=2)) == ["t1", "t2"]
+        # So is a query bounded above the floor
+        assert _ids(search_local("from:carol newer_than:7d", max_results=5)) == ["t3"]
+
+    def test_full_page_reaching_below_the_floor_goes_live(self, gmail: FakeGmail) -> None:
+        gmail.threads = {
+            "tA": [_message("a1", "Bob <bob@example.com>", "Recent", days_ago=1)],
+            "tMid": [_message("b1", "Bob <bob@example.com>", "Unindexed", days_ago=50)],
+            "tOld": [_message("c1", "Bob <bob@example.com>", "Ancient", days_ago=100)],
+        }
+        with patch.object(gmail_index, "SEED_DAYS", 30):
+            gmail_index._seed()
+        # Marking an ancient thread read pulls it into the index past tMid
+        gmail.history = [{"messages": [{"id": "c1", "threadId": "tOld"}]}]
+        gmail.history_id = "200"
+
+        assert search_local("from:bob", max_results=2) is None
+        assert _ids(search_local("from:bob", max_results=1)) == ["tA"]
+
+    def test_history_delta_refetches_touched_threads(self, gmail: FakeGmail) -> None:
+        gmail_index._seed()
+        gmail.threads["t4"] = [_message("m5", "Dana <dana@example.com>", "New", labels=("INBOX", "UNREAD"))]
+        del gmail.threads["t2"]
+        gmail.history = [
+            {"messages": [{"id": "m5", "threadId": "t4"}]},
+            {"messages": [{"id": "m3", "threadId": "t2"}]},
+        ]
+        gmail.history_id = "200"
+
+        assert _ids(search_local("is:unread")) == ["t4", "t1"]
+        assert _ids(search_local("subject:offsite")) == []
+
+    def test_each_mailbox_has_its_own_index(self, gmail: FakeGmail) -> None:
+        gmail_index._seed()
+        assert search_local("from:bob") is not None
+
+        # A new client — re-auth or another identity — asks whose mailbox this is
+        gmail.address = "guest@example.com"
+        other = MagicMock()
+        other.get_json.side_effect = gmail.get_json
+        with patch.object(gmail_index, "get_sync_client", return_value=other), \
+             patch.object(gmail_index, "_start_seed") as start:
+            assert search_local("from:bob") is None
+        start.assert_called_once()
+        assert sorted(p.name for p in gmail_index.INDEX_DIR.glob("*.sqlite3")) == [
+            "gmail_index-guest@example.com.sqlite3", "gmail_index-me@example.com.sqlite3",
+        ]
+
+    def test_expired_history_rebuilds(self, gmail: FakeGmail) -> None:
+        gmail_index._seed()
+        gmail.history = MiseError(ErrorKind.NOT_FOUND, "historyId too old")
+        with patch.object(gmail_index, "_start_seed") as start:
+            assert search_local("from:bob") is None
+        start.assert_called_once()
+        with patch.object(gmail_index, "_start_seed"):
+            gmail.history = []
+            assert search_local("from:bob") is None  # wiped until the reseed lands
@@ -0,0 +1,180 @@
+"""
+Tests for incremental Gmail re-fetch — a re-fetched thread pulls only its
+new messages and carries the earlier deposit's attachment work forward —
+and for the message-by-message fetch of long threads.
+"""
+
+import base64
+import json
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from adapters.gmail import THREAD_FIELDS, fetch_thread
+from adapters.gmail_delta import LARGE_THREAD_MESSAGES, MESSAGE_FIELDS, fetch_thread_chunked, note_thread_sizes, refresh_thread
+from tools.fetch.gmail import fetch_gmail
+from tools.fetch.gmail_refetch import THREAD_STATE_FILE
+
+THREAD_ID = "18fd8caa12fed511"
+DOCX = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+
+def _message(n: int, attachment: bool = False) -> dict[str, Any]:
+    body = {"mimeType": "text/plain", "body": {"data": base64.urlsafe_b64encode(f"Message body {n}".encode()).decode()}}
+    payload: dict[str, Any] = {
+        "headers": [
+            {"name": "From", "value": f"sender{n}@example.com"},
+            {"name": "To", "value": "me@example.com"},
+            {"name": "Subject", "value": "Budget"},
+        ],
+        **body,
+    }
+    if attachment:
+        payload = {
+            "headers": payload["headers"],
+            "mimeType": "multipart/mixed",
+            "parts": [body, {"mimeType": DOCX, "filename": f"plan{n}.docx", "body": {"attachmentId": f"att{n}", "size": 5000}}],
+        }
+    return {"id": f"m{n}", "threadId": THREAD_ID, "labelIds": ["INBOX"], "internalDate": str(1760000000000 + n), "payload": payload}
+
+
+class FakeGmail:
+    """threads.get (full and minimal) and messages.get over an in-memory thread."""
+
+    def __init__(self, messages: list[dict[str, Any]]) -> None:
+        self.messages = messages
+        self.calls: list[tuple[str, str]] = []
+
+    def get_json(self, url: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+        params = params or {}
+        kind = url.rsplit("/", 2)[-2]
+        self.calls.append((kind, params.get("format", "")))
+        if kind == "messages":
+            return next(m for m in self.messages if m["id"] == url.rsplit("/", 1)[-1])
+        history = str(1000 + len(self.messages))
+        if params.get("format") == "minimal":
+            return {"historyId": history, "messages": [{"id": m["id"], "labelIds": m["labelIds"]} for m in self.messages]}
+        return {"id": THREAD_ID, "historyId": history, "messages": self.messages}
+
+
+@pytest.fixture
+def gmail():
+    fake = FakeGmail([_message(1, attachment=True), _message(2)])
+    client = MagicMock()
+    client.get_json.side_effect = fake.get_json
+    with patch("adapters.gmail.get_sync_client", return_value=client), \
+         patch("adapters.gmail_delta.get_sync_client", return_value=client), \
+         patch("tools.fetch.gmail.lookup_exfiltrated", return_value={}) as lookup:
+        fake.lookup = lookup  # type: ignore[attr-defined]
+        yield fake
+
+
+def _manifest(result) -> dict[str, Any]:
+    return json.loads((Path(result.path) / "manifest.json").read_text())
+
+
+class TestIncrementalRefetch:
+
+    def test_first_fetch_records_message_ids_history_and_state(self, gmail, tmp_path) -> None:
+        result = fetch_gmail(THREAD_ID, base_path=tmp_path)
+
+        manifest = _manifest(result)
+        assert manifest["message_ids"] == ["m1", "m2"]
+        assert manifest["history_id"] == "1002"
+        assert (Path(result.path) / THREAD_STATE_FILE).exists()
+        assert "new_messages" not in result.metadata
+
+    def test_refetch_pulls_only_the_new_message(self, gmail, tmp_path) -> None:
+        fetch_gmail(THREAD_ID, base_path=tmp_path)
+        gmail.messages.append(_message(3))
+        gmail.calls.clear()
+
+        result = fetch_gmail(THREAD_ID, base_path=tmp_path)
+
+        assert gmail.calls == [("threads", "minimal"), ("messages", "full")]
+        assert result.metadata["new_messages"] == 1
+        assert _manifest(result)["message_ids"] == ["m1", "m2", "m3"]
+        content = (Path(result.path) / "content.md").read_text()
+        assert "[3/3]" in content and "Message body 3" in content and "Message body 1" in content
+
+    def test_refetch_matches_a_whole_fetch(self, gmail, tmp_path) -> None:
+        fetch_gmail(THREAD_ID, base_path=tmp_path / "a")
+        gmail.messages.append(_message(3, attachment=True))
+        incremental = fetch_gmail(THREAD_ID, base_path=tmp_path / "a")
+        whole = fetch_gmail(THREAD_ID, base_path=tmp_path / "b")
+
+        assert (Path(incremental.path) / "content.md").read_text() == (Path(whole.path) / "content.md").read_text()
+        assert {k: v for k, v in incremental.metadata.items() if k != "new_messages"} == whole.metadata
+
+    def test_carried_messages_skip_attachment_work(self, gmail, tmp_path) -> None:
+        fetch_gmail(THREAD_ID, base_path=tmp_path)
+        gmail.messages.append(_message(3))
+
+        result = fetch_gmail(THREAD_ID, base_path=tmp_path)
+
+        # plan1.docx's outcome is carried from the first fetch, not recomputed
+        assert result.metadata["skipped_office"] == ["plan1.docx"]
+        assert gmail.lookup.call_args_list[-1].args[0] == []
+
+    def test_deleted_message_means_a_whole_fetch(self, gmail, tmp_path) -> None:
+        fetch_gmail(THREAD_ID, base_path=tmp_path)
+        del gmail.messages[0]
+        gmail.calls.clear()
+
+        result = fetch_gmail(THREAD_ID, base_path=tmp_path)
+
+        assert gmail.calls == [("threads", "minimal"), ("threads", "full")]
+        assert _manifest(result)["message_ids"] == ["m2"]
+
+    def test_label_changes_reach_carried_messages(self, gmail, tmp_path) -> None:
+        fetch_gmail(THREAD_ID, base_path=tmp_path)
+        gmail.messages[1]["labelIds"] = ["INBOX", "UNREAD"]
+
+        result = fetch_gmail(THREAD_ID, base_path=tmp_path)
+
+        assert result.metadata["unread_count"] == 1
+
+
+class TestRefreshThread:
+
+    def test_message_mask_is_the_thread_masks_message_part(self) -> None:
+        # A message fetched alone must parse like one fetched with its thread
+        assert f"messages({MESSAGE_FIELDS})" in THREAD_FIELDS
+
+    def test_unknown_stored_message_returns_none(self, gmail) -> None:
+        assert refresh_thread(THREAD_ID, {"gone": _message(9)}) is None
+
+
+class TestLongThreads:
+
+    def test_chunked_fetch_builds_the_same_thread(self, gmail) -> None:
+        gmail.messages.extend(_message(n, attachment=n % 3 == 0) for n in range(3, 15))
+        assert fetch_thread_chunked(THREAD_ID) == fetch_thread(THREAD_ID)
+
+    def test_thread_known_to_be_long_skips_threads_get(self, gmail) -> None:
+        note_thread_sizes({THREAD_ID: LARGE_THREAD_MESSAGES})
+        thread = fetch_thread(THREAD_ID)
+        assert ("threads", "full") not in gmail.calls
+        assert [m.message_id for m in thread.messages] == ["m1", "m2"]
+
+    def test_short_thread_is_one_threads_get(self, gmail) -> None:
+        note_thread_sizes({THREAD_ID: LARGE_THREAD_MESSAGES - 1})
+        fetch_thread(THREAD_ID)
+        assert gmail.calls == [("threads", "full")]
+
+    def test_timed_out_threads_get_falls_back_to_chunks(self, gmail) -> None:
+        answer = gmail.get_json
+
+        def slow_full(url: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+            if (params or {}).get("format") == "full" and "/threads/" in url:
+                raise httpx.ReadTimeout("timed out")
+            return answer(url, params)
+
+        with patch("adapters.gmail.get_sync_client") as get_client:
+            get_client.return_value.get_json.side_effect = slow_full
+            thread = fetch_thread(THREAD_ID)
+        assert thread.history_id == "1002"
+        assert [m.message_id for m in thread.messages] == ["m1", "m2"]
@@ -0,0 +1,54 @@
+"""Unit tests for streaming base64url decode of Gmail attachment responses."""
+
+import base64
+import io
+import os
+
+import pytest
+
+from adapters.gmail_stream import Base64urlFieldWriter
+
+
+def _feed(body: bytes, step: int) -> tuple[bytes, Base64urlFieldWriter]:
+    out = io.BytesIO()
+    writer = Base64urlFieldWriter(out)
+    for i in range(0, len(body), step):
+        writer.write(body[i:i + step])
+    writer.finish()
+    return out.getvalue(), writer
+
+
+class TestBase64urlFieldWriter:
+
+    @pytest.mark.parametrize("step", [1, 3, 4, 5, 64, 65536])
+    def test_any_chunking_decodes_the_same_bytes(self, step: int) -> None:
+        content = os.urandom(1000)
+        body = b'{\n  "data": "' + base64.urlsafe_b64encode(content) + b'"\n}\n'
+        decoded, writer = _feed(body, step)
+        assert decoded == content
+        assert writer.bytes_written == len(content)
+
+    def test_other_fields_around_data_are_skipped(self) -> None:
+        body = b'{"size": 11, "data": "' + base64.urlsafe_b64encode(b"hello world") + b'", "attachmentId": "x"}'
+        assert _feed(body, 5)[0] == b"hello world"
+
+    def test_unpadded_data_decodes(self) -> None:
+        encoded = base64.urlsafe_b64encode(b"hello").rstrip(b"=")
+        assert _feed(b'{"data":"' + encoded + b'"}', 2)[0] == b"hello"
+
+    def test_truncated_response_raises(self) -> None:
+        writer = Base64urlFieldWriter(io.BytesIO())
+        writer.write(b'{"data": "aGVsbG8')
+        with pytest.raises(ValueError):
+            writer.finish()
+
+    def test_seek_to_start_begins_again(self) -> None:
+        out = io.BytesIO()
+        writer = Base64urlFieldWriter(out)
+        writer.write(b'{"data": "aGVs')
+        writer.seek(0)
+        writer.truncate()
+        writer.write(b'{"data": "aGVsbG8="}')
+        writer.finish()
+        assert out.getvalue() == b"hello"
+        assert writer.bytes_written == 5
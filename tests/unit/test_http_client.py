@@ -415,6 +415,33 @@ class TestSyncClient:
 
         creds.refresh.assert_called_once()
 
+    def test_probe_status_never_reads_the_body(self) -> None:
+        """A 200 for a Range probe must not pull the whole file down."""
+        read: list[bytes] = []
+
+        class Body(httpx.SyncByteStream):
+            def __iter__(self):
+                for chunk in (b"x" * 65536,) * 4096:  # 256MB, if anyone asked
+                    read.append(chunk)
+                    yield chunk
+
+        seen: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(200, stream=Body())
+
+        creds = _mock_credentials()
+        creds.quota_project_id = None
+        client = _make_sync_client(creds)
+        client._client = httpx.Client(transport=httpx.MockTransport(handler))
+
+        status = client.probe_status("https://www.googleapis.com/drive/v3/files/abc", headers={"Range": "bytes=0-0"})
+
+        assert status == 200
+        assert seen[0].headers["Range"] == "bytes=0-0"
+        assert read == []
+
 
 class TestSyncSingleton:
     def test_get_sync_client_returns_same_instance(self) -> None:
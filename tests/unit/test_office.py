@@ -82,7 +82,7 @@ class TestOfficeExtraction:
 
         # Verify Sheets API path used
         mock_drive_temp.assert_called_once()
-        mock_fetch_sheet.assert_called_once_with("temp_sheet_id", render_charts=False)
+        mock_fetch_sheet.assert_called_once_with("temp_sheet_id", render_charts=False, stream=False)
 
     @patch("adapters.office.convert_via_drive")
     def test_extract_pptx(self, mock_convert: MagicMock) -> None:
@@ -175,7 +175,7 @@ class TestFetchOffice:
         assert result.format == "markdown"
         assert result.metadata["title"] == "Test.docx"
 
-        mock_extract.assert_called_once_with("abc123", "docx")
+        mock_extract.assert_called_once_with("abc123", "docx", file_size=None)
         mock_write_content.assert_called_once()
 
     @patch("tools.fetch.drive.fetch_and_convert_office")
@@ -404,14 +404,15 @@ class TestFetchPdf:
         mock_get_folder.return_value = tmp_path / "pdf--test--abc123"
         mock_write_content.return_value = tmp_path / "content.md"
 
-        result = fetch_pdf("abc123", "Test Document", {"mimeType": "application/pdf"})
+        result = fetch_pdf("abc123", "Test Document", {"mimeType": "application/pdf", "size": "2048"})
 
         assert result.type == "pdf"
         assert result.format == "markdown"
         assert result.metadata["title"] == "Test Document"
         assert result.metadata["extraction_method"] == "markitdown"
 
-        mock_extract.assert_called_once_with("abc123", thumbnails=True)
+        # The router's metadata already carries the size — no second size query
+        mock_extract.assert_called_once_with("abc123", thumbnails=True, file_size=2048)
         mock_write_content.assert_called_once()
         mock_write_manifest.assert_called_once()
 
@@ -472,7 +473,7 @@ class TestLargeFileStreaming:
         result = fetch_and_convert_pdf("small_file_id")
 
         # Should use memory download
-        mock_download.assert_called_once_with("small_file_id")
+        mock_download.assert_called_once_with("small_file_id", file_size=10 * 1024 * 1024)
         assert result.method == "markitdown"
 
     @patch("adapters.pdf.get_file_size")
@@ -504,7 +505,7 @@ class TestLargeFileStreaming:
         result = fetch_and_convert_pdf("large_file_id")
 
         # Should use streaming download
-        mock_download_temp.assert_called_once_with("large_file_id", suffix=".pdf")
+        mock_download_temp.assert_called_once_with("large_file_id", suffix=".pdf", file_size=100 * 1024 * 1024)
         assert result.method == "markitdown"
         # Should have warning about large file
         assert any("Large file" in w for w in result.warnings)
@@ -204,6 +204,33 @@ class TestRenderViaPdf2image:
             _render_via_pdf2image(file_bytes=b"NOT_A_PDF")
 
 
+class TestRenderPageSelection:
+    """render_pdf_page_selection — only the asked-for pages, one poppler call per run."""
+
+    @patch("pdf2image.convert_from_path")
+    def test_contiguous_runs_share_a_call(self, mock_convert: MagicMock, tmp_path: Path) -> None:
+        from adapters.pdf_render import render_pdf_page_selection
+
+        def convert(path, fmt, size, first_page, last_page):
+            imgs = []
+            for page in range(first_page, last_page + 1):
+                img = MagicMock()
+                img.save = lambda buf, format, page=page: buf.write(f"P{page}".encode())
+                imgs.append(img)
+            return imgs
+
+        mock_convert.side_effect = convert
+        pdf_file = tmp_path / "deck.pdf"
+
+        result = render_pdf_page_selection(pdf_file, [7, 2, 3, 4, 9, 3], 800)
+
+        assert result == {2: b"P3", 3: b"P4", 4: b"P5", 7: b"P8", 9: b"P10"}
+        assert [(c.kwargs["first_page"], c.kwargs["last_page"]) for c in mock_convert.call_args_list] == [
+            (3, 5), (8, 8), (10, 10),
+        ]
+        assert all(c.kwargs["size"] == (800, None) for c in mock_convert.call_args_list)
+
+
 class TestRenderFailsGracefully:
     """Most important test: thumbnail failure must never break text extraction."""
 
@@ -387,7 +414,7 @@ class TestThumbnailsOptOut:
 
         fetch_pdf("abc123", "Test PDF", {"mimeType": "application/pdf"}, thumbnails=False)
 
-        mock_extract.assert_called_once_with("abc123", thumbnails=False)
+        mock_extract.assert_called_once_with("abc123", thumbnails=False, file_size=None)
 
 
 class TestPageCap:
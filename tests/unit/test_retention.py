@@ -0,0 +1,168 @@
+"""Unit tests for deposit retention (workspace/retention.py) and `mise gc`."""
+
+import json
+import os
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+import cli
+from tools import gc
+from workspace import get_deposit_folder, write_content, write_manifest, write_raw
+from workspace.retention import RetentionPolicy, collect, parse_size
+
+NOW = time.time()  # the CLI and the background sweep read the real clock
+DAY = 86400.0
+
+
+def _deposit(base: Path, content_type: str, resource_id: str, size: int, accessed_days_ago: float) -> Path:
+    folder = get_deposit_folder(content_type, resource_id, resource_id, base)
+    write_content(folder, "x" * size)
+    write_manifest(folder, content_type, resource_id, resource_id)
+    manifest = json.loads((folder / "manifest.json").read_text())
+    manifest["accessed_at"] = datetime.fromtimestamp(NOW - accessed_days_ago * DAY, timezone.utc).isoformat()
+    (folder / "manifest.json").write_text(json.dumps(manifest))
+    for f in [folder, *folder.iterdir()]:
+        os.utime(f, (NOW - DAY, NOW - DAY))  # written a day ago: outside the grace window
+    return folder
+
+
+def _policy(**overrides) -> RetentionPolicy:
+    return RetentionPolicy(**{"max_total_bytes": None, "max_age_seconds": None, **overrides})
+
+
+class TestCollect:
+
+    def test_old_deposits_expire(self, tmp_path: Path) -> None:
+        old = _deposit(tmp_path, "doc", "old", 10, accessed_days_ago=40)
+        recent = _deposit(tmp_path, "doc", "recent", 10, accessed_days_ago=2)
+
+        report = collect(tmp_path, _policy(max_age_seconds=30 * DAY), now=NOW)
+
+        assert report.removed == [old.name]
+        assert not old.exists() and recent.exists()
+
+    def test_total_size_evicts_least_recently_accessed_first(self, tmp_path: Path) -> None:
+        a = _deposit(tmp_path, "doc", "a", 1000, accessed_days_ago=3)
+        b = _deposit(tmp_path, "pdf", "b", 1000, accessed_days_ago=1)
+        c = _deposit(tmp_path, "doc", "c", 1000, accessed_days_ago=2)
+
+        report = collect(tmp_path, _policy(max_total_bytes=2500), now=NOW)
+
+        assert report.removed == [a.name]
+        assert b.exists() and c.exists()
+        assert report.kept == 2
+
+    def test_type_quota_only_touches_its_type(self, tmp_path: Path) -> None:
+        pdf_old = _deposit(tmp_path, "pdf", "p1", 1000, accessed_days_ago=5)
+        _deposit(tmp_path, "pdf", "p2", 1000, accessed_days_ago=1)
+        doc_older = _deposit(tmp_path, "doc", "d1", 1000, accessed_days_ago=9)
+
+        report = collect(tmp_path, _policy(type_quotas={"pdf": 1500}), now=NOW)
+
+        assert report.removed == [pdf_old.name]
+        assert doc_older.exists()
+
+    def test_deposit_being_written_is_never_removed(self, tmp_path: Path) -> None:
+        busy = _deposit(tmp_path, "doc", "busy", 10, accessed_days_ago=90)
+        os.utime(busy / "content.md", (NOW - 10, NOW - 10))  # a fetch is writing it now
+
+        report = collect(tmp_path, _policy(max_age_seconds=DAY), now=NOW)
+
+        assert report.removed == []
+        assert busy.name in report.skipped_in_use and busy.exists()
+
+    def test_search_results_age_by_file_time_and_unknown_entries_stay(self, tmp_path: Path) -> None:
+        mise = tmp_path / ".mise"
+        mise.mkdir()
+        search = mise / "search--budget--2026-01-01T00-00-00.json"
+        search.write_text("{}")
+        os.utime(search, (NOW - 60 * DAY, NOW - 60 * DAY))
+        (mise / ".blobs").mkdir()
+        (mise / "notes.txt").write_text("mine")
+
+        report = collect(tmp_path, _policy(max_age_seconds=30 * DAY), now=NOW)
+
+        assert report.removed == [search.name]
+        assert (mise / ".blobs").exists() and (mise / "notes.txt").exists()
+
+    def test_drafts_and_manifestless_folders_are_never_removed(self, tmp_path: Path) -> None:
+        mise = tmp_path / ".mise"
+        bare = mise / "sheet--q4-analysis--draft"
+        bare.mkdir(parents=True)
+        (bare / "content.csv").write_text("a,b\n1,2\n")
+        titled = mise / "doc--notes--draft"
+        titled.mkdir()
+        (titled / "content.md").write_text("# Notes")
+        (titled / "manifest.json").write_text(json.dumps({"type": "doc", "title": "Notes"}))
+        for f in [bare, titled, *bare.iterdir(), *titled.iterdir()]:
+            os.utime(f, (NOW - 40 * DAY, NOW - 40 * DAY))
+
+        report = collect(tmp_path, RetentionPolicy(), now=NOW)
+
+        assert report.removed == []
+        assert (bare / "content.csv").exists() and (titled / "content.md").exists()
+
+    def test_shared_blob_is_charged_once_and_freed_with_its_last_deposit(self, tmp_path: Path) -> None:
+        pdf = bytes(range(256)) * 64
+        a = _deposit(tmp_path, "gmail", "a", 10, accessed_days_ago=50)
+        b = _deposit(tmp_path, "pdf", "b", 10, accessed_days_ago=40)
+        for folder in (a, b):
+            write_raw(folder, pdf, "report.pdf")
+            os.utime(folder, (NOW - DAY, NOW - DAY))
+        blob = next((tmp_path / ".mise" / ".blobs").glob("*/*"))
+        os.utime(blob, (NOW - DAY, NOW - DAY))  # the deposits' report.pdf too: one file
+
+        report = collect(tmp_path, _policy(max_total_bytes=len(pdf)), now=NOW)
+        assert report.removed == [a.name]  # b alone now carries the blob
+        assert blob.exists() and report.orphan_blobs == 0
+
+        report = collect(tmp_path, _policy(max_age_seconds=30 * DAY), now=NOW)
+        assert report.removed == [b.name]
+        assert report.orphan_blobs == 1 and not blob.exists()
+
+    def test_dry_run_removes_nothing(self, tmp_path: Path) -> None:
+        old = _deposit(tmp_path, "doc", "old", 10, accessed_days_ago=40)
+        report = collect(tmp_path, _policy(max_age_seconds=DAY), dry_run=True, now=NOW)
+        assert report.removed == [old.name] and old.exists()
+
+
+class TestPolicy:
+
+    @pytest.mark.parametrize("text,size", [("512", 512), ("64k", 65536), ("500M", 500 << 20), ("1.5G", 3 << 29), ("2GiB", 2 << 30)])
+    def test_parse_size(self, text: str, size: int) -> None:
+        assert parse_size(text) == size
+
+    def test_from_env(self, monkeypatch) -> None:
+        monkeypatch.setenv("MISE_GC_MAX_BYTES", "0")
+        monkeypatch.setenv("MISE_GC_MAX_AGE_DAYS", "7")
+        monkeypatch.setenv("MISE_GC_TYPE_QUOTAS", "pdf=500M, image=1G")
+        policy = RetentionPolicy.from_env()
+        assert policy.max_total_bytes is None
+        assert policy.max_age_seconds == 7 * DAY
+        assert policy.type_quotas == {"pdf": 500 << 20, "image": 1 << 30}
+
+
+class TestGcCommand:
+
+    def test_cli_gc_dry_run_reports_for_cwd(self, tmp_path: Path) -> None:
+        old = _deposit(tmp_path, "doc", "old", 10, accessed_days_ago=400)
+        result = cli.run(["gc", "--dry-run", "--max-age-days", "30"], tmp_path)
+        assert result["removed"] == [old.name] and result["dry_run"] is True
+        assert old.exists()
+
+    def test_malformed_size_is_an_error_result(self, tmp_path: Path) -> None:
+        result = gc.do_gc(tmp_path, max_bytes="lots")
+        assert result["error"] is True and result["kind"] == "invalid_input"
+        assert "Not a size" in result["message"]
+
+    def test_background_sweep_covers_noted_workspaces(self, tmp_path: Path, monkeypatch) -> None:
+        old = _deposit(tmp_path, "doc", "old", 10, accessed_days_ago=400)
+        monkeypatch.setenv("MISE_GC_MAX_AGE_DAYS", "30")
+        with patch.object(gc, "_workspaces", set()):
+            gc.note_workspace(tmp_path)
+            assert gc.sweep_workspaces() == 1
+        assert not old.exists()
@@ -292,6 +292,46 @@ class TestDoSearch:
         mock_drive.assert_called_once()
         mock_gmail.assert_called_once()
 
+    @patch('tools.search.write_search_results')
+    @patch('tools.search.search_local')
+    @patch('tools.search.search_threads')
+    @patch('tools.search.search_files')
+    def test_local_gmail_index_answer_skips_the_api(
+        self, mock_drive, mock_gmail, mock_local, mock_write,
+    ) -> None:
+        """When the local index can answer, the live search never runs."""
+        mock_drive.return_value = DriveSearchResults(results=[])
+        mock_local.return_value = GmailSearchResults(results=[
+            GmailSearchResult(thread_id="t-local", subject="Indexed", snippet="..."),
+        ])
+        mock_write.return_value = "/tmp/fake/search-results.json"
+
+        result = do_search("from:alice", sources=["gmail"])
+
+        mock_local.assert_called_once_with("from:alice", max_results=20)
+        mock_gmail.assert_not_called()
+        assert result.gmail_results[0]["thread_id"] == "t-local"
+
+    @patch('tools.search.write_search_results')
+    @patch('tools.search.mirror_search')
+    @patch('tools.search.search_files')
+    def test_local_drive_mirror_answer_skips_the_api(
+        self, mock_drive, mock_mirror, mock_write,
+    ) -> None:
+        """A metadata query the mirror can answer never reaches files.list."""
+        mock_mirror.return_value = DriveSearchResults(results=[
+            DriveSearchResult(file_id="d-local", name="Budget", mime_type="application/pdf"),
+        ])
+        mock_write.return_value = "/tmp/fake/search-results.json"
+
+        result = do_search("", raw_query="name contains 'budget'")
+
+        mock_mirror.assert_called_once_with(
+            "trashed = false and (name contains 'budget')", max_results=20, folder_id=None,
+        )
+        mock_drive.assert_not_called()
+        assert result.drive_results[0]["id"] == "d-local"
+
     @patch('tools.search.write_search_results')
     @patch('tools.search.search_threads')
     @patch('tools.search.search_files')
@@ -5,8 +5,9 @@ from inline_snapshot import snapshot
 
 from extractors.sheets import (
     extract_sheets_content, extract_sheets_per_tab, strip_sheet_header, _row_to_csv,
+    rows_to_csv, sheet_to_csv,
 )
-from models import SpreadsheetData, SheetTab
+from models import ColumnarGrid, SpreadsheetData, SheetTab
 
 
 # Fixture 'sheets_response' is provided by tests/conftest.py
@@ -141,6 +142,57 @@ class TestRowToCsv:
         assert result == expected
 
 
+class TestColumnarGrid:
+    """The columnar store must render byte-identically to _row_to_csv."""
+
+    @pytest.mark.parametrize("rows", [
+        [],
+        [[]],
+        [[], [], ["a"]],
+        [["a", "b", "c"], ["d"], [], ["e", "f"]],                # ragged, API-trimmed
+        [["x", None, "z"], [None, None], [None]],
+        [[1, 2.5, True], [False, 0, -3.25], ["1", "", None]],  # mixed types per column
+        [['Say "hello"', "a,b"], ["line1\nline2", "plain"], ["cr\rhere", " pad "]],
+        [["", ""], ["", ""]],
+        [["é", "日本"], ["😀", ","]],
+    ])
+    def test_csv_byte_identical_to_row_writer(self, rows) -> None:
+        expected = "".join(_row_to_csv(row) + "\n" for row in rows)
+        for intern in (True, False):
+            grid = ColumnarGrid.from_rows(rows, intern=intern)
+            tab = SheetTab(name="T", values=[], grid=grid)
+            assert sheet_to_csv(tab) == expected
+            assert list(grid.rows()) == [list(r) for r in rows]
+        assert rows_to_csv(rows) == expected
+
+    def test_repeated_strings_share_one_object(self) -> None:
+        labels = ["".join(["Nor", "th"]) for _ in range(10)]  # equal, distinct objects
+        grid = ColumnarGrid.from_rows([[label] for label in labels])
+        assert len({id(cell) for cell in grid.columns[0]}) == 1
+
+    def test_equal_numbers_of_different_types_kept_apart(self) -> None:
+        """1, 1.0 and True hash alike — sharing must not turn True into 1."""
+        grid = ColumnarGrid.from_rows([[1], [1.0], [True]] * 4)
+        assert sheet_to_csv(SheetTab(name="T", values=[], grid=grid)) == "1\n1.0\nTrue\n" * 4
+
+    def test_unknown_cell_types_stringified(self) -> None:
+        grid = ColumnarGrid.from_rows([[{"k": 1}]])
+        assert grid.columns == [["{'k': 1}"]]
+
+    def test_extract_reads_grid_tabs(self, sheets_response: SpreadsheetData) -> None:
+        """extract_sheets_content / per-tab give the same text from either store."""
+        columnar = SpreadsheetData(
+            title=sheets_response.title,
+            spreadsheet_id=sheets_response.spreadsheet_id,
+            sheets=[
+                SheetTab(name=t.name, values=[], grid=ColumnarGrid.from_rows(t.values))
+                for t in sheets_response.sheets
+            ],
+        )
+        assert extract_sheets_content(columnar) == extract_sheets_content(sheets_response)
+        assert extract_sheets_per_tab(columnar) == extract_sheets_per_tab(sheets_response)
+
+
 class TestStripSheetHeader:
     """Tests for strip_sheet_header — the inverse of the banner extract_sheets_content writes (mise-kacani)."""
 
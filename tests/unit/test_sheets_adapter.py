@@ -389,6 +389,141 @@ class TestFetchSpreadsheet:
         assert result.formula_count == 1
 
 
+# ============================================================================
+# ROW-PAGED FETCH (very large sheets)
+# ============================================================================
+
+class _FakeValuesApi:
+    """Serves batchGet row ranges from in-memory grids, trimming trailing
+    blank rows per range the way the real API does."""
+
+    def __init__(self, formatted: list[list], formula: list[list]) -> None:
+        self.grids = {"FORMATTED_VALUE": formatted, "FORMULA": formula}
+        self.ranges: list[str] = []
+
+    def get_json(self, url: str, params: list[tuple[str, str]]) -> dict:
+        p = dict(params)
+        self.ranges.append(p["ranges"])
+        first, last = p["ranges"].rsplit("!", 1)[1].split(":")
+        rows = self.grids[p["valueRenderOption"]][int(first) - 1:int(last)]
+        while rows and not rows[-1]:
+            rows = rows[:-1]
+        return {"valueRanges": [{"values": rows} if rows else {}]}
+
+
+class TestRowPagedFetch:
+    """stream=True pages each tab by row range; the result must match the one-shot path."""
+
+    def _fetch(self, formatted, formula, merges, page_rows):
+        api = _FakeValuesApi(formatted, formula)
+        meta_client = MagicMock()
+        meta_client.get_json.return_value = {
+            "properties": {"title": "Big"},
+            "sheets": [{
+                "properties": {
+                    "sheetId": 0, "title": "Data", "sheetType": "GRID",
+                    "gridProperties": {"rowCount": len(formatted), "columnCount": 2},
+                },
+                "merges": merges,
+            }],
+        }
+        with (
+            patch('adapters.sheets.get_sync_client', return_value=meta_client),
+            patch('adapters.sheets_paging.get_sync_client', return_value=api),
+            patch('adapters.sheets_paging.PAGE_CELLS', page_rows * 2),
+            patch('adapters.sheets_paging.MIN_PAGE_ROWS', 1),
+            patch('adapters.sheets.get_charts_from_spreadsheet', return_value=[]),
+            patch('retry.time.sleep'),
+        ):
+            data = fetch_spreadsheet("big1", stream=True)
+            assert data.sheets[0].values == []
+            rows = [row for page in data.sheets[0].pages for row in page]
+        return data, rows, api
+
+    def test_pages_match_one_shot_rows_and_counts(self) -> None:
+        formatted = [["h1", "h2"], ["a", ""], [], [], ["b", "2"], [], ["c", "3"], [], []]
+        formula = [["h1", "h2"], ["a", ""], [], [], ["b", "=1+1"], [], ["c", "=A7"], [], []]
+        # Vertical merge A2:A4 straddles the first page boundary (page_rows=3)
+        merges = [{"startRowIndex": 1, "endRowIndex": 4, "startColumnIndex": 0, "endColumnIndex": 1}]
+
+        data, rows, api = self._fetch(formatted, formula, merges, page_rows=3)
+
+        expected = [list(r) for r in formatted[:7]]
+        assert _resolve_merges(expected, merges) == 2
+        assert rows == expected
+        assert data.formula_count == 2
+        assert data.merged_cell_count == 2
+        assert "'Data'!1:3" in api.ranges and "'Data'!7:9" in api.ranges
+
+    def test_blank_page_held_until_data_follows(self) -> None:
+        """A wholly blank page still contributes its rows when data comes after."""
+        formatted = [["x"], [], [], [], ["y"]]
+        data, rows, _ = self._fetch(formatted, formatted, [], page_rows=2)
+        assert rows == [["x"], [], [], [], ["y"]]
+
+    def test_trailing_blank_rows_dropped(self) -> None:
+        formatted = [["x"], [], [], []]
+        data, rows, _ = self._fetch(formatted, formatted, [], page_rows=2)
+        assert rows == [["x"]]
+
+    @patch('adapters.sheets.render_charts_as_pngs')
+    @patch('adapters.sheets.get_charts_from_spreadsheet')
+    @patch('adapters.sheets.get_sync_client')
+    def test_auto_mode_stays_one_shot_for_ordinary_grids(self, mock_get_client, mock_charts, mock_render) -> None:
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+        mock_client.get_json.side_effect = [
+            {
+                "properties": {"title": "Small"},
+                "sheets": [{"properties": {
+                    "sheetId": 0, "title": "S", "sheetType": "GRID",
+                    "gridProperties": {"rowCount": 1000, "columnCount": 26},
+                }}],
+            },
+            {"valueRanges": [{"values": [["a"]]}]},
+            {"valueRanges": [{"values": [["a"]]}]},
+        ]
+        mock_charts.return_value = []
+
+        with patch('retry.time.sleep'):
+            result = fetch_spreadsheet("small1")
+
+        assert result.sheets[0].pages is None
+        assert result.sheets[0].values == [["a"]]
+
+    @patch('adapters.sheets.render_charts_as_pngs')
+    @patch('adapters.sheets.get_charts_from_spreadsheet')
+    @patch('adapters.sheets.get_sync_client')
+    def test_columnar_grid_matches_parsed_rows(self, mock_get_client, mock_charts, mock_render) -> None:
+        """columnar=True: raw rows go to a ColumnarGrid, merges resolved first."""
+        merges = [{"startRowIndex": 1, "endRowIndex": 3, "startColumnIndex": 0, "endColumnIndex": 1}]
+        raw = [["h1", "h2"], ["a", "1"], ["", "2"], ["b"]]
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+        mock_client.get_json.side_effect = [
+            {
+                "properties": {"title": "Small"},
+                "sheets": [{
+                    "properties": {"sheetId": 0, "title": "S", "sheetType": "GRID"},
+                    "merges": merges,
+                }],
+            },
+            {"valueRanges": [{"values": [list(r) for r in raw]}]},
+            {"valueRanges": [{"values": raw}]},
+        ]
+        mock_charts.return_value = []
+
+        with patch('retry.time.sleep'):
+            result = fetch_spreadsheet("small1", columnar=True)
+
+        expected = [_parse_row(r) for r in raw]
+        _resolve_merges(expected, merges)
+        tab = result.sheets[0]
+        assert tab.values == []
+        assert tab.grid is not None and list(tab.grid.rows()) == expected
+        assert result.merged_cell_count == 1
+
+
 # ============================================================================
 # TAB FILTERING
 # ============================================================================
@@ -378,3 +378,68 @@ class TestThumbnailFailureHandling:
             _fetch_thumbnails_selective("test-id", sample_presentation_data)
 
         assert sample_presentation_data.thumbnails_included is False
+
+
+class TestPdfThumbnailEngine:
+    """Many flagged slides → one PDF export rendered locally, same outputs."""
+
+    def _deck(self, n: int, flagged: set[int]) -> PresentationData:
+        return PresentationData(
+            title="Big",
+            presentation_id="deck-1",
+            slides=[
+                SlideData(slide_id=f"s{i}", index=i, needs_thumbnail=i in flagged)
+                for i in range(n)
+            ],
+        )
+
+    def test_many_flagged_slides_use_pdf_engine(self) -> None:
+        from adapters.slides import _fetch_thumbnails_selective, PDF_ENGINE_MIN_SLIDES
+
+        flagged = set(range(1, 2 * PDF_ENGINE_MIN_SLIDES, 2))
+        data = self._deck(2 * PDF_ENGINE_MIN_SLIDES, flagged)
+        pages = {i: f"png-{i}".encode() for i in flagged}
+
+        with patch("adapters.drive.export_file", return_value=b"%PDF") as mock_export, \
+             patch("adapters.pdf_info.count_pdf_pages", return_value=len(data.slides)), \
+             patch("adapters.pdf_render.render_pdf_page_selection", return_value=pages) as mock_render, \
+             patch("adapters.slides._fetch_thumbnails_via_api") as mock_api:
+            _fetch_thumbnails_selective("deck-1", data)
+
+        mock_export.assert_called_once_with("deck-1", "application/pdf")
+        assert sorted(mock_render.call_args[0][1]) == sorted(flagged)
+        mock_api.assert_not_called()
+        assert [s.thumbnail_bytes for s in data.slides] == [pages.get(i) for i in range(len(data.slides))]
+        assert data.thumbnails_included is True
+
+    def test_few_flagged_slides_use_api_engine(self) -> None:
+        from adapters.slides import _fetch_thumbnails_selective
+
+        data = self._deck(40, {3})
+        with patch("adapters.drive.export_file") as mock_export, \
+             patch("adapters.slides._fetch_thumbnails_via_api") as mock_api:
+            _fetch_thumbnails_selective("deck-1", data)
+
+        mock_export.assert_not_called()
+        mock_api.assert_called_once_with("deck-1", data, [data.slides[3]])
+
+    @pytest.mark.parametrize("failure", ["export", "page_count", "poppler"])
+    def test_falls_back_to_api_engine(self, failure: str) -> None:
+        """Export too large, skipped slides shifting pages, or no poppler → getThumbnail."""
+        from adapters.slides import _fetch_thumbnails_selective, PDF_ENGINE_MIN_SLIDES
+
+        data = self._deck(PDF_ENGINE_MIN_SLIDES, set(range(PDF_ENGINE_MIN_SLIDES)))
+        export = MagicMock(side_effect=RuntimeError("exportSizeLimitExceeded")) \
+            if failure == "export" else MagicMock(return_value=b"%PDF")
+        count = len(data.slides) - (failure == "page_count")
+        render = MagicMock(side_effect=ImportError("poppler-utils not installed")) \
+            if failure == "poppler" else MagicMock(return_value={})
+
+        with patch("adapters.drive.export_file", export), \
+             patch("adapters.pdf_info.count_pdf_pages", return_value=count), \
+             patch("adapters.pdf_render.render_pdf_page_selection", render), \
+             patch("adapters.slides._fetch_thumbnails_via_api") as mock_api:
+            _fetch_thumbnails_selective("deck-1", data)
+
+        mock_api.assert_called_once()
+        assert all(s.thumbnail_bytes is None and not s.warnings for s in data.slides)
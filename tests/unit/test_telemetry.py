@@ -0,0 +1,131 @@
+"""Tests for per-call telemetry (span trees, counters, Prometheus text)."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from telemetry import (
+    api_span_name,
+    count,
+    finish_trace,
+    render_prometheus,
+    reset_aggregates,
+    run_in_context,
+    span,
+    start_trace,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clean_aggregates():
+    reset_aggregates()
+    yield
+    finish_trace()  # close anything a failing test left open
+    reset_aggregates()
+
+
+class TestSpans:
+    def test_no_trace_is_noop(self) -> None:
+        with span("http:docs") as node:
+            count("http_requests")
+        assert node is None
+        assert finish_trace() is None
+
+    def test_nested_tree_and_rollup(self) -> None:
+        start_trace("fetch")
+        with span("http:docs"):
+            count("http_requests")
+            count("http_bytes", 100)
+        with span("extract.doc"):
+            with span("deposit.write"):
+                count("deposit_bytes", 40)
+        record = finish_trace()
+
+        assert record is not None
+        names = [c["name"] for c in record["children"]]
+        assert names == ["http:docs", "extract.doc"]
+        assert record["children"][1]["children"][0]["name"] == "deposit.write"
+        assert record["totals"] == {
+            "http_requests": 1, "http_bytes": 100, "deposit_bytes": 40,
+        }
+        assert record["wall_ms"] >= 0 and record["cpu_ms"] >= 0
+
+    def test_same_name_siblings_merge(self) -> None:
+        start_trace("fetch")
+        for _ in range(5):
+            with span("http:slides"):
+                count("http_requests")
+        record = finish_trace()
+
+        assert record is not None
+        assert len(record["children"]) == 1
+        node = record["children"][0]
+        assert node["calls"] == 5
+        assert node["counters"] == {"http_requests": 5}
+
+    def test_finish_closes_trace(self) -> None:
+        start_trace("search")
+        assert finish_trace() is not None
+        with span("late") as node:
+            pass
+        assert node is None
+
+    def test_start_replaces_stale_trace(self) -> None:
+        start_trace("fetch")
+        with span("stale"):
+            pass
+        start_trace("search")
+        record = finish_trace()
+        assert record is not None
+        assert "children" not in record
+
+    def test_pool_workers_attach_via_run_in_context(self) -> None:
+        start_trace("fetch")
+
+        def work(i: int) -> int:
+            with span("http:slides"):
+                count("http_requests")
+            return i
+
+        with span("thumbnails"):
+            with ThreadPoolExecutor(max_workers=3) as pool:
+                results = list(pool.map(run_in_context(work), range(6)))
+        record = finish_trace()
+
+        assert results == list(range(6))
+        assert record is not None
+        thumbs = record["children"][0]
+        assert thumbs["name"] == "thumbnails"
+        assert thumbs["children"][0]["calls"] == 6
+        assert record["totals"]["http_requests"] == 6
+
+
+class TestApiSpanName:
+    @pytest.mark.parametrize("url,expected", [
+        ("https://docs.googleapis.com/v1/documents/abc", "http:docs"),
+        ("https://www.googleapis.com/drive/v3/files/abc", "http:drive"),
+        ("https://www.googleapis.com/upload/drive/v3/files", "http:upload"),
+        ("https://gmail.googleapis.com/gmail/v1/users/me/threads/x", "http:gmail"),
+    ])
+    def test_names_the_service(self, url: str, expected: str) -> None:
+        assert api_span_name(url) == expected
+
+
+class TestPrometheus:
+    def test_aggregates_finished_calls(self) -> None:
+        for ok in (True, True, False):
+            start_trace("fetch")
+            with span("pdftotext"):
+                count("http_bytes", 10)
+            finish_trace(ok)
+
+        text = render_prometheus()
+        assert 'mise_calls_total{tool="fetch",ok="true"} 2' in text
+        assert 'mise_calls_total{tool="fetch",ok="false"} 1' in text
+        assert 'mise_span_calls_total{span="pdftotext"} 3' in text
+        assert "mise_http_bytes_total 30" in text
+        assert text.endswith("\n")
+
+    def test_empty_registry_renders(self) -> None:
+        text = render_prometheus()
+        assert "# TYPE mise_calls_total counter" in text
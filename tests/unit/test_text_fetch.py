@@ -1,6 +1,7 @@
 """Tests for text file fetch functionality."""
 
 import pytest
+from pathlib import Path
 from unittest.mock import patch, MagicMock
 from tools.fetch import fetch_text, is_text_file, TEXT_MIME_TYPES
 
@@ -27,78 +28,69 @@ class TestIsTextFile:
         assert not is_text_file("application/vnd.google-apps.document")
 
 
+def _serve(*chunks: bytes):
+    """stream_file side effect: write the chunks the way stream_to_file would."""
+    def stream(file_id, file_obj):
+        file_obj.seek(0)
+        file_obj.truncate()
+        for chunk in chunks:
+            file_obj.write(chunk)
+    return stream
+
+
 class TestFetchText:
     """Tests for fetch_text() function."""
 
-    @patch("tools.fetch.drive.download_file")
-    @patch("tools.fetch.drive.get_deposit_folder")
-    @patch("tools.fetch.drive.write_content")
+    @patch("tools.fetch.drive.stream_file")
     @patch("tools.fetch.drive.write_manifest")
-    def test_fetch_plain_text(self, mock_manifest, mock_write, mock_folder, mock_download):
+    def test_fetch_plain_text(self, mock_manifest, mock_stream, tmp_path):
         """Fetches plain text file and deposits correctly."""
-        mock_download.return_value = b"Hello, world!"
-        mock_folder.return_value = "/tmp/mise/text--test--abc123"
-        mock_write.return_value = "/tmp/mise/text--test--abc123/content.txt"
+        mock_stream.side_effect = _serve(b"Hello, world!")
 
         metadata = {"mimeType": "text/plain", "name": "test.txt"}
-        result = fetch_text("abc123", "test.txt", metadata)
+        result = fetch_text("abc123", "test.txt", metadata, base_path=tmp_path)
 
         assert result.type == "text"
         assert result.format == "text"
         assert result.metadata["char_count"] == 13
-        mock_write.assert_called_once()
         # Check filename is content.txt for text/plain
-        call_args = mock_write.call_args
-        assert call_args[1]["filename"] == "content.txt"
+        assert Path(result.content_file).name == "content.txt"
+        assert Path(result.content_file).read_text() == "Hello, world!"
 
-    @patch("tools.fetch.drive.download_file")
-    @patch("tools.fetch.drive.get_deposit_folder")
-    @patch("tools.fetch.drive.write_content")
+    @patch("tools.fetch.drive.stream_file")
     @patch("tools.fetch.drive.write_manifest")
-    def test_fetch_json(self, mock_manifest, mock_write, mock_folder, mock_download):
+    def test_fetch_json(self, mock_manifest, mock_stream, tmp_path):
         """Fetches JSON file with correct format and extension."""
-        mock_download.return_value = b'{"key": "value"}'
-        mock_folder.return_value = "/tmp/mise/text--data--xyz789"
-        mock_write.return_value = "/tmp/mise/text--data--xyz789/content.json"
+        mock_stream.side_effect = _serve(b'{"key": "value"}')
 
         metadata = {"mimeType": "application/json", "name": "data.json"}
-        result = fetch_text("xyz789", "data.json", metadata)
+        result = fetch_text("xyz789", "data.json", metadata, base_path=tmp_path)
 
         assert result.type == "text"
         assert result.format == "json"
         assert result.metadata["mime_type"] == "application/json"
-        call_args = mock_write.call_args
-        assert call_args[1]["filename"] == "content.json"
+        assert Path(result.content_file).name == "content.json"
 
-    @patch("tools.fetch.drive.download_file")
-    @patch("tools.fetch.drive.get_deposit_folder")
-    @patch("tools.fetch.drive.write_content")
+    @patch("tools.fetch.drive.stream_file")
     @patch("tools.fetch.drive.write_manifest")
-    def test_fetch_csv(self, mock_manifest, mock_write, mock_folder, mock_download):
+    def test_fetch_csv(self, mock_manifest, mock_stream, tmp_path):
         """Fetches CSV file with correct format and extension."""
-        mock_download.return_value = b"a,b,c\n1,2,3"
-        mock_folder.return_value = "/tmp/mise/text--data--csv123"
-        mock_write.return_value = "/tmp/mise/text--data--csv123/content.csv"
+        mock_stream.side_effect = _serve(b"a,b,c\n1,2,3")
 
         metadata = {"mimeType": "text/csv", "name": "data.csv"}
-        result = fetch_text("csv123", "data.csv", metadata)
+        result = fetch_text("csv123", "data.csv", metadata, base_path=tmp_path)
 
         assert result.type == "text"
         assert result.format == "csv"
-        call_args = mock_write.call_args
-        assert call_args[1]["filename"] == "content.csv"
+        assert Path(result.content_file).name == "content.csv"
 
-    @patch("tools.fetch.drive.download_file")
-    @patch("tools.fetch.drive.get_deposit_folder")
-    @patch("tools.fetch.drive.write_content")
+    @patch("tools.fetch.drive.stream_file")
     @patch("tools.fetch.drive.write_manifest")
-    def test_fetch_with_email_context(self, mock_manifest, mock_write, mock_folder, mock_download):
+    def test_fetch_with_email_context(self, mock_manifest, mock_stream, tmp_path):
         """Includes email_context when provided."""
         from models import EmailContext
 
-        mock_download.return_value = b"content"
-        mock_folder.return_value = "/tmp/test"
-        mock_write.return_value = "/tmp/test/content.txt"
+        mock_stream.side_effect = _serve(b"content")
 
         email_ctx = EmailContext(
             message_id="msg123",
@@ -106,25 +98,21 @@ class TestFetchText:
             subject="Test email",
         )
         metadata = {"mimeType": "text/plain", "name": "attachment.txt"}
-        result = fetch_text("file123", "attachment.txt", metadata, email_context=email_ctx)
+        result = fetch_text("file123", "attachment.txt", metadata, email_context=email_ctx, base_path=tmp_path)
 
         assert "email_context" in result.metadata
         assert result.metadata["email_context"]["message_id"] == "msg123"
 
-    @patch("tools.fetch.drive.download_file")
-    @patch("tools.fetch.drive.get_deposit_folder")
-    @patch("tools.fetch.drive.write_content")
+    @patch("tools.fetch.drive.stream_file")
     @patch("tools.fetch.drive.write_manifest")
-    def test_handles_unicode(self, mock_manifest, mock_write, mock_folder, mock_download):
-        """Handles Unicode content correctly."""
-        mock_download.return_value = "Hello, 世界! 🎉".encode("utf-8")
-        mock_folder.return_value = "/tmp/test"
-        mock_write.return_value = "/tmp/test/content.txt"
+    def test_handles_unicode(self, mock_manifest, mock_stream, tmp_path):
+        """Characters split across chunks survive; invalid bytes become U+FFFD."""
+        body = "Hello, 世界! 🎉".encode("utf-8") + b"\xff"
+        mock_stream.side_effect = _serve(body[:8], body[8:16], body[16:])
 
         metadata = {"mimeType": "text/plain", "name": "unicode.txt"}
-        result = fetch_text("uni123", "unicode.txt", metadata)
+        result = fetch_text("uni123", "unicode.txt", metadata, base_path=tmp_path)
 
-        # Verify content was decoded
-        written_content = mock_write.call_args[0][1]
-        assert "世界" in written_content
-        assert "🎉" in written_content
+        written_content = Path(result.content_file).read_text()
+        assert written_content == "Hello, 世界! 🎉\ufffd"
+        assert result.metadata["char_count"] == len(written_content)
@@ -7,13 +7,19 @@ from workspace import (
     slugify,
     get_deposit_folder,
     write_content,
+    open_deposit_stream,
     write_thumbnail,
     write_image,
     write_chart,
     write_charts_metadata,
     write_manifest,
     enrich_manifest,
+    deposit_batch,
+    pending_names,
+    deposit_file,
+    write_raw,
 )
+from workspace import blobs, deposit_writer
 from workspace.manager import write_search_results
 
 
@@ -172,6 +178,41 @@ class TestWriteContent:
         assert path.name == "content.csv"
 
 
+class TestOpenDepositStream:
+    """Tests for streaming a download into a deposit file."""
+
+    def test_binary_passthrough(self, tmp_path: Path) -> None:
+        """Binary mode writes bytes untouched."""
+        with open_deposit_stream(tmp_path, "raw.bin") as stream:
+            stream.write(b"\xff\x00")
+            stream.write(b"\x01")
+
+        assert (tmp_path / "raw.bin").read_bytes() == b"\xff\x00\x01"
+        assert stream.bytes_written == 3
+
+    def test_text_matches_whole_body_decode(self, tmp_path: Path) -> None:
+        """Byte-at-a-time text chunks land exactly as decode(errors="replace") would."""
+        body = "naïve 日本 ✓".encode() + b"\xe6\x97"  # truncated final character
+        with open_deposit_stream(tmp_path, "content.txt", text=True) as stream:
+            for i in range(len(body)):
+                stream.write(body[i:i + 1])
+
+        expected = body.decode("utf-8", errors="replace")
+        assert (tmp_path / "content.txt").read_text() == expected
+        assert stream.char_count == len(expected)
+
+    def test_restart_discards_partial_attempt(self, tmp_path: Path) -> None:
+        """seek(0) + truncate() — what a retried download does — starts over."""
+        with open_deposit_stream(tmp_path, "content.txt", text=True) as stream:
+            stream.write(b"partial \xc3")
+            stream.seek(0)
+            stream.truncate()
+            stream.write(b"whole")
+
+        assert (tmp_path / "content.txt").read_text() == "whole"
+        assert stream.char_count == 5
+
+
 class TestWriteThumbnail:
     """Tests for thumbnail writing."""
 
@@ -419,3 +460,137 @@ class TestEnrichManifest:
             enrich_manifest(tmp_path, {"status": "created"})
 
 
+
+
+class TestDepositBatch:
+    """Buffered, atomic JSON deposit writes."""
+
+    def test_manifest_writes_once_when_the_batch_exits(self, tmp_path: Path) -> None:
+        import json
+
+        with deposit_batch():
+            write_manifest(tmp_path, "doc", "Test", "abc123")
+            enrich_manifest(tmp_path, {"status": "created"})
+            assert not (tmp_path / "manifest.json").exists()
+            assert pending_names(tmp_path) == ["manifest.json"]
+
+        manifest = json.loads((tmp_path / "manifest.json").read_text())
+        assert manifest["status"] == "created" and manifest["id"] == "abc123"
+        assert pending_names(tmp_path) == []
+
+    def test_nested_batches_write_at_the_outermost_exit(self, tmp_path: Path) -> None:
+        with deposit_batch():
+            with deposit_batch():
+                write_manifest(tmp_path, "doc", "Test", "abc123")
+            assert not (tmp_path / "manifest.json").exists()
+        assert (tmp_path / "manifest.json").exists()
+
+    def test_failed_batch_still_writes_what_it_buffered(self, tmp_path: Path) -> None:
+        with pytest.raises(RuntimeError), deposit_batch():
+            write_manifest(tmp_path, "doc", "Test", "abc123")
+            raise RuntimeError("fetch failed later")
+        assert (tmp_path / "manifest.json").exists()
+
+    def test_failed_write_leaves_the_old_file_and_no_temp(self, tmp_path: Path, monkeypatch) -> None:
+        write_manifest(tmp_path, "doc", "Old", "abc123")
+        before = (tmp_path / "manifest.json").read_bytes()
+
+        def fail(src, dst):
+            raise OSError("volume gone")
+
+        monkeypatch.setattr(deposit_writer.os, "replace", fail)
+        with pytest.raises(OSError):
+            write_manifest(tmp_path, "doc", "New", "abc123")
+
+        assert (tmp_path / "manifest.json").read_bytes() == before
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["manifest.json"]
+
+    def test_one_failed_write_does_not_skip_the_rest(self, tmp_path: Path) -> None:
+        gone = tmp_path / "gone"
+        kept = tmp_path / "kept"
+        kept.mkdir()
+
+        with pytest.raises(OSError), deposit_batch():
+            write_manifest(gone, "doc", "Gone", "aaa")  # folder never created
+            write_manifest(kept, "doc", "Kept", "bbb")
+
+        assert (kept / "manifest.json").exists()
+
+    def test_failed_write_does_not_mask_the_block_error(self, tmp_path: Path) -> None:
+        with pytest.raises(RuntimeError), deposit_batch():
+            write_manifest(tmp_path / "gone", "doc", "Gone", "aaa")
+            raise RuntimeError("fetch failed later")
+
+    def test_fsync_knob_syncs_file_and_folder(self, tmp_path: Path, monkeypatch) -> None:
+        synced: list[int] = []
+        monkeypatch.setattr(deposit_writer, "FSYNC", True)
+        monkeypatch.setattr(deposit_writer.os, "fsync", synced.append)
+        write_manifest(tmp_path, "doc", "Test", "abc123")
+        assert len(synced) == 2
+
+
+class TestBlobStore:
+    """Binary deposits stored once under .mise/.blobs/ and linked in."""
+
+    PDF = b"%PDF-1.7 " + bytes(range(256)) * 40
+
+    def _folders(self, tmp_path: Path) -> tuple[Path, Path]:
+        return (
+            get_deposit_folder("gmail", "Thread A", "aaa", base_path=tmp_path),
+            get_deposit_folder("pdf", "Report", "bbb", base_path=tmp_path),
+        )
+
+    def test_same_bytes_in_two_deposits_are_one_file(self, tmp_path: Path) -> None:
+        a, b = self._folders(tmp_path)
+        write_raw(a, self.PDF, "report.pdf")
+        write_raw(b, self.PDF, "report.pdf")
+
+        (blob,) = (tmp_path / ".mise" / ".blobs").glob("*/*")
+        assert (a / "report.pdf").samefile(blob) and (b / "report.pdf").samefile(blob)
+        assert blobs.refs(blob) == 2
+        assert (b / "report.pdf").read_bytes() == self.PDF
+
+    def test_file_on_disk_dedupes_with_bytes(self, tmp_path: Path) -> None:
+        a, b = self._folders(tmp_path)
+        source = tmp_path / "download.tmp"
+        source.write_bytes(self.PDF)
+        deposit_file(a, "report.pdf", source)
+        write_raw(b, self.PDF, "copy.pdf")
+        assert (a / "report.pdf").samefile(b / "copy.pdf")
+        assert source.exists()
+
+    def test_rewriting_a_linked_name_leaves_other_deposits_alone(self, tmp_path: Path) -> None:
+        a, b = self._folders(tmp_path)
+        write_raw(a, self.PDF, "report.pdf")
+        write_raw(b, self.PDF, "report.pdf")
+
+        write_raw(a, self.PDF[::-1], "report.pdf")
+        write_content(a, "text now", filename="report.pdf")
+        with open_deposit_stream(a, "report.pdf") as stream:
+            stream.write(b"streamed")
+
+        assert (b / "report.pdf").read_bytes() == self.PDF
+
+    def test_small_files_and_loose_folders_are_plain_copies(self, tmp_path: Path) -> None:
+        a, _ = self._folders(tmp_path)
+        write_raw(a, b"tiny", "tiny.bin")
+        write_raw(tmp_path, self.PDF, "loose.pdf")  # not in a deposit folder
+        assert (a / "tiny.bin").stat().st_nlink == 1
+        assert (tmp_path / "loose.pdf").stat().st_nlink == 1
+        assert not (tmp_path / ".mise" / ".blobs").exists()
+
+    def test_no_hardlinks_falls_back_to_copies(self, tmp_path: Path, monkeypatch) -> None:
+        import errno
+
+        def refuse(src, dst):
+            raise OSError(errno.EPERM, "Operation not permitted")
+
+        monkeypatch.setattr(blobs, "_unlinkable", set())
+        monkeypatch.setattr(blobs.os, "link", refuse)
+        a, b = self._folders(tmp_path)
+        write_raw(a, self.PDF, "report.pdf")
+        write_raw(b, self.PDF, "report.pdf")
+
+        assert (a / "report.pdf").read_bytes() == (b / "report.pdf").read_bytes() == self.PDF
+        assert not list((tmp_path / ".mise" / ".blobs").glob("*/*"))
+        assert blobs._unlinkable == {tmp_path / ".mise" / ".blobs"}
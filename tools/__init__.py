@@ -10,26 +10,71 @@ Verb model (3 tools):
 - do: Act on Workspace (create, move, rename, edit)
 """
 
-from .search import do_search
-from .fetch import do_fetch
-from .create import do_create
-from .move import do_move
-from .overwrite import do_overwrite
-from .edit import do_prepend, do_append, do_replace_text
-from .draft import do_draft
-from .reply_draft import do_reply_draft
-from .rename import do_rename
-from .share import do_share
-from .gmail_ops import do_archive, do_star, do_label
-from .comment import do_comment
-from .comment_reply import do_comment_reply
-from .setup_oauth import do_setup_oauth
-from .copy import do_copy
-from .trash import do_trash
-from .respond import do_respond
-from .create_event import do_create_event
-from .update_event import do_update_event
-from .freebusy import do_freebusy
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .search import do_search
+    from .fetch import do_fetch
+    from .create import do_create
+    from .copy import do_copy
+    from .move import do_move
+    from .rename import do_rename
+    from .share import do_share
+    from .overwrite import do_overwrite
+    from .edit import do_prepend, do_append, do_replace_text
+    from .draft import do_draft
+    from .reply_draft import do_reply_draft
+    from .gmail_ops import do_archive, do_star, do_label
+    from .comment import do_comment
+    from .comment_reply import do_comment_reply
+    from .setup_oauth import do_setup_oauth
+    from .trash import do_trash
+    from .respond import do_respond
+    from .create_event import do_create_event
+    from .update_event import do_update_event
+    from .freebusy import do_freebusy
+
+# Handler name → the submodule that defines it. Nothing here is imported
+# until first use: `mise search` shouldn't pay for PIL, markdown and the
+# OAuth flow because `create` and `setup_oauth` exist. `from tools import
+# do_x` and `tools.do_x` both resolve through __getattr__ below.
+_HANDLER_MODULES = {
+    "do_search": ".search",
+    "do_fetch": ".fetch",
+    "do_create": ".create",
+    "do_copy": ".copy",
+    "do_move": ".move",
+    "do_rename": ".rename",
+    "do_share": ".share",
+    "do_overwrite": ".overwrite",
+    "do_prepend": ".edit",
+    "do_append": ".edit",
+    "do_replace_text": ".edit",
+    "do_draft": ".draft",
+    "do_reply_draft": ".reply_draft",
+    "do_archive": ".gmail_ops",
+    "do_star": ".gmail_ops",
+    "do_label": ".gmail_ops",
+    "do_comment": ".comment",
+    "do_comment_reply": ".comment_reply",
+    "do_setup_oauth": ".setup_oauth",
+    "do_trash": ".trash",
+    "do_respond": ".respond",
+    "do_create_event": ".create_event",
+    "do_update_event": ".update_event",
+    "do_freebusy": ".freebusy",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _HANDLER_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    handler = getattr(import_module(module, __name__), name)
+    globals()[name] = handler  # later lookups skip this hook
+    return handler
+
 
 # Single source of truth for valid do() operation names.
 OPERATIONS = frozenset({
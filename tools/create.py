@@ -13,8 +13,6 @@ Uses httpx via MiseSyncClient (Phase 1 migration).
 import json
 import logging
 import mimetypes
-import re
-from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -28,8 +26,8 @@ from models import DoResult, MiseError, ErrorKind
 from retry import with_retry
 from workspace import enrich_manifest
 from tools.common import resolve_source as _resolve_source
-from tools.doc_chips import (CHIP_REF_RE, ChipRef, find_placeholder_indices,
-                             insert_chips_in_doc, parse_chip_refs, restore_placeholders)
+from tools.doc_chips import CHIP_REF_RE, ChipRef, insert_chips_in_doc, parse_chip_refs
+from tools.doc_images import _IMAGE_REF_RE, _ImageRef, _embed_images_in_doc, _parse_image_refs
 from tools.form_create import create_form
 from validation import validate_drive_id, sanitize_title
 
@@ -693,230 +691,3 @@ def _set_pageless(doc_id: str) -> None:
             ]
         },
     )
-
-
-# ============================================================================
-# IMAGE EMBEDDING — post-creation injection of local images into Google Docs
-# ============================================================================
-
-# Regex for markdown image refs: ![alt](path)
-# Skips http/https URLs — those are external, not local files.
-_IMAGE_REF_RE = re.compile(r"!\[([^\]]*)\]\((?!https?://)([^)]+)\)")
-
-# Sentinel prefix unlikely to appear in real content
-_PLACEHOLDER_PREFIX = "\u3014MISE_IMG_"
-_PLACEHOLDER_SUFFIX = "\u3015"
-
-
-@dataclass
-class _ImageRef:
-    """A local image reference parsed from markdown."""
-    index: int
-    alt: str
-    path: str
-    placeholder: str
-
-
-def _parse_image_refs(content: str) -> tuple[str, list[_ImageRef]]:
-    """Parse markdown for local image refs, replace with unique placeholders.
-
-    Returns (modified_content, list_of_refs). Remote URLs are left as-is.
-    """
-    refs: list[_ImageRef] = []
-
-    def _replace(match: re.Match) -> str:
-        alt = match.group(1)
-        path = match.group(2)
-        idx = len(refs)
-        placeholder = f"{_PLACEHOLDER_PREFIX}{idx}{_PLACEHOLDER_SUFFIX}"
-        refs.append(_ImageRef(index=idx, alt=alt, path=path, placeholder=placeholder))
-        return placeholder
-
-    modified = _IMAGE_REF_RE.sub(_replace, content)
-    return modified, refs
-
-
-def _resolve_image_path(ref_path: str, base_path: Path | None) -> Path | None:
-    """Resolve an image path relative to base_path. Returns None if not found."""
-    p = Path(ref_path)
-    if p.is_absolute():
-        return p if p.exists() else None
-    if base_path:
-        resolved = (base_path / p).resolve()
-        return resolved if resolved.exists() else None
-    return None
-
-
-def _upload_temp_image(image_bytes: bytes, filename: str, mime_type: str) -> str:
-    """Upload image bytes to Drive as a temp file. Returns file ID."""
-    client = get_sync_client()
-    metadata = {
-        "name": f"_mise_temp_{filename}",
-        "description": "Temporary image for mise doc embedding — safe to delete",
-    }
-    result = client.upload_multipart(
-        _UPLOAD_API, metadata, image_bytes, mime_type,
-        params={"uploadType": "multipart", "fields": "id", "supportsAllDrives": "true"},
-    )
-    return result["id"]
-
-
-def _share_publicly(file_id: str) -> str:
-    """Make a Drive file publicly readable (required for Docs API insertInlineImage).
-
-    Returns the permission ID for later revocation.
-    """
-    client = get_sync_client()
-    result = client.post_json(
-        f"{_DRIVE_API}/{file_id}/permissions",
-        json_body={"role": "reader", "type": "anyone"},
-        params={"supportsAllDrives": "true", "fields": "id"},
-    )
-    return result.get("id", "anyoneWithLink")
-
-
-def _revoke_public(file_id: str, permission_id: str) -> None:
-    """Revoke a specific permission from a Drive file."""
-    client = get_sync_client()
-    try:
-        client.request(
-            "DELETE",
-            f"{_DRIVE_API}/{file_id}/permissions/{permission_id}",
-            params={"supportsAllDrives": "true"},
-        )
-    except Exception:
-        pass  # Best-effort cleanup
-
-
-def _delete_temp_file(file_id: str) -> None:
-    """Delete a temporary Drive file."""
-    client = get_sync_client()
-    try:
-        client.request(
-            "DELETE",
-            f"{_DRIVE_API}/{file_id}",
-            params={"supportsAllDrives": "true"},
-        )
-    except Exception:
-        pass  # Best-effort cleanup
-
-
-def _embed_images_in_doc(
-    doc_id: str,
-    refs: list[_ImageRef],
-    base_path: Path | None,
-) -> dict[str, Any]:
-    """Post-creation: embed local images into a Google Doc.
-
-    Uploads images to Drive, temporarily shares publicly, inserts via
-    Docs batchUpdate, then revokes permissions and cleans up.
-
-    Returns dict with images_embedded count and image_errors list.
-    """
-    from extractors.image import resize_image_bytes
-    from adapters.image import is_svg, render_svg_to_png
-
-    if not refs:
-        return {}
-
-    # Phase 1: Prepare images — resolve paths, read bytes, resize
-    prepared: list[tuple[_ImageRef, bytes, str]] = []  # (ref, bytes, mime_type)
-    errors: list[str] = []
-    for ref in refs:
-        resolved = _resolve_image_path(ref.path, base_path)
-        if not resolved:
-            errors.append(f"Image not found: {ref.path}")
-            continue
-
-        try:
-            image_bytes = resolved.read_bytes()
-            mime_type = mimetypes.guess_type(str(resolved))[0] or "image/png"
-
-            # SVG → PNG conversion (Docs API can't display SVG inline)
-            if is_svg(mime_type):
-                png_bytes, _, _ = render_svg_to_png(image_bytes)
-                if png_bytes:
-                    image_bytes = png_bytes
-                    mime_type = "image/png"
-                else:
-                    errors.append(f"SVG rendering failed: {ref.path}")
-                    continue
-
-            # Resize if needed
-            resized = resize_image_bytes(image_bytes, mime_type)
-            image_bytes = resized.content_bytes
-            mime_type = resized.mime_type
-
-            prepared.append((ref, image_bytes, mime_type))
-        except Exception as e:
-            errors.append(f"Image processing failed for {ref.path}: {e}")
-
-    if not prepared:
-        return {"image_errors": errors} if errors else {}
-
-    # Phase 2: Upload images to Drive and share publicly
-    uploaded: list[tuple[_ImageRef, str, str]] = []  # (ref, drive_file_id, permission_id)
-    for ref, image_bytes, mime_type in prepared:
-        try:
-            filename = Path(ref.path).name
-            file_id = _upload_temp_image(image_bytes, filename, mime_type)
-            perm_id = _share_publicly(file_id)
-            uploaded.append((ref, file_id, perm_id))
-        except Exception as e:
-            errors.append(f"Upload failed for {ref.path}: {e}")
-
-    if not uploaded:
-        return {"image_errors": errors} if errors else {}
-
-    # Phase 3: Find placeholder indices in the created doc
-    placeholders = [ref.placeholder for ref, _, _ in uploaded]
-    indices = find_placeholder_indices(doc_id, placeholders)
-
-    # Phase 4: Build batchUpdate requests in reverse index order
-    requests: list[dict[str, Any]] = []
-    for ref, file_id, _ in uploaded:
-        if ref.placeholder not in indices:
-            errors.append(f"Placeholder not found in doc for {ref.path}")
-            continue
-        start, end = indices[ref.placeholder]
-        requests.append((start, end, file_id))
-
-    # Sort by start index descending — prevents index drift
-    requests.sort(key=lambda x: x[0], reverse=True)
-
-    batch_requests: list[dict[str, Any]] = []
-    for start, end, file_id in requests:
-        # Delete the placeholder text
-        batch_requests.append({
-            "deleteContentRange": {
-                "range": {"startIndex": start, "endIndex": end, "segmentId": ""},
-            }
-        })
-        # Insert image at the same position
-        batch_requests.append({
-            "insertInlineImage": {
-                "uri": f"https://drive.google.com/uc?export=view&id={file_id}",
-                "location": {"index": start, "segmentId": ""},
-            }
-        })
-
-    if batch_requests:
-        try:
-            client = get_sync_client()
-            client.post_json(
-                f"https://docs.googleapis.com/v1/documents/{doc_id}:batchUpdate",
-                json_body={"requests": batch_requests},
-            )
-        except Exception as e:
-            errors.append(f"Docs batchUpdate failed: {e}")
-            restore_placeholders(doc_id, [(r.placeholder, f"![{r.alt}]({r.path})") for r, _, _ in uploaded])
-
-    # Phase 5: Revoke permissions and delete temp files
-    for _, file_id, perm_id in uploaded:
-        _revoke_public(file_id, perm_id)
-        _delete_temp_file(file_id)
-
-    result: dict[str, Any] = {"images_embedded": len(requests)}
-    if errors:
-        result["image_errors"] = errors
-    return result
@@ -11,37 +11,52 @@ calls run_operation(). Tests verify OPERATIONS/DISPATCH/REQUIRED_PARAMS
 stay in sync automatically (tests/unit/test_dispatch.py).
 """
 
+from collections.abc import Callable
 from typing import Any
 
 from adapters.drive import get_file_metadata
 from models import MiseError
 from token_store import ambient_mode
 from validation import diagnose_sa_quota_403
-from tools import (
-    OPERATIONS,
-    do_append,
-    do_archive,
-    do_comment,
-    do_comment_reply,
-    do_copy,
-    do_create,
-    do_draft,
-    do_label,
-    do_move,
-    do_overwrite,
-    do_prepend,
-    do_rename,
-    do_replace_text,
-    do_reply_draft,
-    do_setup_oauth,
-    do_share,
-    do_star,
-    do_trash,
-    do_respond,
-    do_create_event,
-    do_update_event,
-    do_freebusy,
-)
+import tools
+from tools import OPERATIONS
+
+
+def _deferred(name: str) -> Callable[..., Any]:
+    """Stand-in for tools.<name> that imports the real handler on first call.
+
+    Importing this module must not import every operation's module — see
+    tools/__init__.py. Module-level names (not a lookup in each lambda) so
+    tests can still patch tools.dispatch.do_x.
+    """
+    def call(*args: Any, **kwargs: Any) -> Any:
+        return getattr(tools, name)(*args, **kwargs)
+    call.__name__ = name
+    return call
+
+
+do_append = _deferred("do_append")
+do_archive = _deferred("do_archive")
+do_comment = _deferred("do_comment")
+do_comment_reply = _deferred("do_comment_reply")
+do_copy = _deferred("do_copy")
+do_create = _deferred("do_create")
+do_draft = _deferred("do_draft")
+do_label = _deferred("do_label")
+do_move = _deferred("do_move")
+do_overwrite = _deferred("do_overwrite")
+do_prepend = _deferred("do_prepend")
+do_rename = _deferred("do_rename")
+do_replace_text = _deferred("do_replace_text")
+do_reply_draft = _deferred("do_reply_draft")
+do_setup_oauth = _deferred("do_setup_oauth")
+do_share = _deferred("do_share")
+do_star = _deferred("do_star")
+do_trash = _deferred("do_trash")
+do_respond = _deferred("do_respond")
+do_create_event = _deferred("do_create_event")
+do_update_event = _deferred("do_update_event")
+do_freebusy = _deferred("do_freebusy")
 
 # Required params per operation — validated before dispatch.
 # Only lists unconditionally required params (e.g. file_id for move).
@@ -157,6 +172,7 @@ DISPATCH: dict[str, Any] = {
     "freebusy": lambda p: do_freebusy(
         attendees=p.get("attendees"), time_min=p.get("time_min"),
         time_max=p.get("time_max"), duration=p.get("duration"),
+        min_free=p.get("min_free"),
     ),
 }
 
@@ -0,0 +1,293 @@
+"""
+Local images in Google Docs — post-creation embedding of ![alt](path) refs.
+
+create.py swaps each local image ref for a placeholder before import; once the
+doc exists, _embed_images_in_doc uploads each image to Drive as a temp file,
+shares it publicly (insertInlineImage fetches by URL), replaces the
+placeholders in one Docs batchUpdate, then revokes and deletes the temp files.
+
+Split from tools/create.py when the embed went concurrent — that module is
+frozen by the size ratchet (test_architecture.py), and new logic belongs in a
+fresh sibling (as doc_chips.py did).
+"""
+
+import hashlib
+import mimetypes
+import re
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from adapters.http_client import get_sync_client
+from telemetry import run_in_context
+from tools.doc_chips import find_placeholder_indices, restore_placeholders
+
+# Drive API v3 base URLs
+_DRIVE_API = "https://www.googleapis.com/drive/v3/files"
+_UPLOAD_API = "https://www.googleapis.com/upload/drive/v3/files"
+
+
+# Regex for markdown image refs: ![alt](path)
+# Skips http/https URLs — those are external, not local files.
+_IMAGE_REF_RE = re.compile(r"!\[([^\]]*)\]\((?!https?://)([^)]+)\)")
+
+# Sentinel prefix unlikely to appear in real content
+_PLACEHOLDER_PREFIX = "\u3014MISE_IMG_"
+_PLACEHOLDER_SUFFIX = "\u3015"
+
+
+@dataclass
+class _ImageRef:
+    """A local image reference parsed from markdown."""
+    index: int
+    alt: str
+    path: str
+    placeholder: str
+
+
+def _parse_image_refs(content: str) -> tuple[str, list[_ImageRef]]:
+    """Parse markdown for local image refs, replace with unique placeholders.
+
+    Returns (modified_content, list_of_refs). Remote URLs are left as-is.
+    """
+    refs: list[_ImageRef] = []
+
+    def _replace(match: re.Match) -> str:
+        alt = match.group(1)
+        path = match.group(2)
+        idx = len(refs)
+        placeholder = f"{_PLACEHOLDER_PREFIX}{idx}{_PLACEHOLDER_SUFFIX}"
+        refs.append(_ImageRef(index=idx, alt=alt, path=path, placeholder=placeholder))
+        return placeholder
+
+    modified = _IMAGE_REF_RE.sub(_replace, content)
+    return modified, refs
+
+
+def _resolve_image_path(ref_path: str, base_path: Path | None) -> Path | None:
+    """Resolve an image path relative to base_path. Returns None if not found."""
+    p = Path(ref_path)
+    if p.is_absolute():
+        return p if p.exists() else None
+    if base_path:
+        resolved = (base_path / p).resolve()
+        return resolved if resolved.exists() else None
+    return None
+
+
+def _upload_temp_image(image_bytes: bytes, filename: str, mime_type: str) -> str:
+    """Upload image bytes to Drive as a temp file. Returns file ID."""
+    client = get_sync_client()
+    metadata = {
+        "name": f"_mise_temp_{filename}",
+        "description": "Temporary image for mise doc embedding — safe to delete",
+    }
+    result = client.upload_multipart(
+        _UPLOAD_API, metadata, image_bytes, mime_type,
+        params={"uploadType": "multipart", "fields": "id", "supportsAllDrives": "true"},
+    )
+    return result["id"]
+
+
+def _share_publicly(file_id: str) -> str:
+    """Make a Drive file publicly readable (required for Docs API insertInlineImage).
+
+    Returns the permission ID for later revocation.
+    """
+    client = get_sync_client()
+    result = client.post_json(
+        f"{_DRIVE_API}/{file_id}/permissions",
+        json_body={"role": "reader", "type": "anyone"},
+        params={"supportsAllDrives": "true", "fields": "id"},
+    )
+    return result.get("id", "anyoneWithLink")
+
+
+def _revoke_public(file_id: str, permission_id: str) -> None:
+    """Revoke a specific permission from a Drive file."""
+    client = get_sync_client()
+    try:
+        client.request(
+            "DELETE",
+            f"{_DRIVE_API}/{file_id}/permissions/{permission_id}",
+            params={"supportsAllDrives": "true"},
+        )
+    except Exception:
+        pass  # Best-effort cleanup
+
+
+def _delete_temp_file(file_id: str) -> None:
+    """Delete a temporary Drive file."""
+    client = get_sync_client()
+    try:
+        client.request(
+            "DELETE",
+            f"{_DRIVE_API}/{file_id}",
+            params={"supportsAllDrives": "true"},
+        )
+    except Exception:
+        pass  # Best-effort cleanup
+
+
+# Concurrent image prep and Drive round trips (upload+share, revoke+delete)
+# per embed. Phase 1 is PIL/SVG work, which releases the GIL for the heavy
+# parts; Phase 2 and cleanup are I/O.
+_EMBED_WORKERS = 6
+
+
+def _prepare_image(ref: _ImageRef, base_path: Path | None) -> tuple[bytes, str] | str:
+    """Phase 1 for one ref: resolve, read, SVG→PNG, resize.
+
+    Returns (image_bytes, mime_type), or the error message for image_errors.
+    """
+    from extractors.image import resize_image_bytes
+    from adapters.image import is_svg, render_svg_to_png
+
+    resolved = _resolve_image_path(ref.path, base_path)
+    if not resolved:
+        return f"Image not found: {ref.path}"
+
+    try:
+        image_bytes = resolved.read_bytes()
+        mime_type = mimetypes.guess_type(str(resolved))[0] or "image/png"
+
+        # SVG → PNG conversion (Docs API can't display SVG inline)
+        if is_svg(mime_type):
+            png_bytes, _, _ = render_svg_to_png(image_bytes)
+            if not png_bytes:
+                return f"SVG rendering failed: {ref.path}"
+            image_bytes = png_bytes
+            mime_type = "image/png"
+
+        # Resize if needed
+        resized = resize_image_bytes(image_bytes, mime_type)
+        return resized.content_bytes, resized.mime_type
+    except Exception as e:
+        return f"Image processing failed for {ref.path}: {e}"
+
+
+def _upload_and_share(image_bytes: bytes, filename: str, mime_type: str) -> tuple[str, str]:
+    """Phase 2 for one distinct image. Returns (drive_file_id, permission_id)."""
+    file_id = _upload_temp_image(image_bytes, filename, mime_type)
+    return file_id, _share_publicly(file_id)
+
+
+def _cleanup_temp_image(file_id: str, perm_id: str) -> None:
+    _revoke_public(file_id, perm_id)
+    _delete_temp_file(file_id)
+
+
+def _embed_images_in_doc(
+    doc_id: str,
+    refs: list[_ImageRef],
+    base_path: Path | None,
+) -> dict[str, Any]:
+    """Post-creation: embed local images into a Google Doc.
+
+    Uploads images to Drive, temporarily shares publicly, inserts via
+    Docs batchUpdate, then revokes permissions and cleans up.
+
+    Preparation, upload and cleanup run on a bounded thread pool; results
+    are gathered in ref order, so errors read as they did serially. Refs
+    whose prepared bytes are identical (the same logo five times) share
+    one upload.
+
+    Returns dict with images_embedded count and image_errors list.
+    """
+    if not refs:
+        return {}
+
+    workers = min(_EMBED_WORKERS, len(refs))
+
+    # Phase 1: Prepare images — resolve paths, read bytes, resize
+    prepared: list[tuple[_ImageRef, bytes, str]] = []  # (ref, bytes, mime_type)
+    errors: list[str] = []
+    prepare = run_in_context(_prepare_image)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        outcomes = list(pool.map(lambda ref: prepare(ref, base_path), refs))
+    for ref, outcome in zip(refs, outcomes):
+        if isinstance(outcome, str):
+            errors.append(outcome)
+        else:
+            prepared.append((ref, *outcome))
+
+    if not prepared:
+        return {"image_errors": errors} if errors else {}
+
+    # Phase 2: Upload images to Drive and share publicly — once per distinct
+    # content; the first ref with those bytes names the temp file
+    jobs: dict[tuple[bytes, str], Future[tuple[str, str]]] = {}
+    keys: list[tuple[bytes, str]] = []
+    upload = run_in_context(_upload_and_share)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for ref, image_bytes, mime_type in prepared:
+            key = (hashlib.sha256(image_bytes).digest(), mime_type)
+            if key not in jobs:
+                jobs[key] = pool.submit(upload, image_bytes, Path(ref.path).name, mime_type)
+            keys.append(key)
+
+    uploaded: list[tuple[_ImageRef, str, str]] = []  # (ref, drive_file_id, permission_id)
+    for (ref, _, _), key in zip(prepared, keys):
+        try:
+            file_id, perm_id = jobs[key].result()
+            uploaded.append((ref, file_id, perm_id))
+        except Exception as e:
+            errors.append(f"Upload failed for {ref.path}: {e}")
+
+    if not uploaded:
+        return {"image_errors": errors} if errors else {}
+
+    # Phase 3: Find placeholder indices in the created doc
+    placeholders = [ref.placeholder for ref, _, _ in uploaded]
+    indices = find_placeholder_indices(doc_id, placeholders)
+
+    # Phase 4: Build batchUpdate requests in reverse index order
+    requests: list[dict[str, Any]] = []
+    for ref, file_id, _ in uploaded:
+        if ref.placeholder not in indices:
+            errors.append(f"Placeholder not found in doc for {ref.path}")
+            continue
+        start, end = indices[ref.placeholder]
+        requests.append((start, end, file_id))
+
+    # Sort by start index descending — prevents index drift
+    requests.sort(key=lambda x: x[0], reverse=True)
+
+    batch_requests: list[dict[str, Any]] = []
+    for start, end, file_id in requests:
+        # Delete the placeholder text
+        batch_requests.append({
+            "deleteContentRange": {
+                "range": {"startIndex": start, "endIndex": end, "segmentId": ""},
+            }
+        })
+        # Insert image at the same position
+        batch_requests.append({
+            "insertInlineImage": {
+                "uri": f"https://drive.google.com/uc?export=view&id={file_id}",
+                "location": {"index": start, "segmentId": ""},
+            }
+        })
+
+    if batch_requests:
+        try:
+            client = get_sync_client()
+            client.post_json(
+                f"https://docs.googleapis.com/v1/documents/{doc_id}:batchUpdate",
+                json_body={"requests": batch_requests},
+            )
+        except Exception as e:
+            errors.append(f"Docs batchUpdate failed: {e}")
+            restore_placeholders(doc_id, [(r.placeholder, f"![{r.alt}]({r.path})") for r, _, _ in uploaded])
+
+    # Phase 5: Revoke permissions and delete temp files (once per upload)
+    temp_files = {file_id: perm_id for _, file_id, perm_id in uploaded}
+    cleanup = run_in_context(_cleanup_temp_image)
+    with ThreadPoolExecutor(max_workers=min(_EMBED_WORKERS, len(temp_files))) as pool:
+        list(pool.map(cleanup, temp_files, temp_files.values()))
+
+    result: dict[str, Any] = {"images_embedded": len(requests)}
+    if errors:
+        result["image_errors"] = errors
+    return result
@@ -5,7 +5,8 @@ Re-exports all public symbols so `from tools.fetch import X` continues to work.
 """
 
 # Router (entry points)
-from .router import do_fetch, detect_id_type
+from .router import do_fetch, detect_id_type, fetch_one
+from .batch import fetch_many
 
 # Common helpers
 from .common import (
@@ -0,0 +1,99 @@
+"""
+Multi-id fetch — many deposits from one call on a bounded worker pool.
+
+Research-style agents search, then fetch 10–30 results. One call per id
+pays MCP overhead and a cold start each time; here every input runs through
+fetch_one on a shared pool, and the Drive ids' routing metadata arrives in
+one batched files.get instead of one request each.
+
+Each input keeps its own outcome. fetch_one never raises — it returns a
+FetchError — so one bad id costs its own slot and nothing else.
+
+Inputs that name the same file — a bare id and its URL — are fetched once
+and share the outcome. Fetched separately, they would run at the same time
+into the same deposit folder, and each get_deposit_folder would wipe the
+other's files mid-write. The first of them in input order is the one
+fetched, URL decorations and all.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from adapters.drive_batch import get_files_metadata
+from models import FetchBatchResult, FetchError, FetchResult
+from telemetry import count, run_in_context
+from validation import detect_fetch_input_problem, extract_gmail_draft_id, extract_rfc822_message_id
+
+from .router import detect_id_type, fetch_one
+
+# Enough to overlap exports and downloads without tripping per-user rate
+# limits — each worker's fetch may itself fan out (tabs, thumbnails).
+FETCH_WORKERS = 6
+MAX_BATCH = 50
+
+
+def fetch_many(file_ids: list[str], base_path: Path | None = None, **options: Any) -> FetchBatchResult | FetchError:
+    """
+    Fetch every id or URL in file_ids concurrently.
+
+    Args:
+        file_ids: Drive/Gmail ids or URLs, anything do_fetch accepts.
+            Repeats are fetched once.
+        base_path: Base directory for deposits (defaults to cwd)
+        **options: do_fetch's per-item options (recursive, tabs,
+            suggestions, thumbnails) — applied to every item
+
+    Returns:
+        FetchBatchResult in input order, or FetchError for an unusable batch
+    """
+    inputs = list(dict.fromkeys(f.strip() for f in file_ids if f and f.strip()))
+    if not inputs:
+        return FetchError(kind="invalid_input", message="file_id list is empty")
+    if len(inputs) > MAX_BATCH:
+        return FetchError(
+            kind="invalid_input",
+            message=f"{len(inputs)} ids in one fetch — the limit is {MAX_BATCH}. Split the list.",
+        )
+    if options.get("attachment") or options.get("raw"):
+        return FetchError(
+            kind="invalid_input",
+            message="attachment= and raw= name one thread's attachment — fetch it with a single file_id.",
+        )
+
+    routes = {file_id: _route(file_id) for file_id in inputs}
+    fetched: dict[str, str] = {}  # routed id -> the first input naming it
+    for file_id in inputs:
+        fetched.setdefault(routes[file_id][0], file_id)
+    drive_ids = [routes[file_id][1] for file_id in fetched.values()]
+    metadata = get_files_metadata([d for d in drive_ids if d])
+
+    fetch = run_in_context(fetch_one)
+
+    def _one(file_id: str) -> FetchResult | FetchError:
+        drive_id = routes[file_id][1]
+        return fetch(file_id, base_path=base_path, metadata=metadata.get(drive_id) if drive_id else None, **options)
+
+    with ThreadPoolExecutor(max_workers=min(FETCH_WORKERS, len(fetched))) as pool:
+        outcomes = dict(zip(fetched, pool.map(_one, fetched.values())))
+    count("batch_fetch_items", len(fetched))
+    return FetchBatchResult(inputs=inputs, results=[outcomes[routes[file_id][0]] for file_id in inputs])
+
+
+def _route(file_id: str) -> tuple[str, str | None]:
+    """
+    Where do_fetch will send file_id: (routed id, Drive id for metadata).
+
+    The routed id is the source and normalised id, so a URL and its bare id
+    match. Drafts, Message-IDs and inputs the pre-flight rejects take their
+    own routes in do_fetch; they match only themselves and get no metadata.
+    """
+    if extract_gmail_draft_id(file_id) or detect_fetch_input_problem(file_id):
+        return file_id, None
+    if extract_rfc822_message_id(file_id):
+        return file_id, None
+    try:
+        source, normalized_id, _ = detect_id_type(file_id)
+    except ValueError:
+        return file_id, None  # fetch_one reports it
+    return f"{source}:{normalized_id}", normalized_id if source == "drive" else None
@@ -5,16 +5,24 @@ Contains _build_cues, _build_email_context_metadata,
 _enrich_with_comments, and text file detection.
 """
 
+import shutil
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 
-from adapters.drive import fetch_file_comments
+from adapters.drive import fetch_file_comments, get_file_metadata
 from adapters.pdf import PdfConversionResult
 from extractors.comments import extract_comments_content
 from extractors.pdf_anchors import insert_crop_anchors
-from extractors.sheets import extract_sheets_per_tab
-from models import MiseError, EmailContext
-from workspace import write_content, write_page_thumbnail, slugify
+from extractors.sheets import (
+    EMPTY_SHEET, empty_sheets_warning, extract_sheets_per_tab, rows_to_csv, sheet_banner,
+    sheet_to_csv,
+)
+from models import FetchResult, MiseError, EmailContext, SpreadsheetData
+from telemetry import count, run_in_context, span
+from workspace import discard, open_content_stream, pending_names, write_content, write_page_thumbnail, write_raw, slugify
 
 
 def _enrich_with_comments(
@@ -37,15 +45,16 @@ def _enrich_with_comments(
         Fails silently — comments are optional enrichment.
     """
     try:
-        data = fetch_file_comments(file_id, include_resolved=False, max_results=100)
-        if not data.comments:
-            return (0, None)
+        with span("comments"):
+            data = fetch_file_comments(file_id, include_resolved=False, max_results=100)
+            if not data.comments:
+                return (0, None)
 
-        # Extract to markdown
-        comments_md = extract_comments_content(data, document_markdown=document_markdown)
+            # Extract to markdown
+            comments_md = extract_comments_content(data, document_markdown=document_markdown)
 
-        # Write to deposit folder
-        write_content(folder, comments_md, filename="comments.md")
+            # Write to deposit folder
+            write_content(folder, comments_md, filename="comments.md")
 
         return (data.comment_count, comments_md)
     except MiseError:
@@ -85,6 +94,82 @@ def _write_per_tab_csvs(
     return result
 
 
+class _StrippedWriter:
+    """Forward text minus the whole stream's leading/trailing whitespace —
+    what str.strip() does to extract_sheets_content's joined output — while
+    holding back only the current whitespace tail, never the text."""
+
+    def __init__(self, write: Callable[[str], None]) -> None:
+        self._write = write
+        self._held = ""
+        self._started = False
+
+    def __call__(self, text: str) -> None:
+        if not self._started:
+            text = text.lstrip()
+            self._started = bool(text)
+        body = text.rstrip()
+        if body:
+            self._write(self._held + body)
+            self._held = text[len(body):]
+        else:
+            self._held += text
+
+
+def _stream_sheet_csvs(
+    folder: Path, data: SpreadsheetData
+) -> tuple[Path, list[dict[str, Any]]]:
+    """Write content.csv and per-tab CSVs page by page for a row-paged sheet.
+
+    The streaming counterpart of extract_sheets_content + _write_per_tab_csvs,
+    with byte-identical files: each tab's SheetTab.pages are written to both
+    files as they arrive and then dropped, so memory holds one page. Tabs
+    without pages (OBJECT sheets) write from values or grid. Appends the empty-tab
+    warning to data.warnings. Returns (content.csv path, manifest tab index).
+    """
+    multi = len(data.sheets) > 1
+    tabs_info: list[dict[str, Any]] = []
+    empty_sheets: list[str] = []
+    with open_content_stream(folder, "content.csv") as write:
+        content = _StrippedWriter(write)
+        for tab in data.sheets:
+            filename = f"content_{slugify(tab.name, max_length=40)}.csv" if multi else "content.csv"
+            tabs_info.append({"name": tab.name, "sheet_id": tab.sheet_id, "filename": filename})
+            content(sheet_banner(tab.name))
+            with (open_content_stream(folder, filename) if multi else nullcontext()) as tab_write:
+                wrote_rows = False
+                chunks = map(rows_to_csv, tab.pages) if tab.pages is not None else [sheet_to_csv(tab)]
+                for chunk in chunks:
+                    if not chunk:
+                        continue
+                    content(chunk)
+                    if tab_write:
+                        tab_write(chunk)
+                    wrote_rows = True
+                if not wrote_rows:
+                    content(EMPTY_SHEET)
+                    if tab_write:
+                        tab_write(EMPTY_SHEET)
+                    empty_sheets.append(tab.name)
+    if empty_sheets:
+        data.warnings.append(empty_sheets_warning(empty_sheets))
+    return folder / "content.csv", tabs_info
+
+
+def _chart_cache_stats(data: SpreadsheetData) -> dict[str, Any]:
+    """Manifest/metadata fields for charts served from the render cache.
+
+    chart_render_time_ms covers only the charts that were rendered; these
+    report the rest. Empty when the cache had none.
+    """
+    if not data.chart_cache_hits:
+        return {}
+    return {
+        "chart_cache_hits": data.chart_cache_hits,
+        "chart_cache_time_ms": data.chart_cache_time_ms,
+    }
+
+
 def _deposit_pdf_thumbnails(
     folder: Path,
     result: PdfConversionResult,
@@ -140,7 +225,7 @@ def deposit_pdf_crops(folder: Path, result: PdfConversionResult) -> dict[str, An
 
     records = []
     for crop in result.crops:
-        (Path(folder) / crop.name).write_bytes(crop.png_bytes)
+        write_raw(Path(folder), crop.png_bytes, crop.name)
         records.append({
             "file": crop.name,
             "pages": crop.pages,
@@ -243,6 +328,8 @@ def _build_cues(
                     file_names.append(name)
                 if name.startswith("content."):
                     content_length = f.stat().st_size
+    # The manifest is still buffered (workspace.deposit_batch) — list it all the same
+    file_names.extend(n for n in pending_names(folder_path) if n not in file_names)
 
     # Collapse thumbnails into a compact summary
     files = sorted(file_names)
@@ -311,6 +398,12 @@ def is_text_file(mime_type: str) -> bool:
     return False
 
 
+def metadata_size(metadata: dict[str, Any]) -> int | None:
+    """File size from Drive metadata the router already fetched (None when absent)."""
+    size = metadata.get("size")
+    return int(size) if size is not None else None
+
+
 def _build_email_context_metadata(email_context: EmailContext | None) -> dict[str, Any] | None:
     """Build email_context dict for FetchResult metadata.
 
@@ -320,3 +413,36 @@ def _build_email_context_metadata(email_context: EmailContext | None) -> dict[st
     if not email_context:
         return None
     return email_context.to_cue()
+
+
+T = TypeVar("T")
+
+# A cached record whose file has since changed in any of these was routed or
+# named on stale facts.
+_ROUTING_IDENTITY = ("mimeType", "name", "modifiedTime")
+
+
+def route_then_confirm(file_id: str, cached: dict[str, Any], route: Callable[[dict[str, Any]], T]) -> T:
+    """Route from cached Drive metadata now, with the files.get running alongside.
+
+    The freshness check overlaps the download instead of preceding it. When the
+    file changed since it was cached, the fetch is redone from the fresh record,
+    and a first deposit the redo didn't land on (the title or type changed, so
+    the folder name did) is removed rather than left behind as a stale copy.
+    """
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        check = pool.submit(run_in_context(get_file_metadata), file_id)
+        result = route(cached)
+        try:
+            fresh = check.result()
+        except MiseError:
+            fresh = cached  # the download reached the file itself, so its result stands
+    if any(fresh.get(f) != cached.get(f) for f in _ROUTING_IDENTITY):
+        count("drive_meta_cache_stale")
+        redone = route(fresh)
+        if isinstance(result, FetchResult) and isinstance(redone, FetchResult) and result.path != redone.path:
+            discard(Path(result.path))  # its buffered manifest would land in a missing folder
+            shutil.rmtree(result.path, ignore_errors=True)
+        return redone
+    count("drive_meta_cache_hits")
+    return result
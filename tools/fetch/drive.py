@@ -7,7 +7,8 @@ from typing import Any
 
 import orjson
 
-from adapters.drive import get_file_metadata, parse_email_context, download_file, GOOGLE_DOC_MIME, GOOGLE_SHEET_MIME, GOOGLE_SLIDES_MIME, GOOGLE_FOLDER_MIME, GOOGLE_FORM_MIME
+from adapters.drive_meta_cache import recall as recall_metadata
+from adapters.drive import get_file_metadata, parse_email_context, stream_file, GOOGLE_DOC_MIME, GOOGLE_SHEET_MIME, GOOGLE_SLIDES_MIME, GOOGLE_FOLDER_MIME, GOOGLE_FORM_MIME
 from adapters.drive import list_folder as adapter_list_folder, list_folder_recursive as adapter_list_folder_recursive
 from adapters.docs import fetch_document
 from adapters.forms import fetch_form as adapter_fetch_form
@@ -19,18 +20,20 @@ from adapters.pdf import fetch_and_convert_pdf, convert_pdf_content
 from adapters.office import fetch_and_convert_office, get_office_type_from_mime, OfficeType
 from adapters.image import fetch_image as adapter_fetch_image, is_image_file, is_svg
 from extractors.image import resize_image_bytes
-from extractors.docs import extract_doc_content
+from extractors.doc_tabs import extract_doc_content_parallel
 from extractors.folder import extract_folder_content, extract_folder_tree
 from extractors.forms import extract_form_content
 from extractors.sheets import extract_sheets_content
 from extractors.slides import extract_slides_content
 from extractors.video import extract_video_content
 from models import FetchResult, FetchError, EmailContext
-from workspace import get_deposit_folder, write_content, write_manifest, write_thumbnail, write_image, write_chart, write_charts_metadata
+from telemetry import span
+from workspace import deposit_file, get_deposit_folder, open_deposit_stream, publish_staged, staging_folder, write_content, write_raw, write_manifest, write_thumbnail, write_image, write_chart, write_charts_metadata
 
 from .common import (
-    _build_cues, _build_email_context_metadata, _deposit_pdf_thumbnails,
-    _enrich_with_comments, _write_per_tab_csvs, deposit_pdf_crops, is_text_file, pdf_page_fidelity,
+    _build_cues, _build_email_context_metadata, _chart_cache_stats, _deposit_pdf_thumbnails,
+    _enrich_with_comments, _stream_sheet_csvs, _write_per_tab_csvs, deposit_pdf_crops, is_text_file, metadata_size, pdf_page_fidelity,
+    route_then_confirm,
 )
 from .decorations import build_doc_structure, build_slides_index
 
@@ -43,10 +46,13 @@ def _add_file_dates(extra: dict[str, Any], metadata: dict[str, Any]) -> None:
         extra["modified_time"] = metadata["modifiedTime"]
 
 
-def fetch_drive(file_id: str, base_path: Path | None = None, recursive: bool = False, tabs: list[str] | None = None, suggestions: str = "accepted", thumbnails: bool = True) -> FetchResult | FetchError:
+def fetch_drive(file_id: str, base_path: Path | None = None, recursive: bool = False, tabs: list[str] | None = None, suggestions: str = "accepted", thumbnails: bool = True, metadata: dict[str, Any] | None = None) -> FetchResult | FetchError:
     """Fetch Drive file, route by type, extract content, deposit to workspace."""
-    # Get metadata to determine type
-    metadata = get_file_metadata(file_id)
+    # Get metadata to determine type, unless a batch fetch already has it. A search
+    # or listing this session may have cached it: route now, confirm alongside.
+    if metadata is None and (cached := recall_metadata(file_id)) is not None:
+        return route_then_confirm(file_id, cached, lambda fresh: fetch_drive(file_id, base_path, recursive, tabs, suggestions, thumbnails, metadata=fresh))
+    metadata = metadata or get_file_metadata(file_id)
     mime_type = metadata.get("mimeType", "")
     title = metadata.get("name", "untitled")
 
@@ -205,7 +211,8 @@ def _any_truncated(node: "FolderTreeNode") -> bool:
 def fetch_doc(doc_id: str, title: str, metadata: dict[str, Any], email_context: EmailContext | None = None, *, base_path: Path | None = None, suggestions: str = "accepted") -> FetchResult:
     """Fetch Google Doc with open comments included."""
     doc_data = fetch_document(doc_id, suggestions=suggestions)
-    content = extract_doc_content(doc_data)
+    with span("extract.doc"):
+        content = extract_doc_content_parallel(doc_data)
 
     folder = get_deposit_folder("doc", title, doc_id, base_path=base_path)
     content_path = write_content(folder, content)
@@ -253,14 +260,22 @@ def fetch_doc(doc_id: str, title: str, metadata: dict[str, Any], email_context:
 
 def fetch_sheet(sheet_id: str, title: str, metadata: dict[str, Any], email_context: EmailContext | None = None, *, base_path: Path | None = None, tabs: list[str] | None = None) -> FetchResult:
     """Fetch Google Sheet with charts rendered as PNGs and open comments included."""
-    sheet_data = fetch_spreadsheet(sheet_id, tabs=tabs)
-    content = extract_sheets_content(sheet_data)
-
-    folder = get_deposit_folder("sheet", title, sheet_id, base_path=base_path)
-    content_path = write_content(folder, content, filename="content.csv")
-
-    # Write per-tab CSVs for multi-tab spreadsheets
-    tabs_info = _write_per_tab_csvs(folder, sheet_data)
+    sheet_data = fetch_spreadsheet(sheet_id, tabs=tabs, columnar=True, modified_time=metadata.get("modifiedTime"))
+    if any(tab.pages is not None for tab in sheet_data.sheets):
+        # Row-paged (very large sheet): CSVs are written as pages arrive, into
+        # staging — a page that fails must not cost the previous deposit
+        with staging_folder(base_path) as staging:
+            _, tabs_info = _stream_sheet_csvs(staging, sheet_data)
+            folder = get_deposit_folder("sheet", title, sheet_id, base_path=base_path)
+            publish_staged(staging, folder)
+        content_path = folder / "content.csv"
+    else:
+        folder = get_deposit_folder("sheet", title, sheet_id, base_path=base_path)
+        with span("extract.sheet"):
+            content = extract_sheets_content(sheet_data)
+        content_path = write_content(folder, content, filename="content.csv")
+        # Write per-tab CSVs for multi-tab spreadsheets
+        tabs_info = _write_per_tab_csvs(folder, sheet_data)
 
     # Write chart PNGs
     chart_count = 0
@@ -297,6 +312,7 @@ def fetch_sheet(sheet_id: str, title: str, metadata: dict[str, Any], email_conte
     if chart_count > 0:
         extra["chart_count"] = chart_count
         extra["chart_render_time_ms"] = sheet_data.chart_render_time_ms
+        extra.update(_chart_cache_stats(sheet_data))
     if sheet_data.warnings:
         extra["warnings"] = sheet_data.warnings
     if open_comment_count > 0:
@@ -311,6 +327,7 @@ def fetch_sheet(sheet_id: str, title: str, metadata: dict[str, Any], email_conte
     if chart_count > 0:
         result_meta["chart_count"] = chart_count
         result_meta["chart_render_time_ms"] = sheet_data.chart_render_time_ms
+        result_meta.update(_chart_cache_stats(sheet_data))
     if email_context:
         result_meta["email_context"] = _build_email_context_metadata(email_context)
 
@@ -345,7 +362,8 @@ def fetch_slides(presentation_id: str, title: str, metadata: dict[str, Any], ema
     """Fetch Google Slides with open comments included."""
     # Selective logic in adapter skips stock photos/text-only slides
     presentation_data = fetch_presentation(presentation_id, include_thumbnails=thumbnails)
-    content = extract_slides_content(presentation_data)
+    with span("extract.slides"):
+        content = extract_slides_content(presentation_data)
 
     folder = get_deposit_folder("slides", title, presentation_id, base_path=base_path)
     content_path = write_content(folder, content)
@@ -522,7 +540,7 @@ def fetch_pdf(file_id: str, title: str, metadata: dict[str, Any], email_context:
     conversion for complex/image-heavy PDFs.
     """
     # Extract via adapter (handles download + hybrid extraction + thumbnail rendering)
-    result = fetch_and_convert_pdf(file_id, thumbnails=thumbnails)
+    result = fetch_and_convert_pdf(file_id, thumbnails=thumbnails, file_size=metadata_size(metadata))
 
     # Deposit to workspace (crops first — the helper anchors them into result.content)
     folder = get_deposit_folder("pdf", title, file_id, base_path=base_path)
@@ -574,7 +592,7 @@ def fetch_office(file_id: str, title: str, metadata: dict[str, Any], office_type
     Uses adapters/office.py which handles download, conversion, and cleanup.
     """
     # Extract via adapter (handles download + conversion)
-    result = fetch_and_convert_office(file_id, office_type)
+    result = fetch_and_convert_office(file_id, office_type, file_size=metadata_size(metadata))
 
     # Determine output format
     output_format = "csv" if office_type == "xlsx" else "markdown"
@@ -597,14 +615,12 @@ def fetch_office(file_id: str, title: str, metadata: dict[str, Any], office_type
     if office_type == "xlsx" and (result.raw_bytes or result.raw_temp_path):
         # Preserve original filename — consistent with Gmail attachment deposits
         raw_file = title if title.lower().endswith(".xlsx") else f"{title}.xlsx"
-        dest = folder / raw_file
         if result.raw_temp_path:
-            # Large file: copy directly from temp — avoids doubling peak memory
-            import shutil
-            shutil.copy2(result.raw_temp_path, dest)
+            # Large file: deposit straight from temp — avoids doubling peak memory
+            deposit_file(folder, raw_file, result.raw_temp_path)
             result.raw_temp_path.unlink(missing_ok=True)
         else:
-            dest.write_bytes(result.raw_bytes)  # type: ignore[arg-type]
+            write_raw(folder, result.raw_bytes, raw_file)  # type: ignore[arg-type]
 
     # Formula count from spreadsheet data (XLSX only)
     formula_count: int | None = None
@@ -651,14 +667,11 @@ def fetch_text(file_id: str, title: str, metadata: dict[str, Any], email_context
     """
     Fetch text-based file (txt, csv, json, etc.) by downloading directly.
 
-    No extraction needed — just download and deposit.
+    No extraction needed — the download streams straight to disk, so memory
+    stays flat however large the file is.
     """
     mime_type = metadata.get("mimeType", "text/plain")
 
-    # Download content
-    content_bytes = download_file(file_id)
-    content = content_bytes.decode("utf-8", errors="replace")
-
     # Determine output format and extension
     extension_map = {
         "text/csv": ("csv", "csv"),
@@ -672,13 +685,17 @@ def fetch_text(file_id: str, title: str, metadata: dict[str, Any], email_context
     output_format, ext = extension_map.get(mime_type, ("text", "txt"))
     filename = f"content.{ext}"
 
-    # Deposit to workspace
-    folder = get_deposit_folder("text", title, file_id, base_path=base_path)
-    content_path = write_content(folder, content, filename=filename)
+    # Staged until complete: a failed download must not cost the last deposit
+    with staging_folder(base_path) as staging:
+        with open_deposit_stream(staging, filename, text=True) as stream:
+            stream_file(file_id, stream)
+        folder = get_deposit_folder("text", title, file_id, base_path=base_path)
+        publish_staged(staging, folder)
+    content_path = folder / filename
 
     extra: dict[str, Any] = {
         "mime_type": mime_type,
-        "char_count": len(content),
+        "char_count": stream.char_count,
     }
     _add_file_dates(extra, metadata)
     write_manifest(folder, "text", title, file_id, extra=extra)
@@ -686,7 +703,7 @@ def fetch_text(file_id: str, title: str, metadata: dict[str, Any], email_context
     result_meta: dict[str, Any] = {
         "title": title,
         "mime_type": mime_type,
-        "char_count": len(content),
+        "char_count": stream.char_count,
     }
     if email_context:
         result_meta["email_context"] = _build_email_context_metadata(email_context)
@@ -713,7 +730,7 @@ def fetch_image_file(file_id: str, title: str, metadata: dict[str, Any], email_c
     mime_type = metadata.get("mimeType", "")
 
     # Fetch via adapter (handles download + SVG rendering)
-    result = adapter_fetch_image(file_id, title, mime_type)
+    result = adapter_fetch_image(file_id, title, mime_type, file_size=metadata_size(metadata))
 
     # Open with PIL and resize if needed (raster only; SVG bypasses this).
     # Oversized images are scaled to MAX_LONG_EDGE_PX rather than rejected.
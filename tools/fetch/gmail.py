@@ -5,22 +5,28 @@ Gmail fetch — thread extraction, attachment handling, pre-exfil routing.
 from pathlib import Path
 from typing import Any
 
-from adapters.drive import download_file, lookup_exfiltrated
+from adapters.drive import download_file
+from adapters.drive_exfil import lookup_exfiltrated
 from adapters.calendar import get_event_by_ical_uid
-from adapters.gmail import fetch_thread
+from adapters.gmail import AttachmentDownload, fetch_thread
 from adapters.gmail_ids import get_thread_id_for_message, thread_web_link_or_warn
 from adapters.office import convert_office_content, get_office_type_from_mime
 from adapters.pdf import convert_pdf_content, render_pdf_pages
 from extractors.gmail import extract_thread_content, parse_ics_uid
 from extractors.image import resize_image_bytes
 from models import FetchResult, FetchError, InviteState, MiseError, ErrorKind
+from telemetry import span
 from validation import is_gmail_api_id, diagnose_fetch_404
-from workspace import get_deposit_folder, write_content, write_manifest, write_image, write_raw
+from workspace import get_deposit_folder, write_content, write_manifest, write_image
 
 from .common import _build_cues, _deposit_pdf_thumbnails, pdf_page_fidelity
 from .gmail_attachments import (
     MAX_EAGER_ATTACHMENTS,
+    _attachment_source,
+    _deposit_raw,
     _download_attachment_bytes,
+    _download_attachment_file,
+    attachment_downloads,
     _extract_attachment_content,
     _extract_from_drive,
     _resolve_attachment_mime,
@@ -28,6 +34,7 @@ from .gmail_attachments import (
 )
 from .gmail_exfil import _match_exfil_for_message
 from .gmail_participants import participants_with_placement
+from .gmail_refetch import load_prior_thread, mark, refresh_prior_thread, save_thread_state, settle
 
 
 def _enrich_invite_state(messages: list[Any], warnings: list[str]) -> InviteState | None:
@@ -93,8 +100,11 @@ def fetch_gmail(thread_id: str, base_path: Path | None = None) -> FetchResult:
     # a fetch that quietly hands back a different id than the one you asked for is
     # exactly the accept-and-drop shape this repo is named for, wearing a helpful face.
     resolved_from_message_id: str | None = None
+    # A thread deposited before is rebuilt from its stored payloads plus the new messages
+    prior = load_prior_thread(thread_id, base_path)
+    delta = refresh_prior_thread(thread_id, prior)
     try:
-        thread_data = fetch_thread(thread_id)
+        thread_data = delta[0] if delta else fetch_thread(thread_id)
     except MiseError as exc:
         if exc.kind is not ErrorKind.NOT_FOUND or not is_gmail_api_id(thread_id):
             raise
@@ -116,10 +126,12 @@ def fetch_gmail(thread_id: str, base_path: Path | None = None) -> FetchResult:
         thread_data = fetch_thread(thread_id)
 
     # Extract thread text content
-    content = extract_thread_content(thread_data)
+    with span("extract.gmail"):
+        content = extract_thread_content(thread_data)
 
-    # Get deposit folder early (need it for attachment extraction)
-    folder = get_deposit_folder(
+    # Get deposit folder early (need it for attachment extraction). A delta re-fetch
+    # keeps the earlier deposit: its attachments are carried over, not extracted again
+    folder = prior.folder if prior and delta else get_deposit_folder(
         content_type="gmail",
         title=thread_data.subject or "email-thread",
         resource_id=thread_id,
@@ -134,6 +146,9 @@ def fetch_gmail(thread_id: str, base_path: Path | None = None) -> FetchResult:
     extracted_attachments: list[dict[str, Any]] = []
     extraction_warnings: list[str] = []
     extracted_count = 0
+    results: dict[str, list[Any]] = {"extracted": extracted_attachments, "skipped_office": skipped_office, "skipped_images": skipped_images, "warnings": extraction_warnings}
+    carried = prior.outcomes if prior and delta else {}
+    outcomes: dict[str, dict[str, list[Any]]] = {}
 
     # Disclose the message→thread rescue (see the fetch_thread call above). This rides
     # extraction_warnings so it reaches both the manifest and the cues.
@@ -145,12 +160,13 @@ def fetch_gmail(thread_id: str, base_path: Path | None = None) -> FetchResult:
             f"message you named is one of the messages inside it."
         )
 
-    # Pre-exfil lookup: check if attachments already exist in Drive
-    # (indexed by fullText, faster than Gmail download + extraction)
-    message_ids = [msg.message_id for msg in thread_data.messages]
+    # Pre-exfil lookup: check if attachments already exist in Drive (faster than
+    # Gmail download + extraction) — only messages with attachments can have copies
+    message_ids = [msg.message_id for msg in thread_data.messages if msg.attachments and msg.message_id not in carried]
     exfiltrated = lookup_exfiltrated(message_ids)
 
     for msg in thread_data.messages:
+        marks, carry = mark(results), carried.get(msg.message_id)
         # Match ALL attachments for this message to exfil'd Drive files at once.
         # Consumed-pool approach prevents one Drive file matching multiple attachments.
         exfil_files = exfiltrated.get(msg.message_id, [])
@@ -163,6 +179,8 @@ def fetch_gmail(thread_id: str, base_path: Path | None = None) -> FetchResult:
                 "size": att.size,
             }
             all_attachments.append(att_info)
+            if carry is not None:
+                continue  # extracted by the earlier fetch; settle() below carries it
 
             # Resolve Outlook-style octet-stream mis-tagging by filename
             # extension; dispatch on the resolved MIME, keep att.mime_type
@@ -237,6 +255,8 @@ def fetch_gmail(thread_id: str, base_path: Path | None = None) -> FetchResult:
                     extracted_attachments.append(result)
                     extracted_count += 1
 
+        outcomes[msg.message_id] = settle(results, marks, carry)
+        extracted_count = len(extracted_attachments)
         all_drive_links.extend(msg.drive_links)
 
     # Invite-state enrichment: disclose live Calendar state for invitation
@@ -267,7 +287,9 @@ def fetch_gmail(thread_id: str, base_path: Path | None = None) -> FetchResult:
     content_path = write_content(folder, content)
 
     # Build manifest extras
-    extra: dict[str, Any] = {"message_count": len(thread_data.messages)}
+    extra: dict[str, Any] = {"message_count": len(thread_data.messages), "message_ids": [m.message_id for m in thread_data.messages]}
+    if thread_data.history_id:
+        extra["history_id"] = thread_data.history_id
     if thread_data.warnings:
         extra["warnings"] = thread_data.warnings + extraction_warnings
     elif extraction_warnings:
@@ -286,12 +308,15 @@ def fetch_gmail(thread_id: str, base_path: Path | None = None) -> FetchResult:
         resource_id=thread_id,
         extra=extra,
     )
+    save_thread_state(folder, thread_data, outcomes)
 
     # Build result metadata
     metadata: dict[str, Any] = {
         "subject": thread_data.subject,
         "message_count": len(thread_data.messages),
     }
+    if delta:
+        metadata["new_messages"] = len(delta[1])
     if web_link:
         metadata["web_link"] = web_link
     if all_attachments:
@@ -372,23 +397,6 @@ def fetch_gmail(thread_id: str, base_path: Path | None = None) -> FetchResult:
     )
 
 
-def _deposit_raw(folder: Path, data: bytes | None, filename: str) -> dict[str, Any]:
-    """Deposit an attachment's untouched original beside its extraction.
-
-    Best-effort by design (mise-buzafo): the extraction is what the caller asked
-    for, so a failed raw write degrades to a warning rather than losing the fetch.
-    The filename needs no separate cue — _build_cues lists the folder, so writing
-    before it runs puts the file in cues.files for free.
-    """
-    if data is None:
-        return {"warnings": ["raw=True requested but the original bytes were unavailable"]}
-    try:
-        write_raw(folder, data, filename)
-        return {"raw_file": filename}
-    except OSError as e:
-        return {"warnings": [f"raw=True requested but writing {filename} failed: {e}"]}
-
-
 def fetch_attachment(
     thread_id: str,
     attachment_name: str,
@@ -410,6 +418,15 @@ def fetch_attachment(
             with do(create, doc_type='file', file_path=...) to materialise a
             Gmail-only artefact into Drive.
     """
+    with attachment_downloads() as downloads:
+        return _fetch_attachment(thread_id, attachment_name, base_path, raw, thumbnails, downloads)
+
+
+def _fetch_attachment(
+    thread_id: str, attachment_name: str, base_path: Path | None, raw: bool, thumbnails: bool,
+    downloads: list[AttachmentDownload],
+) -> FetchResult | FetchError:
+    """fetch_attachment's body — Office and PDF downloads stay on disk (attachment_downloads)."""
     # 1. Fetch thread to find the attachment
     thread_data = fetch_thread(thread_id)
 
@@ -481,11 +498,12 @@ def fetch_attachment(
                 exfil_file_id = None
                 source_label = "gmail"
 
+        download: AttachmentDownload | None = None
         if not exfil_file_id:
-            content_bytes = _download_attachment_bytes(target_msg, target_att, mime_type)
+            download = _download_attachment_file(target_msg, target_att, mime_type, downloads)
             result = convert_office_content(
                 office_type=office_type,
-                file_bytes=content_bytes,
+                **_attachment_source(download),
                 file_id=thread_id,
             )
         output_format = "csv" if office_type == "xlsx" else "markdown"
@@ -494,9 +512,9 @@ def fetch_attachment(
         # The Drive-exfil path converts server-side and never downloads, so for
         # raw= the bytes have to be fetched deliberately — otherwise raw silently
         # does nothing on exactly the attachments the optimisation applies to.
-        if raw and content_bytes is None:
+        if raw and download is None:
             try:
-                content_bytes = _download_attachment_bytes(target_msg, target_att, mime_type)
+                download = _download_attachment_file(target_msg, target_att, mime_type, downloads)
             except Exception as e:
                 warnings.append(f"raw=True requested but the download failed: {e}")
 
@@ -504,7 +522,7 @@ def fetch_attachment(
         content_path = write_content(folder, result.content, filename=content_filename)
 
         # Before _build_cues so the raw filename lands in cues.files.
-        raw_extras = _deposit_raw(folder, content_bytes, attachment_name) if raw else {}
+        raw_extras = _deposit_raw(folder, download, attachment_name) if raw else {}
 
         all_warnings = warnings + result.warnings + raw_extras.get("warnings", [])
         extra: dict[str, Any] = {"source": source_label, "gmail_thread_id": thread_id}
@@ -535,6 +553,7 @@ def fetch_attachment(
     # Download from pre-exfil Drive or Gmail as appropriate
     # (image_unsupported included: the deposit attempt produces the precise
     # "Image validation failed" error rather than a generic cannot-extract)
+    pdf_download: AttachmentDownload | None = None  # images are resized in memory anyway
     if category in ("pdf", "image", "image_unsupported"):
         content_bytes = None
         if exfil_file_id:
@@ -545,17 +564,21 @@ def fetch_attachment(
                 source_label = "gmail"
 
         if content_bytes is None:
-            content_bytes = _download_attachment_bytes(target_msg, target_att, mime_type)
+            if category == "pdf":
+                pdf_download = _download_attachment_file(target_msg, target_att, mime_type, downloads)
+            else:
+                content_bytes = _download_attachment_bytes(target_msg, target_att, mime_type)
             source_label = "gmail"
 
     # PDF
     if category == "pdf":
-        pdf_result = convert_pdf_content(file_bytes=content_bytes, file_id=thread_id)
+        pdf_source = _attachment_source(pdf_download) if pdf_download else {"file_bytes": content_bytes}
+        pdf_result = convert_pdf_content(**pdf_source, file_id=thread_id)
 
         # Render thumbnails (own folder, no collision risk)
         if thumbnails:
             try:
-                pdf_result.thumbnails = render_pdf_pages(file_bytes=content_bytes)
+                pdf_result.thumbnails = render_pdf_pages(**pdf_source)
             except Exception as e:
                 pdf_result.warnings.append(f"Thumbnail rendering failed: {e}")
 
@@ -567,7 +590,7 @@ def fetch_attachment(
         fidelity_extras = pdf_page_fidelity(pdf_result)  # mutates warnings pre-merge
 
         # Before _build_cues so the raw filename lands in cues.files.
-        raw_extras = _deposit_raw(folder, content_bytes, attachment_name) if raw else {}
+        raw_extras = _deposit_raw(folder, pdf_download or content_bytes, attachment_name) if raw else {}
 
         all_warnings = warnings + pdf_result.warnings + raw_extras.get("warnings", [])
         extra = {
@@ -7,15 +7,18 @@ fetch). Before this module, the same knowledge lived in three places in
 gmail.py and drifted independently.
 """
 
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any, Literal
 
 from adapters.drive import download_file
-from adapters.gmail import download_attachment
+from adapters.gmail import AttachmentDownload, download_attachment
 from adapters.pdf import convert_pdf_content
 from extractors.image import resize_image_bytes, SUPPORTED_IMAGE_MIME_TYPES
 from models import EmailAttachment
-from workspace import write_content, write_image
+from telemetry import span
+from workspace import deposit_file, write_content, write_image, write_raw
 
 from .common import is_text_file
 
@@ -126,16 +129,18 @@ def _is_extractable_attachment(mime_type: str) -> bool:
 
 
 def _deposit_attachment_content(
-    content_bytes: bytes,
+    content_bytes: bytes | Path,
     filename: str,
     mime_type: str,
     file_id: str,
     folder: Path,
 ) -> dict[str, Any] | None:
     """
-    Route attachment bytes by MIME category and deposit to folder.
+    Route attachment content by MIME category and deposit to folder.
 
-    Shared by both Drive (pre-exfil) and Gmail download paths.
+    Shared by both Drive (pre-exfil) and Gmail download paths. content_bytes
+    is the bytes, or the file holding them — Gmail downloads arrive on disk,
+    and a PDF is converted and deposited from there without being read whole.
     Returns extraction result dict or None if type not handled.
     """
     category = classify_attachment(mime_type)
@@ -145,11 +150,15 @@ def _deposit_attachment_content(
         # Multiple PDF attachments would collide on page_01.png filenames.
         # The raw PDF is deposited alongside for Claude to view directly.
         # Single-attachment fetch (fetch_attachment) gets its own folder and does render thumbnails.
-        pdf_result = convert_pdf_content(content_bytes, file_id=file_id)
+        if isinstance(content_bytes, Path):
+            pdf_result = convert_pdf_content(file_id=file_id, file_path=content_bytes)
+            deposit_file(folder, filename, content_bytes)
+        else:
+            pdf_result = convert_pdf_content(content_bytes, file_id=file_id)
+            write_image(folder, content_bytes, filename)
 
         content_filename = f"{filename}.md"
         write_content(folder, pdf_result.content, filename=content_filename)
-        write_image(folder, content_bytes, filename)
 
         return {
             "filename": filename,
@@ -167,8 +176,10 @@ def _deposit_attachment_content(
         # Only PIL failures (genuine MIME mismatch, e.g. DOCX renamed .png) cause
         # a skip — depositing non-image bytes as image/png causes a hard 400 that
         # poisons the session and cannot be fixed by resizing.
+        # PIL needs the bytes; Gmail caps attachments at 25MB
+        image_bytes = content_bytes.read_bytes() if isinstance(content_bytes, Path) else content_bytes
         try:
-            resized = resize_image_bytes(content_bytes, mime_type)
+            resized = resize_image_bytes(image_bytes, mime_type)
         except ValueError as e:
             return {
                 "filename": filename,
@@ -245,26 +256,82 @@ def _extract_attachment_content(
             filename=att.filename,
             mime_type=mime,
         )
+        try:
+            with span("extract.attachment"):
+                return _deposit_attachment_content(
+                    download.temp_path or download.content, att.filename, mime, att.attachment_id, folder
+                )
+        finally:
+            if download.temp_path:
+                download.temp_path.unlink(missing_ok=True)
 
-        # Prefer temp_path for large files (content is cleared to save memory)
-        if download.temp_path:
-            content_bytes = download.temp_path.read_bytes()
-        else:
-            content_bytes = download.content
+    except Exception as e:
+        warnings.append(f"Failed to extract {att.filename}: {str(e)}")
+        return None
 
-        result = _deposit_attachment_content(
-            content_bytes, att.filename, mime, att.attachment_id, folder
-        )
 
-        # Clean up temp file if created
-        if download.temp_path:
-            download.temp_path.unlink(missing_ok=True)
+@contextmanager
+def attachment_downloads() -> Iterator[list[AttachmentDownload]]:
+    """
+    A fetch's Gmail downloads, kept on disk until the block exits.
 
-        return result
+    fetch_attachment converts, renders and raw-deposits Office and PDF
+    attachments straight from the download's temp file rather than reading
+    it whole; the temp files go here however the fetch ends.
+    """
+    downloads: list[AttachmentDownload] = []
+    try:
+        yield downloads
+    finally:
+        for download in downloads:
+            if download.temp_path:
+                download.temp_path.unlink(missing_ok=True)
+
+
+def _download_attachment_file(
+    msg: Any, att: Any, mime_type: str, downloads: list[AttachmentDownload],
+) -> AttachmentDownload:
+    """Download an attachment to disk, registered on an attachment_downloads() list."""
+    download = download_attachment(
+        message_id=msg.message_id,
+        attachment_id=att.attachment_id,
+        filename=att.filename,
+        mime_type=mime_type,
+    )
+    downloads.append(download)
+    return download
 
-    except Exception as e:
-        warnings.append(f"Failed to extract {att.filename}: {str(e)}")
-        return None
+
+def _attachment_source(download: AttachmentDownload) -> dict[str, Any]:
+    """Extractor kwargs for a download — its file on disk, else its bytes."""
+    if download.temp_path:
+        return {"file_path": download.temp_path}
+    return {"file_bytes": download.content}
+
+
+def _deposit_raw(
+    folder: Path, data: AttachmentDownload | bytes | None, filename: str
+) -> dict[str, Any]:
+    """Deposit an attachment's untouched original beside its extraction.
+
+    Best-effort by design (mise-buzafo): the extraction is what the caller asked
+    for, so a failed raw write degrades to a warning rather than losing the fetch.
+    The filename needs no separate cue — _build_cues lists the folder, so writing
+    before it runs puts the file in cues.files for free. A download on disk is
+    copied from its temp file rather than read into memory.
+    """
+    if isinstance(data, AttachmentDownload):
+        data = data.temp_path or data.content
+    if data is None:
+        return {"warnings": ["raw=True requested but the original bytes were unavailable"]}
+    try:
+        if isinstance(data, Path):
+            deposit_file(folder, filename, data)
+        else:
+            write_raw(folder, data, filename)
+        return {"raw_file": filename}
+    except OSError as e:
+        return {"warnings": [f"raw=True requested but writing {filename} failed: {e}"]}
 
 
 def _download_attachment_bytes(msg: Any, att: Any, mime_type: str) -> bytes:
@@ -275,7 +342,7 @@ def _download_attachment_bytes(msg: Any, att: Any, mime_type: str) -> bytes:
         filename=att.filename,
         mime_type=mime_type,
     )
-    # Prefer temp_path for large files (content is cleared to save memory)
+    # Downloads land on disk (content is empty then)
     if dl.temp_path:
         data = dl.temp_path.read_bytes()
         dl.temp_path.unlink(missing_ok=True)
@@ -0,0 +1,93 @@
+"""
+Incremental thread re-fetch — only the messages a deposit doesn't have yet.
+
+Agents monitoring a thread re-fetch it constantly, and each fetch used to
+pull every message whole and extract every attachment again. A deposit now
+keeps THREAD_STATE_FILE beside its manifest: each message's payload as the
+API sent it, and what its attachments produced. A re-fetch lists the
+thread's message ids, fetches just the new messages (adapters/gmail_delta),
+and extracts just their attachments.
+
+content.md is re-rendered from the whole rebuilt thread rather than spliced:
+its "[i/N]" headers and cross-message quote dedupe depend on every message,
+and the render is cheap next to the network and attachment work it follows.
+
+Attachment outcomes are recorded per message with mark/settle: the fetch
+loop notes how long its result lists are before a message, settle() slices
+off what the message added — or, for a message carried over, appends what
+it added last time.
+"""
+
+import json
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from adapters.gmail_delta import refresh_thread
+from models import GmailThreadData, MiseError
+from workspace import find_deposit_folder, write_raw
+
+logger = logging.getLogger(__name__)
+
+THREAD_STATE_FILE = ".thread_state.json"
+
+
+@dataclass
+class PriorThread:
+    """What the last fetch of a thread left in its deposit."""
+    folder: Path
+    payloads: dict[str, dict[str, Any]]
+    outcomes: dict[str, dict[str, list[Any]]]
+
+
+def load_prior_thread(thread_id: str, base_path: Path | None) -> PriorThread | None:
+    """The earlier deposit of thread_id with its stored state, if there is one."""
+    if base_path is None:
+        return None
+    folder = find_deposit_folder("gmail", thread_id, base_path)
+    if folder is None:
+        return None
+    try:
+        state = json.loads((folder / THREAD_STATE_FILE).read_text(encoding="utf-8"))
+        return PriorThread(folder=folder, payloads=state["payloads"], outcomes=state["outcomes"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None  # deposit from before thread state, or damaged — fetch whole
+
+
+def refresh_prior_thread(thread_id: str, prior: PriorThread | None) -> tuple[GmailThreadData, set[str]] | None:
+    """The thread rebuilt on top of prior, or None to fetch it whole."""
+    if prior is None:
+        return None
+    try:
+        return refresh_thread(thread_id, prior.payloads)
+    except MiseError as e:
+        # The whole-thread fetch owns error reporting (404 rescue and diagnosis)
+        logger.info("Incremental refresh of %s failed, fetching whole: %s", thread_id, e)
+        return None
+
+
+def mark(results: dict[str, list[Any]]) -> dict[str, int]:
+    """Where each result list stands before a message is processed."""
+    return {key: len(items) for key, items in results.items()}
+
+
+def settle(results: dict[str, list[Any]], marks: dict[str, int], carried: dict[str, list[Any]] | None) -> dict[str, list[Any]]:
+    """One message's outcome: what it just added, or what it added last time."""
+    for key, items in (carried or {}).items():
+        if key in results:
+            results[key].extend(items)
+    return {key: items[marks[key]:] for key, items in results.items()}
+
+
+def save_thread_state(folder: Path, thread_data: GmailThreadData, outcomes: dict[str, dict[str, list[Any]]]) -> None:
+    """Store what the next re-fetch needs. Skipped when payloads are missing."""
+    payloads = {m.get("id"): m for m in thread_data.raw_messages}
+    if not payloads or set(payloads) != {m.message_id for m in thread_data.messages}:
+        return  # a thread not built from API payloads — nothing to rebuild from
+    state = {"history_id": thread_data.history_id, "payloads": payloads, "outcomes": outcomes}
+    try:
+        write_raw(folder, json.dumps(state).encode("utf-8"), THREAD_STATE_FILE)
+    except (OSError, TypeError, ValueError) as e:
+        # A speedup, not part of the deposit: without it the next fetch is whole
+        logger.warning("Could not store thread state for %s: %s", thread_data.thread_id, e)
@@ -3,12 +3,15 @@ Fetch routing — ID detection and do_fetch entry point.
 """
 
 from pathlib import Path
+from typing import Any
 
 from adapters.gmail import search_threads
 from adapters.gmail_browser import resolve_gmail_url_via_browser
 from adapters.gmail_ids import get_thread_id_for_draft, get_thread_id_for_rfc822_message_id
-from models import MiseError, ErrorKind, FetchResult, FetchError
+from models import MiseError, ErrorKind, FetchBatchResult, FetchResult, FetchError
 from validation import extract_drive_file_id, extract_gmail_draft_id, extract_gmail_id, extract_gmail_permmsgid, extract_gmail_url_context, extract_rfc822_message_id, is_gmail_api_id, is_self_sent_gmail_url, GMAIL_WEB_ID_PREFIXES, detect_fetch_input_problem, diagnose_fetch_404
+from tools.gc import note_workspace
+from workspace import deposit_batch
 
 from .decorations import UrlDecorations, apply_url_decorations, parse_drive_url_decorations
 from .gmail import fetch_gmail, fetch_attachment
@@ -80,14 +83,15 @@ def _self_sent_candidates() -> list[dict[str, str]] | None:
     return candidates or None
 
 
-def do_fetch(file_id: str, base_path: Path | None = None, attachment: str | None = None, recursive: bool = False, tabs: list[str] | None = None, suggestions: str = "accepted", raw: bool = False, thumbnails: bool = True) -> FetchResult | FetchError:
+def do_fetch(file_id: str | list[str], base_path: Path | None = None, attachment: str | None = None, recursive: bool = False, tabs: list[str] | None = None, suggestions: str = "accepted", raw: bool = False, thumbnails: bool = True) -> FetchResult | FetchError | FetchBatchResult:
     """
     Main fetch entry point.
 
     Detects ID type, routes to appropriate fetcher, handles errors.
 
     Args:
-        file_id: Drive file ID or Gmail thread ID
+        file_id: Drive file ID or Gmail thread ID. A list fetches every item
+            concurrently (see batch.fetch_many) and returns a FetchBatchResult.
         base_path: Base directory for deposits (defaults to cwd)
         attachment: Specific attachment filename to extract from Gmail thread
         raw: With attachment=, also deposit the untouched original bytes (PDFs and
@@ -100,6 +104,16 @@ def do_fetch(file_id: str, base_path: Path | None = None, attachment: str | None
             attachments). False skips rendering — the wall-clock and
             deposit-weight lever for text-only corpus hydration
     """
+    if isinstance(file_id, list):
+        from .batch import fetch_many  # batch imports this module
+        return fetch_many(file_id, base_path=base_path, attachment=attachment, recursive=recursive,
+                          tabs=tabs, suggestions=suggestions, raw=raw, thumbnails=thumbnails)
+    return fetch_one(file_id, base_path=base_path, attachment=attachment, recursive=recursive,
+                     tabs=tabs, suggestions=suggestions, raw=raw, thumbnails=thumbnails)
+
+
+def fetch_one(file_id: str, base_path: Path | None = None, attachment: str | None = None, recursive: bool = False, tabs: list[str] | None = None, suggestions: str = "accepted", raw: bool = False, thumbnails: bool = True, metadata: dict[str, Any] | None = None) -> FetchResult | FetchError:
+    """do_fetch for one id; metadata is Drive metadata a batch fetch already holds for it."""
     try:
         if suggestions not in ("accepted", "original", "markup"):
             return FetchError(
@@ -203,17 +217,20 @@ def do_fetch(file_id: str, base_path: Path | None = None, attachment: str | None
                 source, normalized_id, decorations = detect_id_type(file_id)
 
         # Single-attachment fetch (Gmail only)
-        if attachment:
-            if source != "gmail":
-                return FetchError(
-                    kind="invalid_input",
-                    message="attachment parameter only works with Gmail thread/message IDs",
-                )
-            result = fetch_attachment(normalized_id, attachment, base_path=base_path, raw=raw, thumbnails=thumbnails)
-        elif source == "gmail":
-            result = fetch_gmail(normalized_id, base_path=base_path)
-        else:
-            result = fetch_drive(normalized_id, base_path=base_path, recursive=recursive, tabs=tabs, suggestions=suggestions, thumbnails=thumbnails)
+        if attachment and source != "gmail":
+            return FetchError(
+                kind="invalid_input",
+                message="attachment parameter only works with Gmail thread/message IDs",
+            )
+        # One manifest write per deposit, on disk before the decorations read it back
+        with deposit_batch():
+            if attachment:
+                result = fetch_attachment(normalized_id, attachment, base_path=base_path, raw=raw, thumbnails=thumbnails)
+            elif source == "gmail":
+                result = fetch_gmail(normalized_id, base_path=base_path)
+            else:
+                result = fetch_drive(normalized_id, base_path=base_path, recursive=recursive, tabs=tabs, suggestions=suggestions, thumbnails=thumbnails, metadata=metadata)
+        note_workspace(base_path)
 
         # Disclose any resolution (draft→thread, Message-ID→thread, or
         # browser-resolved a-family URL) as a cue — resolve-and-cue, never
@@ -6,6 +6,10 @@ blocks, plus computed common free slots when a duration is given (the slot
 mining happens HERE, in code — never by eyeball), plus office days woven in
 from workingLocation status events where colleagues' sharing allows.
 
+At review scale (30–80 people) nobody is ever all free, so min_free=k asks
+instead for slots where at least k are, ranked by how many — one sweep over
+every busy edge rather than a rescan per day.
+
 Honesty invariants, both load-bearing:
 - A calendar freebusy CANNOT see is named in not_visible and excluded from
   slot mining with a warning — an invisible diary silently treated as empty
@@ -22,11 +26,8 @@ from datetime import datetime, time, timedelta
 from typing import Any
 from zoneinfo import ZoneInfo
 
-from adapters.calendar import (
-    freebusy_query,
-    list_status_events,
-    resolve_calendar_timezone,
-)
+from adapters.calendar import list_status_events, resolve_calendar_timezone
+from adapters.calendar_freebusy import freebusy_query
 from cues_util import current_user_email, with_identity
 from models import ErrorKind, MiseError
 from validation import parse_time_window
@@ -38,6 +39,9 @@ _DAY_START = time(9, 0)
 _DAY_END = time(17, 30)
 _MAX_SLOTS = 20
 
+# (start, end, how many are free throughout, everyone busy at some point)
+Slot = tuple[datetime, datetime, int, set[str]]
+
 _FREEBUSY_REAUTH_ADVICE = (
     " free/busy needs the calendar.freebusy scope, added 2026-08-19 — tokens "
     "minted before that date lack it even though every other calendar call "
@@ -55,8 +59,13 @@ def do_freebusy(
     time_min: str | None = None,
     time_max: str | None = None,
     duration: int | None = None,
+    min_free: int | None = None,
 ) -> dict[str, Any]:
-    """Free/busy for a set of people, with optional common-slot mining."""
+    """Free/busy for a set of people, with optional common-slot mining.
+
+    min_free (needs duration) relaxes "everyone" to "at least this many of
+    the visible people" and ranks the slots by how many are free.
+    """
     assert attendees is not None and time_min is not None and time_max is not None
 
     if isinstance(attendees, str):
@@ -79,6 +88,11 @@ def do_freebusy(
         )
     if duration is not None and duration <= 0:
         return _error("invalid_input", "duration is minutes and must be > 0.")
+    if min_free is not None and (duration is None or min_free <= 0):
+        return _error(
+            "invalid_input",
+            "min_free is a headcount > 0 and needs a duration to mine slots for.",
+        )
 
     # The user's own diary always joins the arithmetic — a slot that ignores
     # the asker's calendar is not a slot anyone can book.
@@ -189,27 +203,43 @@ def do_freebusy(
         result["not_visible"] = not_visible
 
     if duration is not None:
-        all_busy = [b for blocks in busy_by_person.values() for b in blocks]
-        slots = _common_free_slots(
-            all_busy, window_min, window_max, duration, tz,
+        if min_free is not None and min_free > len(busy_by_person):
+            warnings.append(
+                f"min_free={min_free} exceeds the {len(busy_by_person)} "
+                "visible calendars — no slot can meet it."
+            )
+        slots = _mine_slots(
+            busy_by_person, window_min, window_max, duration, tz,
+            min_free=len(busy_by_person) if min_free is None else min_free,
         )
-        result["common_free"] = [
+        rendered: list[dict[str, Any]] = [
             {
                 "start": s.astimezone(tz).isoformat(),
                 "end": e.astimezone(tz).isoformat(),
             }
-            for s, e in slots
+            for s, e, _, _ in slots
         ]
+        quorum = ""
+        if min_free is None:
+            result["common_free"] = rendered
+        else:
+            for slot, (_, _, available, missing) in zip(rendered, slots):
+                slot.update(available=available, missing=sorted(missing))
+            result["quorum_free"] = rendered
+            quorum = (
+                f" with at least {min_free} of {len(busy_by_person)} free, "
+                "most-available first"
+            )
         result["slot_note"] = (
             f"Slots are >= {duration} min, weekdays {_DAY_START:%H:%M}–"
-            f"{_DAY_END:%H:%M} {tz.key}, across: "
+            f"{_DAY_END:%H:%M} {tz.key}{quorum}, across: "
             f"{', '.join(busy_by_person)}."
         )
 
     result["cues"] = with_identity({"warnings": warnings})
     logger.info(
-        "freebusy: people=%d visible=%d duration=%s",
-        len(emails), len(busy_by_person), duration,
+        "freebusy: people=%d visible=%d duration=%s min_free=%s",
+        len(emails), len(busy_by_person), duration, min_free,
     )
     return result
 
@@ -227,36 +257,96 @@ def _merge_blocks(
     return merged
 
 
-def _common_free_slots(
-    busy: list[tuple[datetime, datetime]],
+def _office_hours(
+    window_min: datetime, window_max: datetime, tz: ZoneInfo,
+) -> list[tuple[datetime, datetime]]:
+    """The window's weekday office-hours fences, in order."""
+    fences = []
+    day = window_min.astimezone(tz).date()
+    last_day = window_max.astimezone(tz).date()
+    while day <= last_day:
+        if day.weekday() < 5:  # Mon–Fri
+            start = max(datetime.combine(day, _DAY_START, tzinfo=tz), window_min)
+            end = min(datetime.combine(day, _DAY_END, tzinfo=tz), window_max)
+            if start < end:
+                fences.append((start, end))
+        day += timedelta(days=1)
+    return fences
+
+
+def _mine_slots(
+    busy_by_person: dict[str, list[tuple[datetime, datetime]]],
     window_min: datetime,
     window_max: datetime,
     duration_minutes: int,
     tz: ZoneInfo,
-) -> list[tuple[datetime, datetime]]:
-    """Gaps >= duration inside office hours, Mon–Fri, minus all busy blocks."""
-    merged = _merge_blocks(busy)
+    min_free: int,
+) -> list[Slot]:
+    """Office-hours stretches >= duration where the same min_free people are free throughout.
+
+    Every person's busy edges are sorted once and swept into segments, each
+    carrying who is busy in it — O(B log B) in the total busy blocks, never
+    a per-day rescan. A stretch's missing set is the union over its
+    segments, so its availability is everyone who is free for all of it,
+    not a per-instant count (two people busy at different times are both
+    missing from a stretch spanning both). From each segment the stretch
+    grows right until someone new drops out; each maximal stretch at each
+    availability is a slot, so an all-free hour inside a mostly-free
+    afternoon is offered as well as the afternoon. Ranked most-available
+    first, then chronologically — with min_free equal to the headcount
+    every slot ties, which is the old common-slot order.
+    """
     need = timedelta(minutes=duration_minutes)
-    slots: list[tuple[datetime, datetime]] = []
+    merged = {email: _merge_blocks(blocks) for email, blocks in busy_by_person.items()}
+    # Ends sort before starts at the same moment: back-to-back isn't overlap
+    edges = sorted(
+        (moment, delta, email)
+        for email, blocks in merged.items()
+        for start, end in blocks
+        for moment, delta in ((start, 1), (end, -1))
+    )
+    most_missing = len(merged) - min_free
+    busy: set[str] = set()
+    i = 0
+    found: list[tuple[datetime, datetime, frozenset[str]]] = []
 
-    day = window_min.astimezone(tz).date()
-    last_day = window_max.astimezone(tz).date()
-    while day <= last_day and len(slots) < _MAX_SLOTS:
-        if day.weekday() < 5:  # Mon–Fri
-            day_start = max(
-                datetime.combine(day, _DAY_START, tzinfo=tz), window_min,
-            )
-            day_end = min(
-                datetime.combine(day, _DAY_END, tzinfo=tz), window_max,
-            )
-            cursor = day_start
-            for busy_start, busy_end in merged:
-                if busy_end <= cursor or busy_start >= day_end:
+    for fence_start, fence_end in _office_hours(window_min, window_max, tz):
+        # (segment start, segment end, who is busy) across this fence
+        segments: list[tuple[datetime, datetime, frozenset[str]]] = []
+        cursor = fence_start
+        while cursor < fence_end:
+            while i < len(edges) and edges[i][0] <= cursor:
+                _, delta, email = edges[i]
+                (busy.add if delta > 0 else busy.discard)(email)
+                i += 1
+            end = edges[i][0] if i < len(edges) and edges[i][0] < fence_end else fence_end
+            if segments and segments[-1][2] == busy:
+                segments[-1] = (segments[-1][0], end, segments[-1][2])
+            else:
+                segments.append((cursor, end, frozenset(busy)))
+            cursor = end
+
+        for a, (start, _, first) in enumerate(segments):
+            before = segments[a - 1][2] if a else None
+            missing = first
+            # A stretch whose missing set covers the segment before it would
+            # reach further left — that longer stretch is found from there
+            if len(missing) > most_missing or (before is not None and before <= missing):
+                continue
+            for b in range(a + 1, len(segments)):
+                if segments[b][2] <= missing:
                     continue
-                if busy_start - cursor >= need:
-                    slots.append((cursor, busy_start))
-                cursor = max(cursor, busy_end)
-            if day_end - cursor >= need:
-                slots.append((cursor, day_end))
-        day += timedelta(days=1)
-    return slots[:_MAX_SLOTS]
+                if segments[b - 1][1] - start >= need:
+                    found.append((start, segments[b - 1][1], missing))
+                missing = missing | segments[b][2]
+                if len(missing) > most_missing or (before is not None and before <= missing):
+                    break
+            else:
+                if segments[-1][1] - start >= need:
+                    found.append((start, segments[-1][1], missing))
+
+    found.sort(key=lambda slot: (len(slot[2]), slot[0]))
+    return [
+        (start, end, len(merged) - len(missing), set(missing))
+        for start, end, missing in found[:_MAX_SLOTS]
+    ]
@@ -0,0 +1,94 @@
+"""
+Deposit garbage collection — `mise gc` and the server's background sweep.
+
+The retention rules live in workspace/retention.py. This module decides
+where they run. `mise gc` sweeps the current directory. The server has no
+single workspace: each call names its own base_path, so fetches and
+searches note theirs here (note_workspace), and the lifespan sweep
+(sweep_periodically) revisits every workspace this process has deposited
+into.
+
+MISE_GC=0 turns the background sweep off. MISE_GC_INTERVAL_SECONDS sets how
+often it runs (default hourly). The limits come from
+RetentionPolicy.from_env.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+from workspace.retention import RetentionPolicy, collect, parse_size
+
+logger = logging.getLogger(__name__)
+
+SWEEP_ENABLED = os.environ.get("MISE_GC", "1") != "0"
+SWEEP_INTERVAL_SECONDS = float(os.environ.get("MISE_GC_INTERVAL_SECONDS", "3600"))
+
+_workspaces: set[Path] = set()
+_workspaces_lock = threading.Lock()
+
+
+def note_workspace(base_path: Path | str | None) -> None:
+    """Remember a workspace deposits were written to, for the background sweep."""
+    if base_path:
+        with _workspaces_lock:
+            _workspaces.add(Path(base_path).resolve())
+
+
+def do_gc(
+    base_path: Path,
+    *,
+    dry_run: bool = False,
+    max_bytes: str | None = None,
+    max_age_days: float | None = None,
+) -> dict[str, Any]:
+    """
+    Sweep one workspace's .mise/ to the configured retention policy.
+
+    Args:
+        base_path: Workspace to sweep
+        dry_run: List what would be removed without removing it
+        max_bytes: Override MISE_GC_MAX_BYTES for this run (e.g. "2G")
+        max_age_days: Override MISE_GC_MAX_AGE_DAYS for this run
+
+    Returns:
+        GcReport as a dict, or an invalid_input error dict for a malformed setting
+    """
+    try:
+        policy = RetentionPolicy.from_env()
+        if max_bytes is not None:
+            policy.max_total_bytes = parse_size(max_bytes) or None
+        if max_age_days is not None:
+            policy.max_age_seconds = max_age_days * 86400 or None
+    except ValueError as e:
+        return {"error": True, "kind": "invalid_input", "message": str(e)}
+    return collect(base_path, policy, dry_run=dry_run).to_dict()
+
+
+def sweep_workspaces() -> int:
+    """One sweep over every noted workspace. Returns the deposits removed."""
+    with _workspaces_lock:
+        workspaces = sorted(_workspaces)
+    removed = 0
+    for workspace in workspaces:
+        try:
+            report = collect(workspace, RetentionPolicy.from_env())
+        except Exception as e:  # noqa: BLE001 — housekeeping must never take the server down
+            logger.warning(f"Deposit sweep of {workspace} failed: {e}")
+            continue
+        if report.removed:
+            logger.info(f"Deposit sweep: removed {len(report.removed)} from {workspace} ({report.freed_bytes} bytes)")
+        removed += len(report.removed)
+    return removed
+
+
+async def sweep_periodically() -> None:
+    """Run sweep_workspaces every SWEEP_INTERVAL_SECONDS until cancelled."""
+    if not SWEEP_ENABLED:
+        return
+    while True:
+        await asyncio.sleep(SWEEP_INTERVAL_SECONDS)
+        await asyncio.to_thread(sweep_workspaces)
@@ -10,7 +10,10 @@ from pathlib import Path
 from typing import Any
 
 from adapters.drive import search_files
+from adapters.drive_mirror import mirror_search
 from adapters.gmail import _is_own_address, search_threads
+from adapters.gmail_delta import note_thread_sizes
+from adapters.gmail_index import search_local
 from adapters.activity import search_comment_activities
 from adapters.calendar import list_events
 from adapters.people import attach_profiles, expand_profile, search_people
@@ -34,6 +37,7 @@ from validation import (
     validate_drive_id,
 )
 from token_store import ambient_mode, override_path
+from tools.gc import note_workspace
 from tools.search_calendar import (
     _build_meeting_context_index,
     _enrich_drive_results_with_meetings,
@@ -290,11 +294,24 @@ def do_search(
             parts.append(f"fullText contains '{escape_drive_query(query)}'")
         if type_clause:
             parts.append(type_clause)
-        return search_files(" and ".join(parts), max_results=max_results, folder_id=folder_id)
+        # Metadata-only queries come from the local mirror when it's on;
+        # fullText contains always goes live.
+        drive_query = " and ".join(parts)
+        mirrored = mirror_search(drive_query, max_results=max_results, folder_id=folder_id)
+        if mirrored is not None:
+            return mirrored
+        return search_files(drive_query, max_results=max_results, folder_id=folder_id)
 
     def _run_gmail() -> GmailSearchResults:
         sanitized_query = sanitize_gmail_query(query)
-        return search_threads(sanitized_query, max_results=max_results)
+        # Triage queries come from the local index when it's on and can
+        # answer exactly; body text and everything else goes live.
+        results = search_local(sanitized_query, max_results=max_results)
+        if results is None:
+            results = search_threads(sanitized_query, max_results=max_results)
+        # A long thread found here is fetched message by message, not in one response
+        note_thread_sizes({r.thread_id: r.message_count for r in results.results})
+        return results
 
     def _run_activity() -> list[CommentActivity]:
         # Activity API doesn't support keyword search — returns recent comment events.
@@ -467,5 +484,6 @@ def do_search(
         result.query, result.full_results(), base_path=base_path, sources=result.sources,
     )
     result.path = str(path)
+    note_workspace(base_path)
 
     return result
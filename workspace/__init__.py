@@ -8,6 +8,7 @@ Filesystem-first pattern: content goes to disk, Claude reads what it needs.
 from .manager import (
     slugify,
     get_deposit_folder,
+    find_deposit_folder,
     write_content,
     write_thumbnail,
     write_page_thumbnail,
@@ -18,11 +19,20 @@ from .manager import (
     write_manifest,
     enrich_manifest,
 )
+from .streams import open_content_stream, open_deposit_stream, DepositStream, deposit_file, staging_folder, publish_staged
+from .deposit_writer import deposit_batch, discard, pending_names
 
 __all__ = [
     "slugify",
     "get_deposit_folder",
+    "find_deposit_folder",
     "write_content",
+    "open_content_stream",
+    "open_deposit_stream",
+    "DepositStream",
+    "deposit_file",
+    "staging_folder",
+    "publish_staged",
     "write_thumbnail",
     "write_page_thumbnail",
     "write_image",
@@ -31,4 +41,7 @@ __all__ = [
     "write_charts_metadata",
     "write_manifest",
     "enrich_manifest",
+    "deposit_batch",
+    "pending_names",
+    "discard",
 ]
@@ -0,0 +1,159 @@
+"""
+Content-addressed blob store — one copy of each deposited binary.
+
+The same attachment, image or PDF lands in many deposits: forwarded across
+threads, fetched as an attachment and as a Drive file, re-fetched after an
+edit. Each deposit used to write its own full copy. Now binary deposit files
+are stored once under .mise/.blobs/, named by SHA-256, and a deposit holds a
+hardlink to the blob. Identical bytes are stored once, and re-depositing a
+file that hasn't changed writes nothing.
+
+A blob's references are its links, so the filesystem keeps the count:
+refs() is st_nlink - 1. Retention charges each deposit its share of a
+shared blob, and sweep_orphans() removes blobs no deposit links to.
+
+A linked file must never be written through, or every deposit sharing it
+changes. store_bytes and store_file put a fresh link in place with a rename,
+and the other deposit writers unlink a name before opening it.
+
+Where the filesystem refuses hardlinks (some network volumes), the first
+refusal turns the store off for that workspace and deposits get plain
+copies, as before. Files under BLOB_MIN_BYTES are never linked: below a
+block, a link saves nothing. MISE_BLOBS=0 turns the store off.
+"""
+
+import errno
+import hashlib
+import os
+import secrets
+import shutil
+from collections.abc import Callable
+from pathlib import Path
+
+from telemetry import count, span
+
+BLOB_DIR = ".blobs"
+BLOB_MIN_BYTES = 4096
+ENABLED = os.environ.get("MISE_BLOBS", "1") != "0"
+
+_CHUNK = 1 << 20
+# Errors that mean "this filesystem has no hardlinks", not "this link failed"
+_NO_LINKS = {errno.EPERM, errno.EXDEV, errno.ENOTSUP, errno.EOPNOTSUPP, errno.ENOSYS}
+# Blob stores whose filesystem refused a link; deposits there are copies
+_unlinkable: set[Path] = set()
+
+
+def store_bytes(path: Path, data: bytes) -> bool:
+    """
+    Deposit data at path as a link to its blob, writing the blob if it's new.
+
+    path must be inside a deposit folder: the store is the folder's sibling
+    .blobs/. Returns False, having written nothing, when the store can't take
+    the file — the caller writes a plain copy.
+    """
+    root = path.parent.parent / BLOB_DIR
+    if not ENABLED or len(data) < BLOB_MIN_BYTES or root in _unlinkable:
+        return False
+    blob = _blob_path(root, hashlib.sha256(data).hexdigest())
+
+    def write_blob(tmp: Path) -> None:
+        tmp.write_bytes(data)
+
+    return _link(root, blob, path, write_blob, len(data))
+
+
+def store_file(path: Path, source: Path) -> bool:
+    """store_bytes for bytes already on disk, hashed and copied in chunks."""
+    root = path.parent.parent / BLOB_DIR
+    size = source.stat().st_size
+    if not ENABLED or size < BLOB_MIN_BYTES or root in _unlinkable:
+        return False
+    digest = hashlib.sha256()
+    with source.open("rb") as f:
+        while chunk := f.read(_CHUNK):
+            digest.update(chunk)
+    blob = _blob_path(root, digest.hexdigest())
+
+    def write_blob(tmp: Path) -> None:
+        shutil.copyfile(source, tmp)
+
+    return _link(root, blob, path, write_blob, size)
+
+
+def refs(blob: Path) -> int:
+    """Deposits linked to blob."""
+    return blob.stat().st_nlink - 1
+
+
+def sweep_orphans(deposit_root: Path, fresh_after: float, *, dry_run: bool = False) -> tuple[int, int]:
+    """
+    Remove blobs no deposit links to. Returns (blobs, bytes) removed.
+
+    Blobs modified after fresh_after are kept: store_bytes may be about to
+    link one. Stale temp files from an interrupted write go too.
+    """
+    removed = freed = 0
+    root = deposit_root / BLOB_DIR
+    if not root.is_dir():
+        return 0, 0
+    for blob in root.glob("*/*"):
+        try:
+            stat = blob.stat()
+        except OSError:
+            continue
+        if stat.st_nlink > 1 or stat.st_mtime > fresh_after:
+            continue
+        if not dry_run:
+            blob.unlink(missing_ok=True)
+        removed, freed = removed + 1, freed + stat.st_size
+    return removed, freed
+
+
+def _blob_path(root: Path, digest: str) -> Path:
+    # Fanned out by the first two hex digits, so no one directory grows huge
+    return root / digest[:2] / digest
+
+
+def _link(root: Path, blob: Path, path: Path, write_blob: Callable[[Path], None], size: int) -> bool:
+    """Link path to blob, writing the blob first if the store lacks it."""
+    try:
+        if os.path.samefile(path, blob):
+            count("blob_hits")
+            return True  # already this content
+    except OSError:
+        pass  # path or blob missing
+    tmp = path.with_name(f".{path.name}.{secrets.token_hex(4)}.tmp")
+    with span("deposit.write"):
+        for _ in range(2):  # once more if a sweep removed the blob under us
+            if blob.exists():
+                count("blob_hits")
+            else:
+                _write_blob(blob, write_blob, size)
+            try:
+                os.link(blob, tmp)
+            except FileNotFoundError:
+                continue
+            except OSError as e:
+                if e.errno in _NO_LINKS:
+                    _unlinkable.add(root)
+                    blob.unlink(missing_ok=True)  # nothing can ever link it here
+                return False
+            try:
+                os.replace(tmp, path)
+            except OSError:
+                tmp.unlink(missing_ok=True)
+                raise
+            return True
+    return False
+
+
+def _write_blob(blob: Path, write_blob: Callable[[Path], None], size: int) -> None:
+    blob.parent.mkdir(parents=True, exist_ok=True)
+    tmp = blob.with_name(f".{blob.name}.{secrets.token_hex(4)}.tmp")
+    try:
+        write_blob(tmp)
+        os.replace(tmp, blob)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    count("deposit_bytes", size)
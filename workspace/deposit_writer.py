@@ -0,0 +1,139 @@
+"""
+Deposit JSON writer — manifests and other JSON deposit files.
+
+Each write_manifest, enrich_manifest or write_charts_metadata call used to
+serialise with json.dumps(indent=2) and write straight to disk, and
+enrich_manifest read the manifest back first. On a network filesystem (the
+Cloud Run volume) each of those is a slow round trip, and a reader listing
+the deposit mid-write could see half a manifest.
+
+Now:
+
+- inside deposit_batch() — one per fetch — JSON writes are buffered in
+  memory, later writes to the same file replace earlier ones, and
+  read_json() answers from the buffer. Everything is written once when the
+  batch exits. Outside a batch, writes go to disk immediately.
+- every write serialises with orjson, goes to a temp file beside its
+  target, and is renamed into place, so a reader sees the old file or the
+  new one, never a partial one.
+- MISE_DEPOSIT_FSYNC=1 also fsyncs each file before the rename and its
+  directory after. It is off by default: deposits are re-fetchable caches,
+  and fsync is the slowest call a network volume has.
+"""
+
+import os
+import secrets
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+from telemetry import count, span
+
+FSYNC = os.environ.get("MISE_DEPOSIT_FSYNC", "0") == "1"
+
+_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+_pending: ContextVar[dict[Path, Any] | None] = ContextVar("deposit_pending", default=None)
+
+
+@contextmanager
+def deposit_batch() -> Iterator[None]:
+    """
+    Buffer JSON deposit writes until the block exits, then write each file once.
+
+    Nested batches join the outermost one. The buffer is written even when
+    the block raises, as the unbuffered writes would already have been. A
+    file that fails to write doesn't stop the rest: every pending file is
+    tried, then the first failure is raised — unless the block itself raised,
+    whose exception is the one that propagates.
+    """
+    if _pending.get() is not None:
+        yield
+        return
+    token = _pending.set({})
+    try:
+        yield
+    finally:
+        pending = _pending.get() or {}
+        _pending.reset(token)
+        errors = _flush(pending)
+    if errors:
+        raise errors[0]
+
+
+def _flush(pending: dict[Path, Any]) -> list[OSError]:
+    """Write every pending file, collecting failures rather than stopping at one."""
+    errors: list[OSError] = []
+    for path, data in pending.items():
+        try:
+            _write_atomic(path, orjson.dumps(data, option=_JSON_OPTIONS))
+        except OSError as e:
+            errors.append(e)
+    return errors
+
+
+def write_json(path: Path, data: Any) -> Path:
+    """Write data as JSON to path: buffered inside deposit_batch(), else now."""
+    pending = _pending.get()
+    if pending is not None:
+        pending[path] = data
+        return path
+    return _write_atomic(path, orjson.dumps(data, option=_JSON_OPTIONS))
+
+
+def read_json(path: Path) -> Any:
+    """The JSON at path, as the current batch will leave it."""
+    pending = _pending.get()
+    if pending is not None and path in pending:
+        return pending[path]
+    return orjson.loads(path.read_bytes())
+
+
+def pending_names(folder: Path) -> list[str]:
+    """Names of files in folder the current batch has yet to write."""
+    return [p.name for p in (_pending.get() or {}) if p.parent == folder]
+
+
+def discard(folder: Path) -> None:
+    """Drop the current batch's pending writes into folder, before it is removed."""
+    pending = _pending.get()
+    if pending is None:
+        return
+    for path in [p for p in pending if p.parent == folder]:
+        del pending[path]
+
+
+def _write_atomic(path: Path, payload: bytes) -> Path:
+    """Write payload to a temp file beside path and rename it into place."""
+    tmp = path.with_name(f".{path.name}.{secrets.token_hex(4)}.tmp")
+    with span("deposit.write"):
+        try:
+            with tmp.open("wb") as f:
+                f.write(payload)
+                if FSYNC:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp, path)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+        if FSYNC:
+            _fsync_dir(path.parent)
+    count("deposit_bytes", len(payload))
+    return path
+
+
+def _fsync_dir(folder: Path) -> None:
+    """Make the rename durable. Not every platform can open a directory."""
+    try:
+        fd = os.open(folder, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
@@ -8,6 +8,7 @@ This is a filesystem-first pattern: content goes to disk, Claude reads
 what it needs. No context window spam.
 """
 
+import glob
 import json
 import re
 import unicodedata
@@ -15,6 +16,11 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Literal
 
+from telemetry import count, span
+
+from .blobs import store_bytes
+from .deposit_writer import read_json, write_json
+
 # Deposit root, relative to base_path. Dot-named on purpose (mise-pamofa):
 # hidden from humans browsing the tree, unchanged for agents — every response
 # returns the deposit path explicitly. Old visible mise/ piles keep their name.
@@ -63,6 +69,23 @@ def slugify(text: str, max_length: int = 50) -> str:
     return text or "untitled"
 
 
+def _write(file_path: Path, data: str | bytes) -> Path:
+    """
+    Write one deposit file, accounted to the call's trace (deposit_bytes).
+
+    Binary files in a deposit folder are stored once in the blob store
+    (workspace/blobs.py) and linked in.
+    """
+    if isinstance(data, bytes) and file_path.parent.parent.name == DEPOSIT_DIR and store_bytes(file_path, data):
+        return file_path
+    payload = data.encode("utf-8") if isinstance(data, str) else data
+    with span("deposit.write"):
+        file_path.unlink(missing_ok=True)  # may be a blob link: never write through it
+        file_path.write_bytes(payload)
+    count("deposit_bytes", len(payload))
+    return file_path
+
+
 def get_deposit_folder(
     content_type: ContentType,
     title: str,
@@ -92,8 +115,7 @@ def get_deposit_folder(
         raise ValueError("base_path is required — deposits must not fall back to MCP server's cwd")
     mise_fetch = base_path / DEPOSIT_DIR
 
-    # Build folder name: {type}--{slug}--{id}
-    # Truncate ID to first 12 chars for readability
+    # Build folder name: {type}--{slug}--{id}, the id cut to 12 chars for readability
     slug = slugify(title)
     short_id = resource_id[:12] if len(resource_id) > 12 else resource_id
     folder_name = f"{content_type}--{slug}--{short_id}"
@@ -112,6 +134,17 @@ def get_deposit_folder(
     return folder_path
 
 
+def find_deposit_folder(content_type: ContentType, resource_id: str, base_path: Path) -> Path | None:
+    """An earlier deposit of resource_id under any title — found, never created or wiped."""
+    for folder in sorted((base_path / DEPOSIT_DIR).glob(f"{content_type}--*--{glob.escape(resource_id[:12])}")):
+        try:
+            if json.loads((folder / "manifest.json").read_text(encoding="utf-8")).get("id") == resource_id:
+                return folder
+        except (OSError, ValueError):
+            continue
+    return None
+
+
 def write_content(
     folder: Path,
     content: str,
@@ -128,9 +161,7 @@ def write_content(
     Returns:
         Path to the written file
     """
-    file_path = folder / filename
-    file_path.write_text(content, encoding="utf-8")
-    return file_path
+    return _write(folder / filename, content)
 
 
 def write_thumbnail(
@@ -154,9 +185,7 @@ def write_thumbnail(
     """
     # 1-indexed, zero-padded for sorting
     filename = f"slide_{slide_index + 1:02d}.png"
-    file_path = folder / filename
-    file_path.write_bytes(image_bytes)
-    return file_path
+    return _write(folder / filename, image_bytes)
 
 
 def write_page_thumbnail(
@@ -180,9 +209,7 @@ def write_page_thumbnail(
     """
     # 1-indexed, zero-padded for sorting
     filename = f"page_{page_index + 1:02d}.png"
-    file_path = folder / filename
-    file_path.write_bytes(image_bytes)
-    return file_path
+    return _write(folder / filename, image_bytes)
 
 
 def write_raw(
@@ -204,9 +231,7 @@ def write_raw(
     Returns:
         Path to the written file
     """
-    file_path = folder / filename
-    file_path.write_bytes(data)
-    return file_path
+    return _write(folder / filename, data)
 
 
 def write_image(
@@ -252,9 +277,7 @@ def write_chart(
     """
     # 1-indexed, zero-padded for sorting
     filename = f"chart_{chart_index + 1:02d}.png"
-    file_path = folder / filename
-    file_path.write_bytes(image_bytes)
-    return file_path
+    return _write(folder / filename, image_bytes)
 
 
 def write_charts_metadata(
@@ -271,9 +294,7 @@ def write_charts_metadata(
     Returns:
         Path to the written file
     """
-    file_path = folder / "charts.json"
-    file_path.write_text(json.dumps(charts, indent=2), encoding="utf-8")
-    return file_path
+    return write_json(folder / "charts.json", charts)
 
 
 def write_manifest(
@@ -301,13 +322,10 @@ def write_manifest(
         "title": title,
         "id": resource_id,
         "fetched_at": datetime.now(timezone.utc).isoformat(),
+        **(extra or {}),
     }
-    if extra:
-        manifest.update(extra)
-
-    file_path = folder / "manifest.json"
-    file_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
-    return file_path
+    manifest.setdefault("accessed_at", manifest["fetched_at"])  # retention's LRU key
+    return write_json(folder / "manifest.json", manifest)
 
 
 def enrich_manifest(folder: Path, extra: dict[str, Any]) -> Path:
@@ -315,7 +333,7 @@ def enrich_manifest(folder: Path, extra: dict[str, Any]) -> Path:
     Merge additional fields into an existing manifest.json.
 
     Used post-creation to stamp a deposit with its published state
-    (file_id, web_link, status, created_at).
+    (file_id, web_link, status, created_at). Counts as an access.
 
     Args:
         folder: Deposit folder containing manifest.json
@@ -328,10 +346,9 @@ def enrich_manifest(folder: Path, extra: dict[str, Any]) -> Path:
         FileNotFoundError: If manifest.json doesn't exist in folder
     """
     manifest_path = folder / "manifest.json"
-    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
-    manifest.update(extra)
-    manifest_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
-    return manifest_path
+    manifest = read_json(manifest_path)
+    manifest.update(extra, accessed_at=datetime.now(timezone.utc).isoformat())
+    return write_json(manifest_path, manifest)
 
 
 def write_search_results(
@@ -380,7 +397,6 @@ def write_search_results(
         file_path = mise_fetch / f"{stem}-{n}.json"
         n += 1
 
-    file_path.write_text(json.dumps(results, indent=2), encoding="utf-8")
-    return file_path
+    return write_json(file_path, results)
 
 
@@ -0,0 +1,259 @@
+"""
+Deposit retention — garbage collection for .mise/.
+
+Every fetch creates or refreshes a `{type}--{slug}--{id}/` folder and every
+search adds a `search--….json` file, and nothing removed them: long-lived
+agent workspaces grew to gigabytes of thumbnails, crops and attachments,
+and every scan or grep over .mise/ slowed with them. collect() trims a
+workspace's deposits to a RetentionPolicy:
+
+1. anything not accessed for max_age_seconds goes;
+2. each type with a quota loses its least recently accessed deposits until
+   it fits;
+3. then the whole of .mise/ does the same against max_total_bytes.
+
+"Accessed" is the manifest's accessed_at — set by write_manifest and moved
+on by enrich_manifest — falling back to fetched_at, then to the newest file
+time (search results have no manifest).
+
+A deposit with any file modified in the last grace_seconds is never
+touched: it may be mid-fetch in this process or another one. A chosen
+deposit is renamed aside before it is deleted, and put back if a write
+lands in it in between, so a fetch that races the sweep keeps its folder.
+Folders and files collect() doesn't recognise — dot-names, anything
+without a `{type}--` prefix — are left alone. So is any folder whose
+manifest doesn't show it came from a fetch (an `id` and a `fetched_at`):
+deposit-then-publish drafts like `.mise/sheet--q4-analysis--draft/` are
+written by hand, and until `do(create, source=…)` they have no Drive copy
+to re-fetch.
+
+Deposited binaries are links into the blob store (workspace/blobs.py). A
+deposit is charged its share of each blob it links, so the shares add up
+to the bytes on disk, and once deposits are removed the blobs nothing links
+to any more are removed with them.
+"""
+
+import os
+import re
+import shutil
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+from .blobs import sweep_orphans
+from .manager import DEPOSIT_DIR
+
+_SIZE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([kmgt]?)i?b?\s*$", re.IGNORECASE)
+_UNITS = {"": 1, "k": 1 << 10, "m": 1 << 20, "g": 1 << 30, "t": 1 << 40}
+_DEPOSIT_NAME = re.compile(r"^([a-z]+)--")
+
+
+def parse_size(text: str) -> int:
+    """Bytes from "5G", "500M", "64k" or a plain number. Raises ValueError."""
+    match = _SIZE.match(text)
+    if match is None:
+        raise ValueError(f"Not a size: {text!r} (try 500M or 5G)")
+    return int(float(match.group(1)) * _UNITS[match.group(2).lower()])
+
+
+@dataclass
+class RetentionPolicy:
+    """Limits for one sweep. None means no limit of that kind."""
+    max_total_bytes: int | None = 5 << 30
+    max_age_seconds: float | None = 30 * 86400
+    type_quotas: dict[str, int] = field(default_factory=dict)
+    grace_seconds: float = 900
+
+    @classmethod
+    def from_env(cls) -> "RetentionPolicy":
+        """
+        The policy in MISE_GC_MAX_BYTES (e.g. 5G, 0 = no limit),
+        MISE_GC_MAX_AGE_DAYS (0 = no limit), MISE_GC_TYPE_QUOTAS
+        (e.g. "pdf=500M,image=200M") and MISE_GC_GRACE_SECONDS.
+
+        Raises:
+            ValueError: On a malformed setting
+        """
+        policy = cls()
+        if (max_bytes := os.environ.get("MISE_GC_MAX_BYTES")) is not None:
+            policy.max_total_bytes = parse_size(max_bytes) or None
+        if (max_age := os.environ.get("MISE_GC_MAX_AGE_DAYS")) is not None:
+            policy.max_age_seconds = float(max_age) * 86400 or None
+        for quota in filter(None, os.environ.get("MISE_GC_TYPE_QUOTAS", "").split(",")):
+            content_type, _, size = quota.partition("=")
+            policy.type_quotas[content_type.strip()] = parse_size(size)
+        if (grace := os.environ.get("MISE_GC_GRACE_SECONDS")) is not None:
+            policy.grace_seconds = float(grace)
+        return policy
+
+
+@dataclass
+class Deposit:
+    """One deposit folder (or search-results file) as the sweep sees it."""
+    path: Path
+    content_type: str
+    size: int
+    accessed: float
+    modified: float
+
+
+@dataclass
+class GcReport:
+    """What one sweep removed and what it left."""
+    removed: list[str] = field(default_factory=list)
+    freed_bytes: int = 0
+    kept: int = 0
+    kept_bytes: int = 0
+    skipped_in_use: list[str] = field(default_factory=list)
+    orphan_blobs: int = 0
+    dry_run: bool = False
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "removed": self.removed,
+            "freed_bytes": self.freed_bytes,
+            "kept": self.kept,
+            "kept_bytes": self.kept_bytes,
+            "skipped_in_use": self.skipped_in_use,
+            "orphan_blobs": self.orphan_blobs,
+            "dry_run": self.dry_run,
+        }
+
+
+def scan_deposits(base_path: Path) -> list[Deposit]:
+    """Every deposit under base_path/.mise the sweep may consider."""
+    root = base_path / DEPOSIT_DIR
+    if not root.is_dir():
+        return []
+    deposits = []
+    for entry in root.iterdir():
+        match = _DEPOSIT_NAME.match(entry.name)
+        if match is None or entry.is_symlink():
+            continue
+        manifest = None if entry.is_file() else _read_manifest(entry)
+        if entry.is_dir() and not _is_fetched(manifest):
+            continue
+        files = [entry] if entry.is_file() else [f for f in entry.rglob("*") if f.is_file() and not f.is_symlink()]
+        try:
+            stats = [f.stat() for f in files]
+        except OSError:
+            continue  # removed under us
+        modified = max([s.st_mtime for s in stats] + [entry.stat().st_mtime])
+        deposits.append(Deposit(
+            path=entry,
+            content_type=match.group(1),
+            # A file linked from the blob store costs its share of the blob
+            size=sum(s.st_size // max(s.st_nlink - 1, 1) for s in stats),
+            accessed=_last_access(manifest) or modified,
+            modified=modified,
+        ))
+    return deposits
+
+
+def collect(
+    base_path: Path,
+    policy: RetentionPolicy,
+    *,
+    dry_run: bool = False,
+    now: float | None = None,
+) -> GcReport:
+    """
+    Trim base_path/.mise to policy — see the module docstring for the order.
+
+    Args:
+        base_path: Workspace whose .mise/ to sweep
+        policy: Limits to enforce
+        dry_run: Report what would go without deleting anything
+        now: Clock override (tests)
+
+    Returns:
+        GcReport of removed and kept deposits
+    """
+    now = time.time() if now is None else now
+    report = GcReport(dry_run=dry_run)
+    live = sorted(scan_deposits(base_path), key=lambda d: d.accessed)
+    in_use = {d.path for d in live if now - d.modified < policy.grace_seconds}
+    doomed: dict[Path, Deposit] = {}
+
+    def evict(candidates: list[Deposit], excess: float) -> None:
+        for deposit in candidates:
+            if excess <= 0:
+                return
+            if deposit.path not in in_use and deposit.path not in doomed:
+                doomed[deposit.path] = deposit
+                excess -= deposit.size
+
+    if policy.max_age_seconds is not None:
+        evict([d for d in live if now - d.accessed > policy.max_age_seconds], float("inf"))
+    for content_type, quota in policy.type_quotas.items():
+        of_type = [d for d in live if d.content_type == content_type and d.path not in doomed]
+        evict(of_type, sum(d.size for d in of_type) - quota)
+    if policy.max_total_bytes is not None:
+        remaining = [d for d in live if d.path not in doomed]
+        evict(remaining, sum(d.size for d in remaining) - policy.max_total_bytes)
+
+    for deposit in doomed.values():
+        if dry_run or _remove(deposit, now - policy.grace_seconds):
+            report.removed.append(deposit.path.name)
+            report.freed_bytes += deposit.size
+        else:
+            in_use.add(deposit.path)
+    report.orphan_blobs, orphan_bytes = sweep_orphans(base_path / DEPOSIT_DIR, now - policy.grace_seconds, dry_run=dry_run)
+    report.freed_bytes += orphan_bytes
+    report.skipped_in_use = sorted(p.name for p in in_use)
+    kept = [d for d in live if d.path.name not in report.removed]
+    report.kept, report.kept_bytes = len(kept), sum(d.size for d in kept)
+    return report
+
+
+def _read_manifest(entry: Path) -> dict[str, Any] | None:
+    """A deposit folder's manifest, or None if it has no readable one."""
+    try:
+        manifest = orjson.loads((entry / "manifest.json").read_bytes())
+    except (OSError, ValueError):
+        return None
+    return manifest if isinstance(manifest, dict) else None
+
+
+def _is_fetched(manifest: dict[str, Any] | None) -> bool:
+    """Whether a folder is a fetch's re-fetchable copy rather than a hand-written draft."""
+    if manifest is None or not manifest.get("id") or not manifest.get("fetched_at"):
+        return False
+    return manifest.get("status", "created") == "created"  # any other status is unpublished
+
+
+def _last_access(manifest: dict[str, Any] | None) -> float | None:
+    """accessed_at, else fetched_at, from a deposit's manifest."""
+    if manifest is None:
+        return None
+    stamp = manifest.get("accessed_at") or manifest.get("fetched_at")
+    try:
+        return datetime.fromisoformat(stamp).timestamp() if stamp else None
+    except (ValueError, TypeError):
+        return None
+
+
+def _remove(deposit: Deposit, fresh_after: float) -> bool:
+    """Rename aside, re-check for a racing write, then delete. False if kept."""
+    aside = deposit.path.with_name(f".gc-{deposit.path.name}")
+    try:
+        deposit.path.rename(aside)
+    except OSError:
+        return False
+    try:
+        files = [aside] if aside.is_file() else [f for f in aside.rglob("*") if f.is_file()]
+        raced = any(f.stat().st_mtime > fresh_after for f in files)
+    except OSError:
+        raced = True
+    if raced and not deposit.path.exists():
+        aside.rename(deposit.path)  # a fetch started writing here after the scan
+        return False
+    if aside.is_dir():
+        shutil.rmtree(aside, ignore_errors=True)
+    else:
+        aside.unlink(missing_ok=True)
+    return True
@@ -0,0 +1,179 @@
+"""
+Streaming deposit writers — for content too large to hold in memory.
+
+open_content_stream takes text chunk by chunk; open_deposit_stream is a
+file object a download streams into; deposit_file copies a file already on
+disk. Like manager._write, each opens a fresh file rather than writing
+through an existing one, which may be a link into the blob store.
+
+get_deposit_folder wipes the previous deposit, so a download that can fail
+part-way streams into a staging_folder() first and is moved in with
+publish_staged() only once it is complete. A failed re-fetch then leaves
+the last good deposit as it was.
+"""
+
+import codecs
+import os
+import shutil
+import tempfile
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import BinaryIO
+
+from telemetry import count
+
+from .blobs import store_file
+from .manager import DEPOSIT_DIR
+
+
+@contextmanager
+def open_content_stream(
+    folder: Path,
+    filename: str,
+) -> Iterator[Callable[[str], None]]:
+    """
+    Write a text deposit file incrementally, for content too large to hold.
+
+    Yields a write(chunk) callable; the file is complete when the block
+    exits. Bytes are accounted to the call's trace like manager._write's.
+
+    Args:
+        folder: Deposit folder from get_deposit_folder()
+        filename: Output filename
+    """
+    written = 0
+    (folder / filename).unlink(missing_ok=True)  # may be a blob link
+    with (folder / filename).open("wb") as f:
+        def write(chunk: str) -> None:
+            nonlocal written
+            payload = chunk.encode("utf-8")
+            f.write(payload)
+            written += len(payload)
+
+        yield write
+    count("deposit_bytes", written)
+
+
+class DepositStream:
+    """
+    Binary file object over a deposit file, for downloads streamed to disk.
+
+    Hand it to MiseSyncClient.stream_to_file (or anything else that calls
+    write(bytes)) and nothing larger than one chunk is ever held. In text
+    mode each chunk goes through an incremental UTF-8 decoder, so multi-byte
+    characters split across chunks survive, invalid bytes land on disk as
+    U+FFFD (the same result as decode(errors="replace") on the whole body),
+    and char_count is known without a second pass.
+
+    seek(0) + truncate() start the file over — a retried download must not
+    append to the bytes of the attempt that failed.
+    """
+
+    def __init__(self, f: BinaryIO, text: bool) -> None:
+        self._f = f
+        self._text = text
+        self._decoder = codecs.getincrementaldecoder("utf-8")("replace")
+        self.bytes_written = 0
+        self.char_count = 0
+
+    def write(self, chunk: bytes) -> int:
+        if self._text:
+            decoded = self._decoder.decode(chunk)
+            self.char_count += len(decoded)
+            chunk = decoded.encode("utf-8")
+        self._f.write(chunk)
+        self.bytes_written += len(chunk)
+        return len(chunk)
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        if (offset, whence) != (0, 0):
+            raise ValueError("DepositStream can only seek back to the start")
+        self._decoder.reset()
+        self.bytes_written = 0
+        self.char_count = 0
+        return self._f.seek(0)
+
+    def truncate(self, size: int | None = None) -> int:
+        return self._f.truncate(size)
+
+    def _finish(self) -> None:
+        if self._text:
+            tail = self._decoder.decode(b"", final=True)
+            if tail:
+                self.char_count += len(tail)
+                payload = tail.encode("utf-8")
+                self._f.write(payload)
+                self.bytes_written += len(payload)
+
+
+@contextmanager
+def open_deposit_stream(
+    folder: Path,
+    filename: str,
+    *,
+    text: bool = False,
+) -> Iterator[DepositStream]:
+    """
+    Open a deposit file for a download to stream straight into.
+
+    The file is complete when the block exits. Bytes are accounted to the
+    call's trace like manager._write's.
+
+    Args:
+        folder: Deposit folder from get_deposit_folder()
+        filename: Output filename
+        text: Validate as UTF-8 and count characters (see DepositStream)
+    """
+    (folder / filename).unlink(missing_ok=True)  # may be a blob link
+    with (folder / filename).open("wb") as f:
+        stream = DepositStream(f, text)
+        yield stream
+        stream._finish()
+    count("deposit_bytes", stream.bytes_written)
+
+
+def deposit_file(folder: Path, filename: str, source: Path) -> Path:
+    """
+    Deposit a file already on disk — a download's temp file — without
+    reading it whole. It is linked from the blob store where it can be,
+    else streamed in as a copy.
+
+    Args:
+        folder: Deposit folder from get_deposit_folder()
+        filename: Output filename
+        source: File to deposit (left in place)
+
+    Returns:
+        Path to the deposited file
+    """
+    dest = folder / filename
+    if folder.parent.name == DEPOSIT_DIR and store_file(dest, source):
+        return dest
+    with source.open("rb") as src, open_deposit_stream(folder, filename) as stream:
+        shutil.copyfileobj(src, stream)
+    return dest
+
+
+@contextmanager
+def staging_folder(base_path: Path | None) -> Iterator[Path]:
+    """
+    A scratch folder under .mise/ for files that must be complete before
+    the deposit they belong to is wiped. Removed, with anything left in it,
+    when the block exits. Dot-named, so retention and listings skip it.
+    """
+    if base_path is None:
+        raise ValueError("base_path is required — deposits must not fall back to MCP server's cwd")
+    root = base_path / DEPOSIT_DIR
+    root.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(prefix=".staging-", dir=root))
+    try:
+        yield staging
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+
+
+def publish_staged(staging: Path, folder: Path) -> None:
+    """Move every staged file into folder: renames on one filesystem, no copy."""
+    for staged in staging.iterdir():
+        os.replace(staged, folder / staged.name)